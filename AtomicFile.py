@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+
+"""
+Writing cache and index files so that readers never see a partial one
+
+The data is written to a temporary file next to the target, named after
+the process so that concurrent writers do not clobber each other, and
+renamed over the target only once it is complete. If writing fails, the
+temporary file is removed and the target is left as it was.
+
+Usage:
+    with AtomicFile.AtomicWrite(path) as fobj:
+        fobj.write(data)
+"""
+
+import contextlib
+import os
+
+@contextlib.contextmanager
+def AtomicWrite(path):
+    """Yields a file object open for writing in binary mode, whose contents
+    replace @param path when the block exits without an exception"""
+    temp = "%s.%d.tmp" % (path, os.getpid())
+    try:
+        with open(temp, 'wb') as fobj:
+            yield fobj
+        os.rename(temp, path)
+    except:
+        try:
+            os.unlink(temp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+
+"""
+Single-pass analyses over the tiles of a world
+
+Every analysis WorldFile.py offers (tile counts, gem counts, --find, the
+--poly outlines, --biomes, the --png image) is a function of the tile
+columns. Rather than walking the world once per analysis, a ColumnPass
+streams the columns once, in blocks of CHUNK_COLUMNS (see
+World.StreamColumnBlocks), and feeds each block to every registered
+consumer.
+
+Each block is wrapped in a ColumnChunk, which memoizes derived arrays
+(masks, per-type counts) so consumers asking for the same intermediate
+share one computation.
+
+Usage:
+    plan = ColumnPass.ColumnPass(world)
+    counts = plan.Add(ColumnPass.TileCounter())
+    finder = plan.Add(ColumnPass.Finder(terms))
+    plan.Run()
+    counts.Result(), finder.Result()
+"""
+
+import numpy as np
+
+import IDs
+import TileGrid
+
+# Feed consumers this many columns at a time
+CHUNK_COLUMNS = 256
+
+class ColumnChunk(object):
+    """
+    A block of consecutive world columns
+
+    Attributes:
+        X0          the first column in the block
+        Columns     dict of TileGrid column name to an (ncols, height) array
+    """
+    def __init__(self, x0, columns):
+        self.X0 = x0
+        self.Columns = columns
+        self._memo = {}
+
+    def NumColumns(self):
+        return self.Columns['Type'].shape[0]
+
+    def Memo(self, key, compute):
+        """Returns the value stored under @param key, calling @param compute
+        to produce it the first time"""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def Active(self):
+        "Returns a boolean array: True where a tile is present"
+        return self.Memo('active',
+                lambda: (self.Columns['Flags'] & TileGrid.FLAG_ACTIVE) != 0)
+
+    def TypeMask(self, tileid):
+        "Returns a boolean array: True where the tile type is @param tileid"
+        return self.Memo(('type', tileid),
+                         lambda: self.Columns['Type'] == tileid)
+
+    def WallMask(self, wallid):
+        "Returns a boolean array: True where the wall is @param wallid"
+        return self.Memo(('wall', wallid),
+                         lambda: self.Columns['Wall'] == wallid)
+
+    def TileCounts(self):
+        "Returns an array of the number of active tiles of each type"
+        return self.Memo('tile_counts', lambda: np.bincount(
+                self.Columns['Type'][self.Active()].ravel()))
+
+    def WallCounts(self):
+        "Returns an array of the number of tiles with each wall"
+        return self.Memo('wall_counts',
+                         lambda: np.bincount(self.Columns['Wall'].ravel()))
+
+class Consumer(object):
+    "Base class of the analyses run by a ColumnPass"
+    def Begin(self, world):
+        "Called before the first chunk with the world being scanned"
+        pass
+
+    def Feed(self, chunk):
+        "Called with each ColumnChunk, in column order"
+        raise NotImplementedError()
+
+    def Finish(self):
+        "Called after the last chunk"
+        pass
+
+    def Result(self):
+        raise NotImplementedError()
+
+class TileCounter(Consumer):
+    "Counts active tiles by type, like World.GetTileCounts"
+    def __init__(self):
+        self._counts = np.zeros(0, dtype=np.int64)
+
+    def Feed(self, chunk):
+        self._counts = _add_counts(self._counts, chunk.TileCounts())
+
+    def Result(self):
+        "Returns a dict of tile type to count"
+        return dict((t, int(c)) for t, c in enumerate(self._counts) if c > 0)
+
+class WallCounter(TileCounter):
+    "Counts tiles by wall type, like World.GetWallCounts"
+    def Feed(self, chunk):
+        self._counts = _add_counts(self._counts, chunk.WallCounts())
+
+    def Result(self):
+        "Returns a dict of wall type to count"
+        return dict((w, int(c)) for w, c in enumerate(self._counts)
+                    if c > 0 and w != 0)
+
+def _add_counts(total, counts):
+    if len(counts) > len(total):
+        total = np.concatenate((total, np.zeros(len(counts) - len(total),
+                                                dtype=total.dtype)))
+    total[:len(counts)] += counts
+    return total
+
+class GemCounter(Consumer):
+    "Counts gem tiles and gems in small piles (WorldFile.py --gem-counts)"
+    def __init__(self):
+        self._counts = {}
+
+    def Feed(self, chunk):
+        counts = chunk.TileCounts()
+        for t in xrange(IDs.Tile.Sapphire, IDs.Tile.Diamond+1):
+            if t < len(counts) and counts[t] > 0:
+                key = (t, None)
+                self._counts[key] = self._counts.get(key, 0) + int(counts[t])
+        mask = chunk.TypeMask(IDs.Tile.SmallPiles)
+        if not mask.any():
+            return
+        items = IDs.tile_to_item_array(chunk.Columns['Type'][mask],
+                                       chunk.Columns['U'][mask],
+                                       chunk.Columns['V'][mask])
+        items, counts = np.unique(items[items != IDs.INVALID],
+                                  return_counts=True)
+        for item, count in zip(items.tolist(), counts.tolist()):
+            key = (IDs.Tile.SmallPiles, item)
+            self._counts[key] = self._counts.get(key, 0) + count
+
+    def Result(self):
+        "Returns a dict of (tile type, item or None) to count"
+        return self._counts
+
+class Finder(Consumer):
+    """Finds the tiles matched by any of @param terms (Match.Match objects),
+    skipping the outer @param border tiles, like World.FindMatches"""
+    def __init__(self, terms, border=0, tiles=False):
+        self._terms = terms
+        self._border = border
+        self._tiles = tiles
+        self._xs, self._ys, self._found = [], [], []
+
+    def Begin(self, world):
+        self._width, self._height = world.Width(), world.Height()
+
+    def Feed(self, chunk):
+        columns = chunk.Columns
+        mask = np.zeros(columns['Type'].shape, dtype=np.bool_)
+        for term in self._terms:
+            mask |= term.match_arrays(columns['Type'], columns['U'],
+                                      columns['V'], columns['Wall'])
+        b = self._border
+        if b > 0:
+            xs = np.arange(chunk.X0, chunk.X0 + chunk.NumColumns())
+            mask[(xs < b) | (xs >= self._width - b)] = False
+            mask[:, :b] = False
+            mask[:, self._height-b:] = False
+        cols, rows = np.nonzero(mask)
+        if len(cols) == 0:
+            return
+        self._xs.append(cols + chunk.X0)
+        self._ys.append(rows)
+        if self._tiles:
+            grid = TileGrid.TileGrid(chunk.NumColumns(), self._height,
+                                     columns)
+            self._found.extend(grid.GetTile(c, r).Detach()
+                               for c, r in zip(cols.tolist(), rows.tolist()))
+
+    def Result(self):
+        """Returns (xs, ys) sorted by row and then column, or (xs, ys, tiles)
+        if tiles were requested"""
+        if self._xs:
+            xs, ys = np.concatenate(self._xs), np.concatenate(self._ys)
+        else:
+            xs, ys = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        order = np.lexsort((xs, ys))
+        xs, ys = xs[order], ys[order]
+        if self._tiles:
+            return xs, ys, [self._found[i] for i in order]
+        return xs, ys
+
+def MaskExtents(mask):
+    """Returns (tops, bottoms): the first and last True row of each column
+    of the boolean array @param mask of shape (ncols, height), or -1 for
+    columns without any"""
+    found = mask.any(axis=1)
+    tops = np.where(found, mask.argmax(axis=1), -1)
+    bottoms = np.where(found, mask.shape[1] - 1 - mask[:, ::-1].argmax(axis=1),
+                       -1)
+    return tops, bottoms
+
+class ColumnExtents(Consumer):
+    """Records the first and last row of each column where @param mask_fn,
+    called with a ColumnChunk, returns True; the input to
+    World.ExtentsToPolygons. Only rows ymin..ymax-1 are considered."""
+    def __init__(self, mask_fn, ymin=0, ymax=None):
+        self._mask_fn = mask_fn
+        self._ymin, self._ymax = ymin, ymax
+        self._x0 = None
+        self._tops, self._bottoms = [], []
+
+    def Feed(self, chunk):
+        if self._x0 is None:
+            self._x0 = chunk.X0
+        mask = self._mask_fn(chunk)[:, self._ymin:self._ymax]
+        tops, bottoms = MaskExtents(mask)
+        self._tops.append(np.where(tops >= 0, tops + self._ymin, -1))
+        self._bottoms.append(np.where(bottoms >= 0, bottoms + self._ymin, -1))
+
+    def Any(self):
+        "Returns True if any column had a match"
+        return any((t >= 0).any() for t in self._tops)
+
+    def Result(self):
+        """Returns a list of (x, top, bottom) per column; top and bottom are
+        None for columns without a match"""
+        if not self._tops:
+            return []
+        tops = np.concatenate(self._tops).tolist()
+        bottoms = np.concatenate(self._bottoms).tolist()
+        return [(x, t, b) if t >= 0 else (x, None, None)
+                for x, t, b in zip(xrange(self._x0, self._x0 + len(tops)),
+                                   tops, bottoms)]
+
+class BiomePoints(Consumer):
+    """Collects the tiles contributing to each of @param zones
+    (World.BiomeDefinition objects), the input to World.GetBiomeMask"""
+    def __init__(self, zones):
+        self._weights = [zone.Weights() for zone in zones]
+        self._points = [[] for zone in zones]
+
+    def Feed(self, chunk):
+        types = chunk.Columns['Type']
+        active = chunk.Active()
+        for weights, points in zip(self._weights, self._points):
+            values = np.where(active, weights[types], 0)
+            xs, ys = np.nonzero(values)
+            if len(xs) > 0:
+                points.append((xs + chunk.X0, ys, values[xs, ys]))
+
+    def Result(self):
+        """Returns a list of (xs, ys, values) arrays per zone: the position
+        and value of every tile worth something to the zone"""
+        result = []
+        for points in self._points:
+            if points:
+                result.append(tuple(np.concatenate(p) for p in zip(*points)))
+            else:
+                empty = np.zeros(0, dtype=np.int64)
+                result.append((empty, empty, np.zeros(0, dtype=np.int32)))
+        return result
+
+class Image(Consumer):
+    "Renders the world with a MapRender.MapRenderer"
+    def __init__(self, renderer):
+        self._renderer = renderer
+        self._image = None
+
+    def Begin(self, world):
+        self._image = np.zeros((world.Height(), world.Width(), 4),
+                               dtype=np.uint8)
+
+    def Feed(self, chunk):
+        colors = self._renderer.RenderColumns(chunk.X0, chunk.Columns,
+                                              active=chunk.Active())
+        self._image[:, chunk.X0:chunk.X0+chunk.NumColumns()] = \
+                colors.transpose(1, 0, 2)
+
+    def Result(self):
+        "Returns the uint8[height, width, 4] image"
+        return self._image
+
+class ColumnPass(object):
+    """
+    Runs any number of consumers over a single pass of a world's columns
+
+    ColumnPass.__init__ parameters:
+        world           World to scan (may be lazily loaded)
+        chunk_columns   number of columns per ColumnChunk
+    """
+    def __init__(self, world, chunk_columns=CHUNK_COLUMNS):
+        self._world = world
+        self._chunk_columns = chunk_columns
+        self._consumers = []
+
+    def Add(self, consumer):
+        "Registers @param consumer and returns it"
+        self._consumers.append(consumer)
+        return consumer
+
+    def Empty(self):
+        return len(self._consumers) == 0
+
+    def Run(self, progress=None, xmin=0, xmax=None):
+        """Streams the world's columns xmin..xmax-1 (default: all of them)
+        once through every consumer"""
+        if self.Empty():
+            return
+        for consumer in self._consumers:
+            consumer.Begin(self._world)
+        blocks = self._world.StreamColumnBlocks(self._chunk_columns, xmin,
+                                                xmax, progress=progress)
+        for x0, columns in blocks:
+            chunk = ColumnChunk(x0, columns)
+            for consumer in self._consumers:
+                consumer.Feed(chunk)
+        for consumer in self._consumers:
+            consumer.Finish()
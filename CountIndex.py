@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+
+"""
+Constant-time counts of tile types within rectangles
+
+A CountIndex answers "how many tiles of type T lie in this rectangle"
+without scanning the tiles. It is built in one pass over the world (see
+ColumnPass) and keeps, for every indexed type:
+
+    1) a summed-area table of the type's counts per BLOCKxBLOCK block,
+       which answers the block-aligned interior of a rectangle with four
+       lookups, and
+    2) the positions of the type's tiles, sorted by column and by row,
+       which answer the unaligned strips around the interior (less than
+       BLOCK columns or rows each) with binary searches.
+
+So a query costs O(BLOCK log n), whatever the size of the rectangle.
+Only active tiles are counted, like World.GetTileCounts.
+
+Usage:
+    index = CountIndex.CountIndex.ForWorld(world, [IDs.Tile.Hellstone])
+    index.Count(IDs.Tile.Hellstone, 1000, rock, 1500, world.Height())
+"""
+
+import numpy as np
+
+import ColumnPass
+
+# Default block size, in tiles
+DEFAULT_BLOCK = 64
+
+class CountIndex(object):
+    """
+    Per-type tile counts over rectangles of a world
+
+    CountIndex.__init__ parameters:
+        width, height   size of the world
+        block           block size of the summed-area tables
+        types           int array of the indexed tile types
+        tables          int32[ntypes, nbx+1, nby+1] block summed-area tables
+        offsets         int64[ntypes+1]; the tiles of types[i] are at
+                        offsets[i]:offsets[i+1] of cols and rows
+        cols            x*height+y of each tile, sorted per type
+        rows            y*width+x of each tile, sorted per type
+        complete        True if types are all the types present, so that
+                        any other type has no tiles
+    """
+    def __init__(self, width, height, block, types, tables, offsets, cols,
+                 rows, complete=False):
+        self._width = width
+        self._height = height
+        self._block = block
+        self._types = types
+        self._slots = dict((t, i) for i, t in enumerate(types.tolist()))
+        self._tables = tables
+        self._offsets = offsets
+        self._cols = cols
+        self._rows = rows
+        self._complete = complete
+
+    @staticmethod
+    def ForWorld(world, types=None, block=DEFAULT_BLOCK, progress=None):
+        """Builds the index of @param world for the tile types @param types
+        (default: every type present in the world)"""
+        plan = ColumnPass.ColumnPass(world)
+        builder = plan.Add(Builder(types, block))
+        plan.Run(progress=progress)
+        return builder.Result()
+
+    def Types(self):
+        "Returns the list of indexed tile types"
+        return self._types.tolist()
+
+    def HasType(self, tileid):
+        "Returns True if Count can answer for @param tileid"
+        return self._complete or tileid in self._slots
+
+    def Count(self, tileid, x0, y0, x1, y1):
+        """Returns the number of active tiles of type @param tileid with
+        x0 <= x < x1 and y0 <= y < y1 (clipped to the world). Raises
+        ValueError if @param tileid is not indexed."""
+        slot = self._slots.get(tileid)
+        if slot is None:
+            if self._complete:
+                return 0
+            raise ValueError("Tile type %r is not indexed" % (tileid,))
+        x0, x1 = max(int(x0), 0), min(int(x1), self._width)
+        y0, y1 = max(int(y0), 0), min(int(y1), self._height)
+        if x0 >= x1 or y0 >= y1:
+            return 0
+        b = self._block
+        bx0, bx1 = -(-x0 // b), x1 // b
+        by0, by1 = -(-y0 // b), y1 // b
+        start, end = self._offsets[slot], self._offsets[slot+1]
+        cols = self._cols[start:end]
+        rows = self._rows[start:end]
+        if bx0 >= bx1:
+            return _count_lines(cols, self._height, x0, x1, y0, y1)
+        if by0 >= by1:
+            return _count_lines(rows, self._width, y0, y1, x0, x1)
+        table = self._tables[slot]
+        total = int(table[bx1, by1]) - int(table[bx0, by1]) - \
+                int(table[bx1, by0]) + int(table[bx0, by0])
+        # left and right strips span every row; top and bottom strips only
+        # the columns of the interior
+        total += _count_lines(cols, self._height, x0, bx0 * b, y0, y1)
+        total += _count_lines(cols, self._height, bx1 * b, x1, y0, y1)
+        total += _count_lines(rows, self._width, y0, by0 * b, bx0 * b,
+                              bx1 * b)
+        total += _count_lines(rows, self._width, by1 * b, y1, bx0 * b,
+                              bx1 * b)
+        return total
+
+def _count_lines(keys, stride, a0, a1, b0, b1):
+    """Counts the @param keys (a*stride+b, sorted) with a0 <= a < a1 and
+    b0 <= b < b1"""
+    if a0 >= a1 or len(keys) == 0:
+        return 0
+    # keep the queries in the keys' dtype so searchsorted does not copy them
+    lines = np.arange(a0, a1, dtype=keys.dtype) * stride
+    return int((np.searchsorted(keys, lines + b1) -
+                np.searchsorted(keys, lines + b0)).sum())
+
+class Builder(ColumnPass.Consumer):
+    """Builds a CountIndex for the tile types @param types (default: all)
+    with blocks of @param block tiles"""
+    def __init__(self, types=None, block=DEFAULT_BLOCK):
+        self._types = None if types is None else \
+                np.unique(np.asarray(types, dtype=np.int64))
+        self._block = block
+        self._found = []
+
+    def Begin(self, world):
+        self._width, self._height = world.Width(), world.Height()
+
+    def Feed(self, chunk):
+        xs, ys = np.nonzero(chunk.Active())
+        types = chunk.Columns['Type'][xs, ys]
+        if self._types is not None:
+            keep = np.in1d(types, self._types)
+            xs, ys, types = xs[keep], ys[keep], types[keep]
+        self._found.append((types, (xs + chunk.X0).astype(np.int32),
+                            ys.astype(np.int32)))
+
+    def Result(self):
+        "Returns the CountIndex"
+        width, height, b = self._width, self._height, self._block
+        dtype = np.int32 if width * height < 2**31 else np.int64
+        if self._found:
+            types, xs, ys = (np.concatenate(a) for a in zip(*self._found))
+        else:
+            types = xs = ys = np.zeros(0, dtype=np.int32)
+        xs, ys = xs.astype(dtype), ys.astype(dtype)
+        # chunks arrive in column order, so a stable sort by type leaves
+        # each type's tiles sorted by column
+        order = np.argsort(types, kind='mergesort')
+        types, xs, ys = types[order], xs[order], ys[order]
+        indexed = self._types if self._types is not None else np.unique(types)
+        offsets = np.append(np.searchsorted(types, indexed), len(types))
+        slots = np.repeat(np.arange(len(indexed)), np.diff(offsets))
+        cols = xs * height + ys
+        rows = ys * width + xs
+        rows = rows[np.lexsort((rows, slots))]
+        # per-type block counts, then their summed-area tables
+        nbx, nby = -(-width // b), -(-height // b)
+        counts = np.bincount((slots * nbx + xs // b) * nby + ys // b,
+                             minlength=len(indexed) * nbx * nby)
+        tables = np.zeros((len(indexed), nbx + 1, nby + 1), dtype=np.int32)
+        tables[:, 1:, 1:] = counts.reshape(len(indexed), nbx, nby) \
+                                  .cumsum(axis=1).cumsum(axis=2)
+        return CountIndex(width, height, b, np.asarray(indexed, np.int64),
+                          tables, offsets, cols, rows,
+                          complete=self._types is None)
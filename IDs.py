@@ -52,6 +52,10 @@ Sets            |   Tile set classification associations
 
 Note:
 * The "Prefixes" dictionary has duplicates. These duplicates are in-game.
+* All of the above but Frames are defined in IDTables.py, and compiled into
+  IDTables.marshal the first time IDs is imported after IDTables.py changes.
+  Each table is unmarshalled from there the first time it is used, so that
+  importing IDs stays cheap.
 
 There are three lookup classes for a more Pythonic-feeling lookup:
 Class   |   Description
@@ -86,11 +90,16 @@ Tile, U, and V triplet to a specific item ID.
 
 """
 
+import marshal
 import os
 import struct
+import sys
+import types
+
+import AtomicFile
 
 # NOTE: If any more tables are added (or pseduo-enumeration objects),
-# do not forget to add them to __all__!
+# do not forget to add them to __all__ (and tables in IDTables.py to TABLES)!
 
 """
 TerrariaIDs <-> Names lookup module
@@ -110,24 +119,127 @@ See :help c_^r
 INVALID = -1
 FRAME_SIZE = 18
 
-def _SwapKeysAndValues(d):
-    result = dict((v,k) for k,v in d.iteritems())
-    if len(result) != len(d):
-        raise ValueError("lost %d items in conversion!" % (len(d) - len(result),))
-    return result
-
-def _MakeIDNameLookup(d):
-    return _SwapKeysAndValues(d), d
-
-def _MakeNamesClass(table):
-    class Lookup(object):
-        def __init__(self, t):
-            self._table = t
+# The tables below live in IDTables.py, compiled into CACHE_PATH
+TABLES = ('AnimationID', 'BannerToNPC', 'BuffID', 'Buffs', 'ChainID',
+          'DustID', 'ExtrasID', 'GlowMaskID', 'GoreID', 'InvasionID',
+          'ItemID', 'Items', 'MessageID', 'NPCID', 'NPCToBanner', 'NPCs',
+          'PlayerTextureID', 'PlayerVariantID', 'Prefixes', 'ProjectileID',
+          'Projectiles', 'Sets', 'StatusID', 'TileID', 'Tiles', 'WallID',
+          'Walls')
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(_PACKAGE_DIR, "IDTables.py")
+CACHE_PATH = os.path.join(_PACKAGE_DIR, "IDTables.marshal")
+
+# Bump when the cache layout changes
+CACHE_VERSION = 1
+
+def _SourceKey():
+    """Returns the tuple identifying the IDTables.py a cache was compiled
+    from: the cache and marshal versions, then the file's size and
+    modification time"""
+    stat = os.stat(SOURCE_PATH)
+    return (CACHE_VERSION, marshal.version, stat.st_size,
+            int(stat.st_mtime))
+
+def _CompileTables(path=CACHE_PATH):
+    """Imports IDTables and writes its tables to @param path. Returns the
+    tables, by name.
+
+    The cache is a struct-packed header length, then a marshalled header of
+    (source key, {name: (offset, length)}), then each table marshalled on
+    its own so that it can be loaded without the others."""
+    key = _SourceKey()
+    import IDTables
+    tables = dict((name, getattr(IDTables, name)) for name in TABLES)
+    blobs, index, offset = [], {}, 0
+    for name in TABLES:
+        blobs.append(marshal.dumps(tables[name]))
+        index[name] = (offset, len(blobs[-1]))
+        offset += len(blobs[-1])
+    header = marshal.dumps((key, index))
+    try:
+        with AtomicFile.AtomicWrite(path) as fobj:
+            fobj.write(struct.pack("<I", len(header)))
+            fobj.write(header)
+            fobj.write("".join(blobs))
+    except (IOError, OSError):
+        # read-only installs just import IDTables every time
+        pass
+    return tables
+
+class _TableCache(object):
+    """
+    The tables of IDTables.py, loaded one at a time on first access
+
+    Each table is an attribute, unmarshalled from the cache at @param path
+    when first used. If the cache is missing or older than IDTables.py, it is
+    compiled again (which imports IDTables and so builds every table).
+    """
+    def __init__(self, path=CACHE_PATH):
+        self._path = path
+        self._data = None
+        self._index = None
+        self._tables = None
+
+    def _Open(self):
+        "Reads the cache index, compiling the cache if it is not current"
+        try:
+            with open(self._path, 'rb') as fobj:
+                data = fobj.read()
+            size = struct.calcsize("<I")
+            hlen = struct.unpack("<I", data[:size])[0]
+            key, index = marshal.loads(data[size:size+hlen])
+            if key == _SourceKey():
+                self._data = buffer(data, size + hlen)
+                self._index = index
+                return
+        except (IOError, OSError, EOFError, ValueError, TypeError,
+                struct.error):
+            pass
+        self._tables = _CompileTables(self._path)
+
+    def Load(self, name):
+        "Returns the table @param name, unmarshalling it if needed"
+        if self._index is None and self._tables is None:
+            self._Open()
+        if self._tables is not None:
+            return self._tables[name]
+        offset, length = self._index[name]
+        return marshal.loads(self._data[offset:offset+length])
+
+    def __getattr__(self, name):
+        if name not in TABLES:
+            raise AttributeError(name)
+        table = self.Load(name)
+        setattr(self, name, table)
+        return table
+
+_tables = _TableCache()
+
+class _Names(object):
+    """
+    Attribute access to the names -> IDs table @param table, e.g. Tile.Stone
+
+    The table is loaded on first access. Every name then becomes an instance
+    attribute, so later lookups do not go through __getattr__.
+    """
+    def __init__(self, table):
+        self._name = table
+        self._table = None
+
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        if self._table is None:
+            self._table = getattr(_tables, self._name)
             for k,v in self._table.iteritems():
                 setattr(self, k, v)
-        def __getattr__(self, attr):
-            return self._table[attr]
-    return Lookup(table)
+        return self._table[attr]
+
+Item = _Names('Items')
+Tile = _Names('Tiles')
+Wall = _Names('Walls')
 
 Frames = {
     'ExposedGems': {
@@ -244,6 +356,10 @@ Frames = {
         'Key': 'Width',
         'Entries': [583, 584, 585]
     },
+    'Books': {
+        'Width': FRAME_SIZE,
+        'WaterBolt': 5
+    },
     'JunglePlants': {},
     'JunglePlants2': {},
     'MushroomPlants': {},
@@ -251,7323 +367,9 @@ Frames = {
     # Herbs
 }   # Frames
 
-Prefixes = {
-    0: '',
-    1: "Large",
-    2: "Massive",
-    3: "Dangerous",
-    4: "Savage",
-    5: "Sharp",
-    6: "Pointy",
-    7: "Tiny",
-    8: "Terrible",
-    9: "Small",
-    10: "Dull",
-    11: "Unhappy",
-    12: "Bulky",
-    13: "Shameful",
-    14: "Heavy",
-    15: "Light",
-    16: "Sighted",
-    17: "Rapid",
-    18: "Hasty",
-    19: "Intimidating",
-    20: "Deadly",
-    21: "Staunch",
-    22: "Awful",
-    23: "Lethargic",
-    24: "Awkward",
-    25: "Powerful",
-    58: "Frenzying",
-    26: "Mystic",
-    27: "Adept",
-    28: "Masterful",
-    29: "Inept",
-    30: "Ignorant",
-    31: "Deranged",
-    32: "Intense",
-    33: "Taboo",
-    34: "Celestial",
-    35: "Furious",
-    52: "Manic",
-    36: "Keen",
-    37: "Superior",
-    38: "Forceful",
-    53: "Hurtful",
-    54: "Strong",
-    55: "Unpleasant",
-    39: "Broken",
-    40: "Damaged",
-    56: "Weak",
-    41: "Shoddy",
-    57: "Ruthless",
-    42: "Quick",
-    43: "Deadly",
-    44: "Agile",
-    45: "Nimble",
-    46: "Murderous",
-    47: "Slow",
-    48: "Sluggish",
-    49: "Lazy",
-    50: "Annoying",
-    51: "Nasty",
-    59: "Godly",
-    60: "Demonic",
-    61: "Zealous",
-    62: "Hard",
-    63: "Guarding",
-    64: "Armored",
-    65: "Warding",
-    66: "Arcane",
-    67: "Precise",
-    68: "Lucky",
-    69: "Jagged",
-    70: "Spiked",
-    71: "Angry",
-    72: "Menacing",
-    73: "Brisk",
-    74: "Fleeting",
-    75: "Hasty",
-    76: "Quick",
-    77: "Wild",
-    78: "Rash",
-    79: "Intrepid",
-    80: "Violent",
-    81: "Legendary",
-    82: "Unreal",
-    83: "Mythical"
-}   # Prefixes
-
-AnimationID = _SwapKeysAndValues({
-    "MushroomStatueTurningOn": 0,
-    "MushroomStatueTurningOff": 1,
-})  # AnimationID
-
-BuffID, Buffs = _MakeIDNameLookup({
-    "ObsidianSkin": 1,
-    "Regeneration": 2,
-    "Swiftness": 3,
-    "Gills": 4,
-    "Ironskin": 5,
-    "ManaRegeneration": 6,
-    "MagicPower": 7,
-    "Featherfall": 8,
-    "Spelunker": 9,
-    "Invisibility": 10,
-    "Shine": 11,
-    "NightOwl": 12,
-    "Battle": 13,
-    "Thorns": 14,
-    "WaterWalking": 15,
-    "Archery": 16,
-    "Hunter": 17,
-    "Gravitation": 18,
-    "ShadowOrb": 19,
-    "Poisoned": 20,
-    "PotionSickness": 21,
-    "Darkness": 22,
-    "Cursed": 23,
-    "OnFire": 24,
-    "Tipsy": 25,
-    "WellFed": 26,
-    "FairyBlue": 27,
-    "Werewolf": 28,
-    "Clairvoyance": 29,
-    "Bleeding": 30,
-    "Confused": 31,
-    "Slow": 32,
-    "Weak": 33,
-    "Merfolk": 34,
-    "Silenced": 35,
-    "BrokenArmor": 36,
-    "Horrified": 37,
-    "TheTongue": 38,
-    "CursedInferno": 39,
-    "PetBunny": 40,
-    "BabyPenguin": 41,
-    "PetTurtle": 42,
-    "PaladinsShield": 43,
-    "Frostburn": 44,
-    "BabyEater": 45,
-    "Chilled": 46,
-    "Frozen": 47,
-    "Honey": 48,
-    "Pygmies": 49,
-    "BabySkeletronHead": 50,
-    "BabyHornet": 51,
-    "TikiSpirit": 52,
-    "PetLizard": 53,
-    "PetParrot": 54,
-    "BabyTruffle": 55,
-    "PetSapling": 56,
-    "Wisp": 57,
-    "RapidHealing": 58,
-    "ShadowDodge": 59,
-    "LeafCrystal": 60,
-    "BabyDinosaur": 61,
-    "IceBarrier": 62,
-    "Panic": 63,
-    "BabySlime": 64,
-    "EyeballSpring": 65,
-    "BabySnowman": 66,
-    "Burning": 67,
-    "Suffocation": 68,
-    "Ichor": 69,
-    "Venom": 70,
-    "WeaponImbueVenom": 71,
-    "Midas": 72,
-    "WeaponImbueCursedFlames": 73,
-    "WeaponImbueFire": 74,
-    "WeaponImbueGold": 75,
-    "WeaponImbueIchor": 76,
-    "WeaponImbueNanites": 77,
-    "WeaponImbueConfetti": 78,
-    "WeaponImbuePoison": 79,
-    "Blackout": 80,
-    "PetSpider": 81,
-    "Squashling": 82,
-    "Ravens": 83,
-    "BlackCat": 84,
-    "CursedSapling": 85,
-    "WaterCandle": 86,
-    "Campfire": 87,
-    "ChaosState": 88,
-    "HeartLamp": 89,
-    "Rudolph": 90,
-    "Puppy": 91,
-    "BabyGrinch": 92,
-    "AmmoBox": 93,
-    "ManaSickness": 94,
-    "BeetleEndurance1": 95,
-    "BeetleEndurance2": 96,
-    "BeetleEndurance3": 97,
-    "BeetleMight1": 98,
-    "BeetleMight2": 99,
-    "BeetleMight3": 100,
-    "FairyRed": 101,
-    "FairyGreen": 102,
-    "Wet": 103,
-    "Mining": 104,
-    "Heartreach": 105,
-    "Calm": 106,
-    "Builder": 107,
-    "Titan": 108,
-    "Flipper": 109,
-    "Summoning": 110,
-    "Dangersense": 111,
-    "AmmoReservation": 112,
-    "Lifeforce": 113,
-    "Endurance": 114,
-    "Rage": 115,
-    "Inferno": 116,
-    "Wrath": 117,
-    "MinecartLeft": 118,
-    "Lovestruck": 119,
-    "Stinky": 120,
-    "Fishing": 121,
-    "Sonar": 122,
-    "Crate": 123,
-    "Warmth": 124,
-    "HornetMinion": 125,
-    "ImpMinion": 126,
-    "BunnyMount": 128,
-    "PigronMount": 129,
-    "SlimeMount": 130,
-    "TurtleMount": 131,
-    "BeeMount": 132,
-    "SpiderMinion": 133,
-    "TwinEyesMinion": 134,
-    "PirateMinion": 135,
-    "MiniMinotaur": 136,
-    "Slimed": 137,
-    "MinecartRight": 138,
-    "SharknadoMinion": 139,
-    "UFOMinion": 140,
-    "UFOMount": 141,
-    "DrillMount": 142,
-    "ScutlixMount": 143,
-    "Electrified": 144,
-    "MoonLeech": 145,
-    "Sunflower": 146,
-    "MonsterBanner": 147,
-    "Rabies": 148,
-    "Webbed": 149,
-    "Bewitched": 150,
-    "SoulDrain": 151,
-    "MagicLantern": 152,
-    "ShadowFlame": 153,
-    "BabyFaceMonster": 154,
-    "CrimsonHeart": 155,
-    "Stoned": 156,
-    "PeaceCandle": 157,
-    "StarInBottle": 158,
-    "Sharpened": 159,
-    "Dazed": 160,
-    "DeadlySphere": 161,
-    "UnicornMount": 162,
-    "Obstructed": 163,
-    "VortexDebuff": 164,
-    "DryadsWard": 165,
-    "MinecartRightMech": 166,
-    "MinecartLeftMech": 167,
-    "CuteFishronMount": 168,
-    "BoneJavelin": 169,
-    "SolarShield1": 170,
-    "SolarShield2": 171,
-    "SolarShield3": 172,
-    "NebulaUpLife1": 173,
-    "NebulaUpLife2": 174,
-    "NebulaUpLife3": 175,
-    "NebulaUpMana1": 176,
-    "NebulaUpMana2": 177,
-    "NebulaUpMana3": 178,
-    "NebulaUpDmg1": 179,
-    "NebulaUpDmg2": 180,
-    "NebulaUpDmg3": 181,
-    "StardustMinion": 182,
-    "StardustMinionBleed": 183,
-    "MinecartLeftWood": 184,
-    "MinecartRightWood": 185,
-    "DryadsWardDebuff": 186,
-    "StardustGuardianMinion": 187,
-    "StardustDragonMinion": 188,
-    "Daybreak": 189,
-    "SuspiciousTentacle": 190,
-    "Count": 191,
-})  # BuffID, Buffs
-
-ChainID = _SwapKeysAndValues({
-    "TendonHook": 0,
-    "ThornHook": 1,
-    "IlluminantHook": 2,
-    "Wormhook": 3,
-    "SilkRope": 4,
-    "SilkRope2": 5,
-    "WebRope": 6,
-    "WebRope2": 7,
-    "LunarSolar": 8,
-    "LunarVortex": 9,
-    "LunarNebula": 10,
-    "LunarStardust": 11,
-    "LunarSolarGlow": 12,
-    "LunarVortexGlow": 13,
-    "LunarNebulaGlow": 14,
-    "LunarStardustGlow": 15,
-    "Count": 16,
-})  # ChainID
-
-DustID = _SwapKeysAndValues({
-    "Dirt": 0,
-    "Stone": 1,
-    "Grass": 2,
-    "GrassBlades": 3,
-    "Blood": 5,
-    "Fire": 6,
-    "Iron": 8,
-    "Copper": 9,
-    "Gold": 10,
-    "Silver": 11,
-    "Shadowflame": 27,
-    "Web": 30,
-    "Rainbow": 66,
-    "BlueCrystalShard": 68,
-    "PinkCrystalShard": 69,
-    "PurpleCrystalShard": 70,
-    "Ice": 80,
-    "Tin": 81,
-    "Lead": 82,
-    "Tungsten": 83,
-    "Platinum": 84,
-    "Electric": 226,
-    "GoldFlame": 228,
-    "Vortex": 229,
-    "Marble": 236,
-    "Mothron": 237,
-    "MothronEgg": 238,
-    "Silk": 239,
-    "Granite": 240,
-    "MarblePot": 241,
-    "PinkFlame": 242,
-    "PinkSlime": 243,
-    "CopperCoin": 244,
-    "SilverCoin": 245,
-    "GoldCoin": 246,
-    "PlatinumCoin": 247,
-    "EnchantedNightcrawler": 248,
-    "Grubby": 249,
-    "Sluggy": 250,
-    "Buggy": 251,
-    "CrystalPulse": 254,
-    "CrystalPulse2": 255,
-    "ToxicBubble": 256,
-    "BubbleBlock": 257,
-    "LavaMoss": 258,
-    "SolarFlare": 259,
-    "SparksMech": 260,
-    "AncientLight": 261,
-    "EmberBolt": 262,
-    "PortalBolt": 263,
-    "PortalBoltTrail": 264,
-    "LunarOre": 265,
-    "SomethingRed": 266,
-    "RainbowMk2": 267,
-    "Count": 268,
-})  # DustID
-
-ExtrasID = _SwapKeysAndValues({
-    "BrainScrambler": 0,
-    "Raygun": 1,
-    "LaserRuler": 2,
-    "AntiGravityHookChain": 3,
-    "SaucerDeathrayCap": 4,
-    "BGMartianUFOSmall": 5,
-    "BGMartianUFOBig": 6,
-    "EventIconSnowLegion": 7,
-    "EventIconFrostMoon": 8,
-    "EventIconGoblinArmy": 9,
-    "EventIconMartianMadness": 10,
-    "EventIconPirateInvasion": 11,
-    "EventIconPumpkinMoon": 12,
-    "MoonLordRibs": 13,
-    "MoonLordBackarm": 14,
-    "MoonLordForearm": 15,
-    "MoonLordCoreMoss": 16,
-    "MoonLordEyeWhiteHand": 17,
-    "MoonLordEyeWhiteHead": 18,
-    "MoonLordEye": 19,
-    "MartianProbeDiode": 20,
-    "PhantasmalDeathrayBody": 21,
-    "PhantasmalDeathrayEnd": 22,
-    "MoonLeechBody": 23,
-    "MoonLeechTail": 24,
-    "MoonLordMouth": 25,
-    "MoonLordHandMouth": 26,
-    "MartianProbeScanWave": 27,
-    "TEMPORARYChestOpen": 28,
-    "MoonLordEyeMouth": 29,
-    "CultistBossShadow": 30,
-    "WebbedFloor": 31,
-    "WebbedAir": 32,
-    "CultistLightingArc": 33,
-    "CultistRitual": 34,
-    "CultistIceshard": 35,
-    "StarWrath": 36,
-    "PlayerStoned": 37,
-    "BejeweledValkyrieWing": 38,
-    "KingSlimeCrown": 39,
-    "PirateShipFlag": 40,
-    "PirateShipOar": 41,
-    "PirateShipSail1": 42,
-    "PirateShipSail2": 43,
-    "PirateShipSail3": 44,
-    "PirateShipSail4": 45,
-    "StardustJellyfishSmall": 46,
-    "StardustTowerMark": 47,
-    "EmoteBubble": 48,
-    "ScreenObfuscation": 49,
-    "VortexBlack": 50,
-    "MagicAura": 51,
-    "GuideFrontal": 52,
-    "TravellingMerchantFrontal": 53,
-    "EquipIcons": 54,
-    "MeteorHeadFlame": 55,
-    "MartianWalkerCannon": 56,
-    "AncientLight": 57,
-    "DefenseShield": 58,
-    "PortalGateHalo": 59,
-    "PortalGateHalo2": 60,
-    "SolarBlaze": 61,
-    "SolarBlaze2": 62,
-    "SolarBlaze3": 63,
-    "NebulaArcanumItemHold": 64,
-    "PhantasmMuzzle": 65,
-    "SuspiciousTentacle": 66,
-    "Yoraiz0rDarkness": 67,
-    "LaserGrid2": 68,
-    "Count": 69,
-})  # ExtrasID
-
-GlowMaskID = _SwapKeysAndValues({
-    "None": 65535,
-    "UFOMinion": 0,
-    "VortexAxe": 1,
-    "VortexChainsawProjectile": 2,
-    "VortexDrillProjectile": 3,
-    "VortexHammer": 4,
-    "VortexPickaxe": 5,
-    "NebulaAxe": 6,
-    "NebulaChainsawProjectile": 7,
-    "NebulaDrillProjectile": 8,
-    "NebulaHammer": 9,
-    "NebulaPickaxe": 10,
-    "MartianOfficer": 11,
-    "NebulaArmorArm": 12,
-    "VortexArmorBody": 13,
-    "NebulaArmorBody": 14,
-    "VortexArmorHead": 15,
-    "NebulaArmorHead": 16,
-    "NebulaArmorLegs": 17,
-    "VortexArmorBodyFemale": 18,
-    "NebulaArmorBodyFemale": 19,
-    "VortexChainsawItem": 20,
-    "VortexDrillItem": 21,
-    "NebulaChainsawItem": 22,
-    "NebulaDrillItem": 23,
-    "BrainScrambler": 24,
-    "Electrified": 25,
-    "VortexItemHead": 26,
-    "VortexItemBody": 27,
-    "NebulaItemHead": 28,
-    "NebulaItemBody": 29,
-    "NebulaItemLegs": 30,
-    "MartianEngineer": 31,
-    "MartianTurret": 32,
-    "MartianDrone": 33,
-    "GigaZapper": 34,
-    "LaserMachinegun": 35,
-    "ElectrosphereLauncher": 36,
-    "ElectrosphereMissile": 37,
-    "Xenopopper": 38,
-    "LaserDrill": 39,
-    "LaserDrillTip": 40,
-    "MartianUniformArmorHead": 41,
-    "MartianUniformArmorBody": 42,
-    "MartianUniformArmorBodyFemale": 43,
-    "MartianUniformArmorArms": 44,
-    "MartianUnifromTorso": 45,
-    "MartianUniformHelmet": 46,
-    "LaserMachinegunItem": 47,
-    "MartianSaucer": 48,
-    "MartianSaucerCore": 49,
-    "MartianSaucerCannon": 50,
-    "MartianAstroClock": 51,
-    "MartianBathtub": 52,
-    "MartianBed": 53,
-    "MartianHoverChair": 54,
-    "MartianChandelier": 55,
-    "MartianChest": 56,
-    "MartianDoorClosed": 57,
-    "MartianDoorOpen": 58,
-    "MartianDresser": 59,
-    "MartianHolobookcase": 60,
-    "MartianHoverCandle": 61,
-    "MartianLamppost": 62,
-    "MartianLantern": 63,
-    "MartianPiano": 64,
-    "MartianPlatform": 65,
-    "MartianSofa": 66,
-    "MartianTable": 67,
-    "MartianTableLamp": 68,
-    "MartianWorkBench": 69,
-    "MartianAstroClockItem": 70,
-    "MartianBathtubItem": 71,
-    "MartianBedItem": 72,
-    "MartianHoverChairItem": 73,
-    "MartianChandelierItem": 74,
-    "MartianChestItem": 75,
-    "MartianDoorItem": 76,
-    "MartianDresserItem": 77,
-    "MartianHolobookcaseItem": 78,
-    "MartianHoverCandleItem": 79,
-    "MartianLamppostItem": 80,
-    "MartianLanternItem": 81,
-    "MartianPianoItem": 82,
-    "MartianPlatformItem": 83,
-    "MartianSofaItem": 84,
-    "MartianTableItem": 85,
-    "MartianTableLampItem": 86,
-    "MartianWorkBenchItem": 87,
-    "MartianSink": 88,
-    "MartianSinkItem": 89,
-    "BGMartianUFOSmall": 90,
-    "BGMartianUFOBig": 91,
-    "MothronWings": 92,
-    "MartianConduitPlatingItem": 93,
-    "MartianConduitPlatingTile": 94,
-    "MartianConduitWallItem": 95,
-    "HiTekSunglasses": 96,
-    "HiTekSunglassesItem": 97,
-    "MartianHairDye": 98,
-    "MartianArmorDye": 99,
-    "MartianProbe": 100,
-    "MartianProbeDiode": 101,
-    "ChargedBlasterCannon": 102,
-    "ChlorophyteDye": 103,
-    "PixieDye": 104,
-    "WispDye": 105,
-    "InfernalWispDye": 106,
-    "UnicornWispDye": 107,
-    "CultistTabletFront": 108,
-    "CultistTabletBack": 109,
-    "ShadowflameApparation": 110,
-    "MeteorBrick": 111,
-    "MeteorPlatform": 112,
-    "MeteorBathtub": 113,
-    "MeteorBed": 114,
-    "MeteorBookcase": 115,
-    "MeteorChair": 116,
-    "MeteorChest": 117,
-    "MeteorClock": 118,
-    "MeteorDoorOpen": 119,
-    "MeteorDresser": 120,
-    "MeteorPiano": 121,
-    "MeteorSink": 122,
-    "MeteorSofa": 123,
-    "MeteorTable": 124,
-    "MeteorWorkbench": 125,
-    "LavaMoss": 126,
-    "LongLavaMoss": 127,
-    "DeadlySphere": 128,
-    "LavaLamp": 129,
-    "LavaLampTile": 130,
-    "EnchantedNightcrawler": 131,
-    "LunarTowerStardust": 132,
-    "StardustWormBody": 133,
-    "StardustWormTail": 134,
-    "StardustWormHead": 135,
-    "StardustSoldier": 136,
-    "StardustSpiderSmall": 137,
-    "StardustSpiderBig": 138,
-    "StardustJellyfishBig": 139,
-    "StardustJellyfishSmall": 140,
-    "StardustCellBig": 141,
-    "StardustCellSmall": 142,
-    "LunarTowerNebula": 143,
-    "NebulaSoldier": 144,
-    "NebulaBeast": 145,
-    "NebulaHeadcrab": 146,
-    "NebulaBrain": 147,
-    "NebulaEye": 148,
-    "LunarTowerVortex": 149,
-    "VortexRifleman": 150,
-    "VortexSoldier": 151,
-    "VortexHornet": 152,
-    "VortexHornetQueen": 153,
-    "SolarSolenian": 154,
-    "SolarDrakoMire": 155,
-    "SolarDrakoMireRider": 156,
-    "SolarCrawltipedeHead": 157,
-    "SolarCrawltipedeBody": 158,
-    "SolarCrawltipedeTail": 159,
-    "SolarSroller": 160,
-    "SolarCorite": 161,
-    "LunarTowerSolar": 162,
-    "SolarSpearman": 163,
-    "MartianWalker": 164,
-    "MartianWalkerCannon": 165,
-    "Truffle": 166,
-    "Cyborg": 167,
-    "TruffleSpore": 168,
-    "DesertGhoulCorruption": 169,
-    "DesertGhoulCrimson": 170,
-    "DesertGhoulHallow": 171,
-    "DesertDjinn": 172,
-    "PortalGunProj": 173,
-    "StardustAxeItem": 174,
-    "StardustChainsawItem": 175,
-    "StardustDrillItem": 176,
-    "StardustHammerItem": 177,
-    "StardustPickaxeItem": 178,
-    "StardustChainsawProjectile": 179,
-    "StardustDrillProjectile": 180,
-    "WingsVortex": 181,
-    "WingsNebula": 182,
-    "WingsStardust": 183,
-    "ArmorStardustHead": 184,
-    "ArmorStardustBodyMale": 185,
-    "ArmorStardustBodyFemale": 186,
-    "ArmorStardustLegs": 187,
-    "ArmorStardustArm": 188,
-    "StardustCellMinion": 189,
-    "StardustCellMinionShot": 190,
-    "VortexBeaterItem": 191,
-    "VortexBeaterProj": 192,
-    "VortexBeaterRocket": 193,
-    "NebulaArcanumItem": 194,
-    "NebulaArcanumItemHold": 195,
-    "LunarHamaxeVortex": 196,
-    "LunarHamaxeNebula": 197,
-    "LunarHamaxeStardust": 198,
-    "VortexArmorLegs": 199,
-    "Phantasm": 200,
-    "LunarMonolith": 201,
-    "LunarCraftingStation": 202,
-    "LunarHookSolar": 203,
-    "LunarHookVortex": 204,
-    "LunarHookNebula": 205,
-    "LunarHookStardust": 206,
-    "NebulaBlaze": 207,
-    "JimsHead": 208,
-    "LokisHelm": 209,
-    "LokisBody": 210,
-    "LokisArm": 211,
-    "LokisLegs": 212,
-    "LokisWings": 213,
-    "Count": 214,
-})  # GlowMaskID
-
-GoreID = _SwapKeysAndValues({
-    "ChargedBlasterRing": 618,
-    "MoonLordHeart1": 619,
-    "MoonLordHeart2": 620,
-    "MoonLordHeart3": 621,
-    "MoonLordHeart4": 622,
-    "GoblinArcherHead": 623,
-    "GoblinArcherHand": 624,
-    "GoblinArcherLeg": 625,
-    "GoblinPeonHead": 626,
-    "GoblinPeonHand": 627,
-    "GoblinPeonLeg": 628,
-    "GoblinScoutHead": 629,
-    "GoblinScoutHand": 630,
-    "GoblinScoutLeg": 631,
-    "GoblinThiefHead": 632,
-    "GoblinThiefHand": 633,
-    "GoblinThiefLeg": 634,
-    "GoblinWarriorHead": 635,
-    "GoblinWarriorHand": 636,
-    "GoblinWarriorLeg": 637,
-    "SkeletonMerchantHead": 638,
-    "SkeletonMerchantBag": 639,
-    "SkeletonMerchantChunk1": 640,
-    "SkeletonMerchantChunk2": 641,
-    "SkeletonMerchantChunk3": 642,
-    "ButcherHead": 643,
-    "ButcherSaw": 644,
-    "ButcherArm": 645,
-    "ButcherLeg": 646,
-    "CreatureFromTheDeepHead": 647,
-    "CreatureFromTheDeepArm": 648,
-    "CreatureFromTheDeepLeg": 649,
-    "FritzHead": 650,
-    "FritzArm": 651,
-    "FritzLeg": 652,
-    "NailheadHead": 653,
-    "NailheadArm": 654,
-    "NailheadLeg": 655,
-    "PsychoHead": 656,
-    "PsychoArm": 657,
-    "PsychoLeg": 658,
-    "PsychoKnife": 659,
-    "DeadlySphere1": 660,
-    "DeadlySphere2": 661,
-    "DrManFlyHead": 662,
-    "DrManFlyArm": 663,
-    "DrManFlyLeg": 664,
-    "ThePossessedHead": 665,
-    "ThePossessedArm": 666,
-    "ThePossessedLeg": 667,
-    "CrimsonBunnyHead": 668,
-    "CrimsonBunnyLeg": 669,
-    "CrimsonGoldfishHead": 670,
-    "CrimsonGoldfishTail": 671,
-    "CrimsonPenguinBody": 672,
-    "CrimsonPenguinHead": 673,
-    "CrimsonPenguinLeg": 674,
-    "GoblinSummonerHead": 675,
-    "GoblinSummonerArm": 676,
-    "GoblinSummonerItem": 677,
-    "GoblinSummonerLeg": 678,
-    "ShadowflameApparation": 679,
-    "ShadowflameApparation2": 680,
-    "MothronSpawn1": 681,
-    "MothronSpawn2": 682,
-    "MothronSpawn3": 683,
-    "MothronEgg1": 684,
-    "MothronEgg2": 685,
-    "MothronEgg3": 686,
-    "Mothron1": 687,
-    "Mothron2": 688,
-    "Mothron3": 689,
-    "Mothron4": 690,
-    "Mothron5": 691,
-    "MedusaHead": 692,
-    "MedusaArm": 693,
-    "MedusaLeg": 694,
-    "GreekSkeletonHead": 695,
-    "GreekSkeletonArm": 696,
-    "GreekSkeletonLeg": 697,
-    "GreekPot1": 698,
-    "GreekPot2": 699,
-    "GreekPot3": 700,
-    "GreekPot4": 701,
-    "GreekPot5": 702,
-    "GreekPot6": 703,
-    "ToxicFlask": 704,
-    "ToxicFlask2": 705,
-    "WaterDrip": 706,
-    "WaterDripCorrupt": 707,
-    "WaterDripJungle": 708,
-    "WaterDripHallow": 709,
-    "WaterDripIce": 710,
-    "WaterDripDesert": 711,
-    "WaterDripUnderground": 712,
-    "WaterDripCavern": 713,
-    "WaterDripBlood": 714,
-    "WaterDripCrimson": 715,
-    "LavaDrip": 716,
-    "HoneyDrip": 717,
-    "GraniteGolemHead": 718,
-    "GraniteGolemBody": 719,
-    "GraniteGolemArm": 720,
-    "GraniteGolemLeg": 721,
-    "BloodZombieHead": 722,
-    "BloodZombieChunk": 723,
-    "BloodZombieChunk2": 724,
-    "DripplerChunk": 725,
-    "DripplerChunk2": 726,
-    "DripplerChunk3": 727,
-    "LunarTablet1": 728,
-    "LunarTablet2": 729,
-    "LunarTablet3": 730,
-    "LunarTablet4": 731,
-    "LunarTablet5": 732,
-    "LunarTablet6": 733,
-    "KingSlimeCrown": 734,
-    "CrawDadClaw": 735,
-    "CrawDadEye": 736,
-    "CrawDad2Claw": 737,
-    "CrawDad2Eye": 738,
-    "GiantShelly": 739,
-    "GiantShelly2": 740,
-    "SalamanderArm": 741,
-    "SalamanderHead": 750,
-    "SalamanderLeg": 759,
-    "TaxCollectorHead": 768,
-    "TaxCollectorArm": 769,
-    "TaxCollectorCane": 770,
-    "TaxCollectorLeg": 771,
-    "StardustSoldier1": 772,
-    "StardustSoldier2": 773,
-    "StardustSoldier3": 774,
-    "StardustSpider1": 775,
-    "StardustSpider2": 776,
-    "StardustSpider3": 777,
-    "StardustJellyfish1": 778,
-    "StardustJellyfish2": 779,
-    "StardustJellyfish3": 780,
-    "StardustJellyfish4": 781,
-    "NebulaBrain1": 782,
-    "NebulaBrain2": 783,
-    "NebulaBrain3": 784,
-    "NebulaHeadcrab1": 785,
-    "NebulaHeadcrab2": 786,
-    "NebulaHeadcrab3": 787,
-    "NebulaEye1": 788,
-    "NebulaEye2": 789,
-    "NebulaBeast1": 790,
-    "NebulaBeast2": 791,
-    "NebulaBeast3": 792,
-    "NebulaSoldier1": 793,
-    "NebulaSoldier2": 794,
-    "NebulaSoldier3": 795,
-    "VortexRifleman1": 796,
-    "VortexRifleman2": 797,
-    "VortexRifleman3": 798,
-    "VortexHornetQueen1": 799,
-    "VortexHornetQueen2": 800,
-    "VortexHornetQueen3": 801,
-    "VortexHornet1": 802,
-    "VortexHornet2": 803,
-    "VortexHornet3": 804,
-    "VortexHornet4": 805,
-    "VortexLarva1": 806,
-    "VortexLarve2": 807,
-    "VortexSoldier1": 808,
-    "VortexSoldier2": 809,
-    "VortexSoldier3": 810,
-    "WalkingAntlion1": 811,
-    "WalkingAntlion2": 812,
-    "WalkingAntlion3": 813,
-    "WalkingAntlion4": 814,
-    "FlyingAntlion1": 815,
-    "FlyingAntlion2": 816,
-    "FlyingAntlion3": 817,
-    "FlyingAntlion4": 818,
-    "DuneSplicerHead": 819,
-    "DuneSplicerBody": 820,
-    "DuneSplicerTail": 821,
-    "TombCrawlerHead": 822,
-    "TombCrawlerBody": 823,
-    "TombCrawlerTail": 824,
-    "ChimneySmoke1": 825,
-    "ChimneySmoke2": 826,
-    "ChimneySmoke3": 827,
-    "SolarWormHead": 828,
-    "SolarWormBody": 829,
-    "SolarWormTail": 830,
-    "SolarBeast1": 831,
-    "SolarBeast2": 832,
-    "SolarBeast3": 833,
-    "SolarBeast4": 834,
-    "SolarSpearman1": 835,
-    "SolarSpearman2": 836,
-    "SolarRoller1": 837,
-    "SolarRoller2": 838,
-    "SolarRoller3": 839,
-    "SolarRoller4": 840,
-    "SolarMeteor1": 841,
-    "SolarMeteor2": 842,
-    "SolarMeteor3": 843,
-    "SolarSoldier1": 844,
-    "SolarSoldier2": 845,
-    "SolarSoldier3": 846,
-    "SolarSoldier4": 847,
-    "MartianWalker1": 848,
-    "MartianWalker2": 849,
-    "MartianWalker3": 850,
-    "MartianWalker4": 851,
-    "MartianWalker5": 852,
-    "PirateShip1": 853,
-    "PirateShip2": 854,
-    "PirateShip3": 855,
-    "PirateShip4": 856,
-    "PirateShip5": 857,
-    "PirateShip6": 858,
-    "PirateShip7": 859,
-    "PirateShip8": 860,
-    "PirateShip9": 861,
-    "PirateShip10": 862,
-    "DesertGhoul1": 863,
-    "DesertGhoul2": 864,
-    "DesertGhoul3": 865,
-    "DesertGhoul4": 866,
-    "DesertGhoulCorruption1": 867,
-    "DesertGhoulCorruption2": 868,
-    "DesertGhoulCorruption3": 869,
-    "DesertGhoulCorruption4": 870,
-    "DesertGhoulCrimson1": 871,
-    "DesertGhoulCrimson2": 872,
-    "DesertGhoulCrimson3": 873,
-    "DesertGhoulCrimson4": 874,
-    "DesertLamia1": 875,
-    "DesertLamia2": 876,
-    "DesertLamia3": 877,
-    "DesertLamia4": 878,
-    "DesertGhoulHallow1": 879,
-    "DesertGhoulHallow2": 880,
-    "DesertGhoulHallow3": 881,
-    "DesertGhoulHallow4": 882,
-    "DesertScorpion1": 883,
-    "DesertScorpion2": 884,
-    "DesertScorpion3": 885,
-    "DesertScorpion4": 886,
-    "DesertScorpion5": 887,
-    "DesertBeast1": 888,
-    "DesertBeast2": 889,
-    "DesertBeast3": 890,
-    "DesertBeast4": 891,
-    "PirateShip11": 892,
-    "PirateShip12": 893,
-    "DemonTaxCollectorHead": 894,
-    "DemonTaxCollectorArm": 895,
-    "DemonTaxCollectorLeg": 896,
-    "SquirrelRed": 897,
-    "MartianProbe1": 898,
-    "MartianProbe2": 899,
-    "Cultist1": 900,
-    "Cultist2": 901,
-    "CultistBoss1": 902,
-    "CultistBoss2": 903,
-    "GigaZapperHead": 904,
-    "GigaZapperHand": 905,
-    "GigaZapperLeg": 906,
-    "Count": 907,
-})  # GoreID
-
-InvasionID = _SwapKeysAndValues({
-    "None": 0,
-    "GoblinArmy": 1,
-    "SnowLegion": 2,
-    "PirateInvasion": 3,
-    "MartianMadness": 4,
-    "Count": 5,
-})  # InvasionID
-
-ItemID, Items = _MakeIDNameLookup({
-    "None": 0,
-    "IronPickaxe": 1,
-    "DirtBlock": 2,
-    "StoneBlock": 3,
-    "IronBroadsword": 4,
-    "Mushroom": 5,
-    "IronShortsword": 6,
-    "IronHammer": 7,
-    "Torch": 8,
-    "Wood": 9,
-    "IronAxe": 10,
-    "IronOre": 11,
-    "CopperOre": 12,
-    "GoldOre": 13,
-    "SilverOre": 14,
-    "CopperWatch": 15,
-    "SilverWatch": 16,
-    "GoldWatch": 17,
-    "DepthMeter": 18,
-    "GoldBar": 19,
-    "CopperBar": 20,
-    "SilverBar": 21,
-    "IronBar": 22,
-    "Gel": 23,
-    "WoodenSword": 24,
-    "WoodenDoor": 25,
-    "StoneWall": 26,
-    "Acorn": 27,
-    "LesserHealingPotion": 28,
-    "LifeCrystal": 29,
-    "DirtWall": 30,
-    "Bottle": 31,
-    "WoodenTable": 32,
-    "Furnace": 33,
-    "WoodenChair": 34,
-    "IronAnvil": 35,
-    "WorkBench": 36,
-    "Goggles": 37,
-    "Lens": 38,
-    "WoodenBow": 39,
-    "WoodenArrow": 40,
-    "FlamingArrow": 41,
-    "Shuriken": 42,
-    "SuspiciousLookingEye": 43,
-    "DemonBow": 44,
-    "WarAxeoftheNight": 45,
-    "LightsBane": 46,
-    "UnholyArrow": 47,
-    "Chest": 48,
-    "BandofRegeneration": 49,
-    "MagicMirror": 50,
-    "JestersArrow": 51,
-    "AngelStatue": 52,
-    "CloudinaBottle": 53,
-    "HermesBoots": 54,
-    "EnchantedBoomerang": 55,
-    "DemoniteOre": 56,
-    "DemoniteBar": 57,
-    "Heart": 58,
-    "CorruptSeeds": 59,
-    "VileMushroom": 60,
-    "EbonstoneBlock": 61,
-    "GrassSeeds": 62,
-    "Sunflower": 63,
-    "Vilethorn": 64,
-    "Starfury": 65,
-    "PurificationPowder": 66,
-    "VilePowder": 67,
-    "RottenChunk": 68,
-    "WormTooth": 69,
-    "WormFood": 70,
-    "CopperCoin": 71,
-    "SilverCoin": 72,
-    "GoldCoin": 73,
-    "PlatinumCoin": 74,
-    "FallenStar": 75,
-    "CopperGreaves": 76,
-    "IronGreaves": 77,
-    "SilverGreaves": 78,
-    "GoldGreaves": 79,
-    "CopperChainmail": 80,
-    "IronChainmail": 81,
-    "SilverChainmail": 82,
-    "GoldChainmail": 83,
-    "GrapplingHook": 84,
-    "Chain": 85,
-    "ShadowScale": 86,
-    "PiggyBank": 87,
-    "MiningHelmet": 88,
-    "CopperHelmet": 89,
-    "IronHelmet": 90,
-    "SilverHelmet": 91,
-    "GoldHelmet": 92,
-    "WoodWall": 93,
-    "WoodPlatform": 94,
-    "FlintlockPistol": 95,
-    "Musket": 96,
-    "MusketBall": 97,
-    "Minishark": 98,
-    "IronBow": 99,
-    "ShadowGreaves": 100,
-    "ShadowScalemail": 101,
-    "ShadowHelmet": 102,
-    "NightmarePickaxe": 103,
-    "TheBreaker": 104,
-    "Candle": 105,
-    "CopperChandelier": 106,
-    "SilverChandelier": 107,
-    "GoldChandelier": 108,
-    "ManaCrystal": 109,
-    "LesserManaPotion": 110,
-    "BandofStarpower": 111,
-    "FlowerofFire": 112,
-    "MagicMissile": 113,
-    "DirtRod": 114,
-    "ShadowOrb": 115,
-    "Meteorite": 116,
-    "MeteoriteBar": 117,
-    "Hook": 118,
-    "Flamarang": 119,
-    "MoltenFury": 120,
-    "FieryGreatsword": 121,
-    "MoltenPickaxe": 122,
-    "MeteorHelmet": 123,
-    "MeteorSuit": 124,
-    "MeteorLeggings": 125,
-    "BottledWater": 126,
-    "SpaceGun": 127,
-    "RocketBoots": 128,
-    "GrayBrick": 129,
-    "GrayBrickWall": 130,
-    "RedBrick": 131,
-    "RedBrickWall": 132,
-    "ClayBlock": 133,
-    "BlueBrick": 134,
-    "BlueBrickWall": 135,
-    "ChainLantern": 136,
-    "GreenBrick": 137,
-    "GreenBrickWall": 138,
-    "PinkBrick": 139,
-    "PinkBrickWall": 140,
-    "GoldBrick": 141,
-    "GoldBrickWall": 142,
-    "SilverBrick": 143,
-    "SilverBrickWall": 144,
-    "CopperBrick": 145,
-    "CopperBrickWall": 146,
-    "Spike": 147,
-    "WaterCandle": 148,
-    "Book": 149,
-    "Cobweb": 150,
-    "NecroHelmet": 151,
-    "NecroBreastplate": 152,
-    "NecroGreaves": 153,
-    "Bone": 154,
-    "Muramasa": 155,
-    "CobaltShield": 156,
-    "AquaScepter": 157,
-    "LuckyHorseshoe": 158,
-    "ShinyRedBalloon": 159,
-    "Harpoon": 160,
-    "SpikyBall": 161,
-    "BallOHurt": 162,
-    "BlueMoon": 163,
-    "Handgun": 164,
-    "WaterBolt": 165,
-    "Bomb": 166,
-    "Dynamite": 167,
-    "Grenade": 168,
-    "SandBlock": 169,
-    "Glass": 170,
-    "Sign": 171,
-    "AshBlock": 172,
-    "Obsidian": 173,
-    "Hellstone": 174,
-    "HellstoneBar": 175,
-    "MudBlock": 176,
-    "Sapphire": 177,
-    "Ruby": 178,
-    "Emerald": 179,
-    "Topaz": 180,
-    "Amethyst": 181,
-    "Diamond": 182,
-    "GlowingMushroom": 183,
-    "Star": 184,
-    "IvyWhip": 185,
-    "BreathingReed": 186,
-    "Flipper": 187,
-    "HealingPotion": 188,
-    "ManaPotion": 189,
-    "BladeofGrass": 190,
-    "ThornChakram": 191,
-    "ObsidianBrick": 192,
-    "ObsidianSkull": 193,
-    "MushroomGrassSeeds": 194,
-    "JungleGrassSeeds": 195,
-    "WoodenHammer": 196,
-    "StarCannon": 197,
-    "BluePhaseblade": 198,
-    "RedPhaseblade": 199,
-    "GreenPhaseblade": 200,
-    "PurplePhaseblade": 201,
-    "WhitePhaseblade": 202,
-    "YellowPhaseblade": 203,
-    "MeteorHamaxe": 204,
-    "EmptyBucket": 205,
-    "WaterBucket": 206,
-    "LavaBucket": 207,
-    "JungleRose": 208,
-    "Stinger": 209,
-    "Vine": 210,
-    "FeralClaws": 211,
-    "AnkletoftheWind": 212,
-    "StaffofRegrowth": 213,
-    "HellstoneBrick": 214,
-    "WhoopieCushion": 215,
-    "Shackle": 216,
-    "MoltenHamaxe": 217,
-    "Flamelash": 218,
-    "PhoenixBlaster": 219,
-    "Sunfury": 220,
-    "Hellforge": 221,
-    "ClayPot": 222,
-    "NaturesGift": 223,
-    "Bed": 224,
-    "Silk": 225,
-    "LesserRestorationPotion": 226,
-    "RestorationPotion": 227,
-    "JungleHat": 228,
-    "JungleShirt": 229,
-    "JunglePants": 230,
-    "MoltenHelmet": 231,
-    "MoltenBreastplate": 232,
-    "MoltenGreaves": 233,
-    "MeteorShot": 234,
-    "StickyBomb": 235,
-    "BlackLens": 236,
-    "Sunglasses": 237,
-    "WizardHat": 238,
-    "TopHat": 239,
-    "TuxedoShirt": 240,
-    "TuxedoPants": 241,
-    "SummerHat": 242,
-    "BunnyHood": 243,
-    "PlumbersHat": 244,
-    "PlumbersShirt": 245,
-    "PlumbersPants": 246,
-    "HerosHat": 247,
-    "HerosShirt": 248,
-    "HerosPants": 249,
-    "FishBowl": 250,
-    "ArchaeologistsHat": 251,
-    "ArchaeologistsJacket": 252,
-    "ArchaeologistsPants": 253,
-    "BlackThread": 254,
-    "GreenThread": 255,
-    "NinjaHood": 256,
-    "NinjaShirt": 257,
-    "NinjaPants": 258,
-    "Leather": 259,
-    "RedHat": 260,
-    "Goldfish": 261,
-    "Robe": 262,
-    "RobotHat": 263,
-    "GoldCrown": 264,
-    "HellfireArrow": 265,
-    "Sandgun": 266,
-    "GuideVoodooDoll": 267,
-    "DivingHelmet": 268,
-    "FamiliarShirt": 269,
-    "FamiliarPants": 270,
-    "FamiliarWig": 271,
-    "DemonScythe": 272,
-    "NightsEdge": 273,
-    "DarkLance": 274,
-    "Coral": 275,
-    "Cactus": 276,
-    "Trident": 277,
-    "SilverBullet": 278,
-    "ThrowingKnife": 279,
-    "Spear": 280,
-    "Blowpipe": 281,
-    "Glowstick": 282,
-    "Seed": 283,
-    "WoodenBoomerang": 284,
-    "Aglet": 285,
-    "StickyGlowstick": 286,
-    "PoisonedKnife": 287,
-    "ObsidianSkinPotion": 288,
-    "RegenerationPotion": 289,
-    "SwiftnessPotion": 290,
-    "GillsPotion": 291,
-    "IronskinPotion": 292,
-    "ManaRegenerationPotion": 293,
-    "MagicPowerPotion": 294,
-    "FeatherfallPotion": 295,
-    "SpelunkerPotion": 296,
-    "InvisibilityPotion": 297,
-    "ShinePotion": 298,
-    "NightOwlPotion": 299,
-    "BattlePotion": 300,
-    "ThornsPotion": 301,
-    "WaterWalkingPotion": 302,
-    "ArcheryPotion": 303,
-    "HunterPotion": 304,
-    "GravitationPotion": 305,
-    "GoldChest": 306,
-    "DaybloomSeeds": 307,
-    "MoonglowSeeds": 308,
-    "BlinkrootSeeds": 309,
-    "DeathweedSeeds": 310,
-    "WaterleafSeeds": 311,
-    "FireblossomSeeds": 312,
-    "Daybloom": 313,
-    "Moonglow": 314,
-    "Blinkroot": 315,
-    "Deathweed": 316,
-    "Waterleaf": 317,
-    "Fireblossom": 318,
-    "SharkFin": 319,
-    "Feather": 320,
-    "Tombstone": 321,
-    "MimeMask": 322,
-    "AntlionMandible": 323,
-    "IllegalGunParts": 324,
-    "TheDoctorsShirt": 325,
-    "TheDoctorsPants": 326,
-    "GoldenKey": 327,
-    "ShadowChest": 328,
-    "ShadowKey": 329,
-    "ObsidianBrickWall": 330,
-    "JungleSpores": 331,
-    "Loom": 332,
-    "Piano": 333,
-    "Dresser": 334,
-    "Bench": 335,
-    "Bathtub": 336,
-    "RedBanner": 337,
-    "GreenBanner": 338,
-    "BlueBanner": 339,
-    "YellowBanner": 340,
-    "LampPost": 341,
-    "TikiTorch": 342,
-    "Barrel": 343,
-    "ChineseLantern": 344,
-    "CookingPot": 345,
-    "Safe": 346,
-    "SkullLantern": 347,
-    "TrashCan": 348,
-    "Candelabra": 349,
-    "PinkVase": 350,
-    "Mug": 351,
-    "Keg": 352,
-    "Ale": 353,
-    "Bookcase": 354,
-    "Throne": 355,
-    "Bowl": 356,
-    "BowlofSoup": 357,
-    "Toilet": 358,
-    "GrandfatherClock": 359,
-    "ArmorStatue": 360,
-    "GoblinBattleStandard": 361,
-    "TatteredCloth": 362,
-    "Sawmill": 363,
-    "CobaltOre": 364,
-    "MythrilOre": 365,
-    "AdamantiteOre": 366,
-    "Pwnhammer": 367,
-    "Excalibur": 368,
-    "HallowedSeeds": 369,
-    "EbonsandBlock": 370,
-    "CobaltHat": 371,
-    "CobaltHelmet": 372,
-    "CobaltMask": 373,
-    "CobaltBreastplate": 374,
-    "CobaltLeggings": 375,
-    "MythrilHood": 376,
-    "MythrilHelmet": 377,
-    "MythrilHat": 378,
-    "MythrilChainmail": 379,
-    "MythrilGreaves": 380,
-    "CobaltBar": 381,
-    "MythrilBar": 382,
-    "CobaltChainsaw": 383,
-    "MythrilChainsaw": 384,
-    "CobaltDrill": 385,
-    "MythrilDrill": 386,
-    "AdamantiteChainsaw": 387,
-    "AdamantiteDrill": 388,
-    "DaoofPow": 389,
-    "MythrilHalberd": 390,
-    "AdamantiteBar": 391,
-    "GlassWall": 392,
-    "Compass": 393,
-    "DivingGear": 394,
-    "GPS": 395,
-    "ObsidianHorseshoe": 396,
-    "ObsidianShield": 397,
-    "TinkerersWorkshop": 398,
-    "CloudinaBalloon": 399,
-    "AdamantiteHeadgear": 400,
-    "AdamantiteHelmet": 401,
-    "AdamantiteMask": 402,
-    "AdamantiteBreastplate": 403,
-    "AdamantiteLeggings": 404,
-    "SpectreBoots": 405,
-    "AdamantiteGlaive": 406,
-    "Toolbelt": 407,
-    "PearlsandBlock": 408,
-    "PearlstoneBlock": 409,
-    "MiningShirt": 410,
-    "MiningPants": 411,
-    "PearlstoneBrick": 412,
-    "IridescentBrick": 413,
-    "MudstoneBlock": 414,
-    "CobaltBrick": 415,
-    "MythrilBrick": 416,
-    "PearlstoneBrickWall": 417,
-    "IridescentBrickWall": 418,
-    "MudstoneBrickWall": 419,
-    "CobaltBrickWall": 420,
-    "MythrilBrickWall": 421,
-    "HolyWater": 422,
-    "UnholyWater": 423,
-    "SiltBlock": 424,
-    "FairyBell": 425,
-    "BreakerBlade": 426,
-    "BlueTorch": 427,
-    "RedTorch": 428,
-    "GreenTorch": 429,
-    "PurpleTorch": 430,
-    "WhiteTorch": 431,
-    "YellowTorch": 432,
-    "DemonTorch": 433,
-    "ClockworkAssaultRifle": 434,
-    "CobaltRepeater": 435,
-    "MythrilRepeater": 436,
-    "DualHook": 437,
-    "StarStatue": 438,
-    "SwordStatue": 439,
-    "SlimeStatue": 440,
-    "GoblinStatue": 441,
-    "ShieldStatue": 442,
-    "BatStatue": 443,
-    "FishStatue": 444,
-    "BunnyStatue": 445,
-    "SkeletonStatue": 446,
-    "ReaperStatue": 447,
-    "WomanStatue": 448,
-    "ImpStatue": 449,
-    "GargoyleStatue": 450,
-    "GloomStatue": 451,
-    "HornetStatue": 452,
-    "BombStatue": 453,
-    "CrabStatue": 454,
-    "HammerStatue": 455,
-    "PotionStatue": 456,
-    "SpearStatue": 457,
-    "CrossStatue": 458,
-    "JellyfishStatue": 459,
-    "BowStatue": 460,
-    "BoomerangStatue": 461,
-    "BootStatue": 462,
-    "ChestStatue": 463,
-    "BirdStatue": 464,
-    "AxeStatue": 465,
-    "CorruptStatue": 466,
-    "TreeStatue": 467,
-    "AnvilStatue": 468,
-    "PickaxeStatue": 469,
-    "MushroomStatue": 470,
-    "EyeballStatue": 471,
-    "PillarStatue": 472,
-    "HeartStatue": 473,
-    "PotStatue": 474,
-    "SunflowerStatue": 475,
-    "KingStatue": 476,
-    "QueenStatue": 477,
-    "PiranhaStatue": 478,
-    "PlankedWall": 479,
-    "WoodenBeam": 480,
-    "AdamantiteRepeater": 481,
-    "AdamantiteSword": 482,
-    "CobaltSword": 483,
-    "MythrilSword": 484,
-    "MoonCharm": 485,
-    "Ruler": 486,
-    "CrystalBall": 487,
-    "DiscoBall": 488,
-    "SorcererEmblem": 489,
-    "WarriorEmblem": 490,
-    "RangerEmblem": 491,
-    "DemonWings": 492,
-    "AngelWings": 493,
-    "MagicalHarp": 494,
-    "RainbowRod": 495,
-    "IceRod": 496,
-    "NeptunesShell": 497,
-    "Mannequin": 498,
-    "GreaterHealingPotion": 499,
-    "GreaterManaPotion": 500,
-    "PixieDust": 501,
-    "CrystalShard": 502,
-    "ClownHat": 503,
-    "ClownShirt": 504,
-    "ClownPants": 505,
-    "Flamethrower": 506,
-    "Bell": 507,
-    "Harp": 508,
-    "Wrench": 509,
-    "WireCutter": 510,
-    "ActiveStoneBlock": 511,
-    "InactiveStoneBlock": 512,
-    "Lever": 513,
-    "LaserRifle": 514,
-    "CrystalBullet": 515,
-    "HolyArrow": 516,
-    "MagicDagger": 517,
-    "CrystalStorm": 518,
-    "CursedFlames": 519,
-    "SoulofLight": 520,
-    "SoulofNight": 521,
-    "CursedFlame": 522,
-    "CursedTorch": 523,
-    "AdamantiteForge": 524,
-    "MythrilAnvil": 525,
-    "UnicornHorn": 526,
-    "DarkShard": 527,
-    "LightShard": 528,
-    "RedPressurePlate": 529,
-    "Wire": 530,
-    "SpellTome": 531,
-    "StarCloak": 532,
-    "Megashark": 533,
-    "Shotgun": 534,
-    "PhilosophersStone": 535,
-    "TitanGlove": 536,
-    "CobaltNaginata": 537,
-    "Switch": 538,
-    "DartTrap": 539,
-    "Boulder": 540,
-    "GreenPressurePlate": 541,
-    "GrayPressurePlate": 542,
-    "BrownPressurePlate": 543,
-    "MechanicalEye": 544,
-    "CursedArrow": 545,
-    "CursedBullet": 546,
-    "SoulofFright": 547,
-    "SoulofMight": 548,
-    "SoulofSight": 549,
-    "Gungnir": 550,
-    "HallowedPlateMail": 551,
-    "HallowedGreaves": 552,
-    "HallowedHelmet": 553,
-    "CrossNecklace": 554,
-    "ManaFlower": 555,
-    "MechanicalWorm": 556,
-    "MechanicalSkull": 557,
-    "HallowedHeadgear": 558,
-    "HallowedMask": 559,
-    "SlimeCrown": 560,
-    "LightDisc": 561,
-    "MusicBoxOverworldDay": 562,
-    "MusicBoxEerie": 563,
-    "MusicBoxNight": 564,
-    "MusicBoxTitle": 565,
-    "MusicBoxUnderground": 566,
-    "MusicBoxBoss1": 567,
-    "MusicBoxJungle": 568,
-    "MusicBoxCorruption": 569,
-    "MusicBoxUndergroundCorruption": 570,
-    "MusicBoxTheHallow": 571,
-    "MusicBoxBoss2": 572,
-    "MusicBoxUndergroundHallow": 573,
-    "MusicBoxBoss3": 574,
-    "SoulofFlight": 575,
-    "MusicBox": 576,
-    "DemoniteBrick": 577,
-    "HallowedRepeater": 578,
-    "Drax": 579,
-    "Explosives": 580,
-    "InletPump": 581,
-    "OutletPump": 582,
-    "Timer1Second": 583,
-    "Timer3Second": 584,
-    "Timer5Second": 585,
-    "CandyCaneBlock": 586,
-    "CandyCaneWall": 587,
-    "SantaHat": 588,
-    "SantaShirt": 589,
-    "SantaPants": 590,
-    "GreenCandyCaneBlock": 591,
-    "GreenCandyCaneWall": 592,
-    "SnowBlock": 593,
-    "SnowBrick": 594,
-    "SnowBrickWall": 595,
-    "BlueLight": 596,
-    "RedLight": 597,
-    "GreenLight": 598,
-    "BluePresent": 599,
-    "GreenPresent": 600,
-    "YellowPresent": 601,
-    "SnowGlobe": 602,
-    "Carrot": 603,
-    "AdamantiteBeam": 604,
-    "AdamantiteBeamWall": 605,
-    "DemoniteBrickWall": 606,
-    "SandstoneBrick": 607,
-    "SandstoneBrickWall": 608,
-    "EbonstoneBrick": 609,
-    "EbonstoneBrickWall": 610,
-    "RedStucco": 611,
-    "YellowStucco": 612,
-    "GreenStucco": 613,
-    "GrayStucco": 614,
-    "RedStuccoWall": 615,
-    "YellowStuccoWall": 616,
-    "GreenStuccoWall": 617,
-    "GrayStuccoWall": 618,
-    "Ebonwood": 619,
-    "RichMahogany": 620,
-    "Pearlwood": 621,
-    "EbonwoodWall": 622,
-    "RichMahoganyWall": 623,
-    "PearlwoodWall": 624,
-    "EbonwoodChest": 625,
-    "RichMahoganyChest": 626,
-    "PearlwoodChest": 627,
-    "EbonwoodChair": 628,
-    "RichMahoganyChair": 629,
-    "PearlwoodChair": 630,
-    "EbonwoodPlatform": 631,
-    "RichMahoganyPlatform": 632,
-    "PearlwoodPlatform": 633,
-    "BonePlatform": 634,
-    "EbonwoodWorkBench": 635,
-    "RichMahoganyWorkBench": 636,
-    "PearlwoodWorkBench": 637,
-    "EbonwoodTable": 638,
-    "RichMahoganyTable": 639,
-    "PearlwoodTable": 640,
-    "EbonwoodPiano": 641,
-    "RichMahoganyPiano": 642,
-    "PearlwoodPiano": 643,
-    "EbonwoodBed": 644,
-    "RichMahoganyBed": 645,
-    "PearlwoodBed": 646,
-    "EbonwoodDresser": 647,
-    "RichMahoganyDresser": 648,
-    "PearlwoodDresser": 649,
-    "EbonwoodDoor": 650,
-    "RichMahoganyDoor": 651,
-    "PearlwoodDoor": 652,
-    "EbonwoodSword": 653,
-    "EbonwoodHammer": 654,
-    "EbonwoodBow": 655,
-    "RichMahoganySword": 656,
-    "RichMahoganyHammer": 657,
-    "RichMahoganyBow": 658,
-    "PearlwoodSword": 659,
-    "PearlwoodHammer": 660,
-    "PearlwoodBow": 661,
-    "RainbowBrick": 662,
-    "RainbowBrickWall": 663,
-    "IceBlock": 664,
-    "RedsWings": 665,
-    "RedsHelmet": 666,
-    "RedsBreastplate": 667,
-    "RedsLeggings": 668,
-    "Fish": 669,
-    "IceBoomerang": 670,
-    "Keybrand": 671,
-    "Cutlass": 672,
-    "BorealWoodWorkBench": 673,
-    "TrueExcalibur": 674,
-    "TrueNightsEdge": 675,
-    "Frostbrand": 676,
-    "BorealWoodTable": 677,
-    "RedPotion": 678,
-    "TacticalShotgun": 679,
-    "IvyChest": 680,
-    "IceChest": 681,
-    "Marrow": 682,
-    "UnholyTrident": 683,
-    "FrostHelmet": 684,
-    "FrostBreastplate": 685,
-    "FrostLeggings": 686,
-    "TinHelmet": 687,
-    "TinChainmail": 688,
-    "TinGreaves": 689,
-    "LeadHelmet": 690,
-    "LeadChainmail": 691,
-    "LeadGreaves": 692,
-    "TungstenHelmet": 693,
-    "TungstenChainmail": 694,
-    "TungstenGreaves": 695,
-    "PlatinumHelmet": 696,
-    "PlatinumChainmail": 697,
-    "PlatinumGreaves": 698,
-    "TinOre": 699,
-    "LeadOre": 700,
-    "TungstenOre": 701,
-    "PlatinumOre": 702,
-    "TinBar": 703,
-    "LeadBar": 704,
-    "TungstenBar": 705,
-    "PlatinumBar": 706,
-    "TinWatch": 707,
-    "TungstenWatch": 708,
-    "PlatinumWatch": 709,
-    "TinChandelier": 710,
-    "TungstenChandelier": 711,
-    "PlatinumChandelier": 712,
-    "PlatinumCandle": 713,
-    "PlatinumCandelabra": 714,
-    "PlatinumCrown": 715,
-    "LeadAnvil": 716,
-    "TinBrick": 717,
-    "TungstenBrick": 718,
-    "PlatinumBrick": 719,
-    "TinBrickWall": 720,
-    "TungstenBrickWall": 721,
-    "PlatinumBrickWall": 722,
-    "BeamSword": 723,
-    "IceBlade": 724,
-    "IceBow": 725,
-    "FrostStaff": 726,
-    "WoodHelmet": 727,
-    "WoodBreastplate": 728,
-    "WoodGreaves": 729,
-    "EbonwoodHelmet": 730,
-    "EbonwoodBreastplate": 731,
-    "EbonwoodGreaves": 732,
-    "RichMahoganyHelmet": 733,
-    "RichMahoganyBreastplate": 734,
-    "RichMahoganyGreaves": 735,
-    "PearlwoodHelmet": 736,
-    "PearlwoodBreastplate": 737,
-    "PearlwoodGreaves": 738,
-    "AmethystStaff": 739,
-    "TopazStaff": 740,
-    "SapphireStaff": 741,
-    "EmeraldStaff": 742,
-    "RubyStaff": 743,
-    "DiamondStaff": 744,
-    "GrassWall": 745,
-    "JungleWall": 746,
-    "FlowerWall": 747,
-    "Jetpack": 748,
-    "ButterflyWings": 749,
-    "CactusWall": 750,
-    "Cloud": 751,
-    "CloudWall": 752,
-    "Seaweed": 753,
-    "RuneHat": 754,
-    "RuneRobe": 755,
-    "MushroomSpear": 756,
-    "TerraBlade": 757,
-    "GrenadeLauncher": 758,
-    "RocketLauncher": 759,
-    "ProximityMineLauncher": 760,
-    "FairyWings": 761,
-    "SlimeBlock": 762,
-    "FleshBlock": 763,
-    "MushroomWall": 764,
-    "RainCloud": 765,
-    "BoneBlock": 766,
-    "FrozenSlimeBlock": 767,
-    "BoneBlockWall": 768,
-    "SlimeBlockWall": 769,
-    "FleshBlockWall": 770,
-    "RocketI": 771,
-    "RocketII": 772,
-    "RocketIII": 773,
-    "RocketIV": 774,
-    "AsphaltBlock": 775,
-    "CobaltPickaxe": 776,
-    "MythrilPickaxe": 777,
-    "AdamantitePickaxe": 778,
-    "Clentaminator": 779,
-    "GreenSolution": 780,
-    "BlueSolution": 781,
-    "PurpleSolution": 782,
-    "DarkBlueSolution": 783,
-    "RedSolution": 784,
-    "HarpyWings": 785,
-    "BoneWings": 786,
-    "Hammush": 787,
-    "NettleBurst": 788,
-    "AnkhBanner": 789,
-    "SnakeBanner": 790,
-    "OmegaBanner": 791,
-    "CrimsonHelmet": 792,
-    "CrimsonScalemail": 793,
-    "CrimsonGreaves": 794,
-    "BloodButcherer": 795,
-    "TendonBow": 796,
-    "FleshGrinder": 797,
-    "DeathbringerPickaxe": 798,
-    "BloodLustCluster": 799,
-    "TheUndertaker": 800,
-    "TheMeatball": 801,
-    "TheRottedFork": 802,
-    "EskimoHood": 803,
-    "EskimoCoat": 804,
-    "EskimoPants": 805,
-    "LivingWoodChair": 806,
-    "CactusChair": 807,
-    "BoneChair": 808,
-    "FleshChair": 809,
-    "MushroomChair": 810,
-    "BoneWorkBench": 811,
-    "CactusWorkBench": 812,
-    "FleshWorkBench": 813,
-    "MushroomWorkBench": 814,
-    "SlimeWorkBench": 815,
-    "CactusDoor": 816,
-    "FleshDoor": 817,
-    "MushroomDoor": 818,
-    "LivingWoodDoor": 819,
-    "BoneDoor": 820,
-    "FlameWings": 821,
-    "FrozenWings": 822,
-    "GhostWings": 823,
-    "SunplateBlock": 824,
-    "DiscWall": 825,
-    "SkywareChair": 826,
-    "BoneTable": 827,
-    "FleshTable": 828,
-    "LivingWoodTable": 829,
-    "SkywareTable": 830,
-    "LivingWoodChest": 831,
-    "LivingWoodWand": 832,
-    "PurpleIceBlock": 833,
-    "PinkIceBlock": 834,
-    "RedIceBlock": 835,
-    "CrimstoneBlock": 836,
-    "SkywareDoor": 837,
-    "SkywareChest": 838,
-    "SteampunkHat": 839,
-    "SteampunkShirt": 840,
-    "SteampunkPants": 841,
-    "BeeHat": 842,
-    "BeeShirt": 843,
-    "BeePants": 844,
-    "WorldBanner": 845,
-    "SunBanner": 846,
-    "GravityBanner": 847,
-    "PharaohsMask": 848,
-    "Actuator": 849,
-    "BlueWrench": 850,
-    "GreenWrench": 851,
-    "BluePressurePlate": 852,
-    "YellowPressurePlate": 853,
-    "DiscountCard": 854,
-    "LuckyCoin": 855,
-    "UnicornonaStick": 856,
-    "SandstorminaBottle": 857,
-    "BorealWoodSofa": 858,
-    "BeachBall": 859,
-    "CharmofMyths": 860,
-    "MoonShell": 861,
-    "StarVeil": 862,
-    "WaterWalkingBoots": 863,
-    "Tiara": 864,
-    "PrincessDress": 865,
-    "PharaohsRobe": 866,
-    "GreenCap": 867,
-    "MushroomCap": 868,
-    "TamOShanter": 869,
-    "MummyMask": 870,
-    "MummyShirt": 871,
-    "MummyPants": 872,
-    "CowboyHat": 873,
-    "CowboyJacket": 874,
-    "CowboyPants": 875,
-    "PirateHat": 876,
-    "PirateShirt": 877,
-    "PiratePants": 878,
-    "VikingHelmet": 879,
-    "CrimtaneOre": 880,
-    "CactusSword": 881,
-    "CactusPickaxe": 882,
-    "IceBrick": 883,
-    "IceBrickWall": 884,
-    "AdhesiveBandage": 885,
-    "ArmorPolish": 886,
-    "Bezoar": 887,
-    "Blindfold": 888,
-    "FastClock": 889,
-    "Megaphone": 890,
-    "Nazar": 891,
-    "Vitamins": 892,
-    "TrifoldMap": 893,
-    "CactusHelmet": 894,
-    "CactusBreastplate": 895,
-    "CactusLeggings": 896,
-    "PowerGlove": 897,
-    "LightningBoots": 898,
-    "SunStone": 899,
-    "MoonStone": 900,
-    "ArmorBracing": 901,
-    "MedicatedBandage": 902,
-    "ThePlan": 903,
-    "CountercurseMantra": 904,
-    "CoinGun": 905,
-    "LavaCharm": 906,
-    "ObsidianWaterWalkingBoots": 907,
-    "LavaWaders": 908,
-    "PureWaterFountain": 909,
-    "DesertWaterFountain": 910,
-    "Shadewood": 911,
-    "ShadewoodDoor": 912,
-    "ShadewoodPlatform": 913,
-    "ShadewoodChest": 914,
-    "ShadewoodChair": 915,
-    "ShadewoodWorkBench": 916,
-    "ShadewoodTable": 917,
-    "ShadewoodDresser": 918,
-    "ShadewoodPiano": 919,
-    "ShadewoodBed": 920,
-    "ShadewoodSword": 921,
-    "ShadewoodHammer": 922,
-    "ShadewoodBow": 923,
-    "ShadewoodHelmet": 924,
-    "ShadewoodBreastplate": 925,
-    "ShadewoodGreaves": 926,
-    "ShadewoodWall": 927,
-    "Cannon": 928,
-    "Cannonball": 929,
-    "FlareGun": 930,
-    "Flare": 931,
-    "BoneWand": 932,
-    "LeafWand": 933,
-    "FlyingCarpet": 934,
-    "AvengerEmblem": 935,
-    "MechanicalGlove": 936,
-    "LandMine": 937,
-    "PaladinsShield": 938,
-    "WebSlinger": 939,
-    "JungleWaterFountain": 940,
-    "IcyWaterFountain": 941,
-    "CorruptWaterFountain": 942,
-    "CrimsonWaterFountain": 943,
-    "HallowedWaterFountain": 944,
-    "BloodWaterFountain": 945,
-    "Umbrella": 946,
-    "ChlorophyteOre": 947,
-    "SteampunkWings": 948,
-    "Snowball": 949,
-    "IceSkates": 950,
-    "SnowballLauncher": 951,
-    "WebCoveredChest": 952,
-    "ClimbingClaws": 953,
-    "AncientIronHelmet": 954,
-    "AncientGoldHelmet": 955,
-    "AncientShadowHelmet": 956,
-    "AncientShadowScalemail": 957,
-    "AncientShadowGreaves": 958,
-    "AncientNecroHelmet": 959,
-    "AncientCobaltHelmet": 960,
-    "AncientCobaltBreastplate": 961,
-    "AncientCobaltLeggings": 962,
-    "BlackBelt": 963,
-    "Boomstick": 964,
-    "Rope": 965,
-    "Campfire": 966,
-    "Marshmallow": 967,
-    "MarshmallowonaStick": 968,
-    "CookedMarshmallow": 969,
-    "RedRocket": 970,
-    "GreenRocket": 971,
-    "BlueRocket": 972,
-    "YellowRocket": 973,
-    "IceTorch": 974,
-    "ShoeSpikes": 975,
-    "TigerClimbingGear": 976,
-    "Tabi": 977,
-    "PinkEskimoHood": 978,
-    "PinkEskimoCoat": 979,
-    "PinkEskimoPants": 980,
-    "PinkThread": 981,
-    "ManaRegenerationBand": 982,
-    "SandstorminaBalloon": 983,
-    "MasterNinjaGear": 984,
-    "RopeCoil": 985,
-    "Blowgun": 986,
-    "BlizzardinaBottle": 987,
-    "FrostburnArrow": 988,
-    "EnchantedSword": 989,
-    "PickaxeAxe": 990,
-    "CobaltWaraxe": 991,
-    "MythrilWaraxe": 992,
-    "AdamantiteWaraxe": 993,
-    "EatersBone": 994,
-    "BlendOMatic": 995,
-    "MeatGrinder": 996,
-    "Extractinator": 997,
-    "Solidifier": 998,
-    "Amber": 999,
-    "ConfettiGun": 1000,
-    "ChlorophyteMask": 1001,
-    "ChlorophyteHelmet": 1002,
-    "ChlorophyteHeadgear": 1003,
-    "ChlorophytePlateMail": 1004,
-    "ChlorophyteGreaves": 1005,
-    "ChlorophyteBar": 1006,
-    "RedDye": 1007,
-    "OrangeDye": 1008,
-    "YellowDye": 1009,
-    "LimeDye": 1010,
-    "GreenDye": 1011,
-    "TealDye": 1012,
-    "CyanDye": 1013,
-    "SkyBlueDye": 1014,
-    "BlueDye": 1015,
-    "PurpleDye": 1016,
-    "VioletDye": 1017,
-    "PinkDye": 1018,
-    "RedandBlackDye": 1019,
-    "OrangeandBlackDye": 1020,
-    "YellowandBlackDye": 1021,
-    "LimeandBlackDye": 1022,
-    "GreenandBlackDye": 1023,
-    "TealandBlackDye": 1024,
-    "CyanandBlackDye": 1025,
-    "SkyBlueandBlackDye": 1026,
-    "BlueandBlackDye": 1027,
-    "PurpleandBlackDye": 1028,
-    "VioletandBlackDye": 1029,
-    "PinkandBlackDye": 1030,
-    "FlameDye": 1031,
-    "FlameAndBlackDye": 1032,
-    "GreenFlameDye": 1033,
-    "GreenFlameAndBlackDye": 1034,
-    "BlueFlameDye": 1035,
-    "BlueFlameAndBlackDye": 1036,
-    "SilverDye": 1037,
-    "BrightRedDye": 1038,
-    "BrightOrangeDye": 1039,
-    "BrightYellowDye": 1040,
-    "BrightLimeDye": 1041,
-    "BrightGreenDye": 1042,
-    "BrightTealDye": 1043,
-    "BrightCyanDye": 1044,
-    "BrightSkyBlueDye": 1045,
-    "BrightBlueDye": 1046,
-    "BrightPurpleDye": 1047,
-    "BrightVioletDye": 1048,
-    "BrightPinkDye": 1049,
-    "BlackDye": 1050,
-    "RedandSilverDye": 1051,
-    "OrangeandSilverDye": 1052,
-    "YellowandSilverDye": 1053,
-    "LimeandSilverDye": 1054,
-    "GreenandSilverDye": 1055,
-    "TealandSilverDye": 1056,
-    "CyanandSilverDye": 1057,
-    "SkyBlueandSilverDye": 1058,
-    "BlueandSilverDye": 1059,
-    "PurpleandSilverDye": 1060,
-    "VioletandSilverDye": 1061,
-    "PinkandSilverDye": 1062,
-    "IntenseFlameDye": 1063,
-    "IntenseGreenFlameDye": 1064,
-    "IntenseBlueFlameDye": 1065,
-    "RainbowDye": 1066,
-    "IntenseRainbowDye": 1067,
-    "YellowGradientDye": 1068,
-    "CyanGradientDye": 1069,
-    "VioletGradientDye": 1070,
-    "Paintbrush": 1071,
-    "PaintRoller": 1072,
-    "RedPaint": 1073,
-    "OrangePaint": 1074,
-    "YellowPaint": 1075,
-    "LimePaint": 1076,
-    "GreenPaint": 1077,
-    "TealPaint": 1078,
-    "CyanPaint": 1079,
-    "SkyBluePaint": 1080,
-    "BluePaint": 1081,
-    "PurplePaint": 1082,
-    "VioletPaint": 1083,
-    "PinkPaint": 1084,
-    "DeepRedPaint": 1085,
-    "DeepOrangePaint": 1086,
-    "DeepYellowPaint": 1087,
-    "DeepLimePaint": 1088,
-    "DeepGreenPaint": 1089,
-    "DeepTealPaint": 1090,
-    "DeepCyanPaint": 1091,
-    "DeepSkyBluePaint": 1092,
-    "DeepBluePaint": 1093,
-    "DeepPurplePaint": 1094,
-    "DeepVioletPaint": 1095,
-    "DeepPinkPaint": 1096,
-    "BlackPaint": 1097,
-    "WhitePaint": 1098,
-    "GrayPaint": 1099,
-    "PaintScraper": 1100,
-    "LihzahrdBrick": 1101,
-    "LihzahrdBrickWall": 1102,
-    "SlushBlock": 1103,
-    "PalladiumOre": 1104,
-    "OrichalcumOre": 1105,
-    "TitaniumOre": 1106,
-    "TealMushroom": 1107,
-    "GreenMushroom": 1108,
-    "SkyBlueFlower": 1109,
-    "YellowMarigold": 1110,
-    "BlueBerries": 1111,
-    "LimeKelp": 1112,
-    "PinkPricklyPear": 1113,
-    "OrangeBloodroot": 1114,
-    "RedHusk": 1115,
-    "CyanHusk": 1116,
-    "VioletHusk": 1117,
-    "PurpleMucos": 1118,
-    "BlackInk": 1119,
-    "DyeVat": 1120,
-    "BeeGun": 1121,
-    "PossessedHatchet": 1122,
-    "BeeKeeper": 1123,
-    "Hive": 1124,
-    "HoneyBlock": 1125,
-    "HiveWall": 1126,
-    "CrispyHoneyBlock": 1127,
-    "HoneyBucket": 1128,
-    "HiveWand": 1129,
-    "Beenade": 1130,
-    "GravityGlobe": 1131,
-    "HoneyComb": 1132,
-    "Abeemination": 1133,
-    "BottledHoney": 1134,
-    "RainHat": 1135,
-    "RainCoat": 1136,
-    "LihzahrdDoor": 1137,
-    "DungeonDoor": 1138,
-    "LeadDoor": 1139,
-    "IronDoor": 1140,
-    "TempleKey": 1141,
-    "LihzahrdChest": 1142,
-    "LihzahrdChair": 1143,
-    "LihzahrdTable": 1144,
-    "LihzahrdWorkBench": 1145,
-    "SuperDartTrap": 1146,
-    "FlameTrap": 1147,
-    "SpikyBallTrap": 1148,
-    "SpearTrap": 1149,
-    "WoodenSpike": 1150,
-    "LihzahrdPressurePlate": 1151,
-    "LihzahrdStatue": 1152,
-    "LihzahrdWatcherStatue": 1153,
-    "LihzahrdGuardianStatue": 1154,
-    "WaspGun": 1155,
-    "PiranhaGun": 1156,
-    "PygmyStaff": 1157,
-    "PygmyNecklace": 1158,
-    "TikiMask": 1159,
-    "TikiShirt": 1160,
-    "TikiPants": 1161,
-    "LeafWings": 1162,
-    "BlizzardinaBalloon": 1163,
-    "BundleofBalloons": 1164,
-    "BatWings": 1165,
-    "BoneSword": 1166,
-    "HerculesBeetle": 1167,
-    "SmokeBomb": 1168,
-    "BoneKey": 1169,
-    "Nectar": 1170,
-    "TikiTotem": 1171,
-    "LizardEgg": 1172,
-    "GraveMarker": 1173,
-    "CrossGraveMarker": 1174,
-    "Headstone": 1175,
-    "Gravestone": 1176,
-    "Obelisk": 1177,
-    "LeafBlower": 1178,
-    "ChlorophyteBullet": 1179,
-    "ParrotCracker": 1180,
-    "StrangeGlowingMushroom": 1181,
-    "Seedling": 1182,
-    "WispinaBottle": 1183,
-    "PalladiumBar": 1184,
-    "PalladiumSword": 1185,
-    "PalladiumPike": 1186,
-    "PalladiumRepeater": 1187,
-    "PalladiumPickaxe": 1188,
-    "PalladiumDrill": 1189,
-    "PalladiumChainsaw": 1190,
-    "OrichalcumBar": 1191,
-    "OrichalcumSword": 1192,
-    "OrichalcumHalberd": 1193,
-    "OrichalcumRepeater": 1194,
-    "OrichalcumPickaxe": 1195,
-    "OrichalcumDrill": 1196,
-    "OrichalcumChainsaw": 1197,
-    "TitaniumBar": 1198,
-    "TitaniumSword": 1199,
-    "TitaniumTrident": 1200,
-    "TitaniumRepeater": 1201,
-    "TitaniumPickaxe": 1202,
-    "TitaniumDrill": 1203,
-    "TitaniumChainsaw": 1204,
-    "PalladiumMask": 1205,
-    "PalladiumHelmet": 1206,
-    "PalladiumHeadgear": 1207,
-    "PalladiumBreastplate": 1208,
-    "PalladiumLeggings": 1209,
-    "OrichalcumMask": 1210,
-    "OrichalcumHelmet": 1211,
-    "OrichalcumHeadgear": 1212,
-    "OrichalcumBreastplate": 1213,
-    "OrichalcumLeggings": 1214,
-    "TitaniumMask": 1215,
-    "TitaniumHelmet": 1216,
-    "TitaniumHeadgear": 1217,
-    "TitaniumBreastplate": 1218,
-    "TitaniumLeggings": 1219,
-    "OrichalcumAnvil": 1220,
-    "TitaniumForge": 1221,
-    "PalladiumWaraxe": 1222,
-    "OrichalcumWaraxe": 1223,
-    "TitaniumWaraxe": 1224,
-    "HallowedBar": 1225,
-    "ChlorophyteClaymore": 1226,
-    "ChlorophyteSaber": 1227,
-    "ChlorophytePartisan": 1228,
-    "ChlorophyteShotbow": 1229,
-    "ChlorophytePickaxe": 1230,
-    "ChlorophyteDrill": 1231,
-    "ChlorophyteChainsaw": 1232,
-    "ChlorophyteGreataxe": 1233,
-    "ChlorophyteWarhammer": 1234,
-    "ChlorophyteArrow": 1235,
-    "AmethystHook": 1236,
-    "TopazHook": 1237,
-    "SapphireHook": 1238,
-    "EmeraldHook": 1239,
-    "RubyHook": 1240,
-    "DiamondHook": 1241,
-    "AmberMosquito": 1242,
-    "UmbrellaHat": 1243,
-    "NimbusRod": 1244,
-    "OrangeTorch": 1245,
-    "CrimsandBlock": 1246,
-    "BeeCloak": 1247,
-    "EyeoftheGolem": 1248,
-    "HoneyBalloon": 1249,
-    "BlueHorseshoeBalloon": 1250,
-    "WhiteHorseshoeBalloon": 1251,
-    "YellowHorseshoeBalloon": 1252,
-    "FrozenTurtleShell": 1253,
-    "SniperRifle": 1254,
-    "VenusMagnum": 1255,
-    "CrimsonRod": 1256,
-    "CrimtaneBar": 1257,
-    "Stynger": 1258,
-    "FlowerPow": 1259,
-    "RainbowGun": 1260,
-    "StyngerBolt": 1261,
-    "ChlorophyteJackhammer": 1262,
-    "Teleporter": 1263,
-    "FlowerofFrost": 1264,
-    "Uzi": 1265,
-    "MagnetSphere": 1266,
-    "PurpleStainedGlass": 1267,
-    "YellowStainedGlass": 1268,
-    "BlueStainedGlass": 1269,
-    "GreenStainedGlass": 1270,
-    "RedStainedGlass": 1271,
-    "MulticoloredStainedGlass": 1272,
-    "SkeletronHand": 1273,
-    "Skull": 1274,
-    "BallaHat": 1275,
-    "GangstaHat": 1276,
-    "SailorHat": 1277,
-    "EyePatch": 1278,
-    "SailorShirt": 1279,
-    "SailorPants": 1280,
-    "SkeletronMask": 1281,
-    "AmethystRobe": 1282,
-    "TopazRobe": 1283,
-    "SapphireRobe": 1284,
-    "EmeraldRobe": 1285,
-    "RubyRobe": 1286,
-    "DiamondRobe": 1287,
-    "WhiteTuxedoShirt": 1288,
-    "WhiteTuxedoPants": 1289,
-    "PanicNecklace": 1290,
-    "LifeFruit": 1291,
-    "LihzahrdAltar": 1292,
-    "LihzahrdPowerCell": 1293,
-    "Picksaw": 1294,
-    "HeatRay": 1295,
-    "StaffofEarth": 1296,
-    "GolemFist": 1297,
-    "WaterChest": 1298,
-    "Binoculars": 1299,
-    "RifleScope": 1300,
-    "DestroyerEmblem": 1301,
-    "HighVelocityBullet": 1302,
-    "JellyfishNecklace": 1303,
-    "ZombieArm": 1304,
-    "TheAxe": 1305,
-    "IceSickle": 1306,
-    "ClothierVoodooDoll": 1307,
-    "PoisonStaff": 1308,
-    "SlimeStaff": 1309,
-    "PoisonDart": 1310,
-    "EyeSpring": 1311,
-    "ToySled": 1312,
-    "BookofSkulls": 1313,
-    "KOCannon": 1314,
-    "PirateMap": 1315,
-    "TurtleHelmet": 1316,
-    "TurtleScaleMail": 1317,
-    "TurtleLeggings": 1318,
-    "SnowballCannon": 1319,
-    "BonePickaxe": 1320,
-    "MagicQuiver": 1321,
-    "MagmaStone": 1322,
-    "ObsidianRose": 1323,
-    "Bananarang": 1324,
-    "ChainKnife": 1325,
-    "RodofDiscord": 1326,
-    "DeathSickle": 1327,
-    "TurtleShell": 1328,
-    "TissueSample": 1329,
-    "Vertebrae": 1330,
-    "BloodySpine": 1331,
-    "Ichor": 1332,
-    "IchorTorch": 1333,
-    "IchorArrow": 1334,
-    "IchorBullet": 1335,
-    "GoldenShower": 1336,
-    "BunnyCannon": 1337,
-    "ExplosiveBunny": 1338,
-    "VialofVenom": 1339,
-    "FlaskofVenom": 1340,
-    "VenomArrow": 1341,
-    "VenomBullet": 1342,
-    "FireGauntlet": 1343,
-    "Cog": 1344,
-    "Confetti": 1345,
-    "Nanites": 1346,
-    "ExplosivePowder": 1347,
-    "GoldDust": 1348,
-    "PartyBullet": 1349,
-    "NanoBullet": 1350,
-    "ExplodingBullet": 1351,
-    "GoldenBullet": 1352,
-    "FlaskofCursedFlames": 1353,
-    "FlaskofFire": 1354,
-    "FlaskofGold": 1355,
-    "FlaskofIchor": 1356,
-    "FlaskofNanites": 1357,
-    "FlaskofParty": 1358,
-    "FlaskofPoison": 1359,
-    "EyeofCthulhuTrophy": 1360,
-    "EaterofWorldsTrophy": 1361,
-    "BrainofCthulhuTrophy": 1362,
-    "SkeletronTrophy": 1363,
-    "QueenBeeTrophy": 1364,
-    "WallofFleshTrophy": 1365,
-    "DestroyerTrophy": 1366,
-    "SkeletronPrimeTrophy": 1367,
-    "RetinazerTrophy": 1368,
-    "SpazmatismTrophy": 1369,
-    "PlanteraTrophy": 1370,
-    "GolemTrophy": 1371,
-    "BloodMoonRising": 1372,
-    "TheHangedMan": 1373,
-    "GloryoftheFire": 1374,
-    "BoneWarp": 1375,
-    "WallSkeleton": 1376,
-    "HangingSkeleton": 1377,
-    "BlueSlabWall": 1378,
-    "BlueTiledWall": 1379,
-    "PinkSlabWall": 1380,
-    "PinkTiledWall": 1381,
-    "GreenSlabWall": 1382,
-    "GreenTiledWall": 1383,
-    "BlueBrickPlatform": 1384,
-    "PinkBrickPlatform": 1385,
-    "GreenBrickPlatform": 1386,
-    "MetalShelf": 1387,
-    "BrassShelf": 1388,
-    "WoodShelf": 1389,
-    "BrassLantern": 1390,
-    "CagedLantern": 1391,
-    "CarriageLantern": 1392,
-    "AlchemyLantern": 1393,
-    "DiablostLamp": 1394,
-    "OilRagSconse": 1395,
-    "BlueDungeonChair": 1396,
-    "BlueDungeonTable": 1397,
-    "BlueDungeonWorkBench": 1398,
-    "GreenDungeonChair": 1399,
-    "GreenDungeonTable": 1400,
-    "GreenDungeonWorkBench": 1401,
-    "PinkDungeonChair": 1402,
-    "PinkDungeonTable": 1403,
-    "PinkDungeonWorkBench": 1404,
-    "BlueDungeonCandle": 1405,
-    "GreenDungeonCandle": 1406,
-    "PinkDungeonCandle": 1407,
-    "BlueDungeonVase": 1408,
-    "GreenDungeonVase": 1409,
-    "PinkDungeonVase": 1410,
-    "BlueDungeonDoor": 1411,
-    "GreenDungeonDoor": 1412,
-    "PinkDungeonDoor": 1413,
-    "BlueDungeonBookcase": 1414,
-    "GreenDungeonBookcase": 1415,
-    "PinkDungeonBookcase": 1416,
-    "Catacomb": 1417,
-    "DungeonShelf": 1418,
-    "SkellingtonJSkellingsworth": 1419,
-    "TheCursedMan": 1420,
-    "TheEyeSeestheEnd": 1421,
-    "SomethingEvilisWatchingYou": 1422,
-    "TheTwinsHaveAwoken": 1423,
-    "TheScreamer": 1424,
-    "GoblinsPlayingPoker": 1425,
-    "Dryadisque": 1426,
-    "Sunflowers": 1427,
-    "TerrarianGothic": 1428,
-    "Beanie": 1429,
-    "ImbuingStation": 1430,
-    "StarinaBottle": 1431,
-    "EmptyBullet": 1432,
-    "Impact": 1433,
-    "PoweredbyBirds": 1434,
-    "TheDestroyer": 1435,
-    "ThePersistencyofEyes": 1436,
-    "UnicornCrossingtheHallows": 1437,
-    "GreatWave": 1438,
-    "StarryNight": 1439,
-    "GuidePicasso": 1440,
-    "TheGuardiansGaze": 1441,
-    "FatherofSomeone": 1442,
-    "NurseLisa": 1443,
-    "ShadowbeamStaff": 1444,
-    "InfernoFork": 1445,
-    "SpectreStaff": 1446,
-    "WoodenFence": 1447,
-    "LeadFence": 1448,
-    "BubbleMachine": 1449,
-    "BubbleWand": 1450,
-    "MarchingBonesBanner": 1451,
-    "NecromanticSign": 1452,
-    "RustedCompanyStandard": 1453,
-    "RaggedBrotherhoodSigil": 1454,
-    "MoltenLegionFlag": 1455,
-    "DiabolicSigil": 1456,
-    "ObsidianPlatform": 1457,
-    "ObsidianDoor": 1458,
-    "ObsidianChair": 1459,
-    "ObsidianTable": 1460,
-    "ObsidianWorkBench": 1461,
-    "ObsidianVase": 1462,
-    "ObsidianBookcase": 1463,
-    "HellboundBanner": 1464,
-    "HellHammerBanner": 1465,
-    "HelltowerBanner": 1466,
-    "LostHopesofManBanner": 1467,
-    "ObsidianWatcherBanner": 1468,
-    "LavaEruptsBanner": 1469,
-    "BlueDungeonBed": 1470,
-    "GreenDungeonBed": 1471,
-    "PinkDungeonBed": 1472,
-    "ObsidianBed": 1473,
-    "Waldo": 1474,
-    "Darkness": 1475,
-    "DarkSoulReaper": 1476,
-    "Land": 1477,
-    "TrappedGhost": 1478,
-    "DemonsEye": 1479,
-    "FindingGold": 1480,
-    "FirstEncounter": 1481,
-    "GoodMorning": 1482,
-    "UndergroundReward": 1483,
-    "ThroughtheWindow": 1484,
-    "PlaceAbovetheClouds": 1485,
-    "DoNotStepontheGrass": 1486,
-    "ColdWatersintheWhiteLand": 1487,
-    "LightlessChasms": 1488,
-    "TheLandofDeceivingLooks": 1489,
-    "Daylight": 1490,
-    "SecretoftheSands": 1491,
-    "DeadlandComesAlive": 1492,
-    "EvilPresence": 1493,
-    "SkyGuardian": 1494,
-    "AmericanExplosive": 1495,
-    "Discover": 1496,
-    "HandEarth": 1497,
-    "OldMiner": 1498,
-    "Skelehead": 1499,
-    "FacingtheCerebralMastermind": 1500,
-    "LakeofFire": 1501,
-    "TrioSuperHeroes": 1502,
-    "SpectreHood": 1503,
-    "SpectreRobe": 1504,
-    "SpectrePants": 1505,
-    "SpectrePickaxe": 1506,
-    "SpectreHamaxe": 1507,
-    "Ectoplasm": 1508,
-    "GothicChair": 1509,
-    "GothicTable": 1510,
-    "GothicWorkBench": 1511,
-    "GothicBookcase": 1512,
-    "PaladinsHammer": 1513,
-    "SWATHelmet": 1514,
-    "BeeWings": 1515,
-    "GiantHarpyFeather": 1516,
-    "BoneFeather": 1517,
-    "FireFeather": 1518,
-    "IceFeather": 1519,
-    "BrokenBatWing": 1520,
-    "TatteredBeeWing": 1521,
-    "LargeAmethyst": 1522,
-    "LargeTopaz": 1523,
-    "LargeSapphire": 1524,
-    "LargeEmerald": 1525,
-    "LargeRuby": 1526,
-    "LargeDiamond": 1527,
-    "JungleChest": 1528,
-    "CorruptionChest": 1529,
-    "CrimsonChest": 1530,
-    "HallowedChest": 1531,
-    "FrozenChest": 1532,
-    "JungleKey": 1533,
-    "CorruptionKey": 1534,
-    "CrimsonKey": 1535,
-    "HallowedKey": 1536,
-    "FrozenKey": 1537,
-    "ImpFace": 1538,
-    "OminousPresence": 1539,
-    "ShiningMoon": 1540,
-    "LivingGore": 1541,
-    "FlowingMagma": 1542,
-    "SpectrePaintbrush": 1543,
-    "SpectrePaintRoller": 1544,
-    "SpectrePaintScraper": 1545,
-    "ShroomiteHeadgear": 1546,
-    "ShroomiteMask": 1547,
-    "ShroomiteHelmet": 1548,
-    "ShroomiteBreastplate": 1549,
-    "ShroomiteLeggings": 1550,
-    "Autohammer": 1551,
-    "ShroomiteBar": 1552,
-    "SDMG": 1553,
-    "CenxsTiara": 1554,
-    "CenxsBreastplate": 1555,
-    "CenxsLeggings": 1556,
-    "CrownosMask": 1557,
-    "CrownosBreastplate": 1558,
-    "CrownosLeggings": 1559,
-    "WillsHelmet": 1560,
-    "WillsBreastplate": 1561,
-    "WillsLeggings": 1562,
-    "JimsHelmet": 1563,
-    "JimsBreastplate": 1564,
-    "JimsLeggings": 1565,
-    "AaronsHelmet": 1566,
-    "AaronsBreastplate": 1567,
-    "AaronsLeggings": 1568,
-    "VampireKnives": 1569,
-    "BrokenHeroSword": 1570,
-    "ScourgeoftheCorruptor": 1571,
-    "StaffoftheFrostHydra": 1572,
-    "TheCreationoftheGuide": 1573,
-    "TheMerchant": 1574,
-    "CrownoDevoursHisLunch": 1575,
-    "RareEnchantment": 1576,
-    "GloriousNight": 1577,
-    "SweetheartNecklace": 1578,
-    "FlurryBoots": 1579,
-    "DTownsHelmet": 1580,
-    "DTownsBreastplate": 1581,
-    "DTownsLeggings": 1582,
-    "DTownsWings": 1583,
-    "WillsWings": 1584,
-    "CrownosWings": 1585,
-    "CenxsWings": 1586,
-    "CenxsDress": 1587,
-    "CenxsDressPants": 1588,
-    "PalladiumColumn": 1589,
-    "PalladiumColumnWall": 1590,
-    "BubblegumBlock": 1591,
-    "BubblegumBlockWall": 1592,
-    "TitanstoneBlock": 1593,
-    "TitanstoneBlockWall": 1594,
-    "MagicCuffs": 1595,
-    "MusicBoxSnow": 1596,
-    "MusicBoxSpace": 1597,
-    "MusicBoxCrimson": 1598,
-    "MusicBoxBoss4": 1599,
-    "MusicBoxAltOverworldDay": 1600,
-    "MusicBoxRain": 1601,
-    "MusicBoxIce": 1602,
-    "MusicBoxDesert": 1603,
-    "MusicBoxOcean": 1604,
-    "MusicBoxDungeon": 1605,
-    "MusicBoxPlantera": 1606,
-    "MusicBoxBoss5": 1607,
-    "MusicBoxTemple": 1608,
-    "MusicBoxEclipse": 1609,
-    "MusicBoxMushrooms": 1610,
-    "ButterflyDust": 1611,
-    "AnkhCharm": 1612,
-    "AnkhShield": 1613,
-    "BlueFlare": 1614,
-    "AnglerFishBanner": 1615,
-    "AngryNimbusBanner": 1616,
-    "AnomuraFungusBanner": 1617,
-    "AntlionBanner": 1618,
-    "ArapaimaBanner": 1619,
-    "ArmoredSkeletonBanner": 1620,
-    "BatBanner": 1621,
-    "BirdBanner": 1622,
-    "BlackRecluseBanner": 1623,
-    "BloodFeederBanner": 1624,
-    "BloodJellyBanner": 1625,
-    "BloodCrawlerBanner": 1626,
-    "BoneSerpentBanner": 1627,
-    "BunnyBanner": 1628,
-    "ChaosElementalBanner": 1629,
-    "MimicBanner": 1630,
-    "ClownBanner": 1631,
-    "CorruptBunnyBanner": 1632,
-    "CorruptGoldfishBanner": 1633,
-    "CrabBanner": 1634,
-    "CrimeraBanner": 1635,
-    "CrimsonAxeBanner": 1636,
-    "CursedHammerBanner": 1637,
-    "DemonBanner": 1638,
-    "DemonEyeBanner": 1639,
-    "DerplingBanner": 1640,
-    "EaterofSoulsBanner": 1641,
-    "EnchantedSwordBanner": 1642,
-    "ZombieEskimoBanner": 1643,
-    "FaceMonsterBanner": 1644,
-    "FloatyGrossBanner": 1645,
-    "FlyingFishBanner": 1646,
-    "FlyingSnakeBanner": 1647,
-    "FrankensteinBanner": 1648,
-    "FungiBulbBanner": 1649,
-    "FungoFishBanner": 1650,
-    "GastropodBanner": 1651,
-    "GoblinThiefBanner": 1652,
-    "GoblinSorcererBanner": 1653,
-    "GoblinPeonBanner": 1654,
-    "GoblinScoutBanner": 1655,
-    "GoblinWarriorBanner": 1656,
-    "GoldfishBanner": 1657,
-    "HarpyBanner": 1658,
-    "HellbatBanner": 1659,
-    "HerplingBanner": 1660,
-    "HornetBanner": 1661,
-    "IceElementalBanner": 1662,
-    "IcyMermanBanner": 1663,
-    "FireImpBanner": 1664,
-    "JellyfishBanner": 1665,
-    "JungleCreeperBanner": 1666,
-    "LihzahrdBanner": 1667,
-    "ManEaterBanner": 1668,
-    "MeteorHeadBanner": 1669,
-    "MothBanner": 1670,
-    "MummyBanner": 1671,
-    "MushiLadybugBanner": 1672,
-    "ParrotBanner": 1673,
-    "PigronBanner": 1674,
-    "PiranhaBanner": 1675,
-    "PirateBanner": 1676,
-    "PixieBanner": 1677,
-    "RaincoatZombieBanner": 1678,
-    "ReaperBanner": 1679,
-    "SharkBanner": 1680,
-    "SkeletonBanner": 1681,
-    "SkeletonMageBanner": 1682,
-    "SlimeBanner": 1683,
-    "SnowFlinxBanner": 1684,
-    "SpiderBanner": 1685,
-    "SporeZombieBanner": 1686,
-    "SwampThingBanner": 1687,
-    "TortoiseBanner": 1688,
-    "ToxicSludgeBanner": 1689,
-    "UmbrellaSlimeBanner": 1690,
-    "UnicornBanner": 1691,
-    "VampireBanner": 1692,
-    "VultureBanner": 1693,
-    "NypmhBanner": 1694,
-    "WerewolfBanner": 1695,
-    "WolfBanner": 1696,
-    "WorldFeederBanner": 1697,
-    "WormBanner": 1698,
-    "WraithBanner": 1699,
-    "WyvernBanner": 1700,
-    "ZombieBanner": 1701,
-    "GlassPlatform": 1702,
-    "GlassChair": 1703,
-    "GoldenChair": 1704,
-    "GoldenToilet": 1705,
-    "BarStool": 1706,
-    "HoneyChair": 1707,
-    "SteampunkChair": 1708,
-    "GlassDoor": 1709,
-    "GoldenDoor": 1710,
-    "HoneyDoor": 1711,
-    "SteampunkDoor": 1712,
-    "GlassTable": 1713,
-    "BanquetTable": 1714,
-    "Bar": 1715,
-    "GoldenTable": 1716,
-    "HoneyTable": 1717,
-    "SteampunkTable": 1718,
-    "GlassBed": 1719,
-    "GoldenBed": 1720,
-    "HoneyBed": 1721,
-    "SteampunkBed": 1722,
-    "LivingWoodWall": 1723,
-    "FartinaJar": 1724,
-    "Pumpkin": 1725,
-    "PumpkinWall": 1726,
-    "Hay": 1727,
-    "HayWall": 1728,
-    "SpookyWood": 1729,
-    "SpookyWoodWall": 1730,
-    "PumpkinHelmet": 1731,
-    "PumpkinBreastplate": 1732,
-    "PumpkinLeggings": 1733,
-    "CandyApple": 1734,
-    "SoulCake": 1735,
-    "NurseHat": 1736,
-    "NurseShirt": 1737,
-    "NursePants": 1738,
-    "WizardsHat": 1739,
-    "GuyFawkesMask": 1740,
-    "DyeTraderRobe": 1741,
-    "SteampunkGoggles": 1742,
-    "CyborgHelmet": 1743,
-    "CyborgShirt": 1744,
-    "CyborgPants": 1745,
-    "CreeperMask": 1746,
-    "CreeperShirt": 1747,
-    "CreeperPants": 1748,
-    "CatMask": 1749,
-    "CatShirt": 1750,
-    "CatPants": 1751,
-    "GhostMask": 1752,
-    "GhostShirt": 1753,
-    "PumpkinMask": 1754,
-    "PumpkinShirt": 1755,
-    "PumpkinPants": 1756,
-    "RobotMask": 1757,
-    "RobotShirt": 1758,
-    "RobotPants": 1759,
-    "UnicornMask": 1760,
-    "UnicornShirt": 1761,
-    "UnicornPants": 1762,
-    "VampireMask": 1763,
-    "VampireShirt": 1764,
-    "VampirePants": 1765,
-    "WitchHat": 1766,
-    "LeprechaunHat": 1767,
-    "LeprechaunShirt": 1768,
-    "LeprechaunPants": 1769,
-    "PixieShirt": 1770,
-    "PixiePants": 1771,
-    "PrincessHat": 1772,
-    "PrincessDressNew": 1773,
-    "GoodieBag": 1774,
-    "WitchDress": 1775,
-    "WitchBoots": 1776,
-    "BrideofFrankensteinMask": 1777,
-    "BrideofFrankensteinDress": 1778,
-    "KarateTortoiseMask": 1779,
-    "KarateTortoiseShirt": 1780,
-    "KarateTortoisePants": 1781,
-    "CandyCornRifle": 1782,
-    "CandyCorn": 1783,
-    "JackOLanternLauncher": 1784,
-    "ExplosiveJackOLantern": 1785,
-    "Sickle": 1786,
-    "PumpkinPie": 1787,
-    "ScarecrowHat": 1788,
-    "ScarecrowShirt": 1789,
-    "ScarecrowPants": 1790,
-    "Cauldron": 1791,
-    "PumpkinChair": 1792,
-    "PumpkinDoor": 1793,
-    "PumpkinTable": 1794,
-    "PumpkinWorkBench": 1795,
-    "PumpkinPlatform": 1796,
-    "TatteredFairyWings": 1797,
-    "SpiderEgg": 1798,
-    "MagicalPumpkinSeed": 1799,
-    "BatHook": 1800,
-    "BatScepter": 1801,
-    "RavenStaff": 1802,
-    "JungleKeyMold": 1803,
-    "CorruptionKeyMold": 1804,
-    "CrimsonKeyMold": 1805,
-    "HallowedKeyMold": 1806,
-    "FrozenKeyMold": 1807,
-    "HangingJackOLantern": 1808,
-    "RottenEgg": 1809,
-    "UnluckyYarn": 1810,
-    "BlackFairyDust": 1811,
-    "Jackelier": 1812,
-    "JackOLantern": 1813,
-    "SpookyChair": 1814,
-    "SpookyDoor": 1815,
-    "SpookyTable": 1816,
-    "SpookyWorkBench": 1817,
-    "SpookyPlatform": 1818,
-    "ReaperHood": 1819,
-    "ReaperRobe": 1820,
-    "FoxMask": 1821,
-    "FoxShirt": 1822,
-    "FoxPants": 1823,
-    "CatEars": 1824,
-    "BloodyMachete": 1825,
-    "TheHorsemansBlade": 1826,
-    "BladedGlove": 1827,
-    "PumpkinSeed": 1828,
-    "SpookyHook": 1829,
-    "SpookyWings": 1830,
-    "SpookyTwig": 1831,
-    "SpookyHelmet": 1832,
-    "SpookyBreastplate": 1833,
-    "SpookyLeggings": 1834,
-    "StakeLauncher": 1835,
-    "Stake": 1836,
-    "CursedSapling": 1837,
-    "SpaceCreatureMask": 1838,
-    "SpaceCreatureShirt": 1839,
-    "SpaceCreaturePants": 1840,
-    "WolfMask": 1841,
-    "WolfShirt": 1842,
-    "WolfPants": 1843,
-    "PumpkinMoonMedallion": 1844,
-    "NecromanticScroll": 1845,
-    "JackingSkeletron": 1846,
-    "BitterHarvest": 1847,
-    "BloodMoonCountess": 1848,
-    "HallowsEve": 1849,
-    "MorbidCuriosity": 1850,
-    "TreasureHunterShirt": 1851,
-    "TreasureHunterPants": 1852,
-    "DryadCoverings": 1853,
-    "DryadLoincloth": 1854,
-    "MourningWoodTrophy": 1855,
-    "PumpkingTrophy": 1856,
-    "JackOLanternMask": 1857,
-    "SniperScope": 1858,
-    "HeartLantern": 1859,
-    "JellyfishDivingGear": 1860,
-    "ArcticDivingGear": 1861,
-    "FrostsparkBoots": 1862,
-    "FartInABalloon": 1863,
-    "PapyrusScarab": 1864,
-    "CelestialStone": 1865,
-    "Hoverboard": 1866,
-    "CandyCane": 1867,
-    "SugarPlum": 1868,
-    "Present": 1869,
-    "RedRyder": 1870,
-    "FestiveWings": 1871,
-    "PineTreeBlock": 1872,
-    "ChristmasTree": 1873,
-    "StarTopper1": 1874,
-    "StarTopper2": 1875,
-    "StarTopper3": 1876,
-    "BowTopper": 1877,
-    "WhiteGarland": 1878,
-    "WhiteAndRedGarland": 1879,
-    "RedGardland": 1880,
-    "RedAndGreenGardland": 1881,
-    "GreenGardland": 1882,
-    "GreenAndWhiteGarland": 1883,
-    "MulticoloredBulb": 1884,
-    "RedBulb": 1885,
-    "YellowBulb": 1886,
-    "GreenBulb": 1887,
-    "RedAndGreenBulb": 1888,
-    "YellowAndGreenBulb": 1889,
-    "RedAndYellowBulb": 1890,
-    "WhiteBulb": 1891,
-    "WhiteAndRedBulb": 1892,
-    "WhiteAndYellowBulb": 1893,
-    "WhiteAndGreenBulb": 1894,
-    "MulticoloredLights": 1895,
-    "RedLights": 1896,
-    "GreenLights": 1897,
-    "BlueLights": 1898,
-    "YellowLights": 1899,
-    "RedAndYellowLights": 1900,
-    "RedAndGreenLights": 1901,
-    "YellowAndGreenLights": 1902,
-    "BlueAndGreenLights": 1903,
-    "RedAndBlueLights": 1904,
-    "BlueAndYellowLights": 1905,
-    "GiantBow": 1906,
-    "ReindeerAntlers": 1907,
-    "Holly": 1908,
-    "CandyCaneSword": 1909,
-    "EldMelter": 1910,
-    "ChristmasPudding": 1911,
-    "Eggnog": 1912,
-    "StarAnise": 1913,
-    "ReindeerBells": 1914,
-    "CandyCaneHook": 1915,
-    "ChristmasHook": 1916,
-    "CnadyCanePickaxe": 1917,
-    "FruitcakeChakram": 1918,
-    "SugarCookie": 1919,
-    "GingerbreadCookie": 1920,
-    "HandWarmer": 1921,
-    "Coal": 1922,
-    "Toolbox": 1923,
-    "PineDoor": 1924,
-    "PineChair": 1925,
-    "PineTable": 1926,
-    "DogWhistle": 1927,
-    "ChristmasTreeSword": 1928,
-    "ChainGun": 1929,
-    "Razorpine": 1930,
-    "BlizzardStaff": 1931,
-    "MrsClauseHat": 1932,
-    "MrsClauseShirt": 1933,
-    "MrsClauseHeels": 1934,
-    "ParkaHood": 1935,
-    "ParkaCoat": 1936,
-    "ParkaPants": 1937,
-    "SnowHat": 1938,
-    "UglySweater": 1939,
-    "TreeMask": 1940,
-    "TreeShirt": 1941,
-    "TreeTrunks": 1942,
-    "ElfHat": 1943,
-    "ElfShirt": 1944,
-    "ElfPants": 1945,
-    "SnowmanCannon": 1946,
-    "NorthPole": 1947,
-    "ChristmasTreeWallpaper": 1948,
-    "OrnamentWallpaper": 1949,
-    "CandyCaneWallpaper": 1950,
-    "FestiveWallpaper": 1951,
-    "StarsWallpaper": 1952,
-    "SquigglesWallpaper": 1953,
-    "SnowflakeWallpaper": 1954,
-    "KrampusHornWallpaper": 1955,
-    "BluegreenWallpaper": 1956,
-    "GrinchFingerWallpaper": 1957,
-    "NaughtyPresent": 1958,
-    "BabyGrinchMischiefWhistle": 1959,
-    "IceQueenTrophy": 1960,
-    "SantaNK1Trophy": 1961,
-    "EverscreamTrophy": 1962,
-    "MusicBoxPumpkinMoon": 1963,
-    "MusicBoxAltUnderground": 1964,
-    "MusicBoxFrostMoon": 1965,
-    "BrownPaint": 1966,
-    "ShadowPaint": 1967,
-    "NegativePaint": 1968,
-    "TeamDye": 1969,
-    "AmethystGemsparkBlock": 1970,
-    "TopazGemsparkBlock": 1971,
-    "SapphireGemsparkBlock": 1972,
-    "EmeraldGemsparkBlock": 1973,
-    "RubyGemsparkBlock": 1974,
-    "DiamondGemsparkBlock": 1975,
-    "AmberGemsparkBlock": 1976,
-    "LifeHairDye": 1977,
-    "ManaHairDye": 1978,
-    "DepthHairDye": 1979,
-    "MoneyHairDye": 1980,
-    "TimeHairDye": 1981,
-    "TeamHairDye": 1982,
-    "BiomeHairDye": 1983,
-    "PartyHairDye": 1984,
-    "RainbowHairDye": 1985,
-    "SpeedHairDye": 1986,
-    "AngelHalo": 1987,
-    "Fez": 1988,
-    "Womannquin": 1989,
-    "HairDyeRemover": 1990,
-    "BugNet": 1991,
-    "Firefly": 1992,
-    "FireflyinaBottle": 1993,
-    "MonarchButterfly": 1994,
-    "PurpleEmperorButterfly": 1995,
-    "RedAdmiralButterfly": 1996,
-    "UlyssesButterfly": 1997,
-    "SulphurButterfly": 1998,
-    "TreeNymphButterfly": 1999,
-    "ZebraSwallowtailButterfly": 2000,
-    "JuliaButterfly": 2001,
-    "Worm": 2002,
-    "Mouse": 2003,
-    "LightningBug": 2004,
-    "LightningBuginaBottle": 2005,
-    "Snail": 2006,
-    "GlowingSnail": 2007,
-    "FancyGreyWallpaper": 2008,
-    "IceFloeWallpaper": 2009,
-    "MusicWallpaper": 2010,
-    "PurpleRainWallpaper": 2011,
-    "RainbowWallpaper": 2012,
-    "SparkleStoneWallpaper": 2013,
-    "StarlitHeavenWallpaper": 2014,
-    "Bird": 2015,
-    "BlueJay": 2016,
-    "Cardinal": 2017,
-    "Squirrel": 2018,
-    "Bunny": 2019,
-    "CactusBookcase": 2020,
-    "EbonwoodBookcase": 2021,
-    "FleshBookcase": 2022,
-    "HoneyBookcase": 2023,
-    "SteampunkBookcase": 2024,
-    "GlassBookcase": 2025,
-    "RichMahoganyBookcase": 2026,
-    "PearlwoodBookcase": 2027,
-    "SpookyBookcase": 2028,
-    "SkywareBookcase": 2029,
-    "LihzahrdBookcase": 2030,
-    "FrozenBookcase": 2031,
-    "CactusLantern": 2032,
-    "EbonwoodLantern": 2033,
-    "FleshLantern": 2034,
-    "HoneyLantern": 2035,
-    "SteampunkLantern": 2036,
-    "GlassLantern": 2037,
-    "RichMahoganyLantern": 2038,
-    "PearlwoodLantern": 2039,
-    "FrozenLantern": 2040,
-    "LihzahrdLantern": 2041,
-    "SkywareLantern": 2042,
-    "SpookyLantern": 2043,
-    "FrozenDoor": 2044,
-    "CactusCandle": 2045,
-    "EbonwoodCandle": 2046,
-    "FleshCandle": 2047,
-    "GlassCandle": 2048,
-    "FrozenCandle": 2049,
-    "RichMahoganyCandle": 2050,
-    "PearlwoodCandle": 2051,
-    "LihzahrdCandle": 2052,
-    "SkywareCandle": 2053,
-    "PumpkinCandle": 2054,
-    "CactusChandelier": 2055,
-    "EbonwoodChandelier": 2056,
-    "FleshChandelier": 2057,
-    "HoneyChandelier": 2058,
-    "FrozenChandelier": 2059,
-    "RichMahoganyChandelier": 2060,
-    "PearlwoodChandelier": 2061,
-    "LihzahrdChandelier": 2062,
-    "SkywareChandelier": 2063,
-    "SpookyChandelier": 2064,
-    "GlassChandelier": 2065,
-    "CactusBed": 2066,
-    "FleshBed": 2067,
-    "FrozenBed": 2068,
-    "LihzahrdBed": 2069,
-    "SkywareBed": 2070,
-    "SpookyBed": 2071,
-    "CactusBathtub": 2072,
-    "EbonwoodBathtub": 2073,
-    "FleshBathtub": 2074,
-    "GlassBathtub": 2075,
-    "FrozenBathtub": 2076,
-    "RichMahoganyBathtub": 2077,
-    "PearlwoodBathtub": 2078,
-    "LihzahrdBathtub": 2079,
-    "SkywareBathtub": 2080,
-    "SpookyBathtub": 2081,
-    "CactusLamp": 2082,
-    "EbonwoodLamp": 2083,
-    "FleshLamp": 2084,
-    "GlassLamp": 2085,
-    "FrozenLamp": 2086,
-    "RichMahoganyLamp": 2087,
-    "PearlwoodLamp": 2088,
-    "LihzahrdLamp": 2089,
-    "SkywareLamp": 2090,
-    "SpookyLamp": 2091,
-    "CactusCandelabra": 2092,
-    "EbonwoodCandelabra": 2093,
-    "FleshCandelabra": 2094,
-    "HoneyCandelabra": 2095,
-    "SteampunkCandelabra": 2096,
-    "GlassCandelabra": 2097,
-    "RichMahoganyCandelabra": 2098,
-    "PearlwoodCandelabra": 2099,
-    "FrozenCandelabra": 2100,
-    "LihzahrdCandelabra": 2101,
-    "SkywareCandelabra": 2102,
-    "SpookyCandelabra": 2103,
-    "BrainMask": 2104,
-    "FleshMask": 2105,
-    "TwinMask": 2106,
-    "SkeletronPrimeMask": 2107,
-    "BeeMask": 2108,
-    "PlanteraMask": 2109,
-    "GolemMask": 2110,
-    "EaterMask": 2111,
-    "EyeMask": 2112,
-    "DestroyerMask": 2113,
-    "BlacksmithRack": 2114,
-    "CarpentryRack": 2115,
-    "HelmetRack": 2116,
-    "SpearRack": 2117,
-    "SwordRack": 2118,
-    "StoneSlab": 2119,
-    "SandstoneSlab": 2120,
-    "Frog": 2121,
-    "MallardDuck": 2122,
-    "Duck": 2123,
-    "HoneyBathtub": 2124,
-    "SteampunkBathtub": 2125,
-    "LivingWoodBathtub": 2126,
-    "ShadewoodBathtub": 2127,
-    "BoneBathtub": 2128,
-    "HoneyLamp": 2129,
-    "SteampunkLamp": 2130,
-    "LivingWoodLamp": 2131,
-    "ShadewoodLamp": 2132,
-    "GoldenLamp": 2133,
-    "BoneLamp": 2134,
-    "LivingWoodBookcase": 2135,
-    "ShadewoodBookcase": 2136,
-    "GoldenBookcase": 2137,
-    "BoneBookcase": 2138,
-    "LivingWoodBed": 2139,
-    "BoneBed": 2140,
-    "LivingWoodChandelier": 2141,
-    "ShadewoodChandelier": 2142,
-    "GoldenChandelier": 2143,
-    "BoneChandelier": 2144,
-    "LivingWoodLantern": 2145,
-    "ShadewoodLantern": 2146,
-    "GoldenLantern": 2147,
-    "BoneLantern": 2148,
-    "LivingWoodCandelabra": 2149,
-    "ShadewoodCandelabra": 2150,
-    "GoldenCandelabra": 2151,
-    "BoneCandelabra": 2152,
-    "LivingWoodCandle": 2153,
-    "ShadewoodCandle": 2154,
-    "GoldenCandle": 2155,
-    "BlackScropion": 2156,
-    "Scropion": 2157,
-    "BubbleWallpaper": 2158,
-    "CopperPipeWallpaper": 2159,
-    "DuckyWallpaper": 2160,
-    "FrostCore": 2161,
-    "BunnyCage": 2162,
-    "SquirrelCage": 2163,
-    "MallardDuckCage": 2164,
-    "DuckCage": 2165,
-    "BirdCage": 2166,
-    "BlueJayCage": 2167,
-    "CardinalCage": 2168,
-    "WaterfallWall": 2169,
-    "LavafallWall": 2170,
-    "CrimsonSeeds": 2171,
-    "HeavyWorkBench": 2172,
-    "CopperPlating": 2173,
-    "SnailCage": 2174,
-    "GlowingSnailCage": 2175,
-    "ShroomiteDiggingClaw": 2176,
-    "AmmoBox": 2177,
-    "MonarchButterflyJar": 2178,
-    "PurpleEmperorButterflyJar": 2179,
-    "RedAdmiralButterflyJar": 2180,
-    "UlyssesButterflyJar": 2181,
-    "SulphurButterflyJar": 2182,
-    "TreeNymphButterflyJar": 2183,
-    "ZebraSwallowtailButterflyJar": 2184,
-    "JuliaButterflyJar": 2185,
-    "ScorpionCage": 2186,
-    "BlackScorpionCage": 2187,
-    "VenomStaff": 2188,
-    "SpectreMask": 2189,
-    "FrogCage": 2190,
-    "MouseCage": 2191,
-    "BoneWelder": 2192,
-    "FleshCloningVaat": 2193,
-    "GlassKiln": 2194,
-    "LihzahrdFurnace": 2195,
-    "LivingLoom": 2196,
-    "SkyMill": 2197,
-    "IceMachine": 2198,
-    "BeetleHelmet": 2199,
-    "BeetleScaleMail": 2200,
-    "BeetleShell": 2201,
-    "BeetleLeggings": 2202,
-    "SteampunkBoiler": 2203,
-    "HoneyDispenser": 2204,
-    "Penguin": 2205,
-    "PenguinCage": 2206,
-    "WormCage": 2207,
-    "Terrarium": 2208,
-    "SuperManaPotion": 2209,
-    "EbonwoodFence": 2210,
-    "RichMahoganyFence": 2211,
-    "PearlwoodFence": 2212,
-    "ShadewoodFence": 2213,
-    "BrickLayer": 2214,
-    "ExtendoGrip": 2215,
-    "PaintSprayer": 2216,
-    "PortableCementMixer": 2217,
-    "BeetleHusk": 2218,
-    "CelestialMagnet": 2219,
-    "CelestialEmblem": 2220,
-    "CelestialCuffs": 2221,
-    "PeddlersHat": 2222,
-    "PulseBow": 2223,
-    "DynastyChandelier": 2224,
-    "DynastyLamp": 2225,
-    "DynastyLantern": 2226,
-    "DynastyCandelabra": 2227,
-    "DynastyChair": 2228,
-    "DynastyWorkBench": 2229,
-    "DynastyChest": 2230,
-    "DynastyBed": 2231,
-    "DynastyBathtub": 2232,
-    "DynastyBookcase": 2233,
-    "DynastyCup": 2234,
-    "DynastyBowl": 2235,
-    "DynastyCandle": 2236,
-    "DynastyClock": 2237,
-    "GoldenClock": 2238,
-    "GlassClock": 2239,
-    "HoneyClock": 2240,
-    "SteampunkClock": 2241,
-    "FancyDishes": 2242,
-    "GlassBowl": 2243,
-    "WineGlass": 2244,
-    "LivingWoodPiano": 2245,
-    "FleshPiano": 2246,
-    "FrozenPiano": 2247,
-    "FrozenTable": 2248,
-    "HoneyChest": 2249,
-    "SteampunkChest": 2250,
-    "HoneyWorkBench": 2251,
-    "FrozenWorkBench": 2252,
-    "SteampunkWorkBench": 2253,
-    "GlassPiano": 2254,
-    "HoneyPiano": 2255,
-    "SteampunkPiano": 2256,
-    "HoneyCup": 2257,
-    "SteampunkCup": 2258,
-    "DynastyTable": 2259,
-    "DynastyWood": 2260,
-    "RedDynastyShingles": 2261,
-    "BlueDynastyShingles": 2262,
-    "WhiteDynastyWall": 2263,
-    "BlueDynastyWall": 2264,
-    "DynastyDoor": 2265,
-    "Sake": 2266,
-    "PadThai": 2267,
-    "Pho": 2268,
-    "Revolver": 2269,
-    "Gatligator": 2270,
-    "ArcaneRuneWall": 2271,
-    "WaterGun": 2272,
-    "Katana": 2273,
-    "UltrabrightTorch": 2274,
-    "MagicHat": 2275,
-    "DiamondRing": 2276,
-    "Gi": 2277,
-    "Kimono": 2278,
-    "GypsyRobe": 2279,
-    "BeetleWings": 2280,
-    "TigerSkin": 2281,
-    "LeopardSkin": 2282,
-    "ZebraSkin": 2283,
-    "CrimsonCloak": 2284,
-    "MysteriousCape": 2285,
-    "RedCape": 2286,
-    "WinterCape": 2287,
-    "FrozenChair": 2288,
-    "WoodFishingPole": 2289,
-    "Bass": 2290,
-    "ReinforcedFishingPole": 2291,
-    "FiberglassFishingPole": 2292,
-    "FisherofSouls": 2293,
-    "GoldenFishingRod": 2294,
-    "MechanicsRod": 2295,
-    "SittingDucksFishingRod": 2296,
-    "Trout": 2297,
-    "Salmon": 2298,
-    "AtlanticCod": 2299,
-    "Tuna": 2300,
-    "RedSnapper": 2301,
-    "NeonTetra": 2302,
-    "ArmoredCavefish": 2303,
-    "Damselfish": 2304,
-    "CrimsonTigerfish": 2305,
-    "FrostMinnow": 2306,
-    "PrincessFish": 2307,
-    "GoldenCarp": 2308,
-    "SpecularFish": 2309,
-    "Prismite": 2310,
-    "VariegatedLardfish": 2311,
-    "FlarefinKoi": 2312,
-    "DoubleCod": 2313,
-    "Honeyfin": 2314,
-    "Obsidifish": 2315,
-    "Shrimp": 2316,
-    "ChaosFish": 2317,
-    "Ebonkoi": 2318,
-    "Hemopiranha": 2319,
-    "Rockfish": 2320,
-    "Stinkfish": 2321,
-    "MiningPotion": 2322,
-    "HeartreachPotion": 2323,
-    "CalmingPotion": 2324,
-    "BuilderPotion": 2325,
-    "TitanPotion": 2326,
-    "FlipperPotion": 2327,
-    "SummoningPotion": 2328,
-    "TrapsightPotion": 2329,
-    "PurpleClubberfish": 2330,
-    "ObsidianSwordfish": 2331,
-    "Swordfish": 2332,
-    "IronFence": 2333,
-    "WoodenCrate": 2334,
-    "IronCrate": 2335,
-    "GoldenCrate": 2336,
-    "OldShoe": 2337,
-    "FishingSeaweed": 2338,
-    "TinCan": 2339,
-    "MinecartTrack": 2340,
-    "ReaverShark": 2341,
-    "SawtoothShark": 2342,
-    "Minecart": 2343,
-    "AmmoReservationPotion": 2344,
-    "LifeforcePotion": 2345,
-    "EndurancePotion": 2346,
-    "RagePotion": 2347,
-    "InfernoPotion": 2348,
-    "WrathPotion": 2349,
-    "RecallPotion": 2350,
-    "TeleportationPotion": 2351,
-    "LovePotion": 2352,
-    "StinkPotion": 2353,
-    "FishingPotion": 2354,
-    "SonarPotion": 2355,
-    "CratePotion": 2356,
-    "ShiverthornSeeds": 2357,
-    "Shiverthorn": 2358,
-    "WarmthPotion": 2359,
-    "FishHook": 2360,
-    "BeeHeadgear": 2361,
-    "BeeBreastplate": 2362,
-    "BeeGreaves": 2363,
-    "HornetStaff": 2364,
-    "ImpStaff": 2365,
-    "QueenSpiderStaff": 2366,
-    "AnglerHat": 2367,
-    "AnglerVest": 2368,
-    "AnglerPants": 2369,
-    "SpiderMask": 2370,
-    "SpiderBreastplate": 2371,
-    "SpiderGreaves": 2372,
-    "HighTestFishingLine": 2373,
-    "AnglerEarring": 2374,
-    "TackleBox": 2375,
-    "BlueDungeonPiano": 2376,
-    "GreenDungeonPiano": 2377,
-    "PinkDungeonPiano": 2378,
-    "GoldenPiano": 2379,
-    "ObsidianPiano": 2380,
-    "BonePiano": 2381,
-    "CactusPiano": 2382,
-    "SpookyPiano": 2383,
-    "SkywarePiano": 2384,
-    "LihzahrdPiano": 2385,
-    "BlueDungeonDresser": 2386,
-    "GreenDungeonDresser": 2387,
-    "PinkDungeonDresser": 2388,
-    "GoldenDresser": 2389,
-    "ObsidianDresser": 2390,
-    "BoneDresser": 2391,
-    "CactusDresser": 2392,
-    "SpookyDresser": 2393,
-    "SkywareDresser": 2394,
-    "HoneyDresser": 2395,
-    "LihzahrdDresser": 2396,
-    "Sofa": 2397,
-    "EbonwoodSofa": 2398,
-    "RichMahoganySofa": 2399,
-    "PearlwoodSofa": 2400,
-    "ShadewoodSofa": 2401,
-    "BlueDungeonSofa": 2402,
-    "GreenDungeonSofa": 2403,
-    "PinkDungeonSofa": 2404,
-    "GoldenSofa": 2405,
-    "ObsidianSofa": 2406,
-    "BoneSofa": 2407,
-    "CactusSofa": 2408,
-    "SpookySofa": 2409,
-    "SkywareSofa": 2410,
-    "HoneySofa": 2411,
-    "SteampunkSofa": 2412,
-    "MushroomSofa": 2413,
-    "GlassSofa": 2414,
-    "PumpkinSofa": 2415,
-    "LihzahrdSofa": 2416,
-    "SeashellHairpin": 2417,
-    "MermaidAdornment": 2418,
-    "MermaidTail": 2419,
-    "ZephyrFish": 2420,
-    "Fleshcatcher": 2421,
-    "HotlineFishingHook": 2422,
-    "FrogLeg": 2423,
-    "Anchor": 2424,
-    "CookedFish": 2425,
-    "CookedShrimp": 2426,
-    "Sashimi": 2427,
-    "FuzzyCarrot": 2428,
-    "ScalyTruffle": 2429,
-    "SlimySaddle": 2430,
-    "BeeWax": 2431,
-    "CopperPlatingWall": 2432,
-    "StoneSlabWall": 2433,
-    "Sail": 2434,
-    "CoralstoneBlock": 2435,
-    "BlueJellyfish": 2436,
-    "GreenJellyfish": 2437,
-    "PinkJellyfish": 2438,
-    "BlueJellyfishJar": 2439,
-    "GreenJellyfishJar": 2440,
-    "PinkJellyfishJar": 2441,
-    "LifePreserver": 2442,
-    "ShipsWheel": 2443,
-    "CompassRose": 2444,
-    "WallAnchor": 2445,
-    "GoldfishTrophy": 2446,
-    "BunnyfishTrophy": 2447,
-    "SwordfishTrophy": 2448,
-    "SharkteethTrophy": 2449,
-    "Batfish": 2450,
-    "BublebeeTuna": 2451,
-    "Catfish": 2452,
-    "Cloudfish": 2453,
-    "Cursedfish": 2454,
-    "Dirtfish": 2455,
-    "DynamiteFish": 2456,
-    "EaterofPlankton": 2457,
-    "FallenStarfish": 2458,
-    "TheFishofCthulu": 2459,
-    "Fishotron": 2460,
-    "Harpyfish": 2461,
-    "Hungerfish": 2462,
-    "Ichorfish": 2463,
-    "Jewelfish": 2464,
-    "MirageFish": 2465,
-    "MutantFlinxfin": 2466,
-    "Pengfish": 2467,
-    "Pixiefish": 2468,
-    "Spiderfish": 2469,
-    "TundraTrout": 2470,
-    "UnicornFish": 2471,
-    "GuideVoodooFish": 2472,
-    "Whyverntail": 2473,
-    "ZombieFish": 2474,
-    "AmanitiaFungifin": 2475,
-    "Angelfish": 2476,
-    "BloodyManowar": 2477,
-    "Bonefish": 2478,
-    "Bunnyfish": 2479,
-    "CapnTunabeard": 2480,
-    "Clownfish": 2481,
-    "DemonicHellfish": 2482,
-    "Derpfish": 2483,
-    "Fishron": 2484,
-    "InfectedScabbardfish": 2485,
-    "Mudfish": 2486,
-    "Slimefish": 2487,
-    "TropicalBarracuda": 2488,
-    "KingSlimeTrophy": 2489,
-    "ShipInABottle": 2490,
-    "HardySaddle": 2491,
-    "PressureTrack": 2492,
-    "KingSlimeMask": 2493,
-    "FinWings": 2494,
-    "TreasureMap": 2495,
-    "SeaweedPlanter": 2496,
-    "PillaginMePixels": 2497,
-    "FishCostumeMask": 2498,
-    "FishCostumeShirt": 2499,
-    "FishCostumeFinskirt": 2500,
-    "GingerBeard": 2501,
-    "HoneyedGoggles": 2502,
-    "BorealWood": 2503,
-    "PalmWood": 2504,
-    "BorealWoodWall": 2505,
-    "PalmWoodWall": 2506,
-    "BorealWoodFence": 2507,
-    "PalmWoodFence": 2508,
-    "BorealWoodHelmet": 2509,
-    "BorealWoodBreastplate": 2510,
-    "BorealWoodGreaves": 2511,
-    "PalmWoodHelmet": 2512,
-    "PalmWoodBreastplate": 2513,
-    "PalmWoodGreaves": 2514,
-    "PalmWoodBow": 2515,
-    "PalmWoodHammer": 2516,
-    "PalmWoodSword": 2517,
-    "PalmWoodPlatform": 2518,
-    "PalmWoodBathtub": 2519,
-    "PalmWoodBed": 2520,
-    "PalmWoodBench": 2521,
-    "PalmWoodCandelabra": 2522,
-    "PalmWoodCandle": 2523,
-    "PalmWoodChair": 2524,
-    "PalmWoodChandelier": 2525,
-    "PalmWoodChest": 2526,
-    "PalmWoodSofa": 2527,
-    "PalmWoodDoor": 2528,
-    "PalmWoodDresser": 2529,
-    "PalmWoodLantern": 2530,
-    "PalmWoodPiano": 2531,
-    "PalmWoodTable": 2532,
-    "PalmWoodLamp": 2533,
-    "PalmWoodWorkBench": 2534,
-    "OpticStaff": 2535,
-    "PalmWoodBookcase": 2536,
-    "MushroomBathtub": 2537,
-    "MushroomBed": 2538,
-    "MushroomBench": 2539,
-    "MushroomBookcase": 2540,
-    "MushroomCandelabra": 2541,
-    "MushroomCandle": 2542,
-    "MushroomChandelier": 2543,
-    "MushroomChest": 2544,
-    "MushroomDresser": 2545,
-    "MushroomLantern": 2546,
-    "MushroomLamp": 2547,
-    "MushroomPiano": 2548,
-    "MushroomPlatform": 2549,
-    "MushroomTable": 2550,
-    "SpiderStaff": 2551,
-    "BorealWoodBathtub": 2552,
-    "BorealWoodBed": 2553,
-    "BorealWoodBookcase": 2554,
-    "BorealWoodCandelabra": 2555,
-    "BorealWoodCandle": 2556,
-    "BorealWoodChair": 2557,
-    "BorealWoodChandelier": 2558,
-    "BorealWoodChest": 2559,
-    "BorealWoodClock": 2560,
-    "BorealWoodDoor": 2561,
-    "BorealWoodDresser": 2562,
-    "BorealWoodLamp": 2563,
-    "BorealWoodLantern": 2564,
-    "BorealWoodPiano": 2565,
-    "BorealWoodPlatform": 2566,
-    "SlimeBathtub": 2567,
-    "SlimeBed": 2568,
-    "SlimeBookcase": 2569,
-    "SlimeCandelabra": 2570,
-    "SlimeCandle": 2571,
-    "SlimeChair": 2572,
-    "SlimeChandelier": 2573,
-    "SlimeChest": 2574,
-    "SlimeClock": 2575,
-    "SlimeDoor": 2576,
-    "SlimeDresser": 2577,
-    "SlimeLamp": 2578,
-    "SlimeLantern": 2579,
-    "SlimePiano": 2580,
-    "SlimePlatform": 2581,
-    "SlimeSofa": 2582,
-    "SlimeTable": 2583,
-    "PirateStaff": 2584,
-    "SlimeHook": 2585,
-    "StickyGrenade": 2586,
-    "TartarSauce": 2587,
-    "DukeFishronMask": 2588,
-    "DukeFishronTrophy": 2589,
-    "MolotovCocktail": 2590,
-    "BoneClock": 2591,
-    "CactusClock": 2592,
-    "EbonwoodClock": 2593,
-    "FrozenClock": 2594,
-    "LihzahrdClock": 2595,
-    "LivingWoodClock": 2596,
-    "RichMahoganyClock": 2597,
-    "FleshClock": 2598,
-    "MushroomClock": 2599,
-    "ObsidianClock": 2600,
-    "PalmWoodClock": 2601,
-    "PearlwoodClock": 2602,
-    "PumpkinClock": 2603,
-    "ShadewoodClock": 2604,
-    "SpookyClock": 2605,
-    "SkywareClock": 2606,
-    "SpiderFang": 2607,
-    "FalconBlade": 2608,
-    "FishronWings": 2609,
-    "SlimeGun": 2610,
-    "Flairon": 2611,
-    "GreenDungeonChest": 2612,
-    "PinkDungeonChest": 2613,
-    "BlueDungeonChest": 2614,
-    "BoneChest": 2615,
-    "CactusChest": 2616,
-    "FleshChest": 2617,
-    "ObsidianChest": 2618,
-    "PumpkinChest": 2619,
-    "SpookyChest": 2620,
-    "TempestStaff": 2621,
-    "RazorbladeTyphoon": 2622,
-    "BubbleGun": 2623,
-    "Tsunami": 2624,
-    "Seashell": 2625,
-    "Starfish": 2626,
-    "SteampunkPlatform": 2627,
-    "SkywarePlatform": 2628,
-    "LivingWoodPlatform": 2629,
-    "HoneyPlatform": 2630,
-    "SkywareWorkbench": 2631,
-    "GlassWorkBench": 2632,
-    "LivingWoodWorkBench": 2633,
-    "FleshSofa": 2634,
-    "FrozenSofa": 2635,
-    "LivingWoodSofa": 2636,
-    "PumpkinDresser": 2637,
-    "SteampunkDresser": 2638,
-    "GlassDresser": 2639,
-    "FleshDresser": 2640,
-    "PumpkinLantern": 2641,
-    "ObsidianLantern": 2642,
-    "PumpkinLamp": 2643,
-    "ObsidianLamp": 2644,
-    "BlueDungeonLamp": 2645,
-    "GreenDungeonLamp": 2646,
-    "PinkDungeonLamp": 2647,
-    "HoneyCandle": 2648,
-    "SteampunkCandle": 2649,
-    "SpookyCandle": 2650,
-    "ObsidianCandle": 2651,
-    "BlueDungeonChandelier": 2652,
-    "GreenDungeonChandelier": 2653,
-    "PinkDungeonChandelier": 2654,
-    "SteampunkChandelier": 2655,
-    "PumpkinChandelier": 2656,
-    "ObsidianChandelier": 2657,
-    "BlueDungeonBathtub": 2658,
-    "GreenDungeonBathtub": 2659,
-    "PinkDungeonBathtub": 2660,
-    "PumpkinBathtub": 2661,
-    "ObsidianBathtub": 2662,
-    "GoldenBathtub": 2663,
-    "BlueDungeonCandelabra": 2664,
-    "GreenDungeonCandelabra": 2665,
-    "PinkDungeonCandelabra": 2666,
-    "ObsidianCandelabra": 2667,
-    "PumpkinCandelabra": 2668,
-    "PumpkinBed": 2669,
-    "PumpkinBookcase": 2670,
-    "PumpkinPiano": 2671,
-    "SharkStatue": 2672,
-    "TruffleWorm": 2673,
-    "ApprenticeBait": 2674,
-    "JourneymanBait": 2675,
-    "MasterBait": 2676,
-    "AmberGemsparkWall": 2677,
-    "AmberGemsparkWallOff": 2678,
-    "AmethystGemsparkWall": 2679,
-    "AmethystGemsparkWallOff": 2680,
-    "DiamondGemsparkWall": 2681,
-    "DiamondGemsparkWallOff": 2682,
-    "EmeraldGemsparkWall": 2683,
-    "EmeraldGemsparkWallOff": 2684,
-    "RubyGemsparkWall": 2685,
-    "RubyGemsparkWallOff": 2686,
-    "SapphireGemsparkWall": 2687,
-    "SapphireGemsparkWallOff": 2688,
-    "TopazGemsparkWall": 2689,
-    "TopazGemsparkWallOff": 2690,
-    "TinPlatingWall": 2691,
-    "TinPlating": 2692,
-    "WaterfallBlock": 2693,
-    "LavafallBlock": 2694,
-    "ConfettiBlock": 2695,
-    "ConfettiWall": 2696,
-    "ConfettiBlockBlack": 2697,
-    "ConfettiWallBlack": 2698,
-    "WeaponRack": 2699,
-    "FireworksBox": 2700,
-    "LivingFireBlock": 2701,
-    "AlphabetStatue0": 2702,
-    "AlphabetStatue1": 2703,
-    "AlphabetStatue2": 2704,
-    "AlphabetStatue3": 2705,
-    "AlphabetStatue4": 2706,
-    "AlphabetStatue5": 2707,
-    "AlphabetStatue6": 2708,
-    "AlphabetStatue7": 2709,
-    "AlphabetStatue8": 2710,
-    "AlphabetStatue9": 2711,
-    "AlphabetStatueA": 2712,
-    "AlphabetStatueB": 2713,
-    "AlphabetStatueC": 2714,
-    "AlphabetStatueD": 2715,
-    "AlphabetStatueE": 2716,
-    "AlphabetStatueF": 2717,
-    "AlphabetStatueG": 2718,
-    "AlphabetStatueH": 2719,
-    "AlphabetStatueI": 2720,
-    "AlphabetStatueJ": 2721,
-    "AlphabetStatueK": 2722,
-    "AlphabetStatueL": 2723,
-    "AlphabetStatueM": 2724,
-    "AlphabetStatueN": 2725,
-    "AlphabetStatueO": 2726,
-    "AlphabetStatueP": 2727,
-    "AlphabetStatueQ": 2728,
-    "AlphabetStatueR": 2729,
-    "AlphabetStatueS": 2730,
-    "AlphabetStatueT": 2731,
-    "AlphabetStatueU": 2732,
-    "AlphabetStatueV": 2733,
-    "AlphabetStatueW": 2734,
-    "AlphabetStatueX": 2735,
-    "AlphabetStatueY": 2736,
-    "AlphabetStatueZ": 2737,
-    "FireworkFountain": 2738,
-    "BoosterTrack": 2739,
-    "Grasshopper": 2740,
-    "GrasshopperCage": 2741,
-    "MusicBoxUndergroundCrimson": 2742,
-    "CactusTable": 2743,
-    "CactusPlatform": 2744,
-    "BorealWoodSword": 2745,
-    "BorealWoodHammer": 2746,
-    "BorealWoodBow": 2747,
-    "GlassChest": 2748,
-    "XenoStaff": 2749,
-    "MeteorStaff": 2750,
-    "LivingCursedFireBlock": 2751,
-    "LivingDemonFireBlock": 2752,
-    "LivingFrostFireBlock": 2753,
-    "LivingIchorBlock": 2754,
-    "LivingUltrabrightFireBlock": 2755,
-    "GenderChangePotion": 2756,
-    "VortexHelmet": 2757,
-    "VortexBreastplate": 2758,
-    "VortexLeggings": 2759,
-    "NebulaHelmet": 2760,
-    "NebulaBreastplate": 2761,
-    "NebulaLeggings": 2762,
-    "SolarFlareHelmet": 2763,
-    "SolarFlareBreastplate": 2764,
-    "SolarFlareLeggings": 2765,
-    "LunarTabletFragment": 2766,
-    "SolarTablet": 2767,
-    "DrillContainmentUnit": 2768,
-    "CosmicCarKey": 2769,
-    "MothronWings": 2770,
-    "BrainScrambler": 2771,
-    "VortexAxe": 2772,
-    "VortexChainsaw": 2773,
-    "VortexDrill": 2774,
-    "VortexHammer": 2775,
-    "VortexPickaxe": 2776,
-    "NebulaAxe": 2777,
-    "NebulaChainsaw": 2778,
-    "NebulaDrill": 2779,
-    "NebulaHammer": 2780,
-    "NebulaPickaxe": 2781,
-    "SolarFlareAxe": 2782,
-    "SolarFlareChainsaw": 2783,
-    "SolarFlareDrill": 2784,
-    "SolarFlareHammer": 2785,
-    "SolarFlarePickaxe": 2786,
-    "HoneyfallBlock": 2787,
-    "HoneyfallWall": 2788,
-    "ChlorophyteBrickWall": 2789,
-    "CrimtaneBrickWall": 2790,
-    "ShroomitePlatingWall": 2791,
-    "ChlorophyteBrick": 2792,
-    "CrimtaneBrick": 2793,
-    "ShroomitePlating": 2794,
-    "LaserMachinegun": 2795,
-    "ElectrosphereLauncher": 2796,
-    "Xenopopper": 2797,
-    "LaserDrill": 2798,
-    "LaserRuler": 2799,
-    "AntiGravityHook": 2800,
-    "MoonMask": 2801,
-    "SunMask": 2802,
-    "MartianCostumeMask": 2803,
-    "MartianCostumeShirt": 2804,
-    "MartianCostumePants": 2805,
-    "MartianUniformHelmet": 2806,
-    "MartianUniformTorso": 2807,
-    "MartianUniformPants": 2808,
-    "MartianAstroClock": 2809,
-    "MartianBathtub": 2810,
-    "MartianBed": 2811,
-    "MartianHoverChair": 2812,
-    "MartianChandelier": 2813,
-    "MartianChest": 2814,
-    "MartianDoor": 2815,
-    "MartianDresser": 2816,
-    "MartianHolobookcase": 2817,
-    "MartianHoverCandle": 2818,
-    "MartianLamppost": 2819,
-    "MartianLantern": 2820,
-    "MartianPiano": 2821,
-    "MartianPlatform": 2822,
-    "MartianSofa": 2823,
-    "MartianTable": 2824,
-    "MartianTableLamp": 2825,
-    "MartianWorkBench": 2826,
-    "WoodenSink": 2827,
-    "EbonwoodSink": 2828,
-    "RichMahoganySink": 2829,
-    "PearlwoodSink": 2830,
-    "BoneSink": 2831,
-    "FleshSink": 2832,
-    "LivingWoodSink": 2833,
-    "SkywareSink": 2834,
-    "ShadewoodSink": 2835,
-    "LihzahrdSink": 2836,
-    "BlueDungeonSink": 2837,
-    "GreenDungeonSink": 2838,
-    "PinkDungeonSink": 2839,
-    "ObsidianSink": 2840,
-    "MetalSink": 2841,
-    "GlassSink": 2842,
-    "GoldenSink": 2843,
-    "HoneySink": 2844,
-    "SteampunkSink": 2845,
-    "PumpkinSink": 2846,
-    "SpookySink": 2847,
-    "FrozenSink": 2848,
-    "DynastySink": 2849,
-    "PalmWoodSink": 2850,
-    "MushroomSink": 2851,
-    "BorealWoodSink": 2852,
-    "SlimeSink": 2853,
-    "CactusSink": 2854,
-    "MartianSink": 2855,
-    "WhiteLunaticHood": 2856,
-    "BlueLunaticHood": 2857,
-    "WhiteLunaticRobe": 2858,
-    "BlueLunaticRobe": 2859,
-    "MartianConduitPlating": 2860,
-    "MartianConduitWall": 2861,
-    "HiTekSunglasses": 2862,
-    "MartianHairDye": 2863,
-    "MartianArmorDye": 2864,
-    "PaintingCastleMarsberg": 2865,
-    "PaintingMartiaLisa": 2866,
-    "PaintingTheTruthIsUpThere": 2867,
-    "SmokeBlock": 2868,
-    "LivingFlameDye": 2869,
-    "LivingRainbowDye": 2870,
-    "ShadowDye": 2871,
-    "NegativeDye": 2872,
-    "LivingOceanDye": 2873,
-    "BrownDye": 2874,
-    "BrownAndBlackDye": 2875,
-    "BrightBrownDye": 2876,
-    "BrownAndSilverDye": 2877,
-    "WispDye": 2878,
-    "PixieDye": 2879,
-    "InfluxWaver": 2880,
-    "PhasicWarpEjector": 2881,
-    "ChargedBlasterCannon": 2882,
-    "ChlorophyteDye": 2883,
-    "UnicornWispDye": 2884,
-    "InfernalWispDye": 2885,
-    "ViciousPowder": 2886,
-    "ViciousMushroom": 2887,
-    "BeesKnees": 2888,
-    "GoldBird": 2889,
-    "GoldBunny": 2890,
-    "GoldButterfly": 2891,
-    "GoldFrog": 2892,
-    "GoldGrasshopper": 2893,
-    "GoldMouse": 2894,
-    "GoldWorm": 2895,
-    "StickyDynamite": 2896,
-    "AngryTrapperBanner": 2897,
-    "ArmoredVikingBanner": 2898,
-    "BlackSlimeBanner": 2899,
-    "BlueArmoredBonesBanner": 2900,
-    "BlueCultistArcherBanner": 2901,
-    "BlueCultistCasterBanner": 2902,
-    "BlueCultistFighterBanner": 2903,
-    "BoneLeeBanner": 2904,
-    "ClingerBanner": 2905,
-    "CochinealBeetleBanner": 2906,
-    "CorruptPenguinBanner": 2907,
-    "CorruptSlimeBanner": 2908,
-    "CorruptorBanner": 2909,
-    "CrimslimeBanner": 2910,
-    "CursedSkullBanner": 2911,
-    "CyanBeetleBanner": 2912,
-    "DevourerBanner": 2913,
-    "DiablolistBanner": 2914,
-    "DoctorBonesBanner": 2915,
-    "DungeonSlimeBanner": 2916,
-    "DungeonSpiritBanner": 2917,
-    "ElfArcherBanner": 2918,
-    "ElfCopterBanner": 2919,
-    "EyezorBanner": 2920,
-    "FlockoBanner": 2921,
-    "GhostBanner": 2922,
-    "GiantBatBanner": 2923,
-    "GiantCursedSkullBanner": 2924,
-    "GiantFlyingFoxBanner": 2925,
-    "GingerbreadManBanner": 2926,
-    "GoblinArcherBanner": 2927,
-    "GreenSlimeBanner": 2928,
-    "HeadlessHorsemanBanner": 2929,
-    "HellArmoredBonesBanner": 2930,
-    "HellhoundBanner": 2931,
-    "HoppinJackBanner": 2932,
-    "IceBatBanner": 2933,
-    "IceGolemBanner": 2934,
-    "IceSlimeBanner": 2935,
-    "IchorStickerBanner": 2936,
-    "IlluminantBatBanner": 2937,
-    "IlluminantSlimeBanner": 2938,
-    "JungleBatBanner": 2939,
-    "JungleSlimeBanner": 2940,
-    "KrampusBanner": 2941,
-    "LacBeetleBanner": 2942,
-    "LavaBatBanner": 2943,
-    "LavaSlimeBanner": 2944,
-    "MartianBrainscramblerBanner": 2945,
-    "MartianDroneBanner": 2946,
-    "MartianEngineerBanner": 2947,
-    "MartianGigazapperBanner": 2948,
-    "MartianGreyGruntBanner": 2949,
-    "MartianOfficerBanner": 2950,
-    "MartianRaygunnerBanner": 2951,
-    "MartianScutlixGunnerBanner": 2952,
-    "MartianTeslaTurretBanner": 2953,
-    "MisterStabbyBanner": 2954,
-    "MotherSlimeBanner": 2955,
-    "NecromancerBanner": 2956,
-    "NutcrackerBanner": 2957,
-    "PaladinBanner": 2958,
-    "PenguinBanner": 2959,
-    "PinkyBanner": 2960,
-    "PoltergeistBanner": 2961,
-    "PossessedArmorBanner": 2962,
-    "PresentMimicBanner": 2963,
-    "PurpleSlimeBanner": 2964,
-    "RaggedCasterBanner": 2965,
-    "RainbowSlimeBanner": 2966,
-    "RavenBanner": 2967,
-    "RedSlimeBanner": 2968,
-    "RuneWizardBanner": 2969,
-    "RustyArmoredBonesBanner": 2970,
-    "ScarecrowBanner": 2971,
-    "ScutlixBanner": 2972,
-    "SkeletonArcherBanner": 2973,
-    "SkeletonCommandoBanner": 2974,
-    "SkeletonSniperBanner": 2975,
-    "SlimerBanner": 2976,
-    "SnatcherBanner": 2977,
-    "SnowBallaBanner": 2978,
-    "SnowmanGangstaBanner": 2979,
-    "SpikedIceSlimeBanner": 2980,
-    "SpikedJungleSlimeBanner": 2981,
-    "SplinterlingBanner": 2982,
-    "SquidBanner": 2983,
-    "TacticalSkeletonBanner": 2984,
-    "TheGroomBanner": 2985,
-    "TimBanner": 2986,
-    "UndeadMinerBanner": 2987,
-    "UndeadVikingBanner": 2988,
-    "WhiteCultistArcherBanner": 2989,
-    "WhiteCultistCasterBanner": 2990,
-    "WhiteCultistFighterBanner": 2991,
-    "YellowSlimeBanner": 2992,
-    "YetiBanner": 2993,
-    "ZombieElfBanner": 2994,
-    "SparkyPainting": 2995,
-    "VineRope": 2996,
-    "WormholePotion": 2997,
-    "SummonerEmblem": 2998,
-    "BewitchingTable": 2999,
-    "AlchemyTable": 3000,
-    "StrangeBrew": 3001,
-    "SpelunkerGlowstick": 3002,
-    "BoneArrow": 3003,
-    "BoneTorch": 3004,
-    "VineRopeCoil": 3005,
-    "SoulDrain": 3006,
-    "DartPistol": 3007,
-    "DartRifle": 3008,
-    "CrystalDart": 3009,
-    "CursedDart": 3010,
-    "IchorDart": 3011,
-    "ChainGuillotines": 3012,
-    "FetidBaghnakhs": 3013,
-    "ClingerStaff": 3014,
-    "PutridScent": 3015,
-    "FleshKnuckles": 3016,
-    "FlowerBoots": 3017,
-    "Seedler": 3018,
-    "HellwingBow": 3019,
-    "TendonHook": 3020,
-    "ThornHook": 3021,
-    "IlluminantHook": 3022,
-    "WormHook": 3023,
-    "DevDye": 3024,
-    "PurpleOozeDye": 3025,
-    "ReflectiveSilverDye": 3026,
-    "ReflectiveGoldDye": 3027,
-    "BlueAcidDye": 3028,
-    "DaedalusStormbow": 3029,
-    "FlyingKnife": 3030,
-    "BottomlessBucket": 3031,
-    "SuperAbsorbantSponge": 3032,
-    "GoldRing": 3033,
-    "CoinRing": 3034,
-    "GreedyRing": 3035,
-    "FishFinder": 3036,
-    "WeatherRadio": 3037,
-    "HadesDye": 3038,
-    "TwilightDye": 3039,
-    "AcidDye": 3040,
-    "MushroomDye": 3041,
-    "PhaseDye": 3042,
-    "MagicLantern": 3043,
-    "MusicBoxLunarBoss": 3044,
-    "RainbowTorch": 3045,
-    "CursedCampfire": 3046,
-    "DemonCampfire": 3047,
-    "FrozenCampfire": 3048,
-    "IchorCampfire": 3049,
-    "RainbowCampfire": 3050,
-    "CrystalVileShard": 3051,
-    "ShadowFlameBow": 3052,
-    "ShadowFlameHexDoll": 3053,
-    "ShadowFlameKnife": 3054,
-    "PaintingAcorns": 3055,
-    "PaintingColdSnap": 3056,
-    "PaintingCursedSaint": 3057,
-    "PaintingSnowfellas": 3058,
-    "PaintingTheSeason": 3059,
-    "BoneRattle": 3060,
-    "ArchitectGizmoPack": 3061,
-    "CrimsonHeart": 3062,
-    "Meowmere": 3063,
-    "Sundial": 3064,
-    "StarWrath": 3065,
-    "MarbleBlock": 3066,
-    "HellstoneBrickWall": 3067,
-    "CordageGuide": 3068,
-    "WandofSparking": 3069,
-    "GoldBirdCage": 3070,
-    "GoldBunnyCage": 3071,
-    "GoldButterflyCage": 3072,
-    "GoldFrogCage": 3073,
-    "GoldGrasshopperCage": 3074,
-    "GoldMouseCage": 3075,
-    "GoldWormCage": 3076,
-    "SilkRope": 3077,
-    "WebRope": 3078,
-    "SilkRopeCoil": 3079,
-    "WebRopeCoil": 3080,
-    "Marble": 3081,
-    "MarbleWall": 3082,
-    "MarbleBlockWall": 3083,
-    "Radar": 3084,
-    "LockBox": 3085,
-    "Granite": 3086,
-    "GraniteBlock": 3087,
-    "GraniteWall": 3088,
-    "GraniteBlockWall": 3089,
-    "RoyalGel": 3090,
-    "NightKey": 3091,
-    "LightKey": 3092,
-    "HerbBag": 3093,
-    "Javelin": 3094,
-    "TallyCounter": 3095,
-    "Sextant": 3096,
-    "EoCShield": 3097,
-    "ButchersChainsaw": 3098,
-    "Stopwatch": 3099,
-    "MeteoriteBrick": 3100,
-    "MeteoriteBrickWall": 3101,
-    "MetalDetector": 3102,
-    "EndlessQuiver": 3103,
-    "EndlessMusketPouch": 3104,
-    "ToxicFlask": 3105,
-    "PsychoKnife": 3106,
-    "NailGun": 3107,
-    "Nail": 3108,
-    "NightVisionHelmet": 3109,
-    "CelestialShell": 3110,
-    "PinkGel": 3111,
-    "BouncyGlowstick": 3112,
-    "PinkSlimeBlock": 3113,
-    "PinkTorch": 3114,
-    "BouncyBomb": 3115,
-    "BouncyGrenade": 3116,
-    "PeaceCandle": 3117,
-    "LifeformAnalyzer": 3118,
-    "DPSMeter": 3119,
-    "FishermansGuide": 3120,
-    "GoblinTech": 3121,
-    "REK": 3122,
-    "PDA": 3123,
-    "CellPhone": 3124,
-    "GraniteChest": 3125,
-    "MeteoriteClock": 3126,
-    "MarbleClock": 3127,
-    "GraniteClock": 3128,
-    "MeteoriteDoor": 3129,
-    "MarbleDoor": 3130,
-    "GraniteDoor": 3131,
-    "MeteoriteDresser": 3132,
-    "MarbleDresser": 3133,
-    "GraniteDresser": 3134,
-    "MeteoriteLamp": 3135,
-    "MarbleLamp": 3136,
-    "GraniteLamp": 3137,
-    "MeteoriteLantern": 3138,
-    "MarbleLantern": 3139,
-    "GraniteLantern": 3140,
-    "MeteoritePiano": 3141,
-    "MarblePiano": 3142,
-    "GranitePiano": 3143,
-    "MeteoritePlatform": 3144,
-    "MarblePlatform": 3145,
-    "GranitePlatform": 3146,
-    "MeteoriteSink": 3147,
-    "MarbleSink": 3148,
-    "GraniteSink": 3149,
-    "MeteoriteSofa": 3150,
-    "MarbleSofa": 3151,
-    "GraniteSofa": 3152,
-    "MeteoriteTable": 3153,
-    "MarbleTable": 3154,
-    "GraniteTable": 3155,
-    "MeteoriteWorkBench": 3156,
-    "MarbleWorkBench": 3157,
-    "GraniteWorkBench": 3158,
-    "MeteoriteBathtub": 3159,
-    "MarbleBathtub": 3160,
-    "GraniteBathtub": 3161,
-    "MeteoriteBed": 3162,
-    "MarbleBed": 3163,
-    "GraniteBed": 3164,
-    "MeteoriteBookcase": 3165,
-    "MarbleBookcase": 3166,
-    "GraniteBookcase": 3167,
-    "MeteoriteCandelabra": 3168,
-    "MarbleCandelabra": 3169,
-    "GraniteCandelabra": 3170,
-    "MeteoriteCandle": 3171,
-    "MarbleCandle": 3172,
-    "GraniteCandle": 3173,
-    "MeteoriteChair": 3174,
-    "MarbleChair": 3175,
-    "GraniteChair": 3176,
-    "MeteoriteChandelier": 3177,
-    "MarbleChandelier": 3178,
-    "GraniteChandelier": 3179,
-    "MeteoriteChest": 3180,
-    "MarbleChest": 3181,
-    "MagicWaterDropper": 3182,
-    "GoldenBugNet": 3183,
-    "MagicLavaDropper": 3184,
-    "MagicHoneyDropper": 3185,
-    "EmptyDropper": 3186,
-    "GladiatorHelmet": 3187,
-    "GladiatorBreastplate": 3188,
-    "GladiatorLeggings": 3189,
-    "ReflectiveDye": 3190,
-    "EnchantedNightcrawler": 3191,
-    "Grubby": 3192,
-    "Sluggy": 3193,
-    "Buggy": 3194,
-    "GrubSoup": 3195,
-    "BombFish": 3196,
-    "FrostDaggerfish": 3197,
-    "SharpeningStation": 3198,
-    "IceMirror": 3199,
-    "SailfishBoots": 3200,
-    "TsunamiInABottle": 3201,
-    "TargetDummy": 3202,
-    "CorruptFishingCrate": 3203,
-    "CrimsonFishingCrate": 3204,
-    "DungeonFishingCrate": 3205,
-    "FloatingIslandFishingCrate": 3206,
-    "HallowedFishingCrate": 3207,
-    "JungleFishingCrate": 3208,
-    "CrystalSerpent": 3209,
-    "Toxikarp": 3210,
-    "Bladetongue": 3211,
-    "SharkToothNecklace": 3212,
-    "MoneyTrough": 3213,
-    "Bubble": 3214,
-    "DayBloomPlanterBox": 3215,
-    "MoonglowPlanterBox": 3216,
-    "CorruptPlanterBox": 3217,
-    "CrimsonPlanterBox": 3218,
-    "BlinkrootPlanterBox": 3219,
-    "WaterleafPlanterBox": 3220,
-    "ShiverthornPlanterBox": 3221,
-    "FireBlossomPlanterBox": 3222,
-    "BrainOfConfusion": 3223,
-    "WormScarf": 3224,
-    "BalloonPufferfish": 3225,
-    "BejeweledValkyrieHead": 3226,
-    "BejeweledValkyrieBody": 3227,
-    "BejeweledValkyrieWing": 3228,
-    "RichGravestone1": 3229,
-    "RichGravestone2": 3230,
-    "RichGravestone3": 3231,
-    "RichGravestone4": 3232,
-    "RichGravestone5": 3233,
-    "CrystalBlock": 3234,
-    "MusicBoxMartians": 3235,
-    "MusicBoxPirates": 3236,
-    "MusicBoxHell": 3237,
-    "CrystalBlockWall": 3238,
-    "Trapdoor": 3239,
-    "TallGate": 3240,
-    "SharkronBalloon": 3241,
-    "TaxCollectorHat": 3242,
-    "TaxCollectorSuit": 3243,
-    "TaxCollectorPants": 3244,
-    "BoneGlove": 3245,
-    "ClothierJacket": 3246,
-    "ClothierPants": 3247,
-    "DyeTraderTurban": 3248,
-    "DeadlySphereStaff": 3249,
-    "BalloonHorseshoeFart": 3250,
-    "BalloonHorseshoeHoney": 3251,
-    "BalloonHorseshoeSharkron": 3252,
-    "LavaLamp": 3253,
-    "CageEnchantedNightcrawler": 3254,
-    "CageBuggy": 3255,
-    "CageGrubby": 3256,
-    "CageSluggy": 3257,
-    "SlapHand": 3258,
-    "TwilightHairDye": 3259,
-    "BlessedApple": 3260,
-    "SpectreBar": 3261,
-    "Code1": 3262,
-    "BuccaneerBandana": 3263,
-    "BuccaneerShirt": 3264,
-    "BuccaneerPants": 3265,
-    "ObsidianHelm": 3266,
-    "ObsidianShirt": 3267,
-    "ObsidianPants": 3268,
-    "MedusaHead": 3269,
-    "ItemFrame": 3270,
-    "Sandstone": 3271,
-    "HardenedSand": 3272,
-    "SandstoneWall": 3273,
-    "CorruptHardenedSand": 3274,
-    "CrimsonHardenedSand": 3275,
-    "CorruptSandstone": 3276,
-    "CrimsonSandstone": 3277,
-    "WoodYoyo": 3278,
-    "CorruptYoyo": 3279,
-    "CrimsonYoyo": 3280,
-    "JungleYoyo": 3281,
-    "Cascade": 3282,
-    "Chik": 3283,
-    "Code2": 3284,
-    "Rally": 3285,
-    "Yelets": 3286,
-    "RedsYoyo": 3287,
-    "ValkyrieYoyo": 3288,
-    "Amarok": 3289,
-    "HelFire": 3290,
-    "Kraken": 3291,
-    "TheEyeOfCthulhu": 3292,
-    "RedString": 3293,
-    "OrangeString": 3294,
-    "YellowString": 3295,
-    "LimeString": 3296,
-    "GreenString": 3297,
-    "TealString": 3298,
-    "CyanString": 3299,
-    "SkyBlueString": 3300,
-    "BlueString": 3301,
-    "PurpleString": 3302,
-    "VioletString": 3303,
-    "PinkString": 3304,
-    "BrownString": 3305,
-    "WhiteString": 3306,
-    "RainbowString": 3307,
-    "BlackString": 3308,
-    "BlackCounterweight": 3309,
-    "BlueCounterweight": 3310,
-    "GreenCounterweight": 3311,
-    "PurpleCounterweight": 3312,
-    "RedCounterweight": 3313,
-    "YellowCounterweight": 3314,
-    "FormatC": 3315,
-    "Gradient": 3316,
-    "Valor": 3317,
-    "KingSlimeBossBag": 3318,
-    "EyeOfCthulhuBossBag": 3319,
-    "EaterOfWorldsBossBag": 3320,
-    "BrainOfCthulhuBossBag": 3321,
-    "QueenBeeBossBag": 3322,
-    "SkeletronBossBag": 3323,
-    "WallOfFleshBossBag": 3324,
-    "DestroyerBossBag": 3325,
-    "TwinsBossBag": 3326,
-    "SkeletronPrimeBossBag": 3327,
-    "PlanteraBossBag": 3328,
-    "GolemBossBag": 3329,
-    "FishronBossBag": 3330,
-    "CultistBossBag": 3331,
-    "MoonLordBossBag": 3332,
-    "HiveBackpack": 3333,
-    "YoYoGlove": 3334,
-    "DemonHeart": 3335,
-    "SporeSac": 3336,
-    "ShinyStone": 3337,
-    "HallowHardenedSand": 3338,
-    "HallowSandstone": 3339,
-    "HardenedSandWall": 3340,
-    "CorruptHardenedSandWall": 3341,
-    "CrimsonHardenedSandWall": 3342,
-    "HallowHardenedSandWall": 3343,
-    "CorruptSandstoneWall": 3344,
-    "CrimsonSandstoneWall": 3345,
-    "HallowSandstoneWall": 3346,
-    "DesertFossil": 3347,
-    "DesertFossilWall": 3348,
-    "DyeTradersScimitar": 3349,
-    "PainterPaintballGun": 3350,
-    "TaxCollectorsStickOfDoom": 3351,
-    "StylistKilLaKillScissorsIWish": 3352,
-    "MinecartMech": 3353,
-    "MechanicalWheelPiece": 3354,
-    "MechanicalWagonPiece": 3355,
-    "MechanicalBatteryPiece": 3356,
-    "AncientCultistTrophy": 3357,
-    "MartianSaucerTrophy": 3358,
-    "FlyingDutchmanTrophy": 3359,
-    "LivingMahoganyWand": 3360,
-    "LivingMahoganyLeafWand": 3361,
-    "FallenTuxedoShirt": 3362,
-    "FallenTuxedoPants": 3363,
-    "Fireplace": 3364,
-    "Chimney": 3365,
-    "YoyoBag": 3366,
-    "ShrimpyTruffle": 3367,
-    "Arkhalis": 3368,
-    "ConfettiCannon": 3369,
-    "MusicBoxTowers": 3370,
-    "MusicBoxGoblins": 3371,
-    "BossMaskCultist": 3372,
-    "BossMaskMoonlord": 3373,
-    "FossilHelm": 3374,
-    "FossilShirt": 3375,
-    "FossilPants": 3376,
-    "EmberStaff": 3377,
-    "BoneJavelin": 3378,
-    "BoneDagger": 3379,
-    "FossilOre": 3380,
-    "StardustHelmet": 3381,
-    "StardustBreastplate": 3382,
-    "StardustLeggings": 3383,
-    "PortalGun": 3384,
-    "StrangePlant1": 3385,
-    "StrangePlant2": 3386,
-    "StrangePlant3": 3387,
-    "StrangePlant4": 3388,
-    "Terrarian": 3389,
-    "GoblinSummonerBanner": 3390,
-    "SalamanderBanner": 3391,
-    "GiantShellyBanner": 3392,
-    "CrawdadBanner": 3393,
-    "FritzBanner": 3394,
-    "CreatureFromTheDeepBanner": 3395,
-    "DrManFlyBanner": 3396,
-    "MothronBanner": 3397,
-    "SeveredHandBanner": 3398,
-    "ThePossessedBanner": 3399,
-    "ButcherBanner": 3400,
-    "PsychoBanner": 3401,
-    "DeadlySphereBanner": 3402,
-    "NailheadBanner": 3403,
-    "PoisonousSporeBanner": 3404,
-    "MedusaBanner": 3405,
-    "GreekSkeletonBanner": 3406,
-    "GraniteFlyerBanner": 3407,
-    "GraniteGolemBanner": 3408,
-    "BloodZombieBanner": 3409,
-    "DripplerBanner": 3410,
-    "TombCrawlerBanner": 3411,
-    "DuneSplicerBanner": 3412,
-    "FlyingAntlionBanner": 3413,
-    "WalkingAntlionBanner": 3414,
-    "DesertGhoulBanner": 3415,
-    "DesertLamiaBanner": 3416,
-    "DesertDjinnBanner": 3417,
-    "DesertBasiliskBanner": 3418,
-    "RavagerScorpionBanner": 3419,
-    "StardustSoldierBanner": 3420,
-    "StardustWormBanner": 3421,
-    "StardustJellyfishBanner": 3422,
-    "StardustSpiderBanner": 3423,
-    "StardustSmallCellBanner": 3424,
-    "StardustLargeCellBanner": 3425,
-    "SolarCoriteBanner": 3426,
-    "SolarSrollerBanner": 3427,
-    "SolarCrawltipedeBanner": 3428,
-    "SolarDrakomireRiderBanner": 3429,
-    "SolarDrakomireBanner": 3430,
-    "SolarSolenianBanner": 3431,
-    "NebulaSoldierBanner": 3432,
-    "NebulaHeadcrabBanner": 3433,
-    "NebulaBrainBanner": 3434,
-    "NebulaBeastBanner": 3435,
-    "VortexLarvaBanner": 3436,
-    "VortexHornetQueenBanner": 3437,
-    "VortexHornetBanner": 3438,
-    "VortexSoldierBanner": 3439,
-    "VortexRiflemanBanner": 3440,
-    "PirateCaptainBanner": 3441,
-    "PirateDeadeyeBanner": 3442,
-    "PirateCorsairBanner": 3443,
-    "PirateCrossbowerBanner": 3444,
-    "MartianWalkerBanner": 3445,
-    "RedDevilBanner": 3446,
-    "PinkJellyfishBanner": 3447,
-    "GreenJellyfishBanner": 3448,
-    "DarkMummyBanner": 3449,
-    "LightMummyBanner": 3450,
-    "AngryBonesBanner": 3451,
-    "IceTortoiseBanner": 3452,
-    "NebulaPickup1": 3453,
-    "NebulaPickup2": 3454,
-    "NebulaPickup3": 3455,
-    "FragmentVortex": 3456,
-    "FragmentNebula": 3457,
-    "FragmentSolar": 3458,
-    "FragmentStardust": 3459,
-    "LunarOre": 3460,
-    "LunarBrick": 3461,
-    "StardustAxe": 3462,
-    "StardustChainsaw": 3463,
-    "StardustDrill": 3464,
-    "StardustHammer": 3465,
-    "StardustPickaxe": 3466,
-    "LunarBar": 3467,
-    "WingsSolar": 3468,
-    "WingsVortex": 3469,
-    "WingsNebula": 3470,
-    "WingsStardust": 3471,
-    "LunarBrickWall": 3472,
-    "SolarEruption": 3473,
-    "StardustCellStaff": 3474,
-    "VortexBeater": 3475,
-    "NebulaArcanum": 3476,
-    "BloodWater": 3477,
-    "TheBrideHat": 3478,
-    "TheBrideDress": 3479,
-    "PlatinumBow": 3480,
-    "PlatinumHammer": 3481,
-    "PlatinumAxe": 3482,
-    "PlatinumShortsword": 3483,
-    "PlatinumBroadsword": 3484,
-    "PlatinumPickaxe": 3485,
-    "TungstenBow": 3486,
-    "TungstenHammer": 3487,
-    "TungstenAxe": 3488,
-    "TungstenShortsword": 3489,
-    "TungstenBroadsword": 3490,
-    "TungstenPickaxe": 3491,
-    "LeadBow": 3492,
-    "LeadHammer": 3493,
-    "LeadAxe": 3494,
-    "LeadShortsword": 3495,
-    "LeadBroadsword": 3496,
-    "LeadPickaxe": 3497,
-    "TinBow": 3498,
-    "TinHammer": 3499,
-    "TinAxe": 3500,
-    "TinShortsword": 3501,
-    "TinBroadsword": 3502,
-    "TinPickaxe": 3503,
-    "CopperBow": 3504,
-    "CopperHammer": 3505,
-    "CopperAxe": 3506,
-    "CopperShortsword": 3507,
-    "CopperBroadsword": 3508,
-    "CopperPickaxe": 3509,
-    "SilverBow": 3510,
-    "SilverHammer": 3511,
-    "SilverAxe": 3512,
-    "SilverShortsword": 3513,
-    "SilverBroadsword": 3514,
-    "SilverPickaxe": 3515,
-    "GoldBow": 3516,
-    "GoldHammer": 3517,
-    "GoldAxe": 3518,
-    "GoldShortsword": 3519,
-    "GoldBroadsword": 3520,
-    "GoldPickaxe": 3521,
-    "LunarHamaxeSolar": 3522,
-    "LunarHamaxeVortex": 3523,
-    "LunarHamaxeNebula": 3524,
-    "LunarHamaxeStardust": 3525,
-    "SolarDye": 3526,
-    "NebulaDye": 3527,
-    "VortexDye": 3528,
-    "StardustDye": 3529,
-    "VoidDye": 3530,
-    "StardustDragonStaff": 3531,
-    "Bacon": 3532,
-    "ShiftingSandsDye": 3533,
-    "MirageDye": 3534,
-    "ShiftingPearlSandsDye": 3535,
-    "VortexMonolith": 3536,
-    "NebulaMonolith": 3537,
-    "StardustMonolith": 3538,
-    "SolarMonolith": 3539,
-    "Phantasm": 3540,
-    "LastPrism": 3541,
-    "NebulaBlaze": 3542,
-    "DayBreak": 3543,
-    "SuperHealingPotion": 3544,
-    "Detonator": 3545,
-    "FireworksLauncher": 3546,
-    "BouncyDynamite": 3547,
-    "PartyGirlGrenade": 3548,
-    "LunarCraftingStation": 3549,
-    "FlameAndSilverDye": 3550,
-    "GreenFlameAndSilverDye": 3551,
-    "BlueFlameAndSilverDye": 3552,
-    "ReflectiveCopperDye": 3553,
-    "ReflectiveObsidianDye": 3554,
-    "ReflectiveMetalDye": 3555,
-    "MidnightRainbowDye": 3556,
-    "BlackAndWhiteDye": 3557,
-    "BrightSilverDye": 3558,
-    "SilverAndBlackDye": 3559,
-    "RedAcidDye": 3560,
-    "GelDye": 3561,
-    "PinkGelDye": 3562,
-    "SquirrelRed": 3563,
-    "SquirrelGold": 3564,
-    "SquirrelOrangeCage": 3565,
-    "SquirrelGoldCage": 3566,
-    "MoonlordBullet": 3567,
-    "MoonlordArrow": 3568,
-    "MoonlordTurretStaff": 3569,
-    "LunarFlareBook": 3570,
-    "RainbowCrystalStaff": 3571,
-    "LunarHook": 3572,
-    "LunarBlockSolar": 3573,
-    "LunarBlockVortex": 3574,
-    "LunarBlockNebula": 3575,
-    "LunarBlockStardust": 3576,
-    "SuspiciousLookingTentacle": 3577,
-    "Yoraiz0rShirt": 3578,
-    "Yoraiz0rPants": 3579,
-    "Yoraiz0rWings": 3580,
-    "Yoraiz0rDarkness": 3581,
-    "JimsWings": 3582,
-    "Yoraiz0rHead": 3583,
-    "LivingLeafWall": 3584,
-    "SkiphsHelm": 3585,
-    "SkiphsShirt": 3586,
-    "SkiphsPants": 3587,
-    "SkiphsWings": 3588,
-    "LokisHelm": 3589,
-    "LokisShirt": 3590,
-    "LokisPants": 3591,
-    "LokisWings": 3592,
-    "SandSlimeBanner": 3593,
-    "SeaSnailBanner": 3594,
-    "MoonLordTrophy": 3595,
-    "MoonLordPainting": 3596,
-    "BurningHadesDye": 3597,
-    "GrimDye": 3598,
-    "LokisDye": 3599,
-    "ShadowflameHadesDye": 3600,
-    "CelestialSigil": 3601,
-    "Count": 3602,
-    "YellowPhasesaber": 65512,
-    "WhitePhasesaber": 65513,
-    "PurplePhasesaber": 65514,
-    "GreenPhasesaber": 65515,
-    "RedPhasesaber": 65516,
-    "BluePhasesaber": 65517,
-})  # ItemID, Items
-
-Item = _MakeNamesClass(Items)
-
-MessageID = _SwapKeysAndValues({
-    "NeverCalled": 0,
-    "Unknown1": 1,
-    "Unknown2": 2,
-    "Unknown3": 3,
-    "SyncPlayer": 4,
-    "SyncEquipment": 5,
-    "Unknown6": 6,
-    "Unknown7": 7,
-    "Unknown8": 8,
-    "Unknown9": 9,
-    "TileSection": 10,
-    "Unknown11": 11,
-    "Unknown12": 12,
-    "Unknown13": 13,
-    "Unknown14": 14,
-    "Unknown15": 15,
-    "Unknown16": 16,
-    "Unknown17": 17,
-    "Unknown18": 18,
-    "Unknown19": 19,
-    "Unknown20": 20,
-    "SyncItem": 21,
-    "Unknown22": 22,
-    "Unknown23": 23,
-    "Unknown24": 24,
-    "Unknown25": 25,
-    "Unknown26": 26,
-    "Unknown27": 27,
-    "Unknown28": 28,
-    "Unknown29": 29,
-    "Unknown30": 30,
-    "RequestChestOpen": 31,
-    "SyncChestItem": 32,
-    "SyncPlayerChest": 33,
-    "ChestUpdates": 34,
-    "Unknown35": 35,
-    "Unknown36": 36,
-    "Unknown37": 37,
-    "Unknown38": 38,
-    "Unknown39": 39,
-    "Unknown40": 40,
-    "Unknown41": 41,
-    "Unknown42": 42,
-    "Unknown43": 43,
-    "Unknown44": 44,
-    "Unknown45": 45,
-    "Unknown46": 46,
-    "Unknown47": 47,
-    "Unknown48": 48,
-    "Unknown49": 49,
-    "Unknown50": 50,
-    "Unknown51": 51,
-    "Unknown52": 52,
-    "Unknown53": 53,
-    "Unknown54": 54,
-    "Unknown55": 55,
-    "Unknown56": 56,
-    "Unknown57": 57,
-    "Unknown58": 58,
-    "Unknown59": 59,
-    "Unknown60": 60,
-    "Unknown61": 61,
-    "Unknown62": 62,
-    "Unknown63": 63,
-    "Unknown64": 64,
-    "Unknown65": 65,
-    "Unknown66": 66,
-    "Unknown67": 67,
-    "Unknown68": 68,
-    "ChestName": 69,
-    "BugCatching": 70,
-    "BugReleasing": 71,
-    "TravelMerchantItems": 72,
-    "TeleportationPotion": 73,
-    "AnglerQuest": 74,
-    "AnglerQuestFinished": 75,
-    "AnglerQuestCountSync": 76,
-    "TemporaryAnimation": 77,
-    "InvasionProgressReport": 78,
-    "PlaceObject": 79,
-    "SyncPLayerChestIndex": 80,
-    "ServerCombatText": 81,
-    "NetModules": 82,
-    "NPCKillCountDeathTally": 83,
-    "PlayerStealth": 84,
-    "QuickStackChests": 85,
-    "TileEntitySharing": 86,
-    "TileEntityPlacement": 87,
-    "ItemTweaker": 88,
-    "ItemFrameTryPlacing": 89,
-    "InstancedItem": 90,
-    "SyncEmoteBubble": 91,
-    "SyncExtraValue": 92,
-    "SocialHandshake": 93,
-    "Deprecated1": 94,
-    "MurderSomeoneElsesProjectile": 95,
-    "TeleportPlayerThroughPortal": 96,
-    "AchievementMessageNPCKilled": 97,
-    "AchievementMessageEventHappened": 98,
-    "MinionTargetUpdate": 99,
-    "TeleportNPCThroughPortal": 100,
-    "UpdateTowerShieldStrengths": 101,
-    "NebulaLevelupRequest": 102,
-    "MoonlordHorror": 103,
-    "ShopOverride": 104,
-    "Count": 105,
-})  # MessageID
-
-NPCID, NPCs = _MakeIDNameLookup({
-    "Slimeling": -1,
-    "Slimer": -2,
-    "Green Slime": -3,
-    "Pinky": -4,
-    "Baby Slime": -5,
-    "Black Slime": -6,
-    "Purple Slime": -7,
-    "Red Slime": -8,
-    "Yellow Slime": -9,
-    "Jungle Slime": -10,
-    "BigHornetStingy": 65471,
-    "LittleHornetStingy": 65472,
-    "BigHornetSpikey": 65473,
-    "LittleHornetSpikey": 65474,
-    "BigHornetLeafy": 65475,
-    "LittleHornetLeafy": 65476,
-    "BigHornetHoney": 65477,
-    "LittleHornetHoney": 65478,
-    "BigHornetFatty": 65479,
-    "LittleHornetFatty": 65480,
-    "BigRainZombie": 65481,
-    "SmallRainZombie": 65482,
-    "BigPantlessSkeleton": 65483,
-    "SmallPantlessSkeleton": 65484,
-    "BigMisassembledSkeleton": 65485,
-    "SmallMisassembledSkeleton": 65486,
-    "BigHeadacheSkeleton": 65487,
-    "SmallHeadacheSkeleton": 65488,
-    "BigSkeleton": 65489,
-    "SmallSkeleton": 65490,
-    "BigFemaleZombie": 65491,
-    "SmallFemaleZombie": 65492,
-    "DemonEye2": 65493,
-    "PurpleEye2": 65494,
-    "GreenEye2": 65495,
-    "DialatedEye2": 65496,
-    "SleepyEye2": 65497,
-    "CataractEye2": 65498,
-    "BigTwiggyZombie": 65499,
-    "SmallTwiggyZombie": 65500,
-    "BigSwampZombie": 65501,
-    "SmallSwampZombie": 65502,
-    "BigSlimedZombie": 65503,
-    "SmallSlimedZombie": 65504,
-    "BigPincushionZombie": 65505,
-    "SmallPincushionZombie": 65506,
-    "BigBaldZombie": 65507,
-    "SmallBaldZombie": 65508,
-    "BigZombie": 65509,
-    "SmallZombie": 65510,
-    "BigCrimslime": 65511,
-    "LittleCrimslime": 65512,
-    "BigCrimera": 65513,
-    "LittleCrimera": 65514,
-    "GiantMossHornet": 65515,
-    "BigMossHornet": 65516,
-    "LittleMossHornet": 65517,
-    "TinyMossHornet": 65518,
-    "BigStinger": 65519,
-    "LittleStinger": 65520,
-    "HeavySkeleton": 65521,
-    "BigBoned": 65522,
-    "ShortBones": 65523,
-    "BigEater": 65524,
-    "LittleEater": 65525,
-    "JungleSlime": 65526,
-    "YellowSlime": 65527,
-    "RedSlime": 65528,
-    "PurpleSlime": 65529,
-    "BlackSlime": 65530,
-    "BabySlime": 65531,
-    "Pinky": 65532,
-    "GreenSlime": 65533,
-    "Slimer2": 65534,
-    "Slimeling": 65535,
-    "None": 0,
-    "BlueSlime": 1,
-    "DemonEye": 2,
-    "Zombie": 3,
-    "EyeofCthulhu": 4,
-    "ServantofCthulhu": 5,
-    "EaterofSouls": 6,
-    "DevourerHead": 7,
-    "DevourerBody": 8,
-    "DevourerTail": 9,
-    "GiantWormHead": 10,
-    "GiantWormBody": 11,
-    "GiantWormTail": 12,
-    "EaterofWorldsHead": 13,
-    "EaterofWorldsBody": 14,
-    "EaterofWorldsTail": 15,
-    "MotherSlime": 16,
-    "Merchant": 17,
-    "Nurse": 18,
-    "ArmsDealer": 19,
-    "Dryad": 20,
-    "Skeleton": 21,
-    "Guide": 22,
-    "MeteorHead": 23,
-    "FireImp": 24,
-    "BurningSphere": 25,
-    "GoblinPeon": 26,
-    "GoblinThief": 27,
-    "GoblinWarrior": 28,
-    "GoblinSorcerer": 29,
-    "ChaosBall": 30,
-    "AngryBones": 31,
-    "DarkCaster": 32,
-    "WaterSphere": 33,
-    "CursedSkull": 34,
-    "SkeletronHead": 35,
-    "SkeletronHand": 36,
-    "OldMan": 37,
-    "Demolitionist": 38,
-    "BoneSerpentHead": 39,
-    "BoneSerpentBody": 40,
-    "BoneSerpentTail": 41,
-    "Hornet": 42,
-    "ManEater": 43,
-    "UndeadMiner": 44,
-    "Tim": 45,
-    "Bunny": 46,
-    "CorruptBunny": 47,
-    "Harpy": 48,
-    "CaveBat": 49,
-    "KingSlime": 50,
-    "JungleBat": 51,
-    "DoctorBones": 52,
-    "TheGroom": 53,
-    "Clothier": 54,
-    "Goldfish": 55,
-    "Snatcher": 56,
-    "CorruptGoldfish": 57,
-    "Piranha": 58,
-    "LavaSlime": 59,
-    "Hellbat": 60,
-    "Vulture": 61,
-    "Demon": 62,
-    "BlueJellyfish": 63,
-    "PinkJellyfish": 64,
-    "Shark": 65,
-    "VoodooDemon": 66,
-    "Crab": 67,
-    "DungeonGuardian": 68,
-    "Antlion": 69,
-    "SpikeBall": 70,
-    "DungeonSlime": 71,
-    "BlazingWheel": 72,
-    "GoblinScout": 73,
-    "Bird": 74,
-    "Pixie": 75,
-    "None2": 76,
-    "ArmoredSkeleton": 77,
-    "Mummy": 78,
-    "DarkMummy": 79,
-    "LightMummy": 80,
-    "CorruptSlime": 81,
-    "Wraith": 82,
-    "CursedHammer": 83,
-    "EnchantedSword": 84,
-    "Mimic": 85,
-    "Unicorn": 86,
-    "WyvernHead": 87,
-    "WyvernLegs": 88,
-    "WyvernBody": 89,
-    "WyvernBody2": 90,
-    "WyvernBody3": 91,
-    "WyvernTail": 92,
-    "GiantBat": 93,
-    "Corruptor": 94,
-    "DiggerHead": 95,
-    "DiggerBody": 96,
-    "DiggerTail": 97,
-    "SeekerHead": 98,
-    "SeekerBody": 99,
-    "SeekerTail": 100,
-    "Clinger": 101,
-    "AnglerFish": 102,
-    "GreenJellyfish": 103,
-    "Werewolf": 104,
-    "BoundGoblin": 105,
-    "BoundWizard": 106,
-    "GoblinTinkerer": 107,
-    "Wizard": 108,
-    "Clown": 109,
-    "SkeletonArcher": 110,
-    "GoblinArcher": 111,
-    "VileSpit": 112,
-    "WallofFlesh": 113,
-    "WallofFleshEye": 114,
-    "TheHungry": 115,
-    "TheHungryII": 116,
-    "LeechHead": 117,
-    "LeechBody": 118,
-    "LeechTail": 119,
-    "ChaosElemental": 120,
-    "Slimer": 121,
-    "Gastropod": 122,
-    "BoundMechanic": 123,
-    "Mechanic": 124,
-    "Retinazer": 125,
-    "Spazmatism": 126,
-    "SkeletronPrime": 127,
-    "PrimeCannon": 128,
-    "PrimeSaw": 129,
-    "PrimeVice": 130,
-    "PrimeLaser": 131,
-    "BaldZombie": 132,
-    "WanderingEye": 133,
-    "TheDestroyer": 134,
-    "TheDestroyerBody": 135,
-    "TheDestroyerTail": 136,
-    "IlluminantBat": 137,
-    "IlluminantSlime": 138,
-    "Probe": 139,
-    "PossessedArmor": 140,
-    "ToxicSludge": 141,
-    "SantaClaus": 142,
-    "SnowmanGangsta": 143,
-    "MisterStabby": 144,
-    "SnowBalla": 145,
-    "None3": 146,
-    "IceSlime": 147,
-    "Penguin": 148,
-    "PenguinBlack": 149,
-    "IceBat": 150,
-    "Lavabat": 151,
-    "GiantFlyingFox": 152,
-    "GiantTortoise": 153,
-    "IceTortoise": 154,
-    "Wolf": 155,
-    "RedDevil": 156,
-    "Arapaima": 157,
-    "VampireBat": 158,
-    "Vampire": 159,
-    "Truffle": 160,
-    "ZombieEskimo": 161,
-    "Frankenstein": 162,
-    "BlackRecluse": 163,
-    "WallCreeper": 164,
-    "WallCreeperWall": 165,
-    "SwampThing": 166,
-    "UndeadViking": 167,
-    "CorruptPenguin": 168,
-    "IceElemental": 169,
-    "PigronCorruption": 170,
-    "PigronHallow": 171,
-    "RuneWizard": 172,
-    "Crimera": 173,
-    "Herpling": 174,
-    "AngryTrapper": 175,
-    "MossHornet": 176,
-    "Derpling": 177,
-    "Steampunker": 178,
-    "CrimsonAxe": 179,
-    "PigronCrimson": 180,
-    "FaceMonster": 181,
-    "FloatyGross": 182,
-    "Crimslime": 183,
-    "SpikedIceSlime": 184,
-    "SnowFlinx": 185,
-    "PincushionZombie": 186,
-    "SlimedZombie": 187,
-    "SwampZombie": 188,
-    "TwiggyZombie": 189,
-    "CataractEye": 190,
-    "SleepyEye": 191,
-    "DialatedEye": 192,
-    "GreenEye": 193,
-    "PurpleEye": 194,
-    "LostGirl": 195,
-    "Nymph": 196,
-    "ArmoredViking": 197,
-    "Lihzahrd": 198,
-    "LihzahrdCrawler": 199,
-    "FemaleZombie": 200,
-    "HeadacheSkeleton": 201,
-    "MisassembledSkeleton": 202,
-    "PantlessSkeleton": 203,
-    "SpikedJungleSlime": 204,
-    "Moth": 205,
-    "IcyMerman": 206,
-    "DyeTrader": 207,
-    "PartyGirl": 208,
-    "Cyborg": 209,
-    "Bee": 210,
-    "BeeSmall": 211,
-    "PirateDeckhand": 212,
-    "PirateCorsair": 213,
-    "PirateDeadeye": 214,
-    "PirateCrossbower": 215,
-    "PirateCaptain": 216,
-    "CochinealBeetle": 217,
-    "CyanBeetle": 218,
-    "LacBeetle": 219,
-    "SeaSnail": 220,
-    "Squid": 221,
-    "QueenBee": 222,
-    "ZombieRaincoat": 223,
-    "FlyingFish": 224,
-    "UmbrellaSlime": 225,
-    "FlyingSnake": 226,
-    "Painter": 227,
-    "WitchDoctor": 228,
-    "Pirate": 229,
-    "GoldfishWalker": 230,
-    "HornetFatty": 231,
-    "HornetHoney": 232,
-    "HornetLeafy": 233,
-    "HornetSpikey": 234,
-    "HornetStingy": 235,
-    "JungleCreeper": 236,
-    "JungleCreeperWall": 237,
-    "BlackRecluseWall": 238,
-    "BloodCrawler": 239,
-    "BloodCrawlerWall": 240,
-    "BloodFeeder": 241,
-    "BloodJelly": 242,
-    "IceGolem": 243,
-    "RainbowSlime": 244,
-    "Golem": 245,
-    "GolemHead": 246,
-    "GolemFistLeft": 247,
-    "GolemFistRight": 248,
-    "GolemHeadFree": 249,
-    "AngryNimbus": 250,
-    "Eyezor": 251,
-    "Parrot": 252,
-    "Reaper": 253,
-    "ZombieMushroom": 254,
-    "ZombieMushroomHat": 255,
-    "FungoFish": 256,
-    "AnomuraFungus": 257,
-    "MushiLadybug": 258,
-    "FungiBulb": 259,
-    "GiantFungiBulb": 260,
-    "FungiSpore": 261,
-    "Plantera": 262,
-    "PlanterasHook": 263,
-    "PlanterasTentacle": 264,
-    "Spore": 265,
-    "BrainofCthulhu": 266,
-    "Creeper": 267,
-    "IchorSticker": 268,
-    "RustyArmoredBonesAxe": 269,
-    "RustyArmoredBonesFlail": 270,
-    "RustyArmoredBonesSword": 271,
-    "RustyArmoredBonesSwordNoArmor": 272,
-    "BlueArmoredBones": 273,
-    "BlueArmoredBonesMace": 274,
-    "BlueArmoredBonesNoPants": 275,
-    "BlueArmoredBonesSword": 276,
-    "HellArmoredBones": 277,
-    "HellArmoredBonesSpikeShield": 278,
-    "HellArmoredBonesMace": 279,
-    "HellArmoredBonesSword": 280,
-    "RaggedCaster": 281,
-    "RaggedCasterOpenCoat": 282,
-    "Necromancer": 283,
-    "NecromancerArmored": 284,
-    "DiabolistRed": 285,
-    "DiabolistWhite": 286,
-    "BoneLee": 287,
-    "DungeonSpirit": 288,
-    "GiantCursedSkull": 289,
-    "Paladin": 290,
-    "SkeletonSniper": 291,
-    "TacticalSkeleton": 292,
-    "SkeletonCommando": 293,
-    "AngryBonesBig": 294,
-    "AngryBonesBigMuscle": 295,
-    "AngryBonesBigHelmet": 296,
-    "BirdBlue": 297,
-    "BirdRed": 298,
-    "Squirrel": 299,
-    "Mouse": 300,
-    "Raven": 301,
-    "SlimeMasked": 302,
-    "BunnySlimed": 303,
-    "HoppinJack": 304,
-    "Scarecrow1": 305,
-    "Scarecrow2": 306,
-    "Scarecrow3": 307,
-    "Scarecrow4": 308,
-    "Scarecrow5": 309,
-    "Scarecrow6": 310,
-    "Scarecrow7": 311,
-    "Scarecrow8": 312,
-    "Scarecrow9": 313,
-    "Scarecrow10": 314,
-    "HeadlessHorseman": 315,
-    "Ghost": 316,
-    "DemonEyeOwl": 317,
-    "DemonEyeSpaceship": 318,
-    "ZombieDoctor": 319,
-    "ZombieSuperman": 320,
-    "ZombiePixie": 321,
-    "SkeletonTopHat": 322,
-    "SkeletonAstonaut": 323,
-    "SkeletonAlien": 324,
-    "MourningWood": 325,
-    "Splinterling": 326,
-    "Pumpking": 327,
-    "PumpkingBlade": 328,
-    "Hellhound": 329,
-    "Poltergeist": 330,
-    "ZombieXmas": 331,
-    "ZombieSweater": 332,
-    "SlimeRibbonWhite": 333,
-    "SlimeRibbonYellow": 334,
-    "SlimeRibbonGreen": 335,
-    "SlimeRibbonRed": 336,
-    "BunnyXmas": 337,
-    "ZombieElf": 338,
-    "ZombieElfBeard": 339,
-    "ZombieElfGirl": 340,
-    "PresentMimic": 341,
-    "GingerbreadMan": 342,
-    "Yeti": 343,
-    "Everscream": 344,
-    "IceQueen": 345,
-    "SantaNK1": 346,
-    "ElfCopter": 347,
-    "Nutcracker": 348,
-    "NutcrackerSpinning": 349,
-    "ElfArcher": 350,
-    "Krampus": 351,
-    "Flocko": 352,
-    "Stylist": 353,
-    "WebbedStylist": 354,
-    "Firefly": 355,
-    "Butterfly": 356,
-    "Worm": 357,
-    "LightningBug": 358,
-    "Snail": 359,
-    "GlowingSnail": 360,
-    "Frog": 361,
-    "Duck": 362,
-    "Duck2": 363,
-    "DuckWhite": 364,
-    "DuckWhite2": 365,
-    "ScorpionBlack": 366,
-    "Scorpion": 367,
-    "TravellingMerchant": 368,
-    "Angler": 369,
-    "DukeFishron": 370,
-    "DetonatingBubble": 371,
-    "Sharkron": 372,
-    "Sharkron2": 373,
-    "TruffleWorm": 374,
-    "TruffleWormDigger": 375,
-    "SleepingAngler": 376,
-    "Grasshopper": 377,
-    "ChatteringTeethBomb": 378,
-    "CultistArcherBlue": 379,
-    "CultistArcherWhite": 380,
-    "BrainScrambler": 381,
-    "RayGunner": 382,
-    "MartianOfficer": 383,
-    "ForceBubble": 384,
-    "GrayGrunt": 385,
-    "MartianEngineer": 386,
-    "MartianTurret": 387,
-    "MartianDrone": 388,
-    "GigaZapper": 389,
-    "ScutlixRider": 390,
-    "Scutlix": 391,
-    "MartianSaucer": 392,
-    "MartianSaucerTurret": 393,
-    "MartianSaucerCannon": 394,
-    "MartianSaucerCore": 395,
-    "MoonLordHead": 396,
-    "MoonLordHand": 397,
-    "MoonLordCore": 398,
-    "MartianProbe": 399,
-    "MoonLordFreeEye": 400,
-    "MoonLordLeechBlob": 401,
-    "StardustWormHead": 402,
-    "StardustWormBody": 403,
-    "StardustWormTail": 404,
-    "StardustCellBig": 405,
-    "StardustCellSmall": 406,
-    "StardustJellyfishBig": 407,
-    "StardustJellyfishSmall": 408,
-    "StardustSpiderBig": 409,
-    "StardustSpiderSmall": 410,
-    "StardustSoldier": 411,
-    "SolarCrawltipedeHead": 412,
-    "SolarCrawltipedeBody": 413,
-    "SolarCrawltipedeTail": 414,
-    "SolarDrakomire": 415,
-    "SolarDrakomireRider": 416,
-    "SolarSroller": 417,
-    "SolarCorite": 418,
-    "SolarSolenian": 419,
-    "NebulaBrain": 420,
-    "NebulaHeadcrab": 421,
-    "NebulaBeast": 423,
-    "NebulaSoldier": 424,
-    "VortexRifleman": 425,
-    "VortexHornetQueen": 426,
-    "VortexHornet": 427,
-    "VortexLarva": 428,
-    "VortexSoldier": 429,
-    "ArmedZombie": 430,
-    "ArmedZombieEskimo": 431,
-    "ArmedZombiePincussion": 432,
-    "ArmedZombieSlimed": 433,
-    "ArmedZombieSwamp": 434,
-    "ArmedZombieTwiggy": 435,
-    "ArmedZombieCenx": 436,
-    "CultistTablet": 437,
-    "CultistDevote": 438,
-    "CultistBoss": 439,
-    "CultistBossClone": 440,
-    "GoldBird": 442,
-    "GoldBunny": 443,
-    "GoldButterfly": 444,
-    "GoldFrog": 445,
-    "GoldGrasshopper": 446,
-    "GoldMouse": 447,
-    "GoldWorm": 448,
-    "BoneThrowingSkeleton": 449,
-    "BoneThrowingSkeleton2": 450,
-    "BoneThrowingSkeleton3": 451,
-    "BoneThrowingSkeleton4": 452,
-    "SkeletonMerchant": 453,
-    "CultistDragonHead": 454,
-    "CultistDragonBody1": 455,
-    "CultistDragonBody2": 456,
-    "CultistDragonBody3": 457,
-    "CultistDragonBody4": 458,
-    "CultistDragonTail": 459,
-    "Butcher": 460,
-    "CreatureFromTheDeep": 461,
-    "Fritz": 462,
-    "Nailhead": 463,
-    "CrimsonBunny": 464,
-    "CrimsonGoldfish": 465,
-    "Psycho": 466,
-    "DeadlySphere": 467,
-    "DrManFly": 468,
-    "ThePossessed": 469,
-    "CrimsonPenguin": 470,
-    "GoblinSummoner": 471,
-    "ShadowFlameApparition": 472,
-    "BigMimicCorruption": 473,
-    "BigMimicCrimson": 474,
-    "BigMimicHallow": 475,
-    "BigMimicJungle": 476,
-    "Mothron": 477,
-    "MothronEgg": 478,
-    "MothronSpawn": 479,
-    "Medusa": 480,
-    "GreekSkeleton": 481,
-    "GraniteGolem": 482,
-    "GraniteFlyer": 483,
-    "EnchantedNightcrawler": 484,
-    "Grubby": 485,
-    "Sluggy": 486,
-    "Buggy": 487,
-    "TargetDummy": 488,
-    "BloodZombie": 489,
-    "Drippler": 490,
-    "PirateShip": 491,
-    "PirateShipCannon": 492,
-    "LunarTowerStardust": 493,
-    "Crawdad": 494,
-    "Crawdad2": 495,
-    "GiantShelly": 496,
-    "GiantShelly2": 497,
-    "Salamander": 498,
-    "Salamander2": 499,
-    "Salamander3": 500,
-    "Salamander4": 501,
-    "Salamander5": 502,
-    "Salamander6": 503,
-    "Salamander7": 504,
-    "Salamander8": 505,
-    "Salamander9": 506,
-    "LunarTowerNebula": 507,
-    "LunarTowerVortex": 422,
-    "TaxCollector": 441,
-    "WalkingAntlion": 508,
-    "FlyingAntlion": 509,
-    "DuneSplicerHead": 510,
-    "DuneSplicerBody": 511,
-    "DuneSplicerTail": 512,
-    "TombCrawlerHead": 513,
-    "TombCrawlerBody": 514,
-    "TombCrawlerTail": 515,
-    "SolarFlare": 516,
-    "LunarTowerSolar": 517,
-    "SolarSpearman": 518,
-    "SolarGoop": 519,
-    "MartianWalker": 520,
-    "AncientCultistSquidhead": 521,
-    "AncientLight": 522,
-    "AncientDoom": 523,
-    "DesertGhoul": 524,
-    "DesertGhoulCorruption": 525,
-    "DesertGhoulCrimson": 526,
-    "DesertGhoulHallow": 527,
-    "DesertLamiaLight": 528,
-    "DesertLamiaDark": 529,
-    "DesertScorpionWalk": 530,
-    "DesertScorpionWall": 531,
-    "DesertBeast": 532,
-    "DesertDjinn": 533,
-    "DemonTaxCollector": 534,
-    "SlimeSpiked": 535,
-    "TheBride": 536,
-    "SandSlime": 537,
-    "SquirrelRed": 538,
-    "SquirrelGold": 539,
-    "Count": 540,
-})  # NPCID
-
-PlayerVariantID = _SwapKeysAndValues({
-    "MaleStarter": 0,
-    "MaleSticker": 1,
-    "MaleGangster": 2,
-    "MaleFancy": 3,
-    "FemaleStarter": 4,
-    "FemaleSticker": 5,
-    "FemaleGangster": 6,
-    "FemaleFancy": 7,
-    "Count": 8,
-})  # PlayerVariantID
-
-PlayerTextureID = _SwapKeysAndValues({
-    "Head": 0,
-    "EyeWhites": 1,
-    "Eyes": 2,
-    "TorsoSkin": 3,
-    "Undershirt": 4,
-    "Hands": 5,
-    "Shirt": 6,
-    "ArmSkin": 7,
-    "ArmUndershirt": 8,
-    "ArmHand": 9,
-    "LegSkin": 10,
-    "Pants": 11,
-    "Shoes": 12,
-    "ArmShirt": 13,
-    "Extra": 14,
-    "Count": 15,
-})  # PlayerTextureID
-
-ProjectileID, Projectiles = _MakeIDNameLookup({
-    "None": 0,
-    "WoodenArrowFriendly": 1,
-    "FireArrow": 2,
-    "Shuriken": 3,
-    "UnholyArrow": 4,
-    "JestersArrow": 5,
-    "EnchantedBoomerang": 6,
-    "VilethornBase": 7,
-    "VilethornTip": 8,
-    "Starfury": 9,
-    "PurificationPowder": 10,
-    "VilePowder": 11,
-    "FallingStar": 12,
-    "Hook": 13,
-    "Bullet": 14,
-    "BallofFire": 15,
-    "MagicMissile": 16,
-    "DirtBall": 17,
-    "ShadowOrb": 18,
-    "Flamarang": 19,
-    "GreenLaser": 20,
-    "Bone": 21,
-    "WaterStream": 22,
-    "Harpoon": 23,
-    "SpikyBall": 24,
-    "BallOHurt": 25,
-    "BlueMoon": 26,
-    "WaterBolt": 27,
-    "Bomb": 28,
-    "Dynamite": 29,
-    "Grenade": 30,
-    "SandBallFalling": 31,
-    "IvyWhip": 32,
-    "ThornChakram": 33,
-    "Flamelash": 34,
-    "Sunfury": 35,
-    "MeteorShot": 36,
-    "StickyBomb": 37,
-    "HarpyFeather": 38,
-    "MudBall": 39,
-    "AshBallFalling": 40,
-    "HellfireArrow": 41,
-    "SandBallGun": 42,
-    "Tombstone": 43,
-    "DemonSickle": 44,
-    "DemonScythe": 45,
-    "DarkLance": 46,
-    "Trident": 47,
-    "ThrowingKnife": 48,
-    "Spear": 49,
-    "Glowstick": 50,
-    "Seed": 51,
-    "WoodenBoomerang": 52,
-    "StickyGlowstick": 53,
-    "PoisonedKnife": 54,
-    "Stinger": 55,
-    "EbonsandBallFalling": 56,
-    "CobaltChainsaw": 57,
-    "MythrilChainsaw": 58,
-    "CobaltDrill": 59,
-    "MythrilDrill": 60,
-    "AdamantiteChainsaw": 61,
-    "AdamantiteDrill": 62,
-    "TheDaoofPow": 63,
-    "MythrilHalberd": 64,
-    "EbonsandBallGun": 65,
-    "AdamantiteGlaive": 66,
-    "PearlSandBallFalling": 67,
-    "PearlSandBallGun": 68,
-    "HolyWater": 69,
-    "UnholyWater": 70,
-    "SiltBall": 71,
-    "BlueFairy": 72,
-    "DualHookBlue": 73,
-    "DualHookRed": 74,
-    "HappyBomb": 75,
-    "QuarterNote": 76,
-    "EighthNote": 77,
-    "TiedEighthNote": 78,
-    "RainbowRodBullet": 79,
-    "IceBlock": 80,
-    "WoodenArrowHostile": 81,
-    "FlamingArrow": 82,
-    "EyeLaser": 83,
-    "PinkLaser": 84,
-    "Flames": 85,
-    "PinkFairy": 86,
-    "GreenFairy": 87,
-    "PurpleLaser": 88,
-    "CrystalBullet": 89,
-    "CrystalShard": 90,
-    "HolyArrow": 91,
-    "HallowStar": 92,
-    "MagicDagger": 93,
-    "CrystalStorm": 94,
-    "CursedFlameFriendly": 95,
-    "CursedFlameHostile": 96,
-    "CobaltNaginata": 97,
-    "PoisonDart": 98,
-    "Boulder": 99,
-    "DeathLaser": 100,
-    "EyeFire": 101,
-    "BombSkeletronPrime": 102,
-    "CursedArrow": 103,
-    "CursedBullet": 104,
-    "Gungnir": 105,
-    "LightDisc": 106,
-    "Hamdrax": 107,
-    "Explosives": 108,
-    "SnowBallHostile": 109,
-    "BulletSnowman": 110,
-    "Bunny": 111,
-    "Penguin": 112,
-    "IceBoomerang": 113,
-    "UnholyTridentFriendly": 114,
-    "UnholyTridentHostile": 115,
-    "SwordBeam": 116,
-    "BoneArrow": 117,
-    "IceBolt": 118,
-    "FrostBoltSword": 119,
-    "FrostArrow": 120,
-    "AmethystBolt": 121,
-    "TopazBolt": 122,
-    "SapphireBolt": 123,
-    "EmeraldBolt": 124,
-    "RubyBolt": 125,
-    "DiamondBolt": 126,
-    "Turtle": 127,
-    "FrostBlastHostile": 128,
-    "RuneBlast": 129,
-    "MushroomSpear": 130,
-    "Mushroom": 131,
-    "TerraBeam": 132,
-    "GrenadeI": 133,
-    "RocketI": 134,
-    "ProximityMineI": 135,
-    "GrenadeII": 136,
-    "RocketII": 137,
-    "ProximityMineII": 138,
-    "GrenadeIII": 139,
-    "RocketIII": 140,
-    "ProximityMineIII": 141,
-    "GrenadeIV": 142,
-    "RocketIV": 143,
-    "ProximityMineIV": 144,
-    "PureSpray": 145,
-    "HallowSpray": 146,
-    "CorruptSpray": 147,
-    "MushroomSpray": 148,
-    "CrimsonSpray": 149,
-    "NettleBurstRight": 150,
-    "NettleBurstLeft": 151,
-    "NettleBurstEnd": 152,
-    "TheRottedFork": 153,
-    "TheMeatball": 154,
-    "BeachBall": 155,
-    "LightBeam": 156,
-    "NightBeam": 157,
-    "CopperCoin": 158,
-    "SilverCoin": 159,
-    "GoldCoin": 160,
-    "PlatinumCoin": 161,
-    "CannonballFriendly": 162,
-    "Flare": 163,
-    "Landmine": 164,
-    "Web": 165,
-    "SnowBallFriendly": 166,
-    "RocketFireworkRed": 167,
-    "RocketFireworkGreen": 168,
-    "RocketFireworkBlue": 169,
-    "RocketFireworkYellow": 170,
-    "RopeCoil": 171,
-    "FrostburnArrow": 172,
-    "EnchantedBeam": 173,
-    "IceSpike": 174,
-    "BabyEater": 175,
-    "JungleSpike": 176,
-    "IcewaterSpit": 177,
-    "ConfettiGun": 178,
-    "SlushBall": 179,
-    "BulletDeadeye": 180,
-    "Bee": 181,
-    "PossessedHatchet": 182,
-    "Beenade": 183,
-    "PoisonDartTrap": 184,
-    "SpikyBallTrap": 185,
-    "SpearTrap": 186,
-    "FlamethrowerTrap": 187,
-    "FlamesTrap": 188,
-    "Wasp": 189,
-    "MechanicalPiranha": 190,
-    "Pygmy": 191,
-    "Pygmy2": 192,
-    "Pygmy3": 193,
-    "Pygmy4": 194,
-    "PygmySpear": 195,
-    "SmokeBomb": 196,
-    "BabySkeletronHead": 197,
-    "BabyHornet": 198,
-    "TikiSpirit": 199,
-    "PetLizard": 200,
-    "GraveMarker": 201,
-    "CrossGraveMarker": 202,
-    "Headstone": 203,
-    "Gravestone": 204,
-    "Obelisk": 205,
-    "Leaf": 206,
-    "ChlorophyteBullet": 207,
-    "Parrot": 208,
-    "Truffle": 209,
-    "Sapling": 210,
-    "Wisp": 211,
-    "PalladiumPike": 212,
-    "PalladiumDrill": 213,
-    "PalladiumChainsaw": 214,
-    "OrichalcumHalberd": 215,
-    "OrichalcumDrill": 216,
-    "OrichalcumChainsaw": 217,
-    "TitaniumTrident": 218,
-    "TitaniumDrill": 219,
-    "TitaniumChainsaw": 220,
-    "FlowerPetal": 221,
-    "ChlorophytePartisan": 222,
-    "ChlorophyteDrill": 223,
-    "ChlorophyteChainsaw": 224,
-    "ChlorophyteArrow": 225,
-    "CrystalLeaf": 226,
-    "CrystalLeafShot": 227,
-    "SporeCloud": 228,
-    "ChlorophyteOrb": 229,
-    "GemHookAmethyst": 230,
-    "GemHookTopaz": 231,
-    "GemHookSapphire": 232,
-    "GemHookEmerald": 233,
-    "GemHookRuby": 234,
-    "GemHookDiamond": 235,
-    "BabyDino": 236,
-    "RainCloudMoving": 237,
-    "RainCloudRaining": 238,
-    "RainFriendly": 239,
-    "CannonballHostile": 240,
-    "CrimsandBallFalling": 241,
-    "BulletHighVelocity": 242,
-    "BloodCloudMoving": 243,
-    "BloodCloudRaining": 244,
-    "BloodRain": 245,
-    "Stynger": 246,
-    "FlowerPow": 247,
-    "FlowerPowPetal": 248,
-    "StyngerShrapnel": 249,
-    "RainbowFront": 250,
-    "RainbowBack": 251,
-    "ChlorophyteJackhammer": 252,
-    "BallofFrost": 253,
-    "MagnetSphereBall": 254,
-    "MagnetSphereBolt": 255,
-    "SkeletronHand": 256,
-    "FrostBeam": 257,
-    "Fireball": 258,
-    "EyeBeam": 259,
-    "HeatRay": 260,
-    "BoulderStaffOfEarth": 261,
-    "GolemFist": 262,
-    "IceSickle": 263,
-    "RainNimbus": 264,
-    "PoisonFang": 265,
-    "BabySlime": 266,
-    "PoisonDartBlowgun": 267,
-    "EyeSpring": 268,
-    "BabySnowman": 269,
-    "Skull": 270,
-    "BoxingGlove": 271,
-    "Bananarang": 272,
-    "ChainKnife": 273,
-    "DeathSickle": 274,
-    "SeedPlantera": 275,
-    "PoisonSeedPlantera": 276,
-    "ThornBall": 277,
-    "IchorArrow": 278,
-    "IchorBullet": 279,
-    "GoldenShowerFriendly": 280,
-    "ExplosiveBunny": 281,
-    "VenomArrow": 282,
-    "VenomBullet": 283,
-    "PartyBullet": 284,
-    "NanoBullet": 285,
-    "ExplosiveBullet": 286,
-    "GoldenBullet": 287,
-    "GoldenShowerHostile": 288,
-    "ConfettiMelee": 289,
-    "ShadowBeamHostile": 290,
-    "InfernoHostileBolt": 291,
-    "InfernoHostileBlast": 292,
-    "LostSoulHostile": 293,
-    "ShadowBeamFriendly": 294,
-    "InfernoFriendlyBolt": 295,
-    "InfernoFriendlyBlast": 296,
-    "LostSoulFriendly": 297,
-    "SpiritHeal": 298,
-    "Shadowflames": 299,
-    "PaladinsHammerHostile": 300,
-    "PaladinsHammerFriendly": 301,
-    "SniperBullet": 302,
-    "RocketSkeleton": 303,
-    "VampireKnife": 304,
-    "VampireHeal": 305,
-    "EatersBite": 306,
-    "TinyEater": 307,
-    "FrostHydra": 308,
-    "FrostBlastFriendly": 309,
-    "BlueFlare": 310,
-    "CandyCorn": 311,
-    "JackOLantern": 312,
-    "Spider": 313,
-    "Squashling": 314,
-    "BatHook": 315,
-    "Bat": 316,
-    "Raven": 317,
-    "RottenEgg": 318,
-    "BlackCat": 319,
-    "BloodyMachete": 320,
-    "FlamingJack": 321,
-    "WoodHook": 322,
-    "Stake": 323,
-    "CursedSapling": 324,
-    "FlamingWood": 325,
-    "GreekFire1": 326,
-    "GreekFire2": 327,
-    "GreekFire3": 328,
-    "FlamingScythe": 329,
-    "StarAnise": 330,
-    "CandyCaneHook": 331,
-    "ChristmasHook": 332,
-    "FruitcakeChakram": 333,
-    "Puppy": 334,
-    "OrnamentFriendly": 335,
-    "PineNeedleFriendly": 336,
-    "Blizzard": 337,
-    "RocketSnowmanI": 338,
-    "RocketSnowmanII": 339,
-    "RocketSnowmanIII": 340,
-    "RocketSnowmanIV": 341,
-    "NorthPoleWeapon": 342,
-    "NorthPoleSpear": 343,
-    "NorthPoleSnowflake": 344,
-    "PineNeedleHostile": 345,
-    "OrnamentHostile": 346,
-    "OrnamentHostileShrapnel": 347,
-    "FrostWave": 348,
-    "FrostShard": 349,
-    "Missile": 350,
-    "Present": 351,
-    "Spike": 352,
-    "BabyGrinch": 353,
-    "CrimsandBallGun": 354,
-    "VenomFang": 355,
-    "SpectreWrath": 356,
-    "PulseBolt": 357,
-    "WaterGun": 358,
-    "FrostBoltStaff": 359,
-    "BobberWooden": 360,
-    "BobberReinforced": 361,
-    "BobberFiberglass": 362,
-    "BobberFisherOfSouls": 363,
-    "BobberGolden": 364,
-    "BobberMechanics": 365,
-    "BobbersittingDuck": 366,
-    "ObsidianSwordfish": 367,
-    "Swordfish": 368,
-    "SawtoothShark": 369,
-    "LovePotion": 370,
-    "FoulPotion": 371,
-    "FishHook": 372,
-    "Hornet": 373,
-    "HornetStinger": 374,
-    "FlyingImp": 375,
-    "ImpFireball": 376,
-    "SpiderHiver": 377,
-    "SpiderEgg": 378,
-    "BabySpider": 379,
-    "ZephyrFish": 380,
-    "BobberFleshcatcher": 381,
-    "BobberHotline": 382,
-    "Anchor": 383,
-    "Sharknado": 384,
-    "SharknadoBolt": 385,
-    "Cthulunado": 386,
-    "Retanimini": 387,
-    "Spazmamini": 388,
-    "MiniRetinaLaser": 389,
-    "VenomSpider": 390,
-    "JumperSpider": 391,
-    "DangerousSpider": 392,
-    "OneEyedPirate": 393,
-    "SoulscourgePirate": 394,
-    "PirateCaptain": 395,
-    "SlimeHook": 396,
-    "StickyGrenade": 397,
-    "MiniMinotaur": 398,
-    "MolotovCocktail": 399,
-    "MolotovFire": 400,
-    "MolotovFire2": 401,
-    "MolotovFire3": 402,
-    "TrackHook": 403,
-    "Flairon": 404,
-    "FlaironBubble": 405,
-    "SlimeGun": 406,
-    "Tempest": 407,
-    "MiniSharkron": 408,
-    "Typhoon": 409,
-    "Bubble": 410,
-    "CopperCoinsFalling": 411,
-    "SilverCoinsFalling": 412,
-    "GoldCoinsFalling": 413,
-    "PlatinumCoinsFalling": 414,
-    "RocketFireworksBoxRed": 415,
-    "RocketFireworksBoxGreen": 416,
-    "RocketFireworksBoxBlue": 417,
-    "RocketFireworksBoxYellow": 418,
-    "FireworkFountainYellow": 419,
-    "FireworkFountainRed": 420,
-    "FireworkFountainBlue": 421,
-    "FireworkFountainRainbow": 422,
-    "UFOMinion": 423,
-    "Meteor1": 424,
-    "Meteor2": 425,
-    "Meteor3": 426,
-    "VortexChainsaw": 427,
-    "VortexDrill": 428,
-    "NebulaChainsaw": 429,
-    "NebulaDrill": 430,
-    "SolarFlareChainsaw": 431,
-    "SolarFlareDrill": 432,
-    "UFOLaser": 433,
-    "ScutlixLaserFriendly": 434,
-    "MartianTurretBolt": 435,
-    "BrainScramblerBolt": 436,
-    "GigaZapperSpear": 437,
-    "RayGunnerLaser": 438,
-    "LaserMachinegun": 439,
-    "LaserMachinegunLaser": 440,
-    "ScutlixLaserCrosshair": 441,
-    "ElectrosphereMissile": 442,
-    "Electrosphere": 443,
-    "Xenopopper": 444,
-    "LaserDrill": 445,
-    "AntiGravityHook": 446,
-    "SaucerDeathray": 447,
-    "SaucerMissile": 448,
-    "SaucerLaser": 449,
-    "SaucerScrap": 450,
-    "InfluxWaver": 451,
-    "PhantasmalEye": 452,
-    "DrillMountCrosshair": 453,
-    "PhantasmalSphere": 454,
-    "PhantasmalDeathray": 455,
-    "MoonLeech": 456,
-    "PhasicWarpEjector": 457,
-    "PhasicWarpDisc": 458,
-    "ChargedBlasterOrb": 459,
-    "ChargedBlasterCannon": 460,
-    "ChargedBlasterLaser": 461,
-    "PhantasmalBolt": 462,
-    "ViciousPowder": 463,
-    "CultistBossIceMist": 464,
-    "CultistBossLightningOrb": 465,
-    "CultistBossLightningOrbArc": 466,
-    "CultistBossFireBall": 467,
-    "CultistBossFireBallClone": 468,
-    "BeeArrow": 469,
-    "StickyDynamite": 470,
-    "SkeletonBone": 471,
-    "WebSpit": 472,
-    "SpelunkerGlowstick": 473,
-    "BoneArrowFromMerchant": 474,
-    "VineRopeCoil": 475,
-    "SoulDrain": 476,
-    "CrystalDart": 477,
-    "CursedDart": 478,
-    "IchorDart": 479,
-    "CursedDartFlame": 480,
-    "ChainGuillotine": 481,
-    "ClingerStaff": 482,
-    "SeedlerNut": 483,
-    "SeedlerThorn": 484,
-    "Hellwing": 485,
-    "TendonHook": 486,
-    "ThornHook": 487,
-    "IlluminantHook": 488,
-    "WormHook": 489,
-    "CultistRitual": 490,
-    "FlyingKnife": 491,
-    "MagicLantern": 492,
-    "CrystalVileShardHead": 493,
-    "CrystalVileShardShaft": 494,
-    "ShadowFlameArrow": 495,
-    "ShadowFlame": 496,
-    "ShadowFlameKnife": 497,
-    "Nail": 498,
-    "BabyFaceMonster": 499,
-    "CrimsonHeart": 500,
-    "DrManFlyFlask": 501,
-    "Meowmere": 502,
-    "StarWrath": 503,
-    "Spark": 504,
-    "SilkRopeCoil": 505,
-    "WebRopeCoil": 506,
-    "JavelinFriendly": 507,
-    "JavelinHostile": 508,
-    "ButchersChainsaw": 509,
-    "ToxicFlask": 510,
-    "ToxicCloud": 511,
-    "ToxicCloud2": 512,
-    "ToxicCloud3": 513,
-    "NailFriendly": 514,
-    "BouncyGlowstick": 515,
-    "BouncyBomb": 516,
-    "BouncyGrenade": 517,
-    "CoinPortal": 518,
-    "BombFish": 519,
-    "FrostDaggerfish": 520,
-    "CrystalPulse": 521,
-    "CrystalPulse2": 522,
-    "ToxicBubble": 523,
-    "IchorSplash": 524,
-    "FlyingPiggyBank": 525,
-    "CultistBossParticle": 526,
-    "RichGravestone1": 527,
-    "RichGravestone2": 528,
-    "RichGravestone3": 529,
-    "RichGravestone4": 530,
-    "RichGravestone5": 531,
-    "BoneGloveProj": 532,
-    "DeadlySphere": 533,
-    "Code1": 534,
-    "MedusaHead": 535,
-    "MedusaHeadRay": 536,
-    "StardustSoldierLaser": 537,
-    "Twinkle": 538,
-    "StardustJellyfishSmall": 539,
-    "StardustTowerMark": 540,
-    "WoodYoyo": 541,
-    "CorruptYoyo": 542,
-    "CrimsonYoyo": 543,
-    "JungleYoyo": 544,
-    "Cascade": 545,
-    "Chik": 546,
-    "Code2": 547,
-    "Rally": 548,
-    "Yelets": 549,
-    "RedsYoyo": 550,
-    "ValkyrieYoyo": 551,
-    "Amarok": 552,
-    "HelFire": 553,
-    "Kraken": 554,
-    "TheEyeOfCthulhu": 555,
-    "BlackCounterweight": 556,
-    "BlueCounterweight": 557,
-    "GreenCounterweight": 558,
-    "PurpleCounterweight": 559,
-    "RedCounterweight": 560,
-    "YellowCounterweight": 561,
-    "FormatC": 562,
-    "Gradient": 563,
-    "Valor": 564,
-    "BrainOfConfusion": 565,
-    "GiantBee": 566,
-    "SporeTrap": 567,
-    "SporeTrap2": 568,
-    "SporeGas": 569,
-    "SporeGas2": 570,
-    "SporeGas3": 571,
-    "SalamanderSpit": 572,
-    "NebulaBolt": 573,
-    "NebulaEye": 574,
-    "NebulaSphere": 575,
-    "NebulaLaser": 576,
-    "VortexLaser": 577,
-    "VortexVortexLightning": 578,
-    "VortexVortexPortal": 579,
-    "VortexLightning": 580,
-    "VortexAcid": 581,
-    "MechanicWrench": 582,
-    "NurseSyringeHurt": 583,
-    "NurseSyringeHeal": 584,
-    "ClothiersCurse": 585,
-    "DryadsWardCircle": 586,
-    "PainterPaintball": 587,
-    "PartyGirlGrenade": 588,
-    "SantaBombs": 589,
-    "TruffleSpore": 590,
-    "MinecartMechLaser": 591,
-    "MartianWalkerLaser": 592,
-    "AncientDoomProjectile": 593,
-    "BlowupSmoke": 594,
-    "Arkhalis": 595,
-    "DesertDjinnCurse": 596,
-    "EmberBolt": 597,
-    "BoneJavelin": 598,
-    "BoneDagger": 599,
-    "PortalGun": 600,
-    "PortalGunBolt": 601,
-    "PortalGunGate": 602,
-    "Terrarian": 603,
-    "TerrarianBeam": 604,
-    "SpikedSlimeSpike": 605,
-    "ScutlixLaser": 606,
-    "SolarFlareRay": 607,
-    "SolarCounter": 608,
-    "StardustDrill": 609,
-    "StardustChainsaw": 610,
-    "SolarWhipSword": 611,
-    "SolarWhipSwordExplosion": 612,
-    "StardustCellMinion": 613,
-    "StardustCellMinionShot": 614,
-    "VortexBeater": 615,
-    "VortexBeaterRocket": 616,
-    "NebulaArcanum": 617,
-    "NebulaArcanumSubshot": 618,
-    "NebulaArcanumExplosionShot": 619,
-    "NebulaArcanumExplosionShotShard": 620,
-    "BloodWater": 621,
-    "BlowupSmokeMoonlord": 622,
-    "StardustGuardian": 623,
-    "StardustGuardianExplosion": 624,
-    "StardustDragon1": 625,
-    "StardustDragon2": 626,
-    "StardustDragon3": 627,
-    "StardustDragon4": 628,
-    "TowerDamageBolt": 629,
-    "Phantasm": 630,
-    "PhantasmArrow": 631,
-    "LastPrismLaser": 632,
-    "LastPrism": 633,
-    "NebulaBlaze1": 634,
-    "NebulaBlaze2": 635,
-    "Daybreak": 636,
-    "BouncyDynamite": 637,
-    "MoonlordBullet": 638,
-    "MoonlordArrow": 639,
-    "MoonlordArrowTrail": 640,
-    "MoonlordTurret": 641,
-    "MoonlordTurretLaser": 642,
-    "RainbowCrystal": 643,
-    "RainbowCrystalExplosion": 644,
-    "LunarFlare": 645,
-    "LunarHookSolar": 646,
-    "LunarHookVortex": 647,
-    "LunarHookNebula": 648,
-    "LunarHookStardust": 649,
-    "SuspiciousTentacle": 650,
-    "Count": 651,
-})  # ProjectileID, Projectiles
-
-StatusID = _SwapKeysAndValues({
-    "Ok": 0,
-    "LaterVersion": 1,
-    "UnknownError": 2,
-    "EmptyFile": 3,
-    "DecryptionError": 4,
-    "BadSectionPointer": 5,
-    "BadFooter": 6,
-})  # StatusID
-
-TileID, Tiles = _MakeIDNameLookup({
-    "Dirt": 0,
-    "Stone": 1,
-    "Grass": 2,
-    "Plants": 3,
-    "Torches": 4,
-    "Trees": 5,
-    "Iron": 6,
-    "Copper": 7,
-    "Gold": 8,
-    "Silver": 9,
-    "ClosedDoor": 10,
-    "OpenDoor": 11,
-    "Heart": 12,
-    "Bottles": 13,
-    "Tables": 14,
-    "Chairs": 15,
-    "Anvils": 16,
-    "Furnaces": 17,
-    "WorkBenches": 18,
-    "Platforms": 19,
-    "Saplings": 20,
-    "Containers": 21,
-    "Demonite": 22,
-    "CorruptGrass": 23,
-    "CorruptPlants": 24,
-    "Ebonstone": 25,
-    "DemonAltar": 26,
-    "Sunflower": 27,
-    "Pots": 28,
-    "PiggyBank": 29,
-    "WoodBlock": 30,
-    "ShadowOrbs": 31,
-    "CorruptThorns": 32,
-    "Candles": 33,
-    "Chandeliers": 34,
-    "Jackolanterns": 35,
-    "Presents": 36,
-    "Meteorite": 37,
-    "GrayBrick": 38,
-    "RedBrick": 39,
-    "ClayBlock": 40,
-    "BlueDungeonBrick": 41,
-    "HangingLanterns": 42,
-    "GreenDungeonBrick": 43,
-    "PinkDungeonBrick": 44,
-    "GoldBrick": 45,
-    "SilverBrick": 46,
-    "CopperBrick": 47,
-    "Spikes": 48,
-    "WaterCandle": 49,
-    "Books": 50,
-    "Cobweb": 51,
-    "Vines": 52,
-    "Sand": 53,
-    "Glass": 54,
-    "Signs": 55,
-    "Obsidian": 56,
-    "Ash": 57,
-    "Hellstone": 58,
-    "Mud": 59,
-    "JungleGrass": 60,
-    "JunglePlants": 61,
-    "JungleVines": 62,
-    "Sapphire": 63,
-    "Ruby": 64,
-    "Emerald": 65,
-    "Topaz": 66,
-    "Amethyst": 67,
-    "Diamond": 68,
-    "JungleThorns": 69,
-    "MushroomGrass": 70,
-    "MushroomPlants": 71,
-    "MushroomTrees": 72,
-    "Plants2": 73,
-    "JunglePlants2": 74,
-    "ObsidianBrick": 75,
-    "HellstoneBrick": 76,
-    "Hellforge": 77,
-    "ClayPot": 78,
-    "Beds": 79,
-    "Cactus": 80,
-    "Coral": 81,
-    "ImmatureHerbs": 82,
-    "MatureHerbs": 83,
-    "BloomingHerbs": 84,
-    "Tombstones": 85,
-    "Loom": 86,
-    "Pianos": 87,
-    "Dressers": 88,
-    "Benches": 89,
-    "Bathtubs": 90,
-    "Banners": 91,
-    "Lampposts": 92,
-    "Lamps": 93,
-    "Kegs": 94,
-    "ChineseLanterns": 95,
-    "CookingPots": 96,
-    "Safes": 97,
-    "SkullLanterns": 98,
-    "TrashCan": 99,
-    "Candelabras": 100,
-    "Bookcases": 101,
-    "Thrones": 102,
-    "Bowls": 103,
-    "GrandfatherClocks": 104,
-    "Statues": 105,
-    "Sawmill": 106,
-    "Cobalt": 107,
-    "Mythril": 108,
-    "HallowedGrass": 109,
-    "HallowedPlants": 110,
-    "Adamantite": 111,
-    "Ebonsand": 112,
-    "HallowedPlants2": 113,
-    "TinkerersWorkbench": 114,
-    "HallowedVines": 115,
-    "Pearlsand": 116,
-    "Pearlstone": 117,
-    "PearlstoneBrick": 118,
-    "IridescentBrick": 119,
-    "Mudstone": 120,
-    "CobaltBrick": 121,
-    "MythrilBrick": 122,
-    "Silt": 123,
-    "WoodenBeam": 124,
-    "CrystalBall": 125,
-    "DiscoBall": 126,
-    "MagicalIceBlock": 127,
-    "Mannequin": 128,
-    "Crystals": 129,
-    "ActiveStoneBlock": 130,
-    "InactiveStoneBlock": 131,
-    "Lever": 132,
-    "AdamantiteForge": 133,
-    "MythrilAnvil": 134,
-    "PressurePlates": 135,
-    "Switches": 136,
-    "Traps": 137,
-    "Boulder": 138,
-    "MusicBoxes": 139,
-    "DemoniteBrick": 140,
-    "Explosives": 141,
-    "InletPump": 142,
-    "OutletPump": 143,
-    "Timers": 144,
-    "CandyCaneBlock": 145,
-    "GreenCandyCaneBlock": 146,
-    "SnowBlock": 147,
-    "SnowBrick": 148,
-    "HolidayLights": 149,
-    "AdamantiteBeam": 150,
-    "SandstoneBrick": 151,
-    "EbonstoneBrick": 152,
-    "RedStucco": 153,
-    "YellowStucco": 154,
-    "GreenStucco": 155,
-    "GrayStucco": 156,
-    "Ebonwood": 157,
-    "RichMahogany": 158,
-    "Pearlwood": 159,
-    "RainbowBrick": 160,
-    "IceBlock": 161,
-    "BreakableIce": 162,
-    "CorruptIce": 163,
-    "HallowedIce": 164,
-    "Stalactite": 165,
-    "Tin": 166,
-    "Lead": 167,
-    "Tungsten": 168,
-    "Platinum": 169,
-    "PineTree": 170,
-    "ChristmasTree": 171,
-    "Sinks": 172,
-    "PlatinumCandelabra": 173,
-    "PlatinumCandle": 174,
-    "TinBrick": 175,
-    "TungstenBrick": 176,
-    "PlatinumBrick": 177,
-    "ExposedGems": 178,
-    "GreenMoss": 179,
-    "BrownMoss": 180,
-    "RedMoss": 181,
-    "BlueMoss": 182,
-    "PurpleMoss": 183,
-    "LongMoss": 184,
-    "SmallPiles": 185,
-    "LargePiles": 186,
-    "LargePiles2": 187,
-    "CactusBlock": 188,
-    "Cloud": 189,
-    "MushroomBlock": 190,
-    "LivingWood": 191,
-    "LeafBlock": 192,
-    "SlimeBlock": 193,
-    "BoneBlock": 194,
-    "FleshBlock": 195,
-    "RainCloud": 196,
-    "FrozenSlimeBlock": 197,
-    "Asphalt": 198,
-    "FleshGrass": 199,
-    "FleshIce": 200,
-    "FleshWeeds": 201,
-    "Sunplate": 202,
-    "Crimstone": 203,
-    "Crimtane": 204,
-    "CrimsonVines": 205,
-    "IceBrick": 206,
-    "WaterFountain": 207,
-    "Shadewood": 208,
-    "Cannon": 209,
-    "LandMine": 210,
-    "Chlorophyte": 211,
-    "SnowballLauncher": 212,
-    "Rope": 213,
-    "Chain": 214,
-    "Campfire": 215,
-    "Firework": 216,
-    "Blendomatic": 217,
-    "MeatGrinder": 218,
-    "Extractinator": 219,
-    "Solidifier": 220,
-    "Palladium": 221,
-    "Orichalcum": 222,
-    "Titanium": 223,
-    "Slush": 224,
-    "Hive": 225,
-    "LihzahrdBrick": 226,
-    "DyePlants": 227,
-    "DyeVat": 228,
-    "HoneyBlock": 229,
-    "CrispyHoneyBlock": 230,
-    "Larva": 231,
-    "WoodenSpikes": 232,
-    "PlantDetritus": 233,
-    "Crimsand": 234,
-    "Teleporter": 235,
-    "LifeFruit": 236,
-    "LihzahrdAltar": 237,
-    "PlanteraBulb": 238,
-    "MetalBars": 239,
-    "Painting3X3": 240,
-    "Painting4X3": 241,
-    "Painting6X4": 242,
-    "ImbuingStation": 243,
-    "BubbleMachine": 244,
-    "Painting2X3": 245,
-    "Painting3X2": 246,
-    "Autohammer": 247,
-    "PalladiumColumn": 248,
-    "BubblegumBlock": 249,
-    "Titanstone": 250,
-    "PumpkinBlock": 251,
-    "HayBlock": 252,
-    "SpookyWood": 253,
-    "Pumpkins": 254,
-    "AmethystGemsparkOff": 255,
-    "TopazGemsparkOff": 256,
-    "SapphireGemsparkOff": 257,
-    "EmeraldGemsparkOff": 258,
-    "RubyGemsparkOff": 259,
-    "DiamondGemsparkOff": 260,
-    "AmberGemsparkOff": 261,
-    "AmethystGemspark": 262,
-    "TopazGemspark": 263,
-    "SapphireGemspark": 264,
-    "EmeraldGemspark": 265,
-    "RubyGemspark": 266,
-    "DiamondGemspark": 267,
-    "AmberGemspark": 268,
-    "Womannequin": 269,
-    "FireflyinaBottle": 270,
-    "LightningBuginaBottle": 271,
-    "Cog": 272,
-    "StoneSlab": 273,
-    "SandStoneSlab": 274,
-    "BunnyCage": 275,
-    "SquirrelCage": 276,
-    "MallardDuckCage": 277,
-    "DuckCage": 278,
-    "BirdCage": 279,
-    "BlueJay": 280,
-    "CardinalCage": 281,
-    "FishBowl": 282,
-    "HeavyWorkBench": 283,
-    "CopperPlating": 284,
-    "SnailCage": 285,
-    "GlowingSnailCage": 286,
-    "AmmoBox": 287,
-    "MonarchButterflyJar": 288,
-    "PurpleEmperorButterflyJar": 289,
-    "RedAdmiralButterflyJar": 290,
-    "UlyssesButterflyJar": 291,
-    "SulphurButterflyJar": 292,
-    "TreeNymphButterflyJar": 293,
-    "ZebraSwallowtailButterflyJar": 294,
-    "JuliaButterflyJar": 295,
-    "ScorpionCage": 296,
-    "BlackScorpionCage": 297,
-    "FrogCage": 298,
-    "MouseCage": 299,
-    "BoneWelder": 300,
-    "FleshCloningVat": 301,
-    "GlassKiln": 302,
-    "LihzahrdFurnace": 303,
-    "LivingLoom": 304,
-    "SkyMill": 305,
-    "IceMachine": 306,
-    "SteampunkBoiler": 307,
-    "HoneyDispenser": 308,
-    "PenguinCage": 309,
-    "WormCage": 310,
-    "DynastyWood": 311,
-    "RedDynastyShingles": 312,
-    "BlueDynastyShingles": 313,
-    "MinecartTrack": 314,
-    "Coralstone": 315,
-    "BlueJellyfishBowl": 316,
-    "GreenJellyfishBowl": 317,
-    "PinkJellyfishBowl": 318,
-    "ShipInABottle": 319,
-    "SeaweedPlanter": 320,
-    "BorealWood": 321,
-    "PalmWood": 322,
-    "PalmTree": 323,
-    "BeachPiles": 324,
-    "TinPlating": 325,
-    "Waterfall": 326,
-    "Lavafall": 327,
-    "Confetti": 328,
-    "ConfettiBlack": 329,
-    "CopperCoinPile": 330,
-    "SilverCoinPile": 331,
-    "GoldCoinPile": 332,
-    "PlatinumCoinPile": 333,
-    "WeaponsRack": 334,
-    "FireworksBox": 335,
-    "LivingFire": 336,
-    "AlphabetStatues": 337,
-    "FireworkFountain": 338,
-    "GrasshopperCage": 339,
-    "LivingCursedFire": 340,
-    "LivingDemonFire": 341,
-    "LivingFrostFire": 342,
-    "LivingIchor": 343,
-    "LivingUltrabrightFire": 344,
-    "Honeyfall": 345,
-    "ChlorophyteBrick": 346,
-    "CrimtaneBrick": 347,
-    "ShroomitePlating": 348,
-    "MushroomStatue": 349,
-    "MartianConduitPlating": 350,
-    "ChimneySmoke": 351,
-    "CrimtaneThorns": 352,
-    "VineRope": 353,
-    "BewitchingTable": 354,
-    "AlchemyTable": 355,
-    "Sundial": 356,
-    "MarbleBlock": 357,
-    "GoldBirdCage": 358,
-    "GoldBunnyCage": 359,
-    "GoldButterflyCage": 360,
-    "GoldFrogCage": 361,
-    "GoldGrasshopperCage": 362,
-    "GoldMouseCage": 363,
-    "GoldWormCage": 364,
-    "SilkRope": 365,
-    "WebRope": 366,
-    "Marble": 367,
-    "Granite": 368,
-    "GraniteBlock": 369,
-    "MeteoriteBrick": 370,
-    "PinkSlimeBlock": 371,
-    "PeaceCandle": 372,
-    "WaterDrip": 373,
-    "LavaDrip": 374,
-    "HoneyDrip": 375,
-    "FishingCrate": 376,
-    "SharpeningStation": 377,
-    "TargetDummy": 378,
-    "Bubble": 379,
-    "PlanterBox": 380,
-    "LavaMoss": 381,
-    "VineFlowers": 382,
-    "LivingMahogany": 383,
-    "LivingMahoganyLeaves": 384,
-    "CrystalBlock": 385,
-    "TrapdoorOpen": 386,
-    "TrapdoorClosed": 387,
-    "TallGateClosed": 388,
-    "TallGateOpen": 389,
-    "LavaLamp": 390,
-    "CageEnchantedNightcrawler": 391,
-    "CageBuggy": 392,
-    "CageGrubby": 393,
-    "CageSluggy": 394,
-    "ItemFrame": 395,
-    "Sandstone": 396,
-    "HardenedSand": 397,
-    "CorruptHardenedSand": 398,
-    "CrimsonHardenedSand": 399,
-    "CorruptSandstone": 400,
-    "CrimsonSandstone": 401,
-    "HallowHardenedSand": 402,
-    "HallowSandstone": 403,
-    "DesertFossil": 404,
-    "Fireplace": 405,
-    "Chimney": 406,
-    "FossilOre": 407,
-    "LunarOre": 408,
-    "LunarBrick": 409,
-    "LunarMonolith": 410,
-    "Detonator": 411,
-    "LunarCraftingStation": 412,
-    "SquirrelOrangeCage": 413,
-    "SquirrelGoldCage": 414,
-    "LunarBlockSolar": 415,
-    "LunarBlockVortex": 416,
-    "LunarBlockNebula": 417,
-    "LunarBlockStardust": 418,
-    "Count": 419,
-})  # TileID, Tiles
-
-Tile = _MakeNamesClass(Tiles)
-
-WallID, Walls = _MakeIDNameLookup({
-    "None": 0,
-    "Stone": 1,
-    "DirtUnsafe": 2,
-    "EbonstoneUnsafe": 3,
-    "Wood": 4,
-    "GrayBrick": 5,
-    "RedBrick": 6,
-    "BlueDungeonUnsafe": 7,
-    "GreenDungeonUnsafe": 8,
-    "PinkDungeonUnsafe": 9,
-    "GoldBrick": 10,
-    "SilverBrick": 11,
-    "CopperBrick": 12,
-    "HellstoneBrickUnsafe": 13,
-    "ObsidianBrickUnsafe": 14,
-    "MudUnsafe": 15,
-    "Dirt": 16,
-    "BlueDungeon": 17,
-    "GreenDungeon": 18,
-    "PinkDungeon": 19,
-    "ObsidianBrick": 20,
-    "Glass": 21,
-    "PearlstoneBrick": 22,
-    "IridescentBrick": 23,
-    "MudstoneBrick": 24,
-    "CobaltBrick": 25,
-    "MythrilBrick": 26,
-    "Planked": 27,
-    "PearlstoneBrickUnsafe": 28,
-    "CandyCane": 29,
-    "GreenCandyCane": 30,
-    "SnowBrick": 31,
-    "AdamantiteBeam": 32,
-    "DemoniteBrick": 33,
-    "SandstoneBrick": 34,
-    "EbonstoneBrick": 35,
-    "RedStucco": 36,
-    "YellowStucco": 37,
-    "GreenStucco": 38,
-    "Gray": 39,
-    "SnowWallUnsafe": 40,
-    "Ebonwood": 41,
-    "RichMaogany": 42,
-    "Pearlwood": 43,
-    "RainbowBrick": 44,
-    "TinBrick": 45,
-    "TungstenBrick": 46,
-    "PlatinumBrick": 47,
-    "AmethystUnsafe": 48,
-    "TopazUnsafe": 49,
-    "SapphireUnsafe": 50,
-    "EmeraldUnsafe": 51,
-    "RubyUnsafe": 52,
-    "DiamondUnsafe": 53,
-    "CaveUnsafe": 54,
-    "Cave2Unsafe": 55,
-    "Cave3Unsafe": 56,
-    "Cave4Unsafe": 57,
-    "Cave5Unsafe": 58,
-    "Cave6Unsafe": 59,
-    "LivingLeaf": 60,
-    "Cave7Unsafe": 61,
-    "SpiderUnsafe": 62,
-    "GrassUnsafe": 63,
-    "JungleUnsafe": 64,
-    "FlowerUnsafe": 65,
-    "Grass": 66,
-    "Jungle": 67,
-    "Flower": 68,
-    "CorruptGrassUnsafe": 69,
-    "HallowedGrassUnsafe": 70,
-    "IceUnsafe": 71,
-    "Cactus": 72,
-    "Cloud": 73,
-    "Mushroom": 74,
-    "Bone": 75,
-    "Slime": 76,
-    "Flesh": 77,
-    "LivingWood": 78,
-    "ObsidianBackUnsafe": 79,
-    "MushroomUnsafe": 80,
-    "CrimsonGrassUnsafe": 81,
-    "DiscWall": 82,
-    "CrimstoneUnsafe": 83,
-    "IceBrick": 84,
-    "Shadewood": 85,
-    "HiveUnsafe": 86,
-    "LihzahrdBrickUnsafe": 87,
-    "PurpleStainedGlass": 88,
-    "YellowStainedGlass": 89,
-    "BlueStainedGlass": 90,
-    "GreenStainedGlass": 91,
-    "RedStainedGlass": 92,
-    "RainbowStainedGlass": 93,
-    "BlueDungeonSlabUnsafe": 94,
-    "BlueDungeonTileUnsafe": 95,
-    "PinkDungeonSlabUnsafe": 96,
-    "PinkDungeonTileUnsafe": 97,
-    "GreenDungeonSlabUnsafe": 98,
-    "GreenDungeonTileUnsafe": 99,
-    "BlueDungeonSlab": 100,
-    "BlueDungeonTile": 101,
-    "PinkDungeonSlab": 102,
-    "PinkDungeonTile": 103,
-    "GreenDungeonSlab": 104,
-    "GreenDungeonTile": 105,
-    "WoodenFence": 106,
-    "MetalFence": 107,
-    "Hive": 108,
-    "PalladiumColumn": 109,
-    "BubblegumBlock": 110,
-    "TitanstoneBlock": 111,
-    "LihzahrdBrick": 112,
-    "Pumpkin": 113,
-    "Hay": 114,
-    "SpookyWood": 115,
-    "ChristmasTreeWallpaper": 116,
-    "OrnamentWallpaper": 117,
-    "CandyCaneWallpaper": 118,
-    "FestiveWallpaper": 119,
-    "StarsWallpaper": 120,
-    "SquigglesWallpaper": 121,
-    "SnowflakeWallpaper": 122,
-    "KrampusHornWallpaper": 123,
-    "BluegreenWallpaper": 124,
-    "GrinchFingerWallpaper": 125,
-    "FancyGrayWallpaper": 126,
-    "IceFloeWallpaper": 127,
-    "MusicWallpaper": 128,
-    "PurpleRainWallpaper": 129,
-    "RainbowWallpaper": 130,
-    "SparkleStoneWallpaper": 131,
-    "StarlitHeavenWallpaper": 132,
-    "BubbleWallpaper": 133,
-    "CopperPipeWallpaper": 134,
-    "DuckyWallpaper": 135,
-    "Waterfall": 136,
-    "Lavafall": 137,
-    "EbonwoodFence": 138,
-    "RichMahoganyFence": 139,
-    "PearlwoodFence": 140,
-    "ShadewoodFence": 141,
-    "WhiteDynasty": 142,
-    "BlueDynasty": 143,
-    "ArcaneRunes": 144,
-    "IronFence": 145,
-    "CopperPlating": 146,
-    "StoneSlab": 147,
-    "Sail": 148,
-    "BorealWood": 149,
-    "BorealWoodFence": 150,
-    "PalmWood": 151,
-    "PalmWoodFence": 152,
-    "AmberGemspark": 153,
-    "AmethystGemspark": 154,
-    "DiamondGemspark": 155,
-    "EmeraldGemspark": 156,
-    "AmberGemsparkOff": 157,
-    "AmethystGemsparkOff": 158,
-    "DiamondGemsparkOff": 159,
-    "EmeraldGemsparkOff": 160,
-    "RubyGemsparkOff": 161,
-    "SapphireGemsparkOff": 162,
-    "TopazGemsparkOff": 163,
-    "RubyGemspark": 164,
-    "SapphireGemspark": 165,
-    "TopazGemspark": 166,
-    "TinPlating": 167,
-    "Confetti": 168,
-    "ConfettiBlack": 169,
-    "CaveWall": 170,
-    "CaveWall2": 171,
-    "Honeyfall": 172,
-    "ChlorophyteBrick": 173,
-    "CrimtaneBrick": 174,
-    "ShroomitePlating": 175,
-    "MartianConduit": 176,
-    "HellstoneBrick": 177,
-    "MarbleUnsafe": 178,
-    "MarbleBlock": 179,
-    "GraniteUnsafe": 180,
-    "GraniteBlock": 181,
-    "MeteoriteBrick": 182,
-    "Marble": 183,
-    "Granite": 184,
-    "Cave8Unsafe": 185,
-    "Crystal": 186,
-    "Sandstone": 187,
-    "CorruptionUnsafe1": 188,
-    "CorruptionUnsafe2": 189,
-    "CorruptionUnsafe3": 190,
-    "CorruptionUnsafe4": 191,
-    "CrimsonUnsafe1": 192,
-    "CrimsonUnsafe2": 193,
-    "CrimsonUnsafe3": 194,
-    "CrimsonUnsafe4": 195,
-    "DirtUnsafe1": 196,
-    "DirtUnsafe2": 197,
-    "DirtUnsafe3": 198,
-    "DirtUnsafe4": 199,
-    "HallowUnsafe1": 200,
-    "HallowUnsafe2": 201,
-    "HallowUnsafe3": 202,
-    "HallowUnsafe4": 203,
-    "JungleUnsafe1": 204,
-    "JungleUnsafe2": 205,
-    "JungleUnsafe3": 206,
-    "JungleUnsafe4": 207,
-    "LavaUnsafe1": 208,
-    "LavaUnsafe2": 209,
-    "LavaUnsafe3": 210,
-    "LavaUnsafe4": 211,
-    "RocksUnsafe1": 212,
-    "RocksUnsafe2": 213,
-    "RocksUnsafe3": 214,
-    "RocksUnsafe4": 215,
-    "HardenedSand": 216,
-    "CorruptHardenedSand": 217,
-    "CrimsonHardenedSand": 218,
-    "HallowHardenedSand": 219,
-    "CorruptSandstone": 220,
-    "CrimsonSandstone": 221,
-    "HallowSandstone": 222,
-    "DesertFossil": 223,
-    "LunarBrickWall": 224,
-    "Count": 225
-})  # WallID, Walls
-
-Wall = _MakeNamesClass(Walls)
-
-NPCToBanner = {
-    1: 69,
-    2: 25,
-    3: 87,
-    6: 27,
-    7: 104,
-    10: 84,
-    11: 84,
-    12: 84,
-    16: 146,
-    21: 67,
-    23: 55,
-    24: 50,
-    26: 40,
-    27: 38,
-    28: 42,
-    29: 39,
-    31: 247,
-    32: 68,
-    34: 102,
-    39: 13,
-    40: 13,
-    41: 13,
-    42: 47,
-    43: 54,
-    44: 178,
-    45: 177,
-    46: 14,
-    47: 18,
-    48: 44,
-    49: 7,
-    51: 130,
-    52: 106,
-    53: 176,
-    55: 43,
-    56: 168,
-    57: 19,
-    58: 61,
-    59: 135,
-    60: 45,
-    61: 79,
-    62: 24,
-    63: 51,
-    64: 243,
-    65: 66,
-    66: 24,
-    67: 20,
-    69: 4,
-    71: 107,
-    73: 41,
-    74: 8,
-    75: 63,
-    77: 6,
-    78: 57,
-    79: 245,
-    80: 246,
-    81: 99,
-    82: 85,
-    83: 23,
-    84: 28,
-    85: 16,
-    86: 77,
-    87: 86,
-    88: 86,
-    89: 86,
-    90: 86,
-    91: 86,
-    92: 86,
-    93: 114,
-    94: 100,
-    95: 84,
-    96: 84,
-    97: 84,
-    98: 83,
-    99: 83,
-    100: 83,
-    101: 96,
-    102: 1,
-    103: 244,
-    104: 81,
-    109: 17,
-    110: 164,
-    111: 118,
-    120: 15,
-    121: 167,
-    122: 37,
-    132: 87,
-    133: 25,
-    137: 128,
-    138: 129,
-    140: 153,
-    141: 75,
-    143: 170,
-    144: 145,
-    145: 169,
-    147: 126,
-    148: 150,
-    149: 150,
-    150: 124,
-    151: 134,
-    152: 116,
-    153: 74,
-    154: 248,
-    155: 82,
-    156: 242,
-    157: 5,
-    158: 78,
-    159: 78,
-    161: 29,
-    162: 34,
-    163: 9,
-    164: 71,
-    165: 71,
-    166: 73,
-    167: 179,
-    168: 98,
-    169: 48,
-    170: 60,
-    171: 60,
-    172: 160,
-    173: 21,
-    174: 46,
-    175: 88,
-    176: 47,
-    177: 26,
-    179: 22,
-    180: 60,
-    181: 30,
-    182: 31,
-    183: 101,
-    184: 171,
-    185: 70,
-    186: 87,
-    187: 87,
-    188: 87,
-    189: 87,
-    190: 25,
-    191: 25,
-    192: 25,
-    193: 25,
-    194: 25,
-    195: 80,
-    196: 80,
-    197: 89,
-    198: 53,
-    199: 53,
-    200: 87,
-    201: 67,
-    202: 67,
-    203: 67,
-    204: 172,
-    205: 56,
-    206: 49,
-    212: 62,
-    213: 239,
-    214: 238,
-    215: 240,
-    216: 237,
-    217: 97,
-    218: 103,
-    219: 133,
-    220: 250,
-    221: 174,
-    223: 64,
-    224: 32,
-    225: 76,
-    226: 33,
-    230: 43,
-    231: 47,
-    232: 47,
-    233: 47,
-    234: 47,
-    235: 47,
-    236: 52,
-    237: 52,
-    238: 9,
-    239: 12,
-    240: 12,
-    241: 10,
-    242: 11,
-    243: 125,
-    244: 157,
-    250: 2,
-    251: 111,
-    252: 59,
-    253: 65,
-    254: 72,
-    255: 72,
-    256: 36,
-    257: 3,
-    258: 58,
-    259: 35,
-    260: 35,
-    268: 127,
-    269: 161,
-    270: 161,
-    271: 161,
-    272: 161,
-    273: 91,
-    274: 91,
-    275: 91,
-    276: 91,
-    277: 121,
-    278: 121,
-    279: 121,
-    280: 121,
-    281: 156,
-    282: 156,
-    283: 147,
-    284: 147,
-    285: 105,
-    286: 105,
-    287: 95,
-    288: 108,
-    289: 115,
-    290: 149,
-    291: 166,
-    292: 175,
-    293: 165,
-    294: 247,
-    295: 247,
-    296: 247,
-    301: 158,
-    302: 69,
-    303: 14,
-    304: 123,
-    305: 162,
-    306: 162,
-    307: 162,
-    308: 162,
-    309: 162,
-    310: 162,
-    311: 162,
-    312: 162,
-    313: 162,
-    314: 162,
-    315: 120,
-    316: 113,
-    317: 25,
-    318: 25,
-    319: 87,
-    320: 87,
-    321: 87,
-    326: 173,
-    329: 122,
-    330: 152,
-    331: 87,
-    332: 87,
-    333: 69,
-    334: 69,
-    335: 69,
-    336: 69,
-    337: 14,
-    338: 185,
-    339: 185,
-    340: 185,
-    341: 154,
-    342: 117,
-    343: 184,
-    347: 110,
-    348: 148,
-    349: 148,
-    350: 109,
-    351: 132,
-    352: 112,
-    379: 92,
-    380: 180,
-    381: 136,
-    382: 142,
-    383: 141,
-    384: 141,
-    385: 140,
-    386: 138,
-    387: 144,
-    388: 137,
-    389: 139,
-    390: 143,
-    391: 163,
-    402: 217,
-    403: 217,
-    404: 217,
-    405: 221,
-    406: 221,
-    407: 218,
-    408: 218,
-    409: 219,
-    411: 216,
-    412: 224,
-    413: 224,
-    414: 224,
-    415: 226,
-    416: 225,
-    417: 223,
-    418: 222,
-    419: 227,
-    420: 230,
-    421: 229,
-    423: 231,
-    424: 228,
-    425: 236,
-    426: 233,
-    427: 234,
-    428: 232,
-    429: 235,
-    430: 87,
-    431: 29,
-    432: 87,
-    433: 87,
-    434: 87,
-    435: 87,
-    436: 87,
-    449: 67,
-    450: 67,
-    451: 67,
-    452: 67,
-    460: 196,
-    461: 191,
-    462: 190,
-    463: 199,
-    466: 197,
-    467: 198,
-    468: 192,
-    469: 195,
-    471: 186,
-    477: 193,
-    480: 201,
-    481: 202,
-    482: 204,
-    483: 203,
-    489: 205,
-    490: 206,
-    494: 189,
-    495: 189,
-    496: 188,
-    497: 188,
-    498: 187,
-    499: 187,
-    500: 187,
-    501: 187,
-    502: 187,
-    503: 187,
-    504: 187,
-    505: 187,
-    506: 187,
-    508: 210,
-    509: 209,
-    510: 208,
-    511: 208,
-    512: 208,
-    513: 207,
-    514: 207,
-    515: 207,
-    520: 241,
-    524: 211,
-    525: 211,
-    526: 211,
-    527: 211,
-    528: 212,
-    529: 212,
-    530: 215,
-    531: 215,
-    532: 214,
-    533: 213,
-    537: 249
-}   # NPCToBanner
-
-BannerToNPC = [
-    0,
-    102,
-    250,
-    257,
-    69,
-    157,
-    77,
-    49,
-    74,
-    163,
-    241,
-    242,
-    239,
-    39,
-    46,
-    120,
-    85,
-    109,
-    47,
-    57,
-    67,
-    173,
-    179,
-    83,
-    62,
-    2,
-    177,
-    6,
-    84,
-    161,
-    181,
-    182,
-    224,
-    226,
-    162,
-    259,
-    256,
-    122,
-    27,
-    29,
-    26,
-    73,
-    28,
-    55,
-    48,
-    60,
-    174,
-    42,
-    169,
-    206,
-    24,
-    63,
-    236,
-    199,
-    43,
-    23,
-    205,
-    78,
-    258,
-    252,
-    170,
-    58,
-    212,
-    75,
-    223,
-    253,
-    65,
-    21,
-    32,
-    1,
-    185,
-    164,
-    254,
-    166,
-    153,
-    141,
-    225,
-    86,
-    158,
-    61,
-    196,
-    104,
-    155,
-    98,
-    10,
-    82,
-    87,
-    3,
-    175,
-    197,
-    -6,
-    273,
-    379,
-    0,
-    0,
-    287,
-    101,
-    217,
-    168,
-    81,
-    94,
-    183,
-    34,
-    218,
-    7,
-    285,
-    52,
-    71,
-    288,
-    350,
-    347,
-    251,
-    352,
-    316,
-    93,
-    289,
-    152,
-    342,
-    111,
-    -3,
-    315,
-    277,
-    329,
-    304,
-    150,
-    243,
-    147,
-    268,
-    137,
-    138,
-    51,
-    -10,
-    351,
-    219,
-    151,
-    59,
-    381,
-    388,
-    386,
-    389,
-    385,
-    383,
-    382,
-    390,
-    387,
-    144,
-    16,
-    283,
-    348,
-    290,
-    148,
-    -4,
-    330,
-    140,
-    341,
-    -7,
-    281,
-    244,
-    301,
-    -8,
-    172,
-    269,
-    305,
-    391,
-    110,
-    293,
-    291,
-    121,
-    56,
-    145,
-    143,
-    184,
-    204,
-    326,
-    221,
-    292,
-    53,
-    45,
-    44,
-    167,
-    380,
-    0,
-    0,
-    -9,
-    343,
-    338,
-    471,
-    498,
-    496,
-    494,
-    462,
-    461,
-    468,
-    477,
-    0,
-    469,
-    460,
-    466,
-    467,
-    463,
-    0,
-    480,
-    481,
-    483,
-    482,
-    489,
-    490,
-    513,
-    510,
-    509,
-    508,
-    524,
-    529,
-    533,
-    532,
-    530,
-    411,
-    402,
-    407,
-    409,
-    0,
-    405,
-    418,
-    417,
-    412,
-    416,
-    415,
-    419,
-    424,
-    421,
-    420,
-    423,
-    428,
-    426,
-    427,
-    429,
-    425,
-    216,
-    214,
-    213,
-    215,
-    520,
-    156,
-    64,
-    103,
-    79,
-    80,
-    31,
-    154,
-    537,
-    220,
-]   # BannerToNPC
-
-# As of 1.3.0.8
-Sets = {
-    'AvoidedByNPCs': [356, 99, 97, 29, 334, 88, 395, 85, 55, 21],
-    'BlocksStairs': [54, 387, 386],
-    'BreakableWhenPlacing': [165, 185, 187, 186, 324],
-    'CanBeClearedDuringGeneration': [367, 368, 404, 399, 398, 397, 401, 400,
-        396],
-    'ChecksForMerge': [407, 112, 234, 404, 403, 401, 400, 402, 399, 398, 397,
-        396, 226, 59, 225, 211, 383, 191, 224, 196, 189, 162, 200, 163, 164,
-        161, 147, 76, 75, 58, 57, 109, 199, 70, 60, 2, 0],
-    'Corrupt': [400, 398, 163, 112, 25, 23],
-    'Crimson': [205, 401, 399, 200, 234, 203, 199],
-    'Falling': [123, 224, 116, 112, 234, 53],
-    'FramesOnKillWall': [395, 55, 132, 334, 136, 4, 246, 245, 242, 241, 240],
-    'GeneralPlacementTiles': [31, 21, 151, 70, 25, 112, 203, 226, 44, 43, 41,
-        225],
-    'Hallow': [115, 403, 402, 164, 116, 117, 109],
-    'HellSpecial': [75, 76, 58],
-    'HousingWalls': [386, 389, 11],
-    'Ices': [164, 163, 200, 161],
-    'IcesSlush': [224, 164, 163, 200, 161],
-    'IcesSnow': [147, 164, 163, 200, 161],
-    'InteractibleByNPCs': [411, 406, 405, 302, 390, 378, 287, 377, 355, 354,
-        269, 128, 247, 237, 228, 244, 219, 220, 215, 207, 172, 171, 125, 114,
-        106, 282, 103, 50, 101, 96, 94, 79, 78, 173, 100, 49, 174, 372, 33, 99,
-        88, 97, 29, 21, 395, 55, 36, 35, 26, 12, 133, 77, 17],
-    'JungleSpecial': [211, 225, 226],
-    'NotReallySolid': [10, 388, 387],
-    'Ore': [211, 223, 111, 222, 108, 221, 107, 58, 37, 204, 22, 169, 8, 168, 9,
-        167, 6, 166, 7],
-    'TouchDamageHot': [20, 76, 20, 58, 20, 37],
-    'TouchDamageOther': [60, 232, 40, 48],
-    'TouchDamageSands': [15, 69, 15, 57, 15, 234, 15, 224, 15, 123, 15, 116,
-        15, 112, 15, 53],
-    'TouchDamageVines': [10, 352, 6, 80, 17, 69, 10, 32],
-    'Conversion::Grass': [109, 199, 60, 23, 2],
-    'Conversion::HardenedSand': [399, 402, 398, 397],
-    'Conversion::Ice': [200, 164, 163, 161],
-    'Conversion::Moss': [181, 183, 381, 179, 180, 182],
-    'Conversion::Sand': [234, 116, 112, 53],
-    'Conversion::Sandstone': [401, 403, 400, 396],
-    'Conversion::Stone': [203, 117, 25, 1],
-    'Conversion::Thorn': [69, 352, 32],
-    'RoomNeeds::CountsAsChair': [102, 89, 79, 15],
-    'RoomNeeds::CountsAsDoor': [389, 388, 386, 387, 19, 11, 10],
-    'RoomNeeds::CountsAsTable': [355, 354, 101, 90, 88, 87, 18, 14],
-    'RoomNeeds::CountsAsTorch': [405, 372, 318, 317, 316, 271, 270, 174, 173,
-        149, 100, 98, 95, 93, 49, 42, 35, 34, 33, 4],
-    # For convenience
-    'Conversion': {
-        'Grass': [109, 199, 60, 23, 2],
-        'HardenedSand': [399, 402, 398, 397],
-        'Ice': [200, 164, 163, 161],
-        'Moss': [181, 183, 381, 179, 180, 182],
-        'Sand': [234, 116, 112, 53],
-        'Sandstone': [401, 403, 400, 396],
-        'Stone': [203, 117, 25, 1],
-        'Thorn': [69, 352, 32],
-    },
-    'RoomNeeds': {
-        'CountsAsChair': [102, 89, 79, 15],
-        'CountsAsDoor': [389, 388, 386, 387, 19, 11, 10],
-        'CountsAsTable': [355, 354, 101, 90, 88, 87, 18, 14],
-        'CountsAsTorch': [405, 372, 318, 317, 316, 271, 270, 174, 173, 149,
-            100, 98, 95, 93, 49, 42, 35, 34, 33, 4],
-    }
-}
 
 def IsWallSafe(wallid):
-    return 'Unsafe' not in IDs.WallID[wallid]
+    return 'Unsafe' not in _tables.WallID[wallid]
 
 def _getitem_default(items, idx, default):
     if 0 <= idx < len(items) or idx in items:
@@ -7575,11 +377,12 @@ def _getitem_default(items, idx, default):
     return default
 
 def _identify_tile(tid, u, v):
-    if TileID[tid] not in Frames:
+    name = _tables.TileID[tid]
+    if name not in Frames:
         raise ValueError("Tile %d not in frame table" % (tid,))
     idx = 0
-    Frame = Frames[TileID[tid]]
-    emsg = lambda s: "Tile %s %d %s %s" % (TileID[tid], tid, s, Frame)
+    Frame = Frames[name]
+    emsg = lambda s: "Tile %s %d %s %s" % (name, tid, s, Frame)
     if 'Key' not in Frame:
         raise ValueError(emsg("Lookup on wrong kind of tile"))
     if 'Entries' not in Frame:
@@ -7603,20 +406,18 @@ def _identify_DyePlants(tile, u, v):
     idx = u / Frames['DyePlants']['Width']
     if Frames['DyePlants']['Min'] <= idx <= Frames['DyePlants']['Max']:
         # strange plants
-        return Items['StrangePlant1'] + idx - 8
+        return Item.StrangePlant1 + idx - 8
     # normal dye plants
-    return Items['TealMushroom'] + idx
+    return Item.TealMushroom + idx
 
 def _identify_Banners(tile, u, v):
     # FIXME: Doesn't work
     # FIXME: Requires area knowledge (or seems to). How do I implement this
     # without such knowledge?
     idx = u / Frames['Banners']['Width'] - Frames['Banners']['Min']
-    offset = u
     # banners are oriented in a row-major matrix, 54 entries wide
-    while offset >= Frames['Banners']['RowSize']:
-        idx += Frames['Banners']['Min'] + Frames['Banners']['Stride']
-        offset -= Frames['Banners']['RowSize']
+    rows = max(u, 0) / Frames['Banners']['RowSize']
+    idx += rows * (Frames['Banners']['Min'] + Frames['Banners']['Stride'])
     return idx
 
 def _identify_Statues(tile, u, v):
@@ -7626,10 +427,14 @@ def _identify_Statues(tile, u, v):
     return Frames['Statues']['default'](idx)
 
 def _identify_Books(tile, u, v):
-    return Item.WaterBolt if u == 90 else Item.Book    
+    idx = u / Frames['Books']['Width']
+    return Item.WaterBolt if idx == Frames['Books']['WaterBolt'] else Item.Book
 
-def tile_to_item(tile, u=0, v=0):
-    "Returns an item equivalent to the tile passed"
+def _no_lookup(tile, u, v):
+    return INVALID
+
+def _known_items():
+    "Returns a dict of the tiles whose item does not depend on their frame"
     known = {Tile.ActiveStoneBlock: Item.ActiveStoneBlock,
              Tile.Adamantite: Item.AdamantiteOre,
              Tile.AdamantiteBeam: Item.AdamantiteBeam,
@@ -7834,7 +639,7 @@ def tile_to_item(tile, u=0, v=0):
              Tile.CageSluggy: Item.CageSluggy,
              Tile.SquirrelCage: Item.SquirrelCage}
     for gem in ('Sapphire', 'Ruby', 'Emerald', 'Topaz', 'Amethyst', 'Diamond'):
-        known[Tiles[gem]] = Items[gem]
+        known[getattr(Tile, gem)] = getattr(Item, gem)
     for i in range(Tile.AmethystGemsparkOff, Tile.AmberGemsparkOff+1):
         known[i] = Item.AmethystGemsparkBlock + i - Tile.AmethystGemsparkOff
     for i in range(Tile.AmethystGemspark, Tile.AmberGemspark+1):
@@ -7850,10 +655,13 @@ def tile_to_item(tile, u=0, v=0):
     known[Tile.LunarBlockVortex] = known[Tile.LunarBlockSolar] + 1
     known[Tile.LunarBlockNebula] = known[Tile.LunarBlockVortex] + 1
     known[Tile.LunarBlockStardust] = known[Tile.LunarBlockNebula] + 1
-    if os.getenv('IDS_DUMP_KNOWN'):
-        return known
-    no_lookup = lambda *args: INVALID
-    lookups = {
+    return known
+
+def _frame_lookups():
+    """Returns a dict of the tiles whose item depends on their frame, to the
+    function returning the item of a (tile, u, v)"""
+    no_lookup = _no_lookup
+    return {
         Tile.Torches: _identify_tile,   # Generic
         Tile.MetalBars: _identify_tile, # Generic
         Tile.Trees: no_lookup,          # TODO
@@ -7878,19 +686,137 @@ def tile_to_item(tile, u=0, v=0):
         Tile.DyePlants: _identify_DyePlants,
         Tile.Banners: _identify_Banners
     }
-    if os.getenv('IDS_DUMP_LOOKUPS'):
-        return lookups
-    if tile in known:
-        return known[tile]
-    if tile in lookups:
-        return lookups[tile](tile, u, v)
+
+# Item placeholder of the tiles looked up by frame in _TileItems.Items
+_FRAMED = -2
+
+# Frames are int16; negative ones are never looked up
+MAX_FRAME_COORD = 32767
+
+class _TileItems(object):
+    """
+    Dense tables of the items equivalent to tiles
+
+    Attributes:
+        Items   list of items by tile type, INVALID for tiles without one and
+                _FRAMED for those looked up in Frames
+        Frames  dict of tile type to (key, size, items): items is the list of
+                items by U // size if key is 'Width', or by V // size if key
+                is 'Height'; frames past its end have no item
+
+    Built from _known_items() and _frame_lookups(). The generic frame tiles
+    copy their Frames entries; the others are tabulated by calling their
+    _identify_* function once per frame.
+    """
+    def __init__(self):
+        known = _known_items()
+        lookups = _frame_lookups()
+        self.Items = [INVALID] * (max(max(known), max(lookups)) + 1)
+        self.Frames = {}
+        for tile, lookup in lookups.iteritems():
+            if tile in known or lookup is _no_lookup:
+                continue
+            frame = Frames[_tables.TileID[tile]]
+            key = frame.get('Key', 'Width')
+            if lookup is _identify_tile:
+                items = _dense_entries(frame.get('Entries', []))
+            else:
+                items = []
+                for idx in xrange(MAX_FRAME_COORD // frame[key] + 1):
+                    coord = idx * frame[key]
+                    if key == 'Width':
+                        items.append(lookup(tile, coord, 0))
+                    else:
+                        items.append(lookup(tile, 0, coord))
+            while items and items[-1] == INVALID:
+                items.pop()
+            self.Items[tile] = _FRAMED
+            self.Frames[tile] = (key, frame[key], items)
+        for tile, item in known.iteritems():
+            self.Items[tile] = item
+        self._arrays = None
+
+    def Arrays(self):
+        """Returns Items and Frames with numpy int32 arrays in place of the
+        lists"""
+        if self._arrays is None:
+            np = _numpy()
+            frames = dict((tile, (key, size, np.array(items, dtype=np.int32)))
+                          for tile, (key, size, items) in
+                          self.Frames.iteritems())
+            self._arrays = (np.array(self.Items, dtype=np.int32), frames)
+        return self._arrays
+
+def _dense_entries(entries):
+    "Returns the Frames 'Entries' @param entries as a list"
+    if isinstance(entries, dict):
+        size = max(entries) + 1 if entries else 0
+        return [entries.get(idx, INVALID) for idx in xrange(size)]
+    return list(entries)
+
+def _numpy():
+    # numpy is imported on demand: it would dominate the import time of IDs
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError("Please install numpy")
+    return numpy
+
+_tile_items = None
+
+def _get_tile_items():
+    global _tile_items
+    if _tile_items is None:
+        _tile_items = _TileItems()
+    return _tile_items
+
+def tile_to_item(tile, u=0, v=0):
+    "Returns an item equivalent to the tile passed"
+    tables = _tile_items or _get_tile_items()
+    if 0 <= tile < len(tables.Items):
+        item = tables.Items[tile]
+        if item != _FRAMED:
+            return item
+        key, size, items = tables.Frames[tile]
+        idx = (u if key == 'Width' else v) // size
+        if 0 <= idx < len(items):
+            return items[idx]
     return INVALID
 
+def tile_to_item_array(types, us, vs):
+    """Returns the items equivalent to the tiles of types @param types and
+    frames @param us and @param vs (arrays of the same shape), as an int32
+    array of that shape. Each is tile_to_item(type, u, v)."""
+    np = _numpy()
+    items, frames = _get_tile_items().Arrays()
+    types = np.asarray(types)
+    if types.dtype.kind not in 'iu':
+        types = types.astype(np.int64)
+    shape = types.shape
+    types = types.ravel()
+    result = np.full(types.shape, INVALID, dtype=np.int32)
+    known = (types >= 0) & (types < len(items))
+    result[known] = items[types[known]]
+    framed = np.flatnonzero(result == _FRAMED)
+    if len(framed) > 0:
+        coords = {'Width': np.asarray(us).ravel(),
+                  'Height': np.asarray(vs).ravel()}
+        framed_types = types[framed]
+        for tile in np.unique(framed_types).tolist():
+            key, size, tile_items = frames[tile]
+            where = framed[framed_types == tile]
+            idx = coords[key][where].astype(np.int64) // size
+            found = (idx >= 0) & (idx < len(tile_items))
+            result[where] = INVALID
+            result[where[found]] = tile_items[idx[found]]
+    return result.reshape(shape)
+
+
 def valid_tile(tile):
-    return tile in TileID
+    return tile in _tables.TileID
 
 def valid_item(item):
-    return item in ItemID
+    return item in _tables.ItemID
 
 def strtoint(string, base):
     if base is None:
@@ -7932,28 +858,7 @@ def main_search(Tables, args):
             print(fmt % (key, "<entry not found>"))
 
 def main():
-    import sys
     import argparse
-    Tables = {
-        'animation': AnimationID,
-        'buff': BuffID,
-        'chain': ChainID,
-        'dust': DustID,
-        'extras': ExtrasID,
-        'glowmask': GlowMaskID,
-        'gore': GoreID,
-        'invasion': InvasionID,
-        'item': ItemID,
-        'message': MessageID,
-        'npc': NPCID,
-        'name': NPCs,
-        'playertexture': PlayerTextureID,
-        'playervariant': PlayerVariantID,
-        'projectile': ProjectileID,
-        'status': StatusID,
-        'tile': TileID,
-        'wall': WallID
-    }
     Names = {
         'animation': 'AnimationID',
         'buff': 'BuffID',
@@ -7976,11 +881,11 @@ def main():
     }
     if len(sys.argv) < 3 and '--help' not in sys.argv:
         print("Usage: %s <table> <id>" % (sys.argv[0],))
-        print("Valid tables: %s" % (", ".join(Tables),))
+        print("Valid tables: %s" % (", ".join(Names),))
         raise SystemExit(0)
 
     p = argparse.ArgumentParser(usage="%(prog)s [args] <table> <terms>...")
-    p.add_argument("table", choices=Tables.keys(), help="Table to search in")
+    p.add_argument("table", choices=Names.keys(), help="Table to search in")
     p.add_argument("keys", nargs="+", help="search terms")
     p.add_argument("-s", action="store_true", help="interpret keys as names, not IDs")
     p.add_argument("-x", action="store_true", help="interpret keys as hexadecimal")
@@ -7996,9 +901,9 @@ def main():
         error = lambda _: False
 
     args.table = args.table.lower()
-    if args.table not in Tables:
+    if args.table not in Names:
         error("Error: %s not a valid table" % (args.table,))
-        error("Valid tables: %s" % (", ".join(Tables),))
+        error("Valid tables: %s" % (", ".join(Names),))
         raise SystemExit(1)
 
     if int(args.x) + int(args.d) + int(args.o) > 1:
@@ -8006,6 +911,9 @@ def main():
             raise SystemExit(1)
         p.error("-x, -d, and -o are mutually exclusive")
 
+    # only the table searched is loaded
+    Tables = {args.table: getattr(_tables, Names[args.table])}
+
     try:
         if not args.s:
             main_normal(Tables, args)
@@ -8016,9 +924,6 @@ def main():
             raise SystemExit(1)
         raise
 
-if __name__ == "__main__":
-    main()
-
 # NOTE: If any more tables are added (or pseduo-enumeration objects),
 # do not forget to add them to __all__!
 __all__ = ['AnimationID', 'BannerToNPC', 'BuffID', 'Buffs', 'ChainID',
@@ -8027,6 +932,32 @@ __all__ = ['AnimationID', 'BannerToNPC', 'BuffID', 'Buffs', 'ChainID',
            'MessageID', 'NPCID', 'NPCToBanner', 'NPCs', 'PlayerTextureID',
            'PlayerVariantID', 'Prefixes', 'ProjectileID', 'Projectiles',
            'Sets', 'StatusID', 'Tile', 'TileID', 'Tiles', 'WallID', 'Walls',
-           'tile_to_item', 'INVALID', 'FRAME_SIZE']
-
+           'tile_to_item', 'tile_to_item_array', 'INVALID', 'FRAME_SIZE']
+
+class _LazyModule(types.ModuleType):
+    """The IDs module, whose tables are loaded on first access"""
+    def __getattr__(self, name):
+        if name not in TABLES:
+            raise AttributeError("'module' object has no attribute %r" %
+                                 (name,))
+        table = getattr(_tables, name)
+        setattr(self, name, table)
+        return table
+
+    def __setattr__(self, name, value):
+        # the functions above read the original module's globals
+        self.__dict__[name] = value
+        self._original.__dict__[name] = value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(TABLES))
 
+if __name__ == "__main__":
+    main()
+else:
+    # Stand in for this module; the original is kept alive, as Python clears
+    # the globals of collected modules and the functions above need them
+    _module = _LazyModule(__name__)
+    _module.__dict__.update(globals())
+    _module.__dict__['_original'] = sys.modules[__name__]
+    sys.modules[__name__] = _module
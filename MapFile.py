@@ -5,6 +5,17 @@ import os
 import struct
 import sys
 import zlib
+
+HAVE_NUMPY = False
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError as e:
+    HAVE_NUMPY = False
+
+if HAVE_NUMPY:
+    import Palette
+
 import FileMetadata
 from BinaryString import BinaryString
 import IDs
@@ -62,6 +73,13 @@ Things left to do:
 FILE_MAGIC = FileMetadata.FILE_MAGIC
 FILE_MAGIC_MAP = FileMetadata.FILE_MAGIC_MAP
 
+# Bytes of compressed map data inflated at a time
+INFLATE_CHUNK = 1 << 18
+
+# Longest map tile record before its light values: two header bytes, a
+# two-byte index, a light byte, and a two-byte run length
+MAX_RECORD_SIZE = 7
+
 assert_handlers = []
 def assert_eq(lhs, rhs):
     if lhs != rhs:
@@ -79,6 +97,92 @@ def _clamp(uv, low, high):
         res = high
     return int(res)
 
+class _Inflater(object):
+    """
+    Decompresses raw deflate @param data a piece at a time
+
+    The decompressed bytes not yet consumed are in Buffer from Pos on;
+    Fill() compacts the buffer and decompresses more, so only a few chunks
+    are ever held at once.
+    """
+    def __init__(self, data, chunk=INFLATE_CHUNK):
+        self._data = data
+        self._offset = 0
+        self._chunk = chunk
+        self._zobj = zlib.decompressobj(-15)
+        self._done = False
+        self.Buffer = bytearray()
+        self.Pos = 0
+
+    def Fill(self, nbytes):
+        """Makes @param nbytes bytes available from Pos, or as many as the
+        data has left"""
+        del self.Buffer[:self.Pos]
+        self.Pos = 0
+        while len(self.Buffer) < nbytes and not self._done:
+            if self._zobj.unconsumed_tail:
+                data = self._zobj.unconsumed_tail
+            elif self._offset < len(self._data):
+                data = self._data[self._offset:self._offset+self._chunk]
+                self._offset += self._chunk
+            else:
+                self.Buffer += self._zobj.flush()
+                self._done = True
+                break
+            self.Buffer += self._zobj.decompress(data, self._chunk)
+
+class _ListPalette(object):
+    """
+    The CSV color tables as nested lists, for TileToLookup and DoColorLookup
+    when numpy (and so Palette) is unavailable. Has the lookup attributes
+    and methods of Palette.Palette, with None for missing colors.
+    """
+    def __init__(self):
+        here = os.path.dirname(os.path.abspath(__file__))
+        def rows(name):
+            with open(os.path.join(here, name)) as fobj:
+                return [[int(v) for v in row]
+                        for row in list(csv.reader(fobj))[1:] if row]
+        tiles = rows("MapTile_Colors.csv")
+        ntiles = max([IDs.Tile.Count] + [t + 1 for t, _, _, _, _ in tiles])
+        self.Tiles = [[None]*12 for _ in xrange(ntiles)]
+        for t, o, r, g, b in tiles:
+            self.Tiles[t][o] = (r, g, b)
+        self.Walls = [[None]*2 for _ in xrange(256)]
+        for t, o, r, g, b in rows("MapTile_WallColors.csv"):
+            self.Walls[t][o] = (r, g, b)
+        self.Liquids = [None]*256
+        for t, r, g, b in rows("MapTile_LiquidColors.csv"):
+            self.Liquids[t+1] = (r, g, b)
+        # Map only treats known types (1 to Count-1) as missing
+        self.TileMissing = [0 < i < IDs.Tile.Count and
+                            set(self.Tiles[i]) == set([None])
+                            for i in xrange(ntiles)]
+        self.WallMissing = [0 < i < IDs.Wall.Count and
+                            set(self.Walls[i]) == set([None])
+                            for i in xrange(256)]
+
+    def TileColor(self, tile, option):
+        return self.Tiles[tile][option]
+
+    def WallColor(self, wall, option=0):
+        return self.Walls[wall][option]
+
+    def LiquidColor(self, liquid):
+        return self.Liquids[liquid]
+
+_list_palette = None
+
+def _GetPalette():
+    """Returns the Palette shared by the process, or the shared
+    _ListPalette if numpy is unavailable"""
+    global _list_palette
+    if HAVE_NUMPY:
+        return Palette.GetPalette()
+    if _list_palette is None:
+        _list_palette = _ListPalette()
+    return _list_palette
+
 class FileHeader(object):
     def __init__(self, version=0, magic=0, rev=0, verbose=False):
         self.Version = version
@@ -109,6 +213,7 @@ class Map(object):
     LOOKUP_SKY = 4
     LOOKUP_DIRT = 5
     LOOKUP_ROCK = 6
+    LOOKUP_HELL = 7
     def __init__(self, fname=None, fobj=None, verbose=False):
         self._header = None
         self.HeaderEmpty = 0
@@ -126,9 +231,6 @@ class Map(object):
         self.MaxDirtGradients = 256
         self.MaxRockGradients = 256
         self.tileOptionCounts = [0]*419
-        self.tileLookup = [[None]*self.MaxTileOpts for _ in xrange(419)]
-        self.liquidLookup = [None]*(self.MaxLiquidTypes+1)
-        self.wallLookup = [[None]*self.MaxWallOpts for _ in xrange(225)]
         self.skyLookup = [None]*self.MaxSkyGradients
         self.dirtLookup = [None]*self.MaxDirtGradients
         self.rockLookup = [None]*self.MaxRockGradients
@@ -136,39 +238,16 @@ class Map(object):
         self.skyGradient = ((50, 40, 255), (145, 185, 255))
         self.dirtGradient = ((88, 61, 46), (37, 78, 123))
         self.rockGradient = ((74, 67, 60), (53, 70, 97))
-        self.missingTiles = []
-        self.missingWalls = []
         self._groundLevel = None
         self._rockLevel = None
         self._is_verbose = verbose
-        self._raw_tiles = {}
+        self._tileTypes = None
+        self._tiles = None
+        self._light = None
+        self._colors = None
         self._log = ''
-
-        tileColors = list(csv.reader(open("MapTile_Colors.csv")))
-        for t,o,r,g,b in tileColors[1:]:
-            t, o = int(t), int(o)
-            r, g, b = int(r), int(g), int(b)
-            self.tileLookup[t][o] = (r, g, b)
-
-        liquidColors = list(csv.reader(open("MapTile_LiquidColors.csv")))
-        for t, r, g, b in liquidColors[1:]:
-            t = int(t)
-            r, g, b = int(r), int(g), int(b)
-            self.liquidLookup[t+1] = (r, g, b)
-
-        wallColors = list(csv.reader(open("MapTile_WallColors.csv")))
-        for t,o,r,g,b in wallColors[1:]:
-            t, o = int(t), int(o)
-            r, g, b = int(r), int(g), int(b)
-            self.wallLookup[t][o] = (r, g, b)
-
-        for i in range(1, IDs.Tile.Count):
-            if set(self.tileLookup[i]) == set([None]):
-                self.missingTiles.append(i)
-
-        for i in range(1, IDs.Wall.Count):
-            if set(self.wallLookup[i]) == set([None]):
-                self.missingWalls.append(i)
+        # shared by every Map; see Palette
+        self._palette = _GetPalette()
 
         if fname is not None and fobj is not None:
             raise ValueError("fname and fobj are mutually exclusive")
@@ -177,11 +256,19 @@ class Map(object):
         if fname is not None and fobj is None:
             self.Load(open(fname, 'r'))
 
+    @staticmethod
+    def _IsMissing(missing, kind):
+        "Returns True if the palette has no color for type @param kind"
+        return kind < len(missing) and missing[kind]
+
     def GetLookup(self, lookup_id):
+        """Returns the lookup table @param lookup_id; the tile, liquid, and
+        wall tables are the RGBA arrays of the Palette (or, without numpy,
+        lists of (r, g, b) or None)"""
         lookups = {
-            Map.LOOKUP_TILE: self.tileLookup,
-            Map.LOOKUP_LIQUID: self.liquidLookup,
-            Map.LOOKUP_WALL: self.wallLookup,
+            Map.LOOKUP_TILE: self._palette.Tiles,
+            Map.LOOKUP_LIQUID: self._palette.Liquids,
+            Map.LOOKUP_WALL: self._palette.Walls,
             Map.LOOKUP_SKY: self.skyLookup,
             Map.LOOKUP_DIRT: self.dirtLookup,
             Map.LOOKUP_ROCK: self.rockLookup}
@@ -203,7 +290,7 @@ class Map(object):
         wall = tile.Wall
         extra = 0
         if tile.IsActive and \
-                type not in self.missingTiles and \
+                not self._IsMissing(self._palette.TileMissing, type) and \
                 not transparentTiles:
             # Case 1: active tiles
             if type == IDs.Tile.RainbowBrick:
@@ -364,14 +451,14 @@ class Map(object):
                 option = tile.U / 34;
             else:
                 option = 0
-            assert option < len(self.tileLookup[tile.Type])
+            assert option < self.MaxTileOpts
             return Map.LOOKUP_TILE, tile.Type, option
         elif tile.LiquidType != Tile.LiquidType.None_ and \
                 tile.LiquidAmount > 32 and not transparentLiquid:
             # Case 2: inactive tiles with liquid
             return Map.LOOKUP_LIQUID, tile.LiquidType, 0
         elif wall != 0 and \
-                wall not in self.missingWalls and \
+                not self._IsMissing(self._palette.WallMissing, wall) and \
                 not transparentWalls:
             # Case 3: walls
             extra = tile.WallColor
@@ -406,30 +493,40 @@ class Map(object):
         if key == Map.LOOKUP_NONE:
             result = None
         elif key == Map.LOOKUP_TILE:
-            result = self.tileLookup[lookup][option]
+            result = self._palette.TileColor(lookup, option)
         elif key == Map.LOOKUP_LIQUID:
-            result = self.liquidLookup[lookup]
+            result = self._palette.LiquidColor(lookup)
         elif key == Map.LOOKUP_WALL:
-            result = self.wallLookup[lookup][option]
+            result = self._palette.WallColor(lookup, option)
         elif key == Map.LOOKUP_SKY:
             result = self.skyGradient[lookup]
         elif key == Map.LOOKUP_DIRT:
             result = self.dirtGradient[lookup]
         elif key == Map.LOOKUP_ROCK:
             result = self.rockGradient[lookup]
+        elif key == Map.LOOKUP_HELL:
+            result = self.rockGradient[1]
         else:
             print("Invalid lookup: %s %s %s" % (key, lookup, option))
             result = (255, 255, 255)
         return result
 
-    def rawget(self):
-        return self._raw_tiles
+    def GetTileIndexes(self):
+        """Returns the uint16 [x, y] array of map tile indexes: 0 for
+        unexplored tiles, otherwise an index into the file's tile types (see
+        GenerateTileTypes)"""
+        return self._tiles
 
-    def rawset(self, x, y, tile):
-        self._raw_tiles[(x, y)] = tile
+    def GetLight(self):
+        "Returns the uint8 [x, y] array of tile light levels"
+        return self._light
 
-    def log(self, x, y, w, h, stream):
-        self._log = "x:%d y:%d wxh: %dx%d pos: %d" % (x, y, w, h, stream.get_pos())
+    def GetColors(self):
+        "Returns the uint8 [x, y] array of tile paint colors"
+        return self._colors
+
+    def log(self, x, y, w, h, pos):
+        self._log = "x:%d y:%d wxh: %dx%d pos: %d" % (x, y, w, h, pos)
 
     def verbose(self, *args):
         if self._is_verbose:
@@ -441,7 +538,6 @@ class Map(object):
             self._Load(fobj)
         except (IOError, EOFError, IndexError, AssertionError) as e:
             print(self._log)
-            print(self._raw_tiles)
             raise
 
     def _Load(self, fobj):
@@ -493,12 +589,13 @@ class Map(object):
         for i in range(self._numTileOpts):
             if self._tileOptMap[i]:
                 self._tileOpts[i] = self._stream.readByte()
-                self._totalTileOpts += self._tileOpts[i]
+        # tiles and walls without options still have one map tile type
+        self._totalTileOpts = sum(self._tileOpts)
         self.verbose("read all tile opts")
         for i in range(self._numWallOpts):
             if self._wallOptMap[i]:
                 self._wallOpts[i] = self._stream.readByte()
-                self._totalWallOpts += self._wallOpts[i]
+        self._totalWallOpts = sum(self._wallOpts)
         self.verbose("read all wall opts")
 
     def FromWorld(self, world):
@@ -519,92 +616,224 @@ class Map(object):
         self._height = w.Height()
 
     def GenerateTileTypes(self):
-        self._tileTypes = [0]*(self._totalTileOpts + self._totalWallOpts +
-                               self._numLiquidOpts + self._numSkyOpts +
-                               self._numDirtOpts + self._numRockOpts + 2)
-        self._tileTypes[0] = 0
-        self._posTileOpts = 0
-        self._posWallOpts = 0
-        self._posLiquidOpts = 0
-        self._posSkyOpts = 0
-        self._posDirtOpts = 0
-        self._posRockOpts = 0
-        #self._colorTypes = [(0, 0, 0, 0)]*len(self._numColors)
-        self.verbose("Total tile types: %s" % (len(self._tileTypes),))
+        """Lays out the file's map tile types: empty, then the tile options,
+        wall options, liquids, sky, dirt, and rock gradients, and last the
+        underworld. See GetTileTypes."""
+        self._posTileOpts = 1
+        self._posWallOpts = self._posTileOpts + self._totalTileOpts
+        self._posLiquidOpts = self._posWallOpts + self._totalWallOpts
+        self._posSkyOpts = self._posLiquidOpts + self._numLiquidOpts
+        self._posDirtOpts = self._posSkyOpts + self._numSkyOpts
+        self._posRockOpts = self._posDirtOpts + self._numDirtOpts
+        self._posHell = self._posRockOpts + self._numRockOpts
+        self._numTileTypes = self._posHell + 1
+        sections = (
+            (Map.LOOKUP_NONE, [1]),
+            (Map.LOOKUP_TILE, self._tileOpts),
+            (Map.LOOKUP_WALL, self._wallOpts),
+            (Map.LOOKUP_LIQUID, [1] * self._numLiquidOpts),
+            (Map.LOOKUP_SKY, [self._numSkyOpts]),
+            (Map.LOOKUP_DIRT, [self._numDirtOpts]),
+            (Map.LOOKUP_ROCK, [self._numRockOpts]),
+            (Map.LOOKUP_HELL, [1]))
+        # each section has its tile types, or steps of a gradient, in turn,
+        # with a run of options each
+        kinds, lookups, options = [], [], []
+        for kind, counts in sections:
+            counts = np.asarray(counts, dtype=np.int64)
+            kinds.append(np.full(counts.sum(), kind, dtype=np.int64))
+            lookups.append(np.repeat(np.arange(len(counts)), counts))
+            starts = np.cumsum(counts) - counts
+            options.append(np.arange(counts.sum()) -
+                           np.repeat(starts, counts))
+        kinds, lookups, options = (np.concatenate(a)
+                                   for a in (kinds, lookups, options))
+        # the gradients' steps are options of a single lookup
+        gradient = np.in1d(kinds, (Map.LOOKUP_SKY, Map.LOOKUP_DIRT,
+                                   Map.LOOKUP_ROCK))
+        lookups[gradient], options[gradient] = options[gradient], 0
+        # liquids are looked up by Tile.LiquidType
+        lookups[kinds == Map.LOOKUP_LIQUID] += 1
+        assert len(kinds) == self._numTileTypes
+        self._tileTypes = kinds, lookups, options
+        self.verbose("Total tile types: %s" % (self._numTileTypes,))
+
+    def GetTileTypes(self):
+        """Returns (kinds, lookups, options): int arrays giving, for every
+        map tile index (see GetTileIndexes), its lookup table (one of the
+        Map.LOOKUP_* constants), its index in that table, and its option.
+        For the sky, dirt, and rock gradients, the index is the step of the
+        gradient."""
+        return self._tileTypes
+
+    def GetTileColors(self):
+        """Returns the uint8[ntypes, 4] RGBA color of every map tile index;
+        colorless and unexplored tiles have an alpha of zero"""
+        if not HAVE_NUMPY:
+            raise RuntimeError("Please install numpy")
+        kinds, lookups, options = self._tileTypes
+        pal = self._palette
+        colors = np.zeros((len(kinds), 4), dtype=np.uint8)
+        mask = kinds == Map.LOOKUP_TILE
+        # out of range types and options hit the transparent last entries
+        colors[mask] = pal.Tiles[np.minimum(lookups[mask], pal.NumTiles()),
+                                 np.minimum(options[mask],
+                                            Palette.MAX_TILE_OPTIONS)]
+        mask = (kinds == Map.LOOKUP_WALL) & \
+               (lookups < pal.Walls.shape[0]) & \
+               (options < Palette.MAX_WALL_OPTIONS)
+        colors[mask] = pal.Walls[lookups[mask], options[mask]]
+        mask = (kinds == Map.LOOKUP_LIQUID) & (lookups < len(pal.Liquids))
+        colors[mask] = pal.Liquids[lookups[mask]]
+        for kind, ends in ((Map.LOOKUP_SKY, self.skyGradient),
+                           (Map.LOOKUP_DIRT, self.dirtGradient),
+                           (Map.LOOKUP_ROCK, self.rockGradient)):
+            mask = kinds == kind
+            # fade from the first color to the second, truncating
+            steps = max(mask.sum() - 1, 1)
+            fade = lookups[mask, None]
+            start, end = np.array(ends, dtype=np.int64)
+            colors[mask, :3] = (start * (steps - fade) + end * fade) // steps
+            colors[mask, 3] = 255
+        colors[kinds == Map.LOOKUP_HELL] = self.rockGradient[1] + (255,)
+        return colors
+
+    def Render(self, band=256):
+        """Returns the uint8[height, width, 4] image of the loaded map: every
+        explored tile in its color (see GetTileColors), dimmed by its light.
+        The image is computed @param band rows at a time."""
+        colors = self.GetTileColors()
+        # stored row by row; see LoadMapTiles
+        tiles, light = self._tiles.T, self._light.T
+        height, width = tiles.shape
+        image = np.empty((height, width, 4), dtype=np.uint8)
+        for y0 in xrange(0, height, band):
+            rows = colors[tiles[y0:y0+band]]
+            scale = light[y0:y0+band, :, None].astype(np.uint16)
+            rows[..., :3] = rows[..., :3] * scale // 255
+            image[y0:y0+band] = rows
+        return image
 
     def LoadMapTiles(self, width, height):
+        """Decodes the compressed map tiles that follow the header into the
+        arrays returned by GetTileIndexes, GetLight, and GetColors.
+
+        Each record is a run of tiles in one row sharing a type and color;
+        the runs of a row are gathered and expanded with numpy at its
+        end."""
+        if not HAVE_NUMPY:
+            raise RuntimeError("Please install numpy")
         self.verbose("Offset: %s" % (self._stream.get_pos(),))
-        data = zlib.decompress(self._stream.getContent(remainder=True), -15)
-        stream = BinaryString(data)
-        print(' '.join(hex(ord(c))[2:] for c in stream._content[stream._pos:stream._pos+32]))
-        offsets = [0, 0, 0, 0, 0, 0]
+        tiles = np.zeros((height, width), dtype=np.uint16)
+        light = np.zeros((height, width), dtype=np.uint8)
+        colors = np.zeros((height, width), dtype=np.uint8)
+        inflater = _Inflater(self._stream.getContent(remainder=True),
+                            INFLATE_CHUNK)
+        inflater.Fill(MAX_RECORD_SIZE)
+        buf, pos = inflater.Buffer, 0
+        end = len(buf)
         x, y = 0, 0
-        while y < height:
-            while x < width:
-                self.log(x, y, width, height, stream)
-                assert x >= 0
-                header1 = stream.readByte()
-                header2 = stream.readByte() if (header1 & 1) == 1 else 0
-                section = (header1 & 14) >> 1
-                hasOwnType = (section in (1, 2, 7))
-                tileIdx = 0
-                if hasOwnType:
-                    if (header1 & 16) != 16:
-                        tileIdx = stream.readByte()
-                    else:
-                        tileIdx = stream.readUInt16()
-                light = 255 if (header1 & 32) != 32 else stream.readByte()
-                rleType = ((header1 & 192) >> 6)
-                rle = 0
-                if rleType == 1:
-                    rle = stream.readByte()
-                elif rleType == 2:
-                    rle = stream.readInt16()
-                else:
+        try:
+            for y in xrange(height):
+                # per run: tile index, paint color, and number of tiles
+                indexes, paints, counts = [], [], []
+                lights = bytearray()
+                x = 0
+                while x < width:
+                    if pos + MAX_RECORD_SIZE > end:
+                        inflater.Pos = pos
+                        inflater.Fill(MAX_RECORD_SIZE)
+                        buf, pos = inflater.Buffer, 0
+                        end = len(buf)
+                    header1 = buf[pos]
+                    pos += 1
+                    header2 = 0
+                    if (header1 & 1) == 1:
+                        header2 = buf[pos]
+                        pos += 1
+                    section = (header1 & 14) >> 1
+                    tileIdx = 0
+                    if section in (1, 2, 7):
+                        if (header1 & 16) != 16:
+                            tileIdx = buf[pos]
+                            pos += 1
+                        else:
+                            tileIdx = buf[pos] | (buf[pos+1] << 8)
+                            pos += 2
+                    lit = 255
+                    if (header1 & 32) == 32:
+                        lit = buf[pos]
+                        pos += 1
+                    rleType = (header1 & 192) >> 6
                     rle = 0
-                self.rawset(x, y, (header1, header2, tileIdx, light, rle, section))
-                if section == 0:
-                    x += rle
-                else:
+                    if rleType == 1:
+                        rle = buf[pos]
+                        pos += 1
+                    elif rleType == 2:
+                        rle = buf[pos] | (buf[pos+1] << 8)
+                        rle -= 65536 if rle >= 32768 else 0
+                        pos += 2
+                    count = rle + 1
+                    if section == 0:
+                        indexes.append(0)
+                        paints.append(0)
+                        counts.append(count)
+                        lights += b'\0' * count
+                        x += count
+                        continue
                     if section == 1:
-                        pass
-                        # tileIdx += posTileOpts
+                        tileIdx += self._posTileOpts
                     elif section == 2:
-                        pass
-                        # tileIdx += posWallOpts
+                        tileIdx += self._posWallOpts
                     elif section in (3, 4, 5):
-                        pass
-                        # tileIdx += num22 + section - 3
+                        tileIdx = self._posLiquidOpts + section - 3
                     elif section == 6:
-                        pass
-                        #if y < self._groundLevel:
-                        #    offset = num7 * y / self._groundLevel
-                        #    tileIdx += num23 + offset;
-                        #else:
-                        #    y = num26
-                    #tile = [self._tileTypes[tileIdx], light, (header2 >> 1) & 31]
-                    tile = [tileIdx, light, (header2 >> 1) & 31]
-                    self.rawset(x, y, (header1, header2, tileIdx, light, rle, section))
-                    # SetTile(x, y, tile)
-                    if light == 256:
-                        while rle > 0:
-                            x += 1
-                            # SetTile(x, y, tile)
-                            self.rawset(x, y, (header1, header2, tileIdx, light, rle, section))
-                            rle -= 1
+                        if y < self._groundLevel:
+                            tileIdx = self._posSkyOpts + \
+                                    int(self._numSkyOpts * y /
+                                        float(self._groundLevel))
+                        else:
+                            tileIdx = self._posHell
+                    elif section == 7:
+                        if y < self._rockLevel:
+                            tileIdx += self._posDirtOpts
+                        else:
+                            tileIdx += self._posRockOpts
+                    indexes.append(tileIdx)
+                    paints.append((header2 >> 1) & 31)
+                    counts.append(count)
+                    if lit == 255:
+                        lights += b'\xff' * count
                     else:
-                        while rle > 0:
-                            x += 1
-                            tile[1] = stream.readByte()
-                            self.rawset(x, y, (header1, header2, tileIdx, light, rle, section))
-                            # SetTile(x, y, tile)
-                            rle -= 1
-                x += 1
-            y += 1
+                        # every tile of the run after the first has its own
+                        lights.append(lit)
+                        if pos + rle > end:
+                            inflater.Pos = pos
+                            inflater.Fill(rle)
+                            buf, pos = inflater.Buffer, 0
+                            end = len(buf)
+                        lights += buf[pos:pos+rle]
+                        pos += rle
+                    x += count
+                # runs may not end exactly at the edge of the map
+                tiles[y] = np.repeat(indexes, counts)[:width]
+                colors[y] = np.repeat(paints, counts)[:width]
+                light[y] = np.frombuffer(bytes(lights[:width]), np.uint8)
+        except (IndexError, ValueError):
+            self.log(x, y, width, height, pos)
+            raise
+        # the arrays are indexed [x, y], like World's tile grids
+        self._tiles, self._light, self._colors = tiles.T, light.T, colors.T
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         m = Map(fname=sys.argv[1], verbose=True)
+        if '--png' in sys.argv:
+            import MapRender
+            path = sys.argv[sys.argv.index('--png') + 1]
+            MapRender.MapRenderer.ToImage(m.Render()).save(path)
         if '-p' in sys.argv:
-            for k,v in m.rawget().iteritems():
-                print(k, v)
+            tiles, light = m.GetTileIndexes(), m.GetLight()
+            colors = m.GetColors()
+            for x, y in zip(*np.nonzero(tiles)):
+                print(x, y, tiles[x, y], light[x, y], colors[x, y])
@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+
+"""
+Vectorized minimap rendering of worlds
+
+Produces the same image as calling MapFile.Map.TileToLookup and
+DoColorLookup for every tile, but works on whole blocks of columns at once:
+
+    1) The colors come from the dense RGBA tables of Palette, indexed by
+       (tile type, option), (wall type, option), and liquid type. Entries
+       without a color have an alpha of zero.
+    2) The option of each tile is computed from its Type, U, and V columns
+       with array expressions mirroring the rules in Map.TileToLookup.
+    3) Each pixel takes the color of the first layer present at that tile:
+       tile, liquid, wall, then the sky/dirt/rock background.
+
+The result is a (height, width, 4) uint8 array, which MapRenderer.ToImage
+hands to PIL in a single call.
+
+Usage:
+    renderer = MapRender.MapRenderer(world)
+    renderer.ToImage(renderer.Render()).save("world.png")
+"""
+
+import numpy as np
+
+import ColumnPass
+import IDs
+from Palette import Palette, GetPalette, MAX_TILE_OPTIONS
+import Tile
+import TileGrid
+
+# Background colors; see Map.skyGradient, dirtGradient, and rockGradient
+SKY_COLOR = (50, 40, 255)
+DIRT_COLOR = (88, 61, 46)
+ROCK_COLOR = (74, 67, 60)
+HELL_COLOR = (53, 70, 97)
+
+def _range(a, low, high):
+    return (a >= low) & (a <= high)
+
+def _opt_pots(u, v, y):
+    return np.select([v < 144, v < 252, (v < 360) | ((v > 900) & (v < 1008)),
+                      v < 468, v < 576, v < 648, v < 792, v < 898, v < 1006,
+                      v < 1114, v < 1222],
+                     [0, 1, 2, 3, 4, 5, 6, 8, 7, 0, 3], 7)
+
+def _opt_small_piles(u, v, y):
+    a = u // 18
+    short = np.select([(a < 6) | _range(a, 28, 32),
+                       (a < 22) | _range(a, 33, 35), a < 28, a < 48, a < 54],
+                      [0, 1, 2, 3, 4], 0)
+    b = u // 36
+    tall = np.select([(b < 6) | _range(b, 19, 24) | (b == 33) |
+                      _range(b, 38, 40),
+                      b < 16, (b < 19) | _range(b, 31, 32), b < 31, b < 38],
+                     [0, 2, 1, 3, 4], 0)
+    return np.where(v < 18, short, tall)
+
+def _opt_large_piles(u, v, y):
+    a = u // 54
+    return np.select([a < 7, (a < 22) | _range(a, 33, 35), a < 25, a == 25,
+                      a < 32],
+                     [2, 0, 1, 5, 3], 0)
+
+def _opt_large_piles2(u, v, y):
+    a = u // 54
+    return np.select([(a < 3) | _range(a, 14, 16), a < 6, a < 9, a < 18,
+                      a < 23, a < 25, a < 29],
+                     [0, 6, 7, 4, 8, 0, 1], 0)
+
+def _opt_painting3x3(u, v, y):
+    a = u // 54 + v // 54 * 36
+    return np.select([_range(a, 0, 11) | _range(a, 47, 53),
+                      _range(a, 12, 15) | _range(a, 18, 35), _range(a, 16, 17),
+                      _range(a, 41, 45), a == 46],
+                     [0, 1, 2, 3, 4], 0)
+
+def _opt_containers(u, v, y):
+    a = u // 36
+    return np.select([np.in1d(a, (1, 2, 10, 13, 15)).reshape(a.shape),
+                      np.in1d(a, (3, 4)).reshape(a.shape), a == 6,
+                      np.in1d(a, (11, 17)).reshape(a.shape)],
+                     [1, 2, 3, 4], 0)
+
+def _opt_stalactite(u, v, y):
+    return np.select([u < 54, (u < 106) | (u >= 216), u >= 162], [0, 1, 3], 2)
+
+# (tile types, function of (U, V, y) arrays returning options); mirrors the
+# rules in MapFile.Map.TileToLookup
+OptionRules = (
+    ((IDs.Tile.DemonAltar,), lambda u, v, y: u >= 54),
+    ((IDs.Tile.Sunflower,), lambda u, v, y: u < 34),
+    ((IDs.Tile.Pots,), _opt_pots),
+    ((IDs.Tile.ShadowOrbs,), lambda u, v, y: u >= 36),
+    ((IDs.Tile.LongMoss,), lambda u, v, y: np.clip(u // 22, 0, 5)),
+    ((IDs.Tile.SmallPiles,), _opt_small_piles),
+    ((IDs.Tile.LargePiles,), _opt_large_piles),
+    ((IDs.Tile.LargePiles2,), _opt_large_piles2),
+    ((IDs.Tile.ImmatureHerbs, IDs.Tile.MatureHerbs, IDs.Tile.BloomingHerbs),
+        lambda u, v, y: np.clip(u // 18, 0, 6)),
+    ((IDs.Tile.AdamantiteForge,), lambda u, v, y: u >= 52),
+    ((IDs.Tile.MythrilAnvil,), lambda u, v, y: u >= 28),
+    ((IDs.Tile.PressurePlates,), lambda u, v, y: u != 0),
+    ((IDs.Tile.Painting3X3,), _opt_painting3x3),
+    ((IDs.Tile.Painting6X4,), lambda u, v, y: _range(v // 72, 22, 24)),
+    ((IDs.Tile.Containers,), _opt_containers),
+    ((IDs.Tile.Statues,),
+        lambda u, v, y: np.select([_range(u, 1548, 1654),
+                                   _range(u, 1656, 1798)], [1, 2], 0)),
+    ((IDs.Tile.HolidayLights, IDs.Tile.RainbowBrick),
+        lambda u, v, y: y % 3),
+    ((IDs.Tile.Stalactite,), _opt_stalactite),
+    ((IDs.Tile.ExposedGems,), lambda u, v, y: np.clip(u // 18, 0, 6)),
+    ((IDs.Tile.DyePlants,), lambda u, v, y: u // 34),
+)
+
+def TileOptions(types, us, vs, ys, present=None):
+    """Returns an int32 array of the palette option of every tile, given
+    arrays of their @param types, @param us, @param vs, and @param ys (row)
+    of the same shape. Options outside 0..MAX_TILE_OPTIONS-1 are replaced by
+    MAX_TILE_OPTIONS, which is transparent in Palette.Tiles.
+
+    @param present, if given, is a boolean vector by tile type; rules for
+    types where it is False are skipped"""
+    options = np.zeros(types.shape, dtype=np.int32)
+    for rule_types, rule in OptionRules:
+        if present is not None and \
+                not any(t < len(present) and present[t] for t in rule_types):
+            continue
+        if len(rule_types) == 1:
+            mask = types == rule_types[0]
+        else:
+            mask = np.in1d(types, rule_types).reshape(types.shape)
+        if not mask.any():
+            continue
+        u = us[mask].astype(np.int32)
+        v = vs[mask].astype(np.int32)
+        options[mask] = rule(u, v, ys[mask])
+    options[(options < 0) | (options >= MAX_TILE_OPTIONS)] = MAX_TILE_OPTIONS
+    return options
+
+class MapRenderer(object):
+    """
+    Renders a World as a minimap-style RGBA image
+
+    MapRenderer.__init__ parameters:
+        world               World to render (may be lazily loaded)
+        palette             Palette to use (default: Palette.GetPalette())
+        transparentTiles    do not draw tiles
+        transparentWalls    do not draw walls
+        transparentLiquid   do not draw liquids
+        transparentBg       do not draw the sky/dirt/rock background
+
+    The transparent* parameters have the same meaning as those of
+    MapFile.Map.TileToLookup.
+    """
+    def __init__(self, world, palette=None, transparentTiles=False,
+                 transparentWalls=False, transparentLiquid=False,
+                 transparentBg=False):
+        self._world = world
+        self._palette = palette if palette is not None else GetPalette()
+        self._width = world.Width()
+        self._height = world.Height()
+        self._groundLevel = world.GetFlag('GroundLevel')
+        self._rockLevel = world.GetFlag('RockLevel')
+        self._noTiles = transparentTiles
+        self._noWalls = transparentWalls
+        self._noLiquid = transparentLiquid
+        self._noBg = transparentBg
+        self._background = self._Background()
+
+    def _Background(self):
+        "Returns the uint8[height, 4] background color of each row"
+        ys = np.arange(self._height)
+        colors = np.array([SKY_COLOR, DIRT_COLOR, ROCK_COLOR, HELL_COLOR],
+                          dtype=np.uint8)
+        layer = np.select([ys < self._groundLevel, ys < self._rockLevel,
+                           ys < self._height - 204], [0, 1, 2], 3)
+        result = np.zeros((self._height, 4), dtype=np.uint8)
+        if not self._noBg:
+            result[:, :3] = colors[layer]
+            result[:, 3] = 255
+        return result
+
+    def RenderColumns(self, x0, columns, active=None):
+        """Returns the uint8[ncols, height, 4] colors of the columns
+        x0..x0+ncols-1, given a dict of TileGrid column name to an array of
+        shape (ncols, height). @param active, if given, is the boolean array
+        of active tiles (see ColumnPass.ColumnChunk.Active)"""
+        pal = self._palette
+        types = columns['Type']
+        shape = types.shape
+        ys = np.broadcast_to(np.arange(shape[1], dtype=np.int32), shape)
+        result = np.empty(shape + (4,), dtype=np.uint8)
+        result[:] = self._background[:shape[1]]
+        # pixels already colored by a higher layer
+        done = np.zeros(shape, dtype=np.bool_)
+
+        if not self._noTiles:
+            types = np.minimum(types, pal.NumTiles())
+            if active is None:
+                active = (columns['Flags'] & TileGrid.FLAG_ACTIVE) != 0
+            done = active & ~pal.TileMissing[types]
+            if done.any():
+                present = np.bincount(types[done], minlength=0) > 0
+                options = TileOptions(types[done], columns['U'][done],
+                                      columns['V'][done], ys[done], present)
+                result[done] = pal.Tiles[types[done], options]
+
+        if not self._noLiquid:
+            liquid = columns['LiquidType']
+            mask = ~done & (liquid != Tile.LiquidType.None_)
+            mask &= columns['LiquidAmount'] > 32
+            result[mask] = pal.Liquids[liquid[mask]]
+            done |= mask
+
+        if not self._noWalls:
+            walls = columns['Wall']
+            mask = ~done & (walls != 0)
+            mask &= ~pal.WallMissing[walls]
+            if mask.any():
+                xs = np.broadcast_to(np.arange(x0, x0 + shape[0])[:, None],
+                                     shape)[mask]
+                options = np.where(walls[mask] == IDs.Wall.Planked, xs % 2, 0)
+                result[mask] = pal.Walls[walls[mask], options]
+        return result
+
+    def Render(self, progress=None):
+        """Returns the uint8[height, width, 4] image of the world. Columns
+        are streamed through World.StreamColumns, so lazily loaded worlds are
+        never decoded in full."""
+        plan = ColumnPass.ColumnPass(self._world)
+        image = plan.Add(ColumnPass.Image(self))
+        plan.Run(progress=progress)
+        return image.Result()
+
+    @staticmethod
+    def ToImage(image):
+        "Converts a uint8[height, width, 4] array into an RGBA PIL image"
+        import PIL.Image
+        height, width = image.shape[:2]
+        data = np.ascontiguousarray(image)
+        return PIL.Image.frombuffer('RGBA', (width, height), data.tostring(),
+                                    'raw', 'RGBA', 0, 1)
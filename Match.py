@@ -1,5 +1,14 @@
 #!/usr/bin/env python
 
+import bisect
+
+HAVE_NUMPY = False
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError as e:
+    HAVE_NUMPY = False
+
 EXPR_MAX_TERMS = 4
 
 TOK_EXPRSEP = ';'
@@ -59,12 +68,19 @@ Using "None" or the empty string for the term matches any value
 The @param names is an optional dictionary of strings to numbers. The
 Number token, if not a valid number, is passed through the dictionary
 to find a value.
+
+Each TermSet is compiled into a sorted list of disjoint (low, high)
+intervals, so ranges of any width cost the same and membership tests are
+binary searches. Use match_arrays() to test whole numpy arrays at once.
 """
     def __init__(self, expr, names=None, max_terms=EXPR_MAX_TERMS, **kwargs):
         self._max_terms = max_terms
         self._raw_expr = expr
         self._names = {} if names is None else names
-        self._expr = self._parse_match(expr)
+        self._ranges = self._parse_match(expr)
+        self._intervals = tuple(_merge_ranges(r) for r in self._ranges)
+        self._bounds = None
+        self._expr = None
 
     def _parse_match(self, expr):
         parts = expr.split(TOK_EXPRSEP)
@@ -75,17 +91,19 @@ to find a value.
         return tuple(self._parse_part(p) for p in parts)
 
     def _parse_part(self, part):
+        "Returns the (low, high) ranges of @param part, in order given"
         if part is None or len(part) == 0 or part == TOK_NONE:
             return
         terms = part.split(TOK_TERMSEP)
-        return sum([list(self._parse_range(t)) for t in terms], [])
+        return [self._parse_range(t) for t in terms]
 
     def _parse_range(self, r):
         nums = r.split(TOK_RANGE)
         if len(nums) == 1:
-            return [self._parse_num(nums[0])]
+            num = self._parse_num(nums[0])
+            return (num, num)
         if len(nums) == 2:
-            return range(self._parse_num(nums[0]), self._parse_num(nums[1])+1)
+            return (self._parse_num(nums[0]), self._parse_num(nums[1]))
         raise MatchSyntaxError("Invalid term: %s" % (r,))
 
     def _parse_num(self, num):
@@ -97,19 +115,88 @@ to find a value.
             raise MatchSyntaxError("Token %s not a number" % (num,), e)
 
     def extract(self):
+        """Returns a tuple with a list of the matching numbers (or None) for
+        each TermSet. Expands every range; prefer intervals()"""
+        if self._expr is None:
+            self._expr = tuple(None if r is None else
+                               [v for lo, hi in r for v in range(lo, hi+1)]
+                               for r in self._ranges)
         return self._expr
 
+    def intervals(self):
+        """Returns a tuple with a sorted list of disjoint, inclusive (low,
+        high) intervals (or None) for each TermSet"""
+        return self._intervals
+
     def match(self, v1, *vs):
-        terms = [v1] + list(vs)
-        if len(terms) > self._max_terms:
+        if len(vs) >= self._max_terms:
             raise MatchError("Too many terms passed to match()")
-        while len(terms) < self._max_terms:
-            terms.append(None)
-        for p,v in zip(self._expr, tuple(terms)):
-            if p is not None and v not in p:
+        values = (v1,) + vs
+        for i, p in enumerate(self._intervals):
+            if p is None:
+                continue
+            v = values[i] if i < len(values) else None
+            if v is None or not _in_intervals(p, v):
                 return False
         return True
 
+    def match_arrays(self, a1, *arrays):
+        """Vectorized match(): returns a numpy boolean mask of which
+        elements of the arrays given match, where a1 is tested against the
+        first TermSet, arrays[0] the second, and so on. For tiles, the
+        arrays are the Type, U, V, and Wall columns, in that order"""
+        if not HAVE_NUMPY:
+            raise RuntimeError("Please install numpy")
+        if len(arrays) >= self._max_terms:
+            raise MatchError("Too many arrays passed to match_arrays()")
+        if self._bounds is None:
+            self._bounds = tuple(_interval_bounds(p) for p in self._intervals)
+        arrays = (np.asarray(a1),) + tuple(np.asarray(a) for a in arrays)
+        mask = np.ones(arrays[0].shape, dtype=np.bool_)
+        for i, bounds in enumerate(self._bounds):
+            if bounds is None:
+                continue
+            if i >= len(arrays):
+                # like match(), a missing value never matches
+                mask[...] = False
+                break
+            mask &= _in_intervals_array(bounds, arrays[i])
+        return mask
+
+def _merge_ranges(ranges):
+    "Sorts and merges (low, high) ranges into disjoint intervals"
+    if ranges is None:
+        return None
+    merged = []
+    for lo, hi in sorted(r for r in ranges if r[0] <= r[1]):
+        if merged and lo <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(hi, merged[-1][1]))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+def _in_intervals(intervals, value):
+    "True if @param value is within one of the sorted @param intervals"
+    i = bisect.bisect_right(intervals, (value, float('inf'))) - 1
+    return i >= 0 and intervals[i][0] <= value <= intervals[i][1]
+
+def _interval_bounds(intervals):
+    "Returns (lows, highs) numpy arrays for @param intervals, or None"
+    if intervals is None:
+        return None
+    lows = np.array([lo for lo, _ in intervals], dtype=np.int64)
+    highs = np.array([hi for _, hi in intervals], dtype=np.int64)
+    return lows, highs
+
+def _in_intervals_array(bounds, values):
+    """Vectorized _in_intervals over the numpy array @param values, given
+    the (lows, highs) @param bounds from _interval_bounds"""
+    lows, highs = bounds
+    if len(lows) == 0:
+        return np.zeros(values.shape, dtype=np.bool_)
+    idx = np.searchsorted(lows, values, side='right') - 1
+    return (idx >= 0) & (values <= highs[np.maximum(idx, 0)])
+
 def _do_test(expr, *rs, **kwargs):
     names = kwargs.get("names", None)
     m = Match(expr, names)
@@ -160,5 +247,18 @@ if __name__ == "__main__":
     _do_test("One", [1], names={'One': 1})
     # test names range
     _do_test("One-Five", [1, 2, 3, 4, 5], names={'One': 1, 'Five': 5})
+    # test matching, including wide ranges and overlapping terms
+    m = Match("1,3-5,4-9;0-65535;;0x10-0x7fffffff")
+    assert m.intervals() == ([(1, 1), (3, 9)], [(0, 65535)], None,
+                             [(16, 0x7fffffff)])
+    assert m.match(4, 0, None, 16) and not m.match(2, 0, None, 16)
+    assert not m.match(4, -1, None, 16) and not m.match(4, 0)
+    if HAVE_NUMPY:
+        types = np.array([1, 2, 9, 10, 4])
+        us = np.array([0, 0, 0, 0, -1])
+        walls = np.array([16, 16, 99, 16, 16])
+        mask = m.match_arrays(types, us, us, walls)
+        assert mask.tolist() == [True, False, True, False, False], mask
+    print("match PASS")
 
 
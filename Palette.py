@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+
+"""
+Compiled minimap color tables
+
+The MapTile_Colors.csv, MapTile_WallColors.csv, and MapTile_LiquidColors.csv
+files are compiled into dense RGBA tables indexed by type and option, plus
+vectors of the types without any color. Compiled tables are saved to
+CACHE_PATH, next to the package, and reused by later processes for as long
+as the CSV files are unchanged.
+
+GetPalette() returns the palette shared by the whole process; MapFile.Map,
+MapRender, and RegionArea.FindFile all use it.
+
+Usage:
+    palette = Palette.GetPalette()
+    palette.TileColor(IDs.Tile.Stone, 0)
+"""
+
+import csv
+import os
+
+import numpy as np
+
+import AtomicFile
+import IDs
+
+CSV_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(CSV_DIR, "MapTile_Palette.npz")
+
+SOURCES = ("MapTile_Colors.csv", "MapTile_WallColors.csv",
+           "MapTile_LiquidColors.csv")
+
+MAX_TILE_OPTIONS = 12
+MAX_WALL_OPTIONS = 2
+
+# Bump when the compiled layout changes
+PALETTE_VERSION = 1
+
+ARRAYS = ('Tiles', 'Walls', 'Liquids', 'TileMissing', 'WallMissing')
+
+def _read_csv(name):
+    "Returns the rows of the CSV file @param name, minus its header"
+    with open(os.path.join(CSV_DIR, name)) as fobj:
+        rows = list(csv.reader(fobj))
+    return [[int(v) for v in row] for row in rows[1:] if row]
+
+def _compile():
+    "Returns a dict of the palette arrays, compiled from the CSV files"
+    tiles, walls, liquids = [_read_csv(name) for name in SOURCES]
+    ntiles = max(IDs.Tile.Count, max(t for t,_,_,_,_ in tiles) + 1)
+    arrays = {}
+    arrays['Tiles'] = np.zeros((ntiles+1, MAX_TILE_OPTIONS+1, 4), np.uint8)
+    for t, o, r, g, b in tiles:
+        arrays['Tiles'][t, o] = (r, g, b, 255)
+    arrays['Walls'] = np.zeros((256, MAX_WALL_OPTIONS, 4), np.uint8)
+    for t, o, r, g, b in walls:
+        arrays['Walls'][t, o] = (r, g, b, 255)
+    arrays['Liquids'] = np.zeros((256, 4), np.uint8)
+    for t, r, g, b in liquids:
+        arrays['Liquids'][t+1] = (r, g, b, 255)
+    # Map only treats known types (1 to Count-1) as missing
+    has_tile = arrays['Tiles'][:, :, 3].any(axis=1)
+    arrays['TileMissing'] = np.zeros(ntiles+1, dtype=np.bool_)
+    arrays['TileMissing'][1:IDs.Tile.Count] = ~has_tile[1:IDs.Tile.Count]
+    has_wall = arrays['Walls'][:, :, 3].any(axis=1)
+    arrays['WallMissing'] = np.zeros(256, dtype=np.bool_)
+    arrays['WallMissing'][1:IDs.Wall.Count] = ~has_wall[1:IDs.Wall.Count]
+    return arrays
+
+def SourceKey():
+    """Returns the int64 array identifying the CSV files a palette is
+    compiled from: the palette version, then each file's size and
+    modification time"""
+    key = [PALETTE_VERSION, IDs.Tile.Count, IDs.Wall.Count]
+    for name in SOURCES:
+        stat = os.stat(os.path.join(CSV_DIR, name))
+        key.extend([stat.st_size, int(stat.st_mtime)])
+    return np.array(key, dtype=np.int64)
+
+class Palette(object):
+    """
+    Dense RGBA color tables for minimap rendering
+
+    Attributes:
+        Tiles       uint8[ntiles+1, MAX_TILE_OPTIONS+1, 4] by (type, option)
+        Walls       uint8[256, MAX_WALL_OPTIONS, 4] by (wall, option)
+        Liquids     uint8[256, 4] by Tile.LiquidType
+        TileMissing bool[ntiles+1]: True for types without any color
+        WallMissing bool[256]: True for walls without any color
+
+    The last row and last option of Tiles are transparent, so that unknown
+    types and out of range options can be looked up safely.
+
+    Palette.__init__ compiles the CSV files unless given the @param arrays
+    (a dict of the attributes above).
+    """
+    def __init__(self, arrays=None):
+        if arrays is None:
+            arrays = _compile()
+        for name in ARRAYS:
+            setattr(self, name, arrays[name])
+
+    @staticmethod
+    def Load(path, key=None):
+        """Loads the palette saved at @param path. Returns None if there is
+        no such file or if it was compiled from CSV files other than those
+        of @param key (default: SourceKey())"""
+        if not os.path.exists(path):
+            return None
+        if key is None:
+            key = SourceKey()
+        try:
+            with np.load(path) as data:
+                if not np.array_equal(data['key'], key):
+                    return None
+                return Palette(dict((name, data[name]) for name in ARRAYS))
+        except (IOError, ValueError, KeyError):
+            return None
+
+    def Save(self, path, key=None):
+        "Writes the palette to @param path"
+        arrays = dict((name, getattr(self, name)) for name in ARRAYS)
+        arrays['key'] = key if key is not None else SourceKey()
+        with AtomicFile.AtomicWrite(path) as fobj:
+            np.savez(fobj, **arrays)
+
+    @staticmethod
+    def ForPackage(path=CACHE_PATH):
+        """Returns the palette of the package's CSV files, loading it from
+        @param path if that is current and compiling (and saving) it
+        otherwise"""
+        key = SourceKey()
+        palette = Palette.Load(path, key)
+        if palette is None:
+            palette = Palette()
+            try:
+                palette.Save(path, key)
+            except (IOError, OSError):
+                # read-only installs just compile the palette every time
+                pass
+        return palette
+
+    def NumTiles(self):
+        "Returns the number of tile types with a row in Tiles"
+        return self.Tiles.shape[0] - 1
+
+    def TileColor(self, tile, option=None):
+        """Returns the (r, g, b) of @param tile with @param option, or None
+        if it has no color. If @param option is None, returns the color of
+        the tile's last option with one."""
+        if option is None:
+            options = np.flatnonzero(self.Tiles[tile, :, 3])
+            if len(options) == 0:
+                return None
+            option = options[-1]
+        return _rgb(self.Tiles[tile, option])
+
+    def WallColor(self, wall, option=0):
+        "Returns the (r, g, b) of @param wall with @param option, or None"
+        return _rgb(self.Walls[wall, option])
+
+    def LiquidColor(self, liquid):
+        "Returns the (r, g, b) of the Tile.LiquidType @param liquid, or None"
+        return _rgb(self.Liquids[liquid])
+
+def _rgb(rgba):
+    return tuple(rgba[:3].tolist()) if rgba[3] else None
+
+_palette = None
+
+def GetPalette():
+    "Returns the palette shared by the process, loading it if needed"
+    global _palette
+    if _palette is None:
+        _palette = Palette.ForPackage()
+    return _palette
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+
+"""
+Contour tracing of boolean tile masks
+
+Turns a boolean (width, height) mask, indexed [x, y] like the TileGrid
+columns, into closed polygons with holes. This is marching squares on the
+lattice of tile corners, where every contour segment lies on a tile edge,
+done for all tiles at once:
+
+    1) Every edge between a True tile and a False tile becomes a directed
+       unit segment with the True tile on its right, found with one diff
+       along each axis of the padded mask. Outer boundaries then run
+       clockwise (as drawn, with y pointing down) and holes run
+       counterclockwise.
+    2) Each segment is linked to the segment leaving its end corner. At a
+       corner where two True tiles touch diagonally there are two, and the
+       connectivity decides whether the contour turns right (the tiles are
+       apart) or left (they are joined).
+    3) The links form disjoint cycles, one per ring. Rings are found and
+       ordered by pointer jumping, so the cost is O(n log n) array work in
+       the number of segments.
+    4) Corners where the contour keeps its direction are dropped, and each
+       ring is assigned to the component containing the tile on its right;
+       the ring with positive area is the component's outer boundary.
+
+Points are tile corners: tile (x, y) covers the square from (x, y) to
+(x+1, y+1).
+
+Usage:
+    for shell, holes in trace(mask):
+        ...
+    polys = to_polygons(mask)   # as written by WorldFile.py --poly
+"""
+
+import numpy as np
+
+from Region import Label
+
+# Segment directions, in clockwise order as drawn: E, S, W, N
+_DX = np.array([1, 0, -1, 0])
+_DY = np.array([0, 1, 0, -1])
+# Offset from a segment's start corner to the tile on its right
+_RIGHT_X = np.array([0, -1, -1, 0])
+_RIGHT_Y = np.array([0, 0, -1, -1])
+
+def _segments(mask):
+    """Returns (xs, ys, dirs): the start corner and direction of every
+    boundary segment of @param mask"""
+    width, height = mask.shape
+    padded = np.zeros((width + 2, height + 2), dtype=np.int8)
+    padded[1:-1, 1:-1] = mask
+    # between tiles x-1 and x of row y, from corner (x, y) to (x, y+1)
+    vert = padded[1:, 1:-1] - padded[:-1, 1:-1]
+    # between tiles y-1 and y of column x, from corner (x, y) to (x+1, y)
+    horz = padded[1:-1, 1:] - padded[1:-1, :-1]
+    parts = []
+    for edges, sign, dx, dy, d in ((horz, 1, 0, 0, 0), (vert, -1, 0, 0, 1),
+                                   (horz, -1, 1, 0, 2), (vert, 1, 0, 1, 3)):
+        xs, ys = np.nonzero(edges == sign)
+        parts.append((xs + dx, ys + dy, np.full(len(xs), d, dtype=np.int64)))
+    return tuple(np.concatenate(p) for p in zip(*parts))
+
+def _link(xs, ys, dirs, height, connectivity):
+    """Returns the index of the segment following each segment; the
+    segments must be sorted by start corner and then direction"""
+    stride = height + 1
+    keys = xs * stride + ys
+    ends = (xs + _DX[dirs]) * stride + ys + _DY[dirs]
+    lo = np.searchsorted(keys, ends, side='left')
+    hi = np.searchsorted(keys, ends, side='right')
+    nxt = lo
+    # two ways on: turn right to keep diagonal tiles apart, left to join them
+    turn = (dirs + (1 if connectivity == 4 else 3)) % 4
+    saddle = np.flatnonzero(hi - lo == 2)
+    other = dirs[lo[saddle]] != turn[saddle]
+    nxt[saddle[other]] += 1
+    return nxt
+
+def _rings(nxt):
+    """Splits the permutation @param nxt into its cycles. Returns (order,
+    starts): the segments of each cycle in order, each cycle beginning with
+    its smallest index, and the offset of every cycle in order."""
+    n = len(nxt)
+    index = np.arange(n)
+    # the smallest index of each cycle, by doubling the window
+    heads, jump = index, nxt
+    while True:
+        wider = np.minimum(heads, heads[jump])
+        if (wider == heads).all():
+            break
+        heads, jump = wider, jump[jump]
+    # the distance of each segment to the last one of its cycle
+    last = heads[nxt] == nxt
+    succ = np.where(last, index, nxt)
+    dist = np.where(last, 0, 1)
+    while True:
+        further = succ[succ]
+        if (further == succ).all():
+            break
+        dist = dist + dist[succ]
+        succ = further
+    order = np.lexsort((-dist, heads))
+    starts = np.flatnonzero(heads[order] == order)
+    return order, starts
+
+def trace(mask, connectivity=4, min_count=0):
+    """Traces the components of the boolean array @param mask (see
+    Region.Label.label for @param connectivity and @param min_count).
+    Returns a list of (shell, holes) per component, ordered by label, where
+    shell is a list of (x, y) corners and holes is a list of such lists.
+    The first point of a ring is not repeated at its end."""
+    mask = np.asarray(mask, dtype=np.bool_)
+    width, height = mask.shape
+    runs, labels = Label.label_runs(mask, connectivity)
+    if len(labels) == 0:
+        return []
+    xs, ys, dirs = _segments(mask)
+    order = np.lexsort((dirs, ys, xs))
+    xs, ys, dirs = xs[order], ys[order], dirs[order]
+    order, starts = _rings(_link(xs, ys, dirs, height, connectivity))
+    xs, ys, dirs = xs[order], ys[order], dirs[order]
+    ring_ids = np.repeat(np.arange(len(starts)),
+                         np.diff(np.append(starts, len(xs))))
+    # twice the signed area of each ring: positive for outer boundaries
+    areas = np.bincount(ring_ids, weights=xs * _DY[dirs] - ys * _DX[dirs])
+    # the component on the right of each ring's first segment
+    rxs, rstarts, _ = runs
+    run_keys = rxs * (height + 1) + rstarts
+    cell_keys = (xs[starts] + _RIGHT_X[dirs[starts]]) * (height + 1) + \
+                ys[starts] + _RIGHT_Y[dirs[starts]]
+    owners = labels[np.searchsorted(run_keys, cell_keys, side='right') - 1]
+    counts = np.bincount(labels, weights=runs[2] - runs[1])
+    # keep the corners where the direction changes
+    prev = np.arange(len(xs)) - 1
+    prev[starts] = np.append(starts[1:], len(xs)) - 1
+    corners = dirs != dirs[prev]
+    points = zip(xs[corners].tolist(), ys[corners].tolist())
+    bounds = np.searchsorted(np.flatnonzero(corners),
+                             np.append(starts, len(xs))).tolist()
+    shells, holes = {}, {}
+    for ring, owner in enumerate(owners.tolist()):
+        if counts[owner] < min_count:
+            continue
+        points_ = points[bounds[ring]:bounds[ring+1]]
+        if areas[ring] > 0:
+            shells[owner] = points_
+        else:
+            holes.setdefault(owner, []).append(points_)
+    return [(shells[k], holes.get(k, [])) for k in sorted(shells)]
+
+def to_polygons(mask, connectivity=4, simplify=True, epsilon=0.5,
+                min_count=0):
+    """Traces @param mask like trace() and returns a list of polygons in the
+    format of WorldFile.py --poly: a list of [x, y] points for a component
+    without holes, otherwise [shell, [hole, ...]]. Rings are passed through
+    Region.Poly.Simplify with @param epsilon if @param simplify is set."""
+    if simplify:
+        from Region.Poly import Simplify
+        fix = lambda ring: Simplify(ring, epsilon)
+    else:
+        fix = lambda ring: [list(p) for p in ring]
+    polys = []
+    for shell, holes in trace(mask, connectivity, min_count):
+        if holes:
+            polys.append([fix(shell), [fix(h) for h in holes]])
+        else:
+            polys.append(fix(shell))
+    return polys
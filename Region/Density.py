@@ -4,24 +4,98 @@ import numpy as np
 import PIL.Image
 
 class DensityCalculator(object):
-    def __init__(self, width, height, window_size=50):
+    """
+    Sums weighted points over a window around every tile of a world
+
+    Each point adds its weight to the tiles x-window..x+window-1 by
+    y-window..y+window-1 around it. Points are only recorded as they are
+    added; the density is computed once, when first asked for, from a
+    summed-area table of the points, so the cost does not depend on the
+    number of points or the window size. The density is int32, or int64 if
+    the sums of the points might not fit in int32.
+
+    If @param sigma is given, each point instead adds its weight times
+    exp(-d**2 / (2*sigma**2)) to the tiles up to window tiles away along
+    each axis (d being the distance along each axis), and the density is a
+    float array.
+    """
+    def __init__(self, width, height, window_size=50, sigma=None):
         self._width = width
         self._height = height
         self._window_size = window_size
-        self._density = np.asmatrix(np.ndarray((self._width, self._height),
-                                               dtype=(np.int_, np.int_)))
+        self._sigma = sigma
+        self._points = np.zeros((self._width, self._height), dtype=np.int32)
+        self._density = None
         self._max = 0
 
     def add_point(self, x, y, weight=1):
-        xmin = max(0, x-self._window_size)
-        xmax = min(self._width, x+self._window_size)
-        ymin = max(0, y-self._window_size)
-        ymax = min(self._height, y+self._window_size)
-        self._density[xmin:xmax, ymin:ymax] += weight
-        self._max = max(self._max, self._density[xmin:xmax, ymin:ymax].max())
+        self._points[x, y] += weight
+        self._density = None
+
+    def add_points(self, xs, ys, weights=1):
+        """Adds the points (@param xs[i], @param ys[i]), each of weight
+        @param weights[i] (or all of weight @param weights)"""
+        np.add.at(self._points, (np.asarray(xs), np.asarray(ys)), weights)
+        self._density = None
+
+    def _sum_dtype(self):
+        # the sums of the points fit in int32 unless the weights are huge
+        if np.abs(self._points).sum(dtype=np.int64) < 2**31:
+            return np.int32
+        return np.int64
+
+    def _box_density(self):
+        # the summed-area table, one axis at a time to keep temporaries small
+        dtype = self._sum_dtype()
+        w = self._window_size
+        xlo, xhi = _window_bounds(np.arange(self._width), w, self._width)
+        ylo, yhi = _window_bounds(np.arange(self._height), w, self._height)
+        table = np.zeros((self._width + 1, self._height), dtype=dtype)
+        np.cumsum(self._points, axis=0, dtype=dtype, out=table[1:])
+        columns = table[xhi] - table[xlo]
+        table = np.zeros((self._width, self._height + 1), dtype=dtype)
+        np.cumsum(columns, axis=1, out=table[:, 1:])
+        del columns
+        return table[:, yhi] - table[:, ylo]
+
+    def summed_area_table(self):
+        """Returns the (width+1, height+1) summed-area table of the points:
+        entry [x, y] is the sum of the points left of x and above y. See
+        window_sums."""
+        dtype = self._sum_dtype()
+        table = np.zeros((self._width + 1, self._height + 1), dtype=dtype)
+        np.cumsum(self._points, axis=0, dtype=dtype, out=table[1:, 1:])
+        np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+        return table
+
+    def _gaussian_density(self):
+        w = self._window_size
+        offsets = np.arange(-w, w + 1)
+        kernel = np.exp(-offsets**2 / (2.0 * self._sigma**2))
+        density = self._points.astype(np.float64)
+        # separable: convolve each axis with the kernel by FFT
+        for axis in (0, 1):
+            size = density.shape[axis]
+            n = size + 2 * w
+            spectrum = np.fft.rfft(density, n, axis=axis)
+            shape = [1, 1]
+            shape[axis] = -1
+            spectrum *= np.fft.rfft(kernel, n).reshape(shape)
+            full = np.fft.irfft(spectrum, n, axis=axis)
+            density = np.take(full, np.arange(w, w + size), axis=axis)
+        return density
+
+    def _compute(self):
+        if self._density is None:
+            if self._sigma is None:
+                self._density = self._box_density()
+            else:
+                self._density = self._gaussian_density()
+            self._max = self._density.max() if self._density.size else 0
+        return self._density
 
     def get_density(self, x, y, scale_to=None, scale_int=False):
-        value = self._density[x, y]
+        value = self._compute()[x, y]
         if scale_to is not None and self._max != 0:
             value = scale_to*value/self._max
             if scale_int:
@@ -29,7 +103,8 @@ class DensityCalculator(object):
         return value
 
     def get_matrix(self):
-        return self._density
+        "Returns the density of every tile as a (width, height) array"
+        return self._compute()
 
     def width(self):
         return self._width
@@ -37,12 +112,28 @@ class DensityCalculator(object):
     def height(self):
         return self._height
 
+def _window_bounds(positions, window, size):
+    "Returns (lo, hi): tile i sums the points at i-window+1..i+window"
+    lo = np.clip(positions - window + 1, 0, size)
+    hi = np.clip(positions + window + 1, 0, size)
+    return lo, hi
+
+def window_sums(table, window, xs, ys):
+    """Returns the box-window density (as computed by DensityCalculator) at
+    the tiles (@param xs, @param ys) from the summed_area_table() @param
+    table. The arguments may be scalars or broadcastable arrays."""
+    width, height = table.shape[0] - 1, table.shape[1] - 1
+    xlo, xhi = _window_bounds(np.asarray(xs), window, width)
+    ylo, yhi = _window_bounds(np.asarray(ys), window, height)
+    return table[xhi, yhi] - table[xlo, yhi] - table[xhi, ylo] + \
+           table[xlo, ylo]
+
 def load_density(path):
     fobj = open(path)
     result = []
     for line in fobj:
         result.append([int(i) for i in line.strip().split()])
-    return np.asmatrix(np.array(result, dtype=(np.int_, np.int_)))
+    return np.array(result, dtype=np.int32)
 
 def density_to_png(matrix, path):
     img = PIL.Image.new('RGB', matrix.shape)
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+
+"""
+Connected-component labeling of boolean tile masks
+
+Masks are indexed [x, y] like the TileGrid columns. Rather than visiting
+each tile, the labeler works on the vertical runs of True tiles in each
+column, which are found with one diff over the mask:
+
+    1) Runs in neighboring columns which touch are joined by an edge. For
+       each run, the runs it touches in the next column form a contiguous
+       range, found with two searchsorted calls over all runs at once.
+    2) The edges are merged with a vectorized union-find: every round,
+       the larger root of each edge is hooked onto the smaller one and the
+       trees are flattened by pointer jumping.
+    3) Per-component statistics are reductions over the runs.
+
+Components are 4-connected by default; pass connectivity=8 to also join
+tiles touching at a corner. The area of a component is every tile it
+encloses: its own, those of its holes (found by labeling the rest of the
+mask with the other connectivity), and those of the components inside the
+holes, and so on.
+
+Usage:
+    components, grid = label(mask)
+    for c in components:
+        print c.label, c.count, c.area, (c.xmin, c.ymin, c.xmax, c.ymax)
+"""
+
+import collections
+
+import numpy as np
+
+# label: the component's value in the label grid (1, 2, ...)
+# count: number of True tiles in the component
+# area: count plus every tile the component encloses (holes, islands)
+# xmin, ymin, xmax, ymax: inclusive bounding box
+Component = collections.namedtuple('Component',
+        ('label', 'count', 'area', 'xmin', 'ymin', 'xmax', 'ymax'))
+
+def find_runs(mask):
+    """Returns (xs, starts, ends): the column, first row, and last row + 1
+    of every vertical run of True in @param mask, ordered by column and
+    then row"""
+    width, height = mask.shape
+    padded = np.zeros((width, height + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    xs, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return xs, starts, ends
+
+def _run_edges(xs, starts, ends, height, connectivity):
+    """Returns (a, b) arrays of run indexes: run a touches run b, which is
+    in the next column"""
+    stride = height + 2
+    start_keys = xs * stride + starts
+    end_keys = xs * stride + ends
+    slack = 1 if connectivity == 8 else 0
+    base = (xs + 1) * stride
+    # runs b of column x+1 with ends[b] > starts[a] and starts[b] < ends[a]
+    lo = np.searchsorted(end_keys, base + starts - slack, side='right')
+    hi = np.searchsorted(start_keys, base + ends + slack, side='left')
+    counts = np.maximum(hi - lo, 0)
+    a = np.repeat(np.arange(len(xs)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts,
+                                                  counts)
+    b = np.repeat(lo, counts) + offsets
+    return a, b
+
+def _union(n, a, b):
+    "Returns the root of each of @param n nodes joined by edges (a, b)"
+    parent = np.arange(n)
+    while len(a) > 0:
+        pa, pb = parent[a], parent[b]
+        differ = pa != pb
+        if not differ.any():
+            break
+        a, b = a[differ], b[differ]
+        pa, pb = pa[differ], pb[differ]
+        # any smaller root will do; edges that lose out are retried
+        parent[np.maximum(pa, pb)] = np.minimum(pa, pb)
+        while True:
+            grand = parent[parent]
+            if (grand == parent).all():
+                break
+            parent = grand
+    return parent
+
+def label_runs(mask, connectivity=4):
+    """Returns ((xs, starts, ends), labels): the runs of @param mask (see
+    find_runs) and the component label (1, 2, ...) of each run. Labels are
+    numbered in order of each component's first tile by column, then
+    row."""
+    if connectivity not in (4, 8):
+        raise ValueError("connectivity must be 4 or 8, not %r" % (
+                         connectivity,))
+    runs = find_runs(mask)
+    xs, starts, ends = runs
+    a, b = _run_edges(xs, starts, ends, mask.shape[1], connectivity)
+    roots = _union(len(xs), a, b)
+    # roots are the first run of each component, so this keeps their order
+    ids = np.cumsum(roots == np.arange(len(roots)))
+    return runs, ids[roots]
+
+def runs_to_grid(runs, labels, shape):
+    """Returns an int32 array of @param shape holding the label of each
+    run's tiles, and 0 elsewhere"""
+    xs, starts, ends = runs
+    width, height = shape
+    delta = np.zeros(width * height + 1, dtype=np.int32)
+    np.add.at(delta, xs * height + starts, labels)
+    np.add.at(delta, xs * height + ends, -labels)
+    return np.cumsum(delta[:-1], dtype=np.int32).reshape(shape)
+
+def _left_of_first(runs, labels, other_runs, other_labels, height):
+    """Returns (first, owners): the index of the first run of each label
+    in @param labels whose first tile is not in column 0, and the label in
+    @param other_labels of the tile left of that first tile"""
+    xs, starts, _ = runs
+    first = np.flatnonzero(np.diff(np.maximum.accumulate(labels),
+                                   prepend=0) > 0)
+    first = first[xs[first] > 0]
+    oxs, ostarts, _ = other_runs
+    keys = oxs * (height + 1) + ostarts
+    left = (xs[first] - 1) * (height + 1) + starts[first]
+    return first, other_labels[np.searchsorted(keys, left, side='right') - 1]
+
+def _areas(mask, runs, labels, counts, connectivity):
+    """Returns the area of each component: its @param counts plus the tiles
+    of its holes, and of everything inside those holes in turn"""
+    ncomponents = len(counts)
+    width, height = mask.shape
+    holes, hlabels = label_runs(~mask, 12 - connectivity)
+    hxs, hstarts, hends = holes
+    if len(hxs) == 0:
+        return counts.astype(np.int64)
+    nholes = hlabels.max()
+    # components and holes form a tree, rooted at 0 for the outside: the
+    # tile left of the first tile of either belongs to what encloses it.
+    # Nodes 1..ncomponents are the components and the rest are the holes
+    parent = np.zeros(ncomponents + nholes + 1, dtype=np.int64)
+    sizes = np.zeros(ncomponents + nholes + 1, dtype=np.int64)
+    sizes[1:ncomponents+1] = counts
+    sizes[ncomponents+1:] = np.bincount(hlabels, weights=hends - hstarts,
+                                        minlength=nholes+1)[1:]
+    border = np.zeros(nholes + 1, dtype=np.bool_)
+    border[hlabels[(hxs == 0) | (hxs == width - 1) | (hstarts == 0) |
+                   (hends == height)]] = True
+    first, owners = _left_of_first(holes, hlabels, runs, labels, height)
+    enclosed = ~border[hlabels[first]]
+    parent[ncomponents + hlabels[first[enclosed]]] = owners[enclosed]
+    first, owners = _left_of_first(runs, labels, holes, hlabels, height)
+    parent[labels[first]] = ncomponents + owners
+    # add each node's total to its parent's, deepest nodes first
+    depth = np.zeros(len(parent), dtype=np.int64)
+    ancestor = parent.copy()
+    while ancestor.any():
+        depth += ancestor != 0
+        ancestor = parent[ancestor]
+    for level in range(depth.max(), 0, -1):
+        nodes = np.flatnonzero(depth == level)
+        np.add.at(sizes, parent[nodes], sizes[nodes])
+    return sizes[1:ncomponents+1]
+
+def label(mask, connectivity=4, grid=True, min_count=0):
+    """Labels the connected components of the boolean (width, height) array
+    @param mask. Returns (components, label_grid), where components is a
+    list of Component tuples ordered by label and label_grid is an int32
+    array like @param mask holding each tile's label (0 for False tiles).
+    If @param grid is False, label_grid is None.
+
+    Components with fewer than @param min_count tiles are left out of the
+    list (but not out of label_grid)."""
+    mask = np.asarray(mask, dtype=np.bool_)
+    runs, labels = label_runs(mask, connectivity)
+    xs, starts, ends = runs
+    if len(xs) == 0:
+        return [], (np.zeros(mask.shape, dtype=np.int32) if grid else None)
+    n = labels.max()
+    counts = np.bincount(labels, weights=ends - starts, minlength=n+1)[1:]
+    order = np.argsort(labels, kind='mergesort')
+    bounds = np.flatnonzero(np.diff(labels[order], prepend=0))
+    xmin = np.minimum.reduceat(xs[order], bounds)
+    xmax = np.maximum.reduceat(xs[order], bounds)
+    ymin = np.minimum.reduceat(starts[order], bounds)
+    ymax = np.maximum.reduceat(ends[order], bounds) - 1
+    areas = _areas(mask, runs, labels, counts, connectivity)
+    components = [Component(i + 1, int(counts[i]), int(areas[i]),
+                            int(xmin[i]), int(ymin[i]), int(xmax[i]),
+                            int(ymax[i]))
+                  for i in np.flatnonzero(counts >= min_count).tolist()]
+    label_grid = runs_to_grid(runs, labels, mask.shape) if grid else None
+    return components, label_grid
@@ -115,7 +115,12 @@ class WorldPolySet(object):
         if val.split(None, 1)[0] in self._tok_operator:
             op, args = val.split(None, 1)
             return self._parse_operator(name, op, args)
-        poly = Polygon(ast.literal_eval(val))
+        points = ast.literal_eval(val)
+        if isinstance(points[0][0], (list, tuple)):
+            # [shell, [hole, ...]], as from Region.Contour.to_polygons
+            poly = Polygon(points[0], points[1])
+        else:
+            poly = Polygon(points)
         self._poly_lookup[name] = NamedMultiPolygon(name, [poly])
         self._polys.append(self._poly_lookup[name])
         self._update_lims(self._poly_lookup[name])
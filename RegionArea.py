@@ -5,10 +5,13 @@ import csv
 import os
 import sys
 import time
+import numpy as np
 from shapely.geometry import Point, Polygon, MultiPolygon
 
 import IDs
+import Palette
 from Region.PolySet import NamedMultiPolygon, WorldPolySet
+from Region.Raster import contains_points
 
 G = {'VERBOSE': False}
 
@@ -21,13 +24,21 @@ def verbose(message, *args):
         sys.stderr.write("\n")
 
 class FindFile(object):
+    """
+    The matches of a WorldFile.py --find run, read from its --csv (FMT_FIND)
+    or --csv-v2/--csv-v3 (FMT_CSV) output
+
+    The points are kept as arrays (see Arrays); iterating yields (Point,
+    tile) pairs, grouped by tile.
+    """
     FMT_DEDUCE = 0
     FMT_FIND = 1
     FMT_CSV = 2
 
     def __init__(self, path=None, type=FMT_DEDUCE):
-        # dict(TileID -> list((x, y), (x2, y2), ...)
-        self._points = {}
+        # per Load: (tiles, xs, ys) arrays in file order
+        self._loaded = []
+        self._arrays = None
         self._format = type
         self._colors = self._load_colors()
         if path is not None:
@@ -56,41 +67,71 @@ class FindFile(object):
     def Color(self, tid):
         if self._format != FindFile.FMT_CSV:
             return None
-        return self._colors.get(tid, (0,0,0))
+        if not 0 <= tid <= self._colors.NumTiles():
+            return (0,0,0)
+        color = self._colors.TileColor(tid)
+        return color if color is not None else (0,0,0)
 
     def _load_colors(self):
-        reader = csv.reader(open("MapTile_Colors.csv", "r"))
-        next(reader) # discard headers
-        colors = {}
-        for line in reader:
-            colors[int(line[0])] = line[2:]
-        verbose("loaded %d colors", len(colors))
-        return colors
-
-    def _load_old(self, fobj):
-        # tileid, x, y
-        for line in csv.reader(fobj):
-            if not line[1].isdigit() or not line[2].isdigit():
-                continue
-            self._add_point(line[0], float(line[1]), float(line[2]))
+        # the tile colors, by the last option with one
+        return Palette.GetPalette()
+
+    def _columns(self, reader):
+        "Returns the tile, x, and y columns of @param reader as string arrays"
+        t, x, y = self._tidpos, self._xpos, self._ypos
+        rows = [(line[t], line[x], line[y]) for line in reader]
+        if not rows:
+            return (np.zeros(0, dtype=str),) * 3
+        return tuple(np.array(column) for column in zip(*rows))
+
+    def _load_old(self, reader):
+        # tile name, x, y
+        tids, xs, ys = self._columns(reader)
+        keep = (np.char.isdigit(xs) & np.char.isdigit(ys)) if len(xs) else \
+               np.zeros(0, dtype=np.bool_)
+        self._add_points(tids[keep].astype(object),
+                         xs[keep].astype(np.float64),
+                         ys[keep].astype(np.float64))
 
     def _load_csv(self, reader):
-        for line in reader:
-            if line[self._tidpos] == "-1":
-                continue
-            line2 = [int(i) if i.isdigit() else i for i in line]
-            tid = line2[self._tidpos]
-            x = line2[self._xpos]
-            y = line2[self._ypos]
-            self._add_point(tid, x, y)
-
-    def _add_point(self, id, x, y):
-        if id not in self._points:
-            self._points[id] = []
-        self._points[id].append(Point(x, y))
+        tids, xs, ys = self._columns(reader)
+        # attribute rows (Width, Height, levels) have tile -1
+        keep = tids != "-1"
+        self._add_points(tids[keep].astype(np.int64),
+                         xs[keep].astype(np.int64),
+                         ys[keep].astype(np.int64))
+
+    def _add_points(self, tids, xs, ys):
+        self._loaded.append((tids, xs, ys))
+        self._arrays = None
+
+    def Arrays(self):
+        """Returns (tiles, xs, ys): arrays of every point, in the order of
+        iteration. The points are grouped by tile, the groups in the order
+        each tile first appears in the files, and the points of a group in
+        file order."""
+        if self._arrays is None:
+            if self._loaded:
+                tids, xs, ys = (np.concatenate(a)
+                                for a in zip(*self._loaded))
+            else:
+                tids = xs = ys = np.zeros(0)
+            _, first, inverse = np.unique(tids, return_index=True,
+                                          return_inverse=True)
+            # rank each tile by its first appearance; the stable sort keeps
+            # file order within each tile
+            rank = np.argsort(np.argsort(first))
+            order = np.argsort(rank[inverse], kind='mergesort')
+            self._arrays = tids[order], xs[order], ys[order]
+        return self._arrays
+
+    def __len__(self):
+        return len(self.Arrays()[0])
 
     def __iter__(self):
-        return iter((v,k) for k in self._points for v in self._points[k])
+        tids, xs, ys = self.Arrays()
+        return iter((Point(x, y), t) for t, x, y in
+                    zip(tids.tolist(), xs.tolist(), ys.tolist()))
 
     def _deduce_format(self, headers):
         if len(headers) == 3:
@@ -105,19 +146,108 @@ class FindFile(object):
         self._xpos = headers.index('x')
         self._ypos = headers.index('y')
 
+class HitList(object):
+    """The (name, Point) pairs of the points a region contains, as returned
+    by do_search; the Points are only made when asked for"""
+    def __init__(self, names, xs, ys, indices):
+        self._names = names
+        self._xs = xs
+        self._ys = ys
+        self._indices = indices
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, i):
+        j = self._indices[i]
+        return (_scalar(self._names[j]),
+                Point(_scalar(self._xs[j]), _scalar(self._ys[j])))
+
+    def __iter__(self):
+        return (self[i] for i in xrange(len(self)))
+
+def _scalar(value):
+    "Returns a numpy scalar as the equivalent Python value"
+    return value.item() if hasattr(value, 'item') else value
+
+class PointGrid(object):
+    """
+    A bucket index of points: the points are sorted by the CELLxCELL cell
+    they fall in, so the points near a rectangle are a few contiguous runs
+    """
+    def __init__(self, xs, ys, cell=64):
+        self._cell = cell
+        cx = np.floor(xs / cell).astype(np.int64)
+        cy = np.floor(ys / cell).astype(np.int64)
+        self._x0, self._y0 = (cx.min(), cy.min()) if len(cx) else (0, 0)
+        self._nx = (cx.max() - self._x0 + 1) if len(cx) else 0
+        self._ny = (cy.max() - self._y0 + 1) if len(cy) else 0
+        keys = (cx - self._x0) * self._ny + (cy - self._y0)
+        self._order = np.argsort(keys, kind='mergesort')
+        self._starts = np.searchsorted(keys[self._order],
+                                       np.arange(self._nx * self._ny + 1))
+
+    def Query(self, minx, miny, maxx, maxy):
+        """Returns the indexes, in increasing order, of the points in the
+        cells overlapping the rectangle (a superset of the points in it)"""
+        c = self._cell
+        x0 = max(int(np.floor(minx / c)) - self._x0, 0)
+        x1 = min(int(np.floor(maxx / c)) - self._x0 + 1, self._nx)
+        y0 = max(int(np.floor(miny / c)) - self._y0, 0)
+        y1 = min(int(np.floor(maxy / c)) - self._y0 + 1, self._ny)
+        if x0 >= x1 or y0 >= y1:
+            return np.zeros(0, dtype=np.int64)
+        # one run of cells per column of cells
+        firsts = np.arange(x0, x1) * self._ny
+        lo, hi = self._starts[firsts + y0], self._starts[firsts + y1]
+        counts = hi - lo
+        runs = np.repeat(lo - np.cumsum(counts) + counts, counts) + \
+               np.arange(counts.sum())
+        return np.sort(self._order[runs])
+
 def do_search(polygons, points):
+    """Finds the regions of @param polygons (a WorldPolySet) containing each
+    of @param points: a FindFile, or an iterable of (shapely Point, name)
+    pairs. Returns a dict of region name to a HitList of the (name, point)
+    pairs it contains, plus '+counts': a dict of region name to a dict of
+    point name to the number of such points. A region made of several
+    polygons lists a point once per polygon containing it.
+
+    The points near each polygon are found with a PointGrid, and each
+    polygon is rasterized once (see Region.Raster), so the points are
+    looked up rather than tested one by one."""
+    if hasattr(points, 'Arrays'):
+        names, xs, ys = points.Arrays()
+    else:
+        points = list(points)
+        names = [ptname for _, ptname in points]
+        xs = np.array([pt.x for pt, _ in points], dtype=np.float64)
+        ys = np.array([pt.y for pt, _ in points], dtype=np.float64)
     results = {'+counts': {}}
-    for point, ptname in points:
-        for poly in polygons.polys():
-            polname = poly.name()
-            if polname not in results:
-                results[polname] = []
-                results['+counts'][polname] = {}
-            if poly.contains(point):
-                if ptname not in results['+counts'][polname]:
-                    results['+counts'][polname][ptname] = 0
-                results[polname].append((ptname, point))
-                results['+counts'][polname][ptname] += 1
+    if len(names) == 0:
+        return results
+    uniq, ptcodes = np.unique(np.asarray(names), return_inverse=True)
+    ptnames = [_scalar(n) for n in uniq]
+    grid = PointGrid(xs, ys)
+    hits = {}
+    for poly in polygons.polys():
+        polname = poly.name()
+        if polname not in hits:
+            results['+counts'][polname] = {}
+            hits[polname] = []
+        if poly.is_empty:
+            continue
+        near = grid.Query(*poly.bounds)
+        inside = contains_points(poly, xs[near], ys[near])
+        hits[polname].append(near[inside])
+    for polname, found in hits.iteritems():
+        # in point order, then polygon order, as a point-by-point scan
+        found = np.sort(np.concatenate(found or [np.zeros(0, np.int64)]),
+                        kind='mergesort')
+        results[polname] = HitList(names, xs, ys, found)
+        counts = np.bincount(ptcodes[found], minlength=len(ptnames))
+        results['+counts'][polname] = dict(
+                (ptnames[c], int(n)) for c, n in enumerate(counts) if n > 0)
     return results
 
 def draw_r(regions, points, **kwargs):
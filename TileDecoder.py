@@ -0,0 +1,478 @@
+#!/usr/bin/env python
+
+"""
+Bulk decoder for the tiles section of a world file
+
+Tile.FromStream decodes a single tile through a BinaryString, creating a
+Tile object per encoded tile. This module decodes whole batches of columns
+at once, writing the encoded tiles into flat arrays and then expanding the
+vertical RLE with numpy.repeat straight into the columns of a
+TileGrid.TileGrid.
+
+The per-tile work happens in _decode_runs, which is written in the subset
+of Python understood by numba. If numba is installed, the function is
+compiled on first use; otherwise the same function runs as plain Python
+over lists and a bytearray copy of just the bytes a batch can take, which
+is still considerably faster than Tile.FromStream.
+
+ScanColumns walks the section without decoding it, to find where each
+column (and optionally every Nth row) starts; see TileIndex.
+DecodeTilesParallel uses those column offsets to split the section into
+column ranges decoded by a multiprocessing pool into shared memory.
+
+Usage:
+    grid, pos = TileDecoder.DecodeTiles(content, start, end, width, height,
+                                        important)
+    columns, rowpos, rowy = TileDecoder.ScanColumns(content, start, end,
+                                                    width, height, important)
+"""
+
+import ctypes
+import multiprocessing
+import multiprocessing.sharedctypes
+from types import FunctionType
+
+import numpy as np
+
+import IDs
+import TileGrid
+
+HAVE_NUMBA = False
+try:
+    import numba
+    HAVE_NUMBA = True
+except ImportError as e:
+    HAVE_NUMBA = False
+
+# Number of columns decoded per batch
+BATCH_COLUMNS = 64
+
+# Most bytes one encoded tile can take: three header bytes, a 16-bit type,
+# u and v, the tile color, the wall and its color, the liquid amount, and a
+# 16-bit run length. As each covers at least one cell, n cells never take
+# more than n * MAX_TILE_BYTES bytes.
+MAX_TILE_BYTES = 15
+
+# Tile header bits, see Tile.py for their meanings
+_BIT_MOREHDR = 0b00000001
+_BIT_ACTIVE = 0b00000010
+_BIT_HASWALL = 0b00000100
+_MASK_LIQUID = 0b00011000
+_BIT_TYPE16B = 0b00100000
+_MASK_WIRES = 0b00001110     # Header 2; same bits as TileGrid.FLAG_WIRE*
+_MASK_BSTYLE = 0b01110000
+_BIT_ACTUATE = 0b00000010
+_BIT_INACTIV = 0b00000100
+_BIT_TCOLOR = 0b00001000
+_BIT_WCOLOR = 0b00010000
+_MASK_HASRLE = 0b11000000
+
+_FLAG_ACTIVE = TileGrid.FLAG_ACTIVE
+_FLAG_ACTUATOR = TileGrid.FLAG_ACTUATOR
+_FLAG_INACTIVE = TileGrid.FLAG_INACTIVE
+
+_TIMERS = IDs.Tile.Timers
+
+# The value arrays passed to _decode_runs are in TileGrid.Columns order
+Fields = TileGrid.ColumnNames
+
+# The kernels read bytes through _int. It is int for plain Python; _njit
+# binds it to np.int64, as numba otherwise unifies the uint8 bytes and the
+# int literals of a variable to float64, which cannot index arrays
+_int = int
+
+def _decode_runs(data, pos, end, ncells, important, nimportant,
+                 types, walls, us, vs, liquids, amounts, tcolors, wcolors,
+                 bricks, flags, runs):
+    """Decodes encoded tiles from data[pos:end] until ncells cells have been
+    covered. Each encoded tile is stored at index n of the value arrays and
+    runs[n] holds the number of cells it occupies.
+
+    Returns (number of encoded tiles, position after the last, cells)"""
+    n = 0
+    cells = 0
+    while cells < ncells and pos < end:
+        h1 = data[pos]
+        pos += 1
+        h2 = 0
+        h3 = 0
+        if h1 & _BIT_MOREHDR:
+            h2 = data[pos]
+            pos += 1
+            if h2 & _BIT_MOREHDR:
+                h3 = data[pos]
+                pos += 1
+        f = 0
+        t = 0
+        u = -1
+        v = -1
+        tcolor = 0
+        wall = 0
+        wcolor = 0
+        amount = 0
+        brick = 0
+        if h1 & _BIT_ACTIVE:
+            f |= _FLAG_ACTIVE
+            if h1 & _BIT_TYPE16B:
+                t = _int(data[pos]) | (_int(data[pos+1]) << 8)
+                pos += 2
+            else:
+                t = _int(data[pos])
+                pos += 1
+            if t < nimportant and important[t]:
+                u = _int(data[pos]) | (_int(data[pos+1]) << 8)
+                v = _int(data[pos+2]) | (_int(data[pos+3]) << 8)
+                pos += 4
+                if u >= 0x8000:
+                    u -= 0x10000
+                if v >= 0x8000:
+                    v -= 0x10000
+                if t == _TIMERS:
+                    v = 0
+            if h3 & _BIT_TCOLOR:
+                tcolor = data[pos]
+                pos += 1
+        if h1 & _BIT_HASWALL:
+            wall = data[pos]
+            pos += 1
+            if h3 & _BIT_WCOLOR:
+                wcolor = data[pos]
+                pos += 1
+        liquid = (h1 & _MASK_LIQUID) >> 3
+        if liquid != 0:
+            amount = _int(data[pos])
+            pos += 1
+        if h2 != 0:
+            f |= h2 & _MASK_WIRES
+            brick = (h2 & _MASK_BSTYLE) >> 4
+        if h3 & _BIT_ACTUATE:
+            f |= _FLAG_ACTUATOR
+        if h3 & _BIT_INACTIV:
+            f |= _FLAG_INACTIVE
+        rle_type = (h1 & _MASK_HASRLE) >> 6
+        rle = 0
+        if rle_type == 1:
+            rle = _int(data[pos])
+            pos += 1
+        elif rle_type != 0:
+            rle = _int(data[pos]) | (_int(data[pos+1]) << 8)
+            pos += 2
+            if rle >= 0x8000:
+                rle = 0     # negative; Tile.FromStream ignores those too
+        types[n] = t
+        walls[n] = wall
+        us[n] = u
+        vs[n] = v
+        liquids[n] = liquid
+        amounts[n] = amount
+        tcolors[n] = tcolor
+        wcolors[n] = wcolor
+        bricks[n] = brick
+        flags[n] = f
+        runs[n] = rle + 1
+        n += 1
+        cells += rle + 1
+    return n, pos, cells
+
+def _scan_columns(data, pos, end, width, height, important, nimportant,
+                  every, ncheck, columns, rowpos, rowy):
+    """Walks the encoded tiles in data[pos:end] without decoding them,
+    storing the offset of the first tile of column x in columns[x] and the
+    offset after the last column in columns[width].
+
+    If every > 0, rowpos[x*ncheck+k] and rowy[x*ncheck+k] are set to the
+    offset and starting row of the encoded tile covering row k*every.
+
+    Returns (number of columns scanned, position after the last)"""
+    x = 0
+    while x < width and pos < end:
+        columns[x] = pos
+        y = 0
+        k = 0
+        while y < height and pos < end:
+            tpos = pos
+            h1 = data[pos]
+            pos += 1
+            h3 = 0
+            if h1 & _BIT_MOREHDR:
+                h2 = data[pos]
+                pos += 1
+                if h2 & _BIT_MOREHDR:
+                    h3 = data[pos]
+                    pos += 1
+            if h1 & _BIT_ACTIVE:
+                if h1 & _BIT_TYPE16B:
+                    t = _int(data[pos]) | (_int(data[pos+1]) << 8)
+                    pos += 2
+                else:
+                    t = _int(data[pos])
+                    pos += 1
+                if t < nimportant and important[t]:
+                    pos += 4
+                if h3 & _BIT_TCOLOR:
+                    pos += 1
+            if h1 & _BIT_HASWALL:
+                pos += 1
+                if h3 & _BIT_WCOLOR:
+                    pos += 1
+            if h1 & _MASK_LIQUID:
+                pos += 1
+            rle_type = (h1 & _MASK_HASRLE) >> 6
+            rle = 0
+            if rle_type == 1:
+                rle = _int(data[pos])
+                pos += 1
+            elif rle_type != 0:
+                rle = _int(data[pos]) | (_int(data[pos+1]) << 8)
+                pos += 2
+                if rle >= 0x8000:
+                    rle = 0
+            y += rle + 1
+            if every > 0:
+                while k < ncheck and k * every < y:
+                    rowpos[x*ncheck+k] = tpos
+                    rowy[x*ncheck+k] = y - rle - 1
+                    k += 1
+        x += 1
+    columns[x] = pos
+    return x, pos
+
+def _njit(func):
+    "Returns @param func compiled by numba, with _int as np.int64"
+    func = FunctionType(func.__code__, dict(func.__globals__, _int=np.int64),
+                        func.__name__, func.__defaults__)
+    return numba.njit(cache=True)(func)
+
+if HAVE_NUMBA:
+    _decode_runs_compiled = _njit(_decode_runs)
+    _scan_columns_compiled = _njit(_scan_columns)
+
+def _window(content, pos, end, ncells):
+    """Returns a bytearray of the bytes from file offset @param pos that
+    @param ncells cells can take, for the pure-Python kernels: indexing it
+    yields ints, and only this much of the section is copied at a time"""
+    return bytearray(content[pos:min(end, pos + ncells * MAX_TILE_BYTES)])
+
+class _Decoder(object):
+    """Holds the section bytes and scratch buffers for _decode_runs, in the
+    form suited to the compiled or pure-Python kernel"""
+    def __init__(self, content, start, end, important, batch_cells,
+                 compiled=HAVE_NUMBA):
+        self.compiled = compiled
+        self.content = content
+        self.nimportant = len(important)
+        if compiled:
+            # the kernel reads the section in place
+            self.data = np.frombuffer(content, dtype=np.uint8, count=end)
+            self.important = np.array(important, dtype=np.bool_)
+            self.kernel = _decode_runs_compiled
+            self.values = tuple(np.empty(batch_cells, dtype=dtype)
+                                for _, dtype, _ in TileGrid.Columns)
+            self.runs = np.empty(batch_cells, dtype=np.int64)
+        else:
+            self.important = list(important)
+            self.kernel = _decode_runs
+            self.values = tuple([0]*batch_cells for _ in Fields)
+            self.runs = [0]*batch_cells
+
+    def decode(self, pos, end, ncells):
+        """Decodes ncells cells starting at file offset pos. Returns the
+        value arrays, the run lengths, and the new file offset"""
+        if self.compiled:
+            data, offset = self.data, 0
+        else:
+            data, offset = _window(self.content, pos, end, ncells), pos
+        limit = min(end, offset + len(data)) - offset
+        n, p, cells = self.kernel(data, pos - offset, limit, ncells,
+                                  self.important, self.nimportant,
+                                  *(self.values + (self.runs,)))
+        values = []
+        for (_, dtype, _), arr in zip(TileGrid.Columns, self.values):
+            values.append(np.asarray(arr[:n], dtype=dtype))
+        runs = np.asarray(self.runs[:n], dtype=np.int64)
+        return values, runs, p + offset
+
+def _DecodeInto(flat, content, start, end, width, height, important,
+                progress=None, compiled=HAVE_NUMBA):
+    """Decodes width columns of height tiles from content[start:end] into
+    @param flat, a list of 1D arrays of width*height cells in Fields order.
+    Returns the offset after the last tile read."""
+    batch_cells = min(BATCH_COLUMNS, width) * height
+    decoder = _Decoder(content, start, end, important, batch_cells,
+                       compiled=compiled)
+    total = width * height
+    pos = start
+    cell = 0
+    while cell < total and pos < end:
+        ncells = min(batch_cells, total - cell)
+        values, runs, pos = decoder.decode(pos, end, ncells)
+        covered = int(runs.sum())
+        for arr, vals in zip(flat, values):
+            expanded = np.repeat(vals, runs)
+            count = min(covered, total - cell)
+            arr[cell:cell+count] = expanded[:count]
+        cell += covered
+        if progress is not None:
+            progress(pos - start, end - start)
+    return pos
+
+def DecodeTiles(content, start, end, width, height, important,
+                progress=None, compiled=HAVE_NUMBA):
+    """Decodes the tiles section content[start:end] into a TileGrid.
+
+    @param content - the world file contents (a str, mmap, or buffer)
+    @param important - the header's ImportantTiles list
+    @param progress - optional callable(bytes_done, bytes_total)
+    @param compiled - use the numba-compiled kernel (default: if available)
+
+    Returns (grid, pos) where pos is the offset after the last tile read.
+    """
+    grid = TileGrid.TileGrid(width, height)
+    flat = [getattr(grid, name).reshape(-1) for name in Fields]
+    pos = _DecodeInto(flat, content, start, end, width, height, important,
+                      progress=progress, compiled=compiled)
+    return grid, pos
+
+def IterColumns(content, start, end, width, height, important,
+                compiled=HAVE_NUMBA):
+    """Decodes the tiles section content[start:end] one column at a time,
+    yielding (x, columns) where columns is a dict of column name to a 1D
+    array of height cells. Only one column is held in memory at once."""
+    decoder = _Decoder(content, start, end, important, height,
+                       compiled=compiled)
+    pos = start
+    for x in xrange(width):
+        column = {}
+        if pos < end:
+            values, runs, pos = decoder.decode(pos, end, height)
+        else:
+            values, runs = None, None
+        for i, (name, dtype, default) in enumerate(TileGrid.Columns):
+            if values is not None and len(runs) > 0:
+                arr = np.repeat(values[i], runs)[:height]
+            else:
+                arr = np.empty(0, dtype=dtype)
+            if len(arr) < height:
+                # truncated section: pad with empty tiles
+                pad = np.empty(height - len(arr), dtype=dtype)
+                pad.fill(default)
+                arr = np.concatenate((arr, pad))
+            column[name] = arr
+        yield x, column
+
+# Worker process state for DecodeTilesParallel, set by _init_worker
+_worker = {}
+
+# ctypes equivalents of the TileGrid column types, for shared memory
+_CTYPES = {
+    np.uint8: ctypes.c_uint8,
+    np.int16: ctypes.c_int16,
+    np.uint16: ctypes.c_uint16
+}
+
+def _init_worker(shared, content, columns, height, important, compiled):
+    _worker.update(shared=shared, content=content, columns=columns,
+                   height=height, important=important, compiled=compiled)
+
+def _decode_range(xrange_):
+    "Decodes columns x0 through x1-1 into the shared arrays"
+    x0, x1 = xrange_
+    h = _worker['height']
+    columns = _worker['columns']
+    flat = []
+    for (name, dtype, _), raw in zip(TileGrid.Columns, _worker['shared']):
+        flat.append(np.frombuffer(raw, dtype=dtype)[x0*h:x1*h])
+    _DecodeInto(flat, _worker['content'], int(columns[x0]),
+                int(columns[x1]), x1 - x0, h, _worker['important'],
+                compiled=_worker['compiled'])
+    return x1 - x0
+
+def DecodeTilesParallel(content, start, end, width, height, important,
+                        workers, columns=None, progress=None,
+                        compiled=HAVE_NUMBA):
+    """Decodes the tiles section like DecodeTiles, splitting it into column
+    ranges decoded by a pool of @param workers processes.
+
+    @param columns - column start offsets as returned by ScanColumns (or
+                     held by a TileIndex); scanned for if omitted
+
+    The grid's arrays live in shared memory written to by the workers.
+    Returns (grid, pos) like DecodeTiles.
+    """
+    if columns is None:
+        columns, _, _ = ScanColumns(content, start, end, width, height,
+                                    important, compiled=compiled)
+    shared = []
+    arrays = {}
+    for name, dtype, default in TileGrid.Columns:
+        raw = multiprocessing.sharedctypes.RawArray(_CTYPES[dtype],
+                                                    width * height)
+        arr = np.frombuffer(raw, dtype=dtype)
+        arr.fill(default)
+        shared.append(raw)
+        arrays[name] = arr.reshape((width, height))
+    # aim for several ranges per worker so uneven columns balance out
+    nranges = min(width, workers * 4)
+    bounds = [width * i // nranges for i in range(nranges + 1)]
+    ranges = [(x0, x1) for x0, x1 in zip(bounds, bounds[1:]) if x1 > x0]
+    pool = multiprocessing.Pool(workers, initializer=_init_worker,
+                                initargs=(shared, content, columns, height,
+                                          list(important), compiled))
+    try:
+        done = 0
+        for ncols in pool.imap_unordered(_decode_range, ranges):
+            done += ncols
+            if progress is not None:
+                progress(done, width)
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    return TileGrid.TileGrid(width, height, arrays), int(columns[width])
+
+def ScanColumns(content, start, end, width, height, important, every=0,
+                compiled=HAVE_NUMBA):
+    """Finds where each column starts in the tiles section content[start:end]
+    without decoding any tiles.
+
+    Returns (columns, rowpos, rowy): columns is an int64 array of width+1
+    offsets, where column x spans columns[x]:columns[x+1]. If @param every is
+    positive, rowpos and rowy are (width, ceil(height/every)) arrays holding
+    the offset and starting row of the encoded tile covering every every'th
+    row; otherwise they are None.
+    """
+    ncheck = (height + every - 1) // every if every > 0 else 0
+    columns = np.zeros(width + 1, dtype=np.int64)
+    rowpos = np.zeros(width * ncheck, dtype=np.int64)
+    rowy = np.zeros(width * ncheck, dtype=np.int32)
+    if compiled:
+        data = np.frombuffer(content, dtype=np.uint8, count=end)
+        ncols, pos = _scan_columns_compiled(data, start, end, width, height,
+                np.array(important, dtype=np.bool_), len(important), every,
+                ncheck, columns, rowpos, rowy)
+    else:
+        # a window of BATCH_COLUMNS columns at a time, as in _Decoder
+        important = list(important)
+        ncols, pos = 0, start
+        while ncols < width and pos < end:
+            batch = min(BATCH_COLUMNS, width - ncols)
+            data = _window(content, pos, end, batch * height)
+            cols = [0] * (batch + 1)
+            rpos = [0] * (batch * ncheck)
+            ry = [0] * (batch * ncheck)
+            n, p = _scan_columns(data, 0, len(data), batch, height,
+                                 important, len(important), every, ncheck,
+                                 cols, rpos, ry)
+            columns[ncols:ncols+n] = np.array(cols[:n]) + pos
+            checks = slice(ncols * ncheck, (ncols + n) * ncheck)
+            rowpos[checks] = np.array(rpos[:n*ncheck], dtype=np.int64) + pos
+            rowy[checks] = ry[:n*ncheck]
+            ncols, pos = ncols + n, p + pos
+    # columns never reached (truncated section) are empty
+    columns[ncols:] = pos
+    if ncheck == 0:
+        return columns, None, None
+    return columns, rowpos.reshape((width, ncheck)), \
+            rowy.reshape((width, ncheck))
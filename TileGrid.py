@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+
+"""
+Columnar tile storage for Terraria worlds
+
+A TileGrid stores every tile attribute in its own numpy array of shape
+(width, height), indexed [x, y]. Because the arrays are C-ordered, each
+world column is contiguous in memory, which matches the column-major order
+in which the world file stores its tiles.
+
+Columns and their types:
+    Type            uint16  tile type (see IDs.TileID)
+    Wall            uint8   wall type (see IDs.WallID)
+    U, V            int16   frame coordinates (-1 if not important)
+    LiquidType      uint8   see Tile.LiquidType
+    LiquidAmount    uint8   0-255
+    TileColor       uint8   tile paint
+    WallColor       uint8   wall paint
+    BrickStyle      uint8   see Tile.BrickStyle
+    Flags           uint8   packed FLAG_* bits (see below)
+
+The Flags column packs the boolean tile attributes:
+    FLAG_ACTIVE     tile.IsActive
+    FLAG_WIRERED    tile.WireRed
+    FLAG_WIREGREEN  tile.WireGreen
+    FLAG_WIREBLUE   tile.WireBlue
+    FLAG_ACTUATOR   tile.Actuator
+    FLAG_INACTIVE   tile.InActive
+
+BrickStyle needs three bits of its own, so it lives in a separate column
+rather than in Flags.
+
+TileGrid.GetTile(x, y) returns a TileView, a Tile.Tile subclass reading and
+writing through to the arrays, so existing code using tile attributes keeps
+working unmodified.
+"""
+
+import numpy as np
+
+import Tile
+
+FLAG_ACTIVE =    0b00000001
+FLAG_WIRERED =   0b00000010
+FLAG_WIREGREEN = 0b00000100
+FLAG_WIREBLUE =  0b00001000
+FLAG_ACTUATOR =  0b00010000
+FLAG_INACTIVE =  0b00100000
+
+# (column name, numpy type, default value)
+Columns = (
+    ('Type', np.uint16, 0),
+    ('Wall', np.uint8, 0),
+    ('U', np.int16, -1),
+    ('V', np.int16, -1),
+    ('LiquidType', np.uint8, Tile.LiquidType.None_),
+    ('LiquidAmount', np.uint8, 0),
+    ('TileColor', np.uint8, 0),
+    ('WallColor', np.uint8, 0),
+    ('BrickStyle', np.uint8, Tile.BrickStyle.Full),
+    ('Flags', np.uint8, 0)
+)
+ColumnNames = tuple(c for c,_,_ in Columns)
+
+# Tile attribute name -> Flags bit
+FlagBits = (
+    ('IsActive', FLAG_ACTIVE),
+    ('WireRed', FLAG_WIRERED),
+    ('WireGreen', FLAG_WIREGREEN),
+    ('WireBlue', FLAG_WIREBLUE),
+    ('Actuator', FLAG_ACTUATOR),
+    ('InActive', FLAG_INACTIVE)
+)
+
+def PackFlags(tile):
+    "Returns the Flags column value for the Tile object given"
+    flags = 0
+    for attr, bit in FlagBits:
+        if getattr(tile, attr):
+            flags |= bit
+    return flags
+
+def _make_column_property(name):
+    def getter(self):
+        return int(getattr(self._grid, name)[self._x, self._y])
+    def setter(self, value):
+        getattr(self._grid, name)[self._x, self._y] = value
+    return property(getter, setter, doc="Tile %s (column %s)" % (name, name))
+
+def _make_flag_property(name, bit):
+    def getter(self):
+        return bool(self._grid.Flags[self._x, self._y] & bit)
+    def setter(self, value):
+        if value:
+            self._grid.Flags[self._x, self._y] |= bit
+        else:
+            self._grid.Flags[self._x, self._y] &= ~bit & 0xff
+    return property(getter, setter, doc="Tile %s (Flags bit %d)" % (name, bit))
+
+class TileView(Tile.Tile):
+    """A Tile reading its attributes from a TileGrid cell.
+
+    Views are cheap to create and hold no tile data themselves. Assigning to
+    an attribute modifies the underlying grid."""
+    def __init__(self, grid, x, y):
+        self._grid = grid
+        self._x = x
+        self._y = y
+
+    Type = _make_column_property('Type')
+    Wall = _make_column_property('Wall')
+    U = _make_column_property('U')
+    V = _make_column_property('V')
+    LiquidType = _make_column_property('LiquidType')
+    LiquidAmount = _make_column_property('LiquidAmount')
+    TileColor = _make_column_property('TileColor')
+    WallColor = _make_column_property('WallColor')
+    BrickStyle = _make_column_property('BrickStyle')
+    IsActive = _make_flag_property('IsActive', FLAG_ACTIVE)
+    WireRed = _make_flag_property('WireRed', FLAG_WIRERED)
+    WireGreen = _make_flag_property('WireGreen', FLAG_WIREGREEN)
+    WireBlue = _make_flag_property('WireBlue', FLAG_WIREBLUE)
+    Actuator = _make_flag_property('Actuator', FLAG_ACTUATOR)
+    InActive = _make_flag_property('InActive', FLAG_INACTIVE)
+
+    def Detach(self):
+        "Returns a standalone Tile.Tile copy of this tile"
+        return Tile.Tile(**dict(self.ToTuple()))
+
+class TileGrid(object):
+    """
+    Columnar storage of a width by height world of tiles
+
+    Each entry of TileGrid.Columns is available as an attribute holding a
+    numpy array of shape (width, height): grid.Type[x, y] is the type of the
+    tile at (x, y).
+    """
+    def __init__(self, width, height, columns=None):
+        """Creates an empty grid, or one wrapping the @param columns dict of
+        column name to numpy array (such as one made by TileGrid.Columns())"""
+        self._width = width
+        self._height = height
+        for name, dtype, default in Columns:
+            if columns is not None and name in columns:
+                arr = columns[name]
+                if arr.shape != (width, height):
+                    raise ValueError("Column %s has shape %s, not %s" % (
+                                     name, arr.shape, (width, height)))
+            else:
+                arr = np.empty((width, height), dtype=dtype)
+                arr.fill(default)
+            setattr(self, name, arr)
+
+    @staticmethod
+    def FromTiles(width, height, tiles, counts):
+        """Builds a grid from a sequence of Tile objects in file order (x
+        outer, y inner) and the number of consecutive cells each occupies"""
+        counts = np.asarray(counts, dtype=np.int64)
+        total = width * height
+        columns = {}
+        for name, dtype, default in Columns:
+            if name == 'Flags':
+                values = [PackFlags(t) for t in tiles]
+            else:
+                values = [getattr(t, name) for t in tiles]
+            flat = np.repeat(np.array(values, dtype=dtype), counts)
+            if len(flat) < total:
+                pad = np.empty(total - len(flat), dtype=dtype)
+                pad.fill(default)
+                flat = np.concatenate((flat, pad))
+            columns[name] = flat[:total].reshape((width, height))
+        return TileGrid(width, height, columns)
+
+    def Width(self):
+        return self._width
+
+    def Height(self):
+        return self._height
+
+    def Columns(self):
+        "Returns a dict of column name to numpy array"
+        return dict((name, getattr(self, name)) for name in ColumnNames)
+
+    def Column(self, x):
+        "Returns a dict of column name to the 1D array for world column x"
+        return dict((name, getattr(self, name)[x]) for name in ColumnNames)
+
+    def NumBytes(self):
+        "Total number of bytes used by the tile arrays"
+        return sum(getattr(self, name).nbytes for name in ColumnNames)
+
+    def Active(self):
+        "Returns a boolean array: True where a tile is present"
+        return (self.Flags & FLAG_ACTIVE) != 0
+
+    def GetTile(self, x, y):
+        "Returns a TileView for the tile at x, y"
+        return TileView(self, x, y)
+
+    def SetTile(self, x, y, tile, count=1):
+        """Stores @param tile at (x, y) and the following count-1 cells of
+        the same column"""
+        for name in ColumnNames:
+            if name == 'Flags':
+                value = PackFlags(tile)
+            else:
+                value = getattr(tile, name)
+            getattr(self, name)[x, y:y+count] = value
+
+    def TileCounts(self):
+        "Returns a dict of tile type to number of active tiles of that type"
+        counts = np.bincount(self.Type[self.Active()],
+                             minlength=0).astype(np.int64)
+        return dict((int(t), int(c)) for t, c in enumerate(counts) if c > 0)
+
+    def WallCounts(self):
+        "Returns a dict of wall type to number of tiles with that wall"
+        walls = self.Wall[self.Wall != 0]
+        counts = np.bincount(walls, minlength=0).astype(np.int64)
+        return dict((int(w), int(c)) for w, c in enumerate(counts) if c > 0)
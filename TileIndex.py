@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+
+"""
+Random access into the tiles section of a world file
+
+The tiles section stores the world column by column with vertical RLE, so
+the offset of any one tile depends on every tile before it. A TileIndex
+records where each column starts (and, optionally, where every Nth row of
+each column starts), which lets a lazily loaded World decode just the
+columns a query touches.
+
+Building an index takes one pass over the tiles section. Indexes are saved
+to a sidecar file next to the world (see SidecarPath) and reused for as
+long as the world's WorldId and MetaRevision are unchanged; Terraria bumps
+MetaRevision every time the world is saved.
+
+Usage:
+    index = TileIndex.TileIndex.ForWorld(path, content, header, flags)
+    start, end = index.ColumnRange(x)
+    offset, ystart = index.RowCheckpoint(x, y)
+"""
+
+import os
+from warnings import warn
+
+import numpy as np
+
+import AtomicFile
+import TileDecoder
+
+# Record a checkpoint every this many rows by default (0 to disable)
+DEFAULT_ROW_INTERVAL = 256
+
+# Bump when the sidecar layout changes
+INDEX_VERSION = 1
+
+def SidecarPath(path):
+    "Returns the path of the index file for the world file @param path"
+    return path + ".tileidx.npz"
+
+class TileIndex(object):
+    """
+    Byte offsets of the columns (and row checkpoints) of a tiles section
+
+    Attributes:
+        Columns     int64[width+1]; column x spans Columns[x]:Columns[x+1]
+        RowInterval checkpoint spacing in rows, or 0 if there are none
+        RowPos      int64[width, nchecks] offset of the tile covering row
+                    k*RowInterval of column x
+        RowY        int32[width, nchecks] the row that tile starts on
+    """
+    def __init__(self, world_id, revision, width, height, columns,
+                 row_interval=0, rowpos=None, rowy=None):
+        self.WorldId = world_id
+        self.MetaRevision = revision
+        self.Width = width
+        self.Height = height
+        self.Columns = columns
+        self.RowInterval = row_interval
+        self.RowPos = rowpos
+        self.RowY = rowy
+
+    @staticmethod
+    def Build(content, header, flags, row_interval=DEFAULT_ROW_INTERVAL):
+        """Scans the tiles section of @param content, described by the world
+        @param header and @param flags, and returns a new TileIndex"""
+        start = header.GetTilesPointer()
+        end = header.GetChestsPointer()
+        width, height = flags.TilesWide, flags.TilesHigh
+        columns, rowpos, rowy = TileDecoder.ScanColumns(content, start, end,
+                width, height, header.ImportantTiles, every=row_interval)
+        return TileIndex(flags.WorldId, header.MetaRevision, width, height,
+                         columns, row_interval, rowpos, rowy)
+
+    @staticmethod
+    def Load(path, header, flags):
+        """Loads the index saved at @param path. Returns None if there is no
+        such file or if it does not match the world @param header and
+        @param flags"""
+        if not os.path.exists(path):
+            return None
+        try:
+            data = np.load(path)
+            meta = data['meta']
+            arrays = dict((k, data[k]) for k in data.files)
+        except (IOError, ValueError, KeyError) as e:
+            warn("Ignoring unreadable tile index %s: %s" % (path, e))
+            return None
+        version, world_id, revision, width, height, interval = meta.tolist()
+        if (version, world_id, revision, width, height) != (INDEX_VERSION,
+                flags.WorldId, header.MetaRevision, flags.TilesWide,
+                flags.TilesHigh):
+            return None
+        columns = arrays['columns']
+        if columns[0] != header.GetTilesPointer():
+            return None
+        return TileIndex(world_id, revision, width, height, columns,
+                         interval, arrays.get('rowpos'), arrays.get('rowy'))
+
+    @staticmethod
+    def ForWorld(path, content, header, flags,
+                 row_interval=DEFAULT_ROW_INTERVAL):
+        """Returns the index for the world file @param path, loading it from
+        its sidecar file if that is current and building (and saving) it
+        otherwise. If @param path is None, the index is built and not
+        saved."""
+        sidecar = SidecarPath(path) if path is not None else None
+        if sidecar is not None:
+            index = TileIndex.Load(sidecar, header, flags)
+            if index is not None:
+                return index
+        index = TileIndex.Build(content, header, flags, row_interval)
+        if sidecar is not None:
+            try:
+                index.Save(sidecar)
+            except (IOError, OSError) as e:
+                warn("Unable to save tile index %s: %s" % (sidecar, e))
+        return index
+
+    def Save(self, path):
+        "Writes the index to @param path"
+        meta = np.array([INDEX_VERSION, self.WorldId, self.MetaRevision,
+                         self.Width, self.Height, self.RowInterval],
+                        dtype=np.int64)
+        arrays = {'meta': meta, 'columns': self.Columns}
+        if self.RowInterval > 0:
+            arrays['rowpos'] = self.RowPos
+            arrays['rowy'] = self.RowY
+        with AtomicFile.AtomicWrite(path) as fobj:
+            np.savez(fobj, **arrays)
+
+    def ColumnRange(self, x):
+        "Returns the (start, end) offsets of column x"
+        return int(self.Columns[x]), int(self.Columns[x+1])
+
+    def RowCheckpoint(self, x, y):
+        """Returns (offset, ystart): decoding column x from offset yields the
+        tile starting at row ystart <= y first"""
+        if self.RowInterval <= 0:
+            return int(self.Columns[x]), 0
+        k = y // self.RowInterval
+        return int(self.RowPos[x, k]), int(self.RowY[x, k])
@@ -10,6 +10,7 @@ class World:
 import collections
 import copy
 import cProfile
+import mmap
 import os
 import pstats
 import StringIO
@@ -24,6 +25,16 @@ try:
 except ImportError as e:
     HAVE_NUMPY = False
 
+# the array modules need numpy, but an ImportError in them is a bug, not a
+# reason to fall back to the list path
+if HAVE_NUMPY:
+    import TileGrid
+    import TileDecoder
+    import TileIndex
+    import WorldCache
+    import ColumnPass
+    import CountIndex
+
 import Header
 from WorldFlags import WorldFlags
 import BinaryString
@@ -100,7 +111,15 @@ class BiomeDefinition(object):
         return self._window
 
     def TileValue(self, tile_obj):
-        return self._tiles.get(tile_obj.Tile, 0)
+        return self._tiles.get(tile_obj.Type, 0)
+
+    def Weights(self):
+        """Returns an int32 numpy array of the value of each tile type,
+        indexed by any TileGrid Type"""
+        weights = np.zeros(1 << 16, dtype=np.int32)
+        for tileid, value in self._tiles.iteritems():
+            weights[tileid] = value
+        return weights
 
     # if this class needs to be used as a key,
     #def __eq__(self, other):
@@ -192,52 +211,110 @@ AllZones = (Zone_Corrupt, Zone_Holy, Zone_Meteor, Zone_Jungle, Zone_Snow,
             Zone_PeaceCandle)
 
 class BiomeIdentifier(object):
-    def __init__(self, world, zones=AllZones, progress=None):
+    """
+    Answers which biomes' tiles surround each tile of a world
+
+    The tiles of every zone are gathered in one pass over the world (see
+    ColumnPass.BiomePoints) and each zone's window sums are computed with
+    a summed-area table (see Region.Density). By default, each zone keeps
+    one plane of window sums, in the narrowest of uint16, int16, or int32
+    that holds them. If @param lazy is True, each zone keeps its
+    summed-area table (int32) instead and GetBiomesAt computes the sums on
+    demand.
+    Zones without any tiles in the world keep nothing.
+    """
+    def __init__(self, world, zones=AllZones, progress=None, lazy=False):
+        from Region.Density import DensityCalculator
         if not HAVE_NUMPY:
             raise RuntimeError("Please install numpy")
         self._world = world
         self._zones = tuple(zones)
         self._zone_map = dict((z.Name(), i) for i,z in enumerate(self._zones))
         self._progress = progress
-        self._data = np.asmatrix(
-                np.zeros((world.Width(), world.Height()),
-                         dtype=[(z.Name(), '<i4') for z in self._zones]))
-        for x, y, t in self._world.EachTile(rowcol=False,
-                                            progress=self._progress):
-            for zone in self._zones:
-                v = zone.TileValue(t)
-                if v != 0:
-                    self._add_biome_point(x, y, zone, v)
-
-    def _add_biome_point(self, x, y, zone, value=1):
-        # add x, y, zone to a np.matrix set (with fuzz)
-        window = zone.WindowSize()
-        w, h = self._world.Width(), self._world.Height()
-        xmin = max(0, x - window)
-        xmax = min(w, x + window)
-        ymin = max(0, y - window)
-        ymax = min(h, y + window)
-        self._data[xmin:xmax, ymin:ymax][zone.Name()] += value
+        self._lazy = lazy
+        plan = ColumnPass.ColumnPass(world)
+        found = plan.Add(ColumnPass.BiomePoints(self._zones))
+        plan.Run(progress=self._progress)
+        self._data = []
+        for zone, points in zip(self._zones, found.Result()):
+            if len(points[0]) == 0:
+                self._data.append(None)
+                continue
+            calc = DensityCalculator(world.Width(), world.Height(),
+                                     zone.WindowSize())
+            calc.add_points(*points)
+            if lazy:
+                self._data.append(calc.summed_area_table())
+            else:
+                plane = calc.get_matrix()
+                self._data.append(plane.astype(_narrowest_dtype(plane),
+                                               copy=False))
 
     def GetBiomesAt(self, x, y, asdict=False):
+        """Returns the window sum of each zone at (@param x, @param y), as a
+        tuple in zone order or, if @param asdict is True, a dict of zone
+        name to sum"""
+        from Region.Density import window_sums
+        values = []
+        for zone, data in zip(self._zones, self._data):
+            if data is None:
+                values.append(0)
+            elif self._lazy:
+                values.append(int(window_sums(data, zone.WindowSize(), x, y)))
+            else:
+                values.append(int(data[x, y]))
         if asdict:
-            return dict((z.Name(), self._data[x, y][z.Name()]) \
-                    for z in self._zones)
-        return tuple(self._data[x, y][z.Name()] for z in self._zones)
+            return dict((z.Name(), v) for z, v in zip(self._zones, values))
+        return tuple(values)
+
+def _narrowest_dtype(data):
+    "Returns the smallest of uint16, int16, and int32 holding @param data"
+    lo, hi = data.min(), data.max()
+    for dtype in (np.uint16, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return dtype
+    return data.dtype
+
+class _PolyMatch(object):
+    """
+    A World.GetPolygon match function which can also be evaluated over
+    whole columns at once: Mask(columns) returns a boolean array for a dict
+    of TileGrid column name to array, like those of World.StreamColumns.
+    """
+    def __init__(self, tileid=None, wallid=None):
+        self._tileid = tileid
+        self._wallid = wallid
+
+    def __call__(self, t):
+        if self._tileid is not None and t.Type != self._tileid:
+            return False
+        if self._wallid is not None and t.Wall != self._wallid:
+            return False
+        return True
+
+    def Mask(self, columns):
+        mask = None
+        if self._tileid is not None:
+            mask = columns['Type'] == self._tileid
+        if self._wallid is not None:
+            walls = columns['Wall'] == self._wallid
+            mask = walls if mask is None else mask & walls
+        return mask
 
 def PolyMatch_Tile(tileid):
     """
     Used for World.GetPolygon:
         poly = w.GetPolygon(PolyMatch_Tile(IDs.Tile.LihzahrdBrick))
     """
-    return lambda t: t.Type == tileid
+    return _PolyMatch(tileid=tileid)
 
 def PolyMatch_Wall(wallid):
     """
     Used for World.GetPolygon:
         poly = w.GetPolygon(PolyMatch_Wall(IDs.Wall.LihzahrdBrickUnsafe))
     """
-    return lambda t: t.Wall == wallid
+    return _PolyMatch(wallid=wallid)
 
 def PolyMatch(tileid, wallid):
     """
@@ -250,7 +327,43 @@ def PolyMatch(tileid, wallid):
         wfn = PolyMatch_Wall(IDs.Wall.LihzahrdBrickUnsafe)
         poly = w.GetPolygon(lambda tile: tfn(tile) and wfn(tile))
     """
-    return lambda t: t.Type == tileid and t.Wall == wallid
+    return _PolyMatch(tileid=tileid, wallid=wallid)
+
+def ExtentsToPolygons(extents, simplify=False, epsilon=0.5, multi=False,
+                      shortcircuit=False):
+    """
+    Builds the result of World.GetPolygon from @param extents, an iterable
+    of (x, top, bottom) giving the first and last matching row of each
+    column x, or (x, None, None) for columns without a match. The remaining
+    parameters are those of World.GetPolygon.
+    """
+    simplify_fn = lambda p: p
+    if simplify:
+        import Region.Poly
+        simplify_fn = lambda p: Region.Poly.Simplify(p, epsilon)
+    polys = []
+    points = []
+    for x, top, bottom in extents:
+        if top is not None:
+            points.append([[x, top], [x, bottom]])
+        else:
+            if multi and len(points) > 0:
+                polys.append(points)
+                points = []
+            if shortcircuit and len(polys) > 0:
+                break
+    if len(points) > 0:
+        verbose("Adding points: %s", points)
+        polys.append(points)
+    # 2) convert those to polygons
+    results = []
+    for poly in polys:
+        verbose("Evaluating %s", poly)
+        if len(poly) < 3:
+            warn("Discarding line segment %s" % (poly,))
+            continue
+        results.append(simplify_fn(PointsToChain(poly)))
+    return results if multi else results[0]
 
 class World(object):
     """
@@ -265,11 +378,48 @@ class World(object):
         load_signs  (bool) whether or not to load the world signs
         load_npcs   (bool) whether or not to load the world NPCs
         load_tents  (bool) whether or not to load the world tile entities
+        lazy        (bool) memory-map the file and decode sections on demand
+        index_rows  (int) row checkpoint interval for the tile index (see
+                    below; default: TileIndex.DEFAULT_ROW_INTERVAL)
+        cache       (bool, str, or WorldCache.WorldCache) cache decoded
+                    worlds; True uses WorldCache.DEFAULT_CACHE_DIR and a
+                    string names the cache directory (needs numpy)
+        workers     (int) decode the tiles using this many processes (needs
+                    numpy; default: 1)
         progress    (bool) show progress during loading
         verbose     (bool) show diagnostic information
         debug       (bool) show even more diagnostic information
 
-    "Read Only" worlds:
+    Tile storage:
+        If numpy is installed, tiles are stored column-wise in a
+        TileGrid.TileGrid and the Tile objects returned by GetTile, EachTile,
+        and friends are lightweight TileGrid.TileView instances. Modifying a
+        view modifies only the tile it refers to. Use GetTileGrid() to access
+        the underlying arrays directly.
+
+    Lazy loading:
+        If lazy=True, the world file is memory-mapped instead of read into
+        memory, and only the file header is parsed by Load(). The flags,
+        tiles, chests, signs, NPCs, and tile entities are each decoded the
+        first time they are needed (by GetFlag, GetTile, GetChests, GetNPCs,
+        and so on). Sections disabled via the load_* parameters are never
+        loaded.
+
+        With numpy installed, GetTile, GetTiles, and w[r, c] on a lazily
+        loaded world decode only the columns they touch. This uses a
+        TileIndex of column offsets, built by one pass over the tiles section
+        and saved next to the world file for reuse (see TileIndex). Any
+        other tile access decodes the whole section.
+
+    Caching:
+        If a cache is given, the decoded tiles, tile and wall counts, chests,
+        signs, NPCs, and tile entities are stored in it once they have all
+        been loaded. Loading the same, unmodified world file again then
+        memory-maps the stored tiles instead of decoding them. Lazily loaded
+        worlds only consult the cache once the tiles are needed. Worlds with
+        sections disabled via the load_* parameters are not stored.
+
+    "Read Only" worlds (only without numpy):
         If read_only=True (the default), then duplicated tiles in a sequence
         will all be references to the same tile instance, so modifying one
         tile will modify all of them. This will lead to unexpected side-effects
@@ -284,6 +434,10 @@ class World(object):
                  load_signs=True,
                  load_npcs=True,
                  load_tents=True,
+                 lazy=False,
+                 index_rows=None,
+                 cache=None,
+                 workers=1,
                  progress=False,
                  verbose=False, debug=False,
                  progress_delay=0.2,
@@ -297,6 +451,24 @@ class World(object):
         self._signs = None
         self._npcs = None
         self._tents = None
+        self._footer = None
+        self._pending = set()
+        self._path = None
+        self._index = None
+        self._index_rows = index_rows
+        self._cache = None
+        self._cache_key = None
+        self._cache_world_key = None
+        self._workers = workers
+        if cache is not None and cache is not False:
+            if not HAVE_NUMPY:
+                raise RuntimeError("Please install numpy")
+            if cache is True:
+                self._cache = WorldCache.WorldCache()
+            elif isinstance(cache, basestring):
+                self._cache = WorldCache.WorldCache(cache)
+            else:
+                self._cache = cache
         self._width = 0
         self._height = 0
         self._loaded = False
@@ -307,6 +479,7 @@ class World(object):
         self._prof_stats = []
         self._tile_counts = collections.defaultdict(int)
         self._wall_counts = collections.defaultdict(int)
+        self._count_index = None
 
         G.VERBOSE_MODE = G.VERBOSE_MODE or verbose or debug
         G.DEBUG_MODE = G.DEBUG_MODE or debug
@@ -317,6 +490,7 @@ class World(object):
         self._should_load_signs = load_signs
         self._should_load_npcs = load_npcs
         self._should_load_tents = load_tents
+        self._lazy = lazy
         self._max_progress_len = 0
         self._last_progress_len = 0
         if fname is not None and fobj is not None:
@@ -341,8 +515,8 @@ class World(object):
 
     def __repr__(self):
         if self._loaded:
-            return "<Terraria World %r (%d, %d)>" % (self._flags.Title,
-                    self._width, self._height)
+            return "<Terraria World %r (%d, %d)>" % (self.Title(),
+                    self.Width(), self.Height())
         return super(World, self).__repr__()
 
     def _PosToIdx(self, x, y):
@@ -351,6 +525,11 @@ class World(object):
     def _IdxToPos(self, idx):
         return (idx % self._width, int(idx / self._width))
 
+    def _TileAt(self, x, y):
+        if HAVE_NUMPY:
+            return self._tiles.GetTile(x, y)
+        return self._tiles[self._PosToIdx(x, y)]
+
     def _ensure_offset(self, offset, or_fatal=False):
         if or_fatal and self._pos() != offset:
             raise RuntimeError("Stream position %d not at expected offset %d" %
@@ -377,30 +556,41 @@ class World(object):
     def _pos(self):
         return self._stream.get_pos()
 
-    def Open(self, fobj=None, fname=None):
+    def Open(self, fobj=None, fname=None, lazy=False):
         """Specify the file object or file name to read from. This actually
-        loads the contents of the file into memory."""
+        loads the contents of the file into memory, unless @param lazy is
+        True, in which case the file is memory-mapped."""
         if fobj is None and fname is not None:
             fobj = open(fname, 'r')
         elif fobj is None and fname is None:
             raise RuntimeError("Must provide either file object or file path")
-        self._stream = BinaryString.BinaryString(fobj.read(),
-                                                 debug=G.DEBUG_MODE)
+        self._stream = self._MakeStream(fobj, lazy)
+
+    @staticmethod
+    def _MakeStream(fobj, lazy=False):
+        """Returns a BinaryString over @param fobj: a memory map of it if
+        @param lazy is True and fobj is a real file, or its contents"""
+        if lazy and hasattr(fobj, 'fileno'):
+            data = mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ)
+            return BinaryString.BinaryString(data, debug=G.DEBUG_MODE,
+                                             asis=True)
+        return BinaryString.BinaryString(fobj.read(), debug=G.DEBUG_MODE)
 
     @staticmethod
     def ListWorlds():
         """Returns a list of worlds (filename, world, filepath). The world
-        is a valid world instance with the header and world flags loaded."""
+        is a lazily loaded world instance: its header is loaded, and its
+        flags are loaded on first use. See WorldCatalog to list worlds
+        without opening them."""
+        import WorldCatalog
         worlds = []
-        if os.path.exists(WORLDPATH_LINUX):
-            for f in os.listdir(WORLDPATH_LINUX):
-                fp = os.path.join(WORLDPATH_LINUX, f)
-                if f.endswith('.wld'):
-                    w = World()
-                    w.Open(open(fp, 'r'))
-                    w.LoadHeader()
-                    w.LoadFlags()
-                    worlds.append((f, w, fp))
+        catalog = WorldCatalog.GetCatalog()
+        catalog.Refresh()
+        for entry in catalog.Entries():
+            w = World(load_tiles=False, load_chests=False, load_signs=False,
+                      load_npcs=False, load_tents=False)
+            w.Load(open(entry.Path, 'r'), lazy=True)
+            worlds.append((entry.FileName, w, entry.Path))
         verbose("Discovered %d worlds", len(worlds))
         return worlds
 
@@ -412,34 +602,59 @@ class World(object):
         True.
 
         If @param doopen is True, return an opened file object."""
+        import WorldCatalog
         if worldname is None and worldid is None:
             raise RuntimeError("must provide either worldname or worldid")
         if worldname is not None:
             fp = os.path.join(WORLDPATH_LINUX, worldname + ".wld")
             if os.path.exists(fp):
                 return open(fp, 'r') if doopen else fp
-        for fn, w, fp in World.ListWorlds():
-            if worldname is not None and worldname == w.GetFlag('Title'):
-                return open(fp, 'r') if doopen else fp
-            elif worldid is not None and worldid == w.GetFlag('WorldId'):
-                return open(fp, 'r') if doopen else fp
+        catalog = WorldCatalog.GetCatalog()
+        entry = None
+        if worldname is not None:
+            entry = catalog.ByTitle(worldname)
+        if entry is None and worldid is not None:
+            entry = catalog.ById(worldid)
+        if entry is not None:
+            return open(entry.Path, 'r') if doopen else entry.Path
         if not failquiet:
             raise RuntimeError("World %s not found" % (worldname,))
         verbose("No world matching (n=%r, id=%r) found", worldname, worldid)
 
     # {{{ Region <Loaders> begin
 
-    def Load(self, fobj=None):
+    def Load(self, fobj=None, lazy=None):
         """Loads the world given by @param fobj (if present) or the value of
         @param fname or @param fobj passed to __init__.
 
         Use the arguments to __init__ to suppress loading certain sections.
+        If @param lazy (default: the value passed to __init__) is True, only
+        the header is loaded now; see the World class docstring.
         """
+        if lazy is None:
+            lazy = self._lazy
         if fobj is not None:
-            self._stream = BinaryString.BinaryString(fobj.read(),
-                                                     debug=G.DEBUG_MODE)
+            self._stream = self._MakeStream(fobj, lazy)
+            self._path = getattr(fobj, 'name', None)
         # Populate self._header
         self.LoadHeader()
+        if lazy:
+            self._pending = set(['flags'])
+            for section, enabled in (('tiles', self._should_load_tiles),
+                                     ('chests', self._should_load_chests),
+                                     ('signs', self._should_load_signs),
+                                     ('npcs', self._should_load_npcs),
+                                     ('tents', self._should_load_tents)):
+                if enabled:
+                    self._pending.add(section)
+            if self._header.Version < Header.Version140:
+                self._pending.discard('tents')
+            verbose("Deferring section loading until first use")
+            return
+        if self._LoadFromCache():
+            self._pending = set(['flags'])
+            self._Require('flags')
+            return
 
         offsets = self._header.SectionPointers
         verbose("Header size: %s" % (offsets[1] - offsets[0],))
@@ -486,6 +701,19 @@ class World(object):
         assert self._pos() == self._header.GetFooterPointer()
         self._progress("Loading footer")
         self.LoadFooter()
+        self._CheckFooter()
+        self._progress(force=True)
+        self._StoreInCache()
+
+        if G.DEBUG_MODE:
+            stats = self._stream.getReadStats().items()
+            stats.sort()
+            print("Read statistics (size, number of times read):")
+            for nbytes, ntimes in stats:
+                print("%d\t%d" % (nbytes, ntimes))
+
+    def _CheckFooter(self):
+        "Warns if the footer is invalid or disagrees with the world flags"
         verbose("Loaded footer: %s", self._footer)
         if not self._footer['Loaded']:
             warn("Invalid footer detected!")
@@ -495,14 +723,95 @@ class World(object):
         if self._footer['WorldID'] != self.GetFlag('WorldId'):
             warn("Footer ID %s does not match header ID %s" % (
                  self._footer['WorldID'], self.GetFlag('WorldId')))
+
+    def _Require(self, section):
+        """Decodes @param section ('flags', 'tiles', 'chests', 'signs',
+        'npcs', or 'tents') if it is still pending after a lazy Load()"""
+        if section not in self._pending:
+            return
+        self._pending.discard(section)
+        if section == 'flags':
+            self._progress("Loading world flags")
+            self.LoadFlags()
+            self.LoadFooter()
+            self._CheckFooter()
+        elif section == 'tiles':
+            self._Require('flags')
+            if self._LoadFromCache():
+                return
+            self._progress("Loading tiles...")
+            self.LoadTiles(self._width, self._height)
+            if self._WillStoreInCache():
+                # store the remaining sections along with the tiles
+                for other in ('chests', 'signs', 'npcs', 'tents'):
+                    self._Require(other)
+                self._StoreInCache()
+        elif section == 'chests':
+            self._progress("Loading chests...")
+            self.LoadChests()
+        elif section == 'signs':
+            self._progress("Loading signs...")
+            self.LoadSigns()
+        elif section == 'npcs':
+            self._progress("Loading NPCs...")
+            self.LoadNPCs()
+        elif section == 'tents':
+            self._progress("Loading tile entities...")
+            self.LoadTileEntities()
         self._progress(force=True)
 
-        if G.DEBUG_MODE:
-            stats = self._stream.getReadStats().items()
-            stats.sort()
-            print("Read statistics (size, number of times read):")
-            for nbytes, ntimes in stats:
-                print("%d\t%d" % (nbytes, ntimes))
+    def _LoadFromCache(self):
+        """Installs the tiles and other sections from the cache, if there is
+        an entry for this world. Otherwise, remembers the key to store the
+        world under once it is loaded. Returns True on a cache hit."""
+        if self._cache is None or not self._path or \
+                not os.path.exists(self._path):
+            return False
+        if self._cache_key is not None:
+            # already missed; the world is stored once loaded
+            return False
+        if self._cache_world_key is None:
+            content, _ = self._stream.getContent()
+            self._cache_world_key = WorldCache.WorldCache.Key(self._path,
+                    content, self._header)
+        key = self._cache_world_key
+        entry = self._cache.Fetch(key, writable=not self._readonly)
+        if entry is None:
+            verbose("World not found in cache %s", self._cache.Directory())
+            self._cache_key = key
+            return False
+        verbose("Loaded world from cache %s", self._cache.Directory())
+        self._tiles = entry['tiles']
+        self._tile_counts = collections.defaultdict(int, entry['tile_counts'])
+        self._wall_counts = collections.defaultdict(int, entry['wall_counts'])
+        self._chests = entry['chests']
+        self._signs = entry['signs']
+        self._npcs = entry['npcs']
+        self._mobs = entry['mobs']
+        self._tents = entry['tents']
+        self._pending -= set(['tiles', 'chests', 'signs', 'npcs', 'tents'])
+        return True
+
+    def _WillStoreInCache(self):
+        "Returns True if _StoreInCache would store the world"
+        return self._cache_key is not None and all((self._should_load_tiles,
+                                                   self._should_load_chests,
+                                                   self._should_load_signs,
+                                                   self._should_load_npcs,
+                                                   self._should_load_tents))
+
+    def _StoreInCache(self):
+        "Stores the world in the cache after a miss, if fully loaded"
+        if not self._WillStoreInCache():
+            return
+        key, self._cache_key = self._cache_key, None
+        self._progress("Caching world...")
+        self._cache.Store(key, self._tiles,
+                          tile_counts=dict(self._tile_counts),
+                          wall_counts=dict(self._wall_counts),
+                          chests=self._chests, signs=self._signs,
+                          npcs=self._npcs, mobs=self._mobs, tents=self._tents)
+        self._progress(force=True)
 
     def LoadHeader(self, stream=None):
         if stream is None:
@@ -596,6 +905,10 @@ class World(object):
         end = self._header.SectionPointers[2]
         size = end - start
         verbose("Section is %s bytes long" % (size,))
+        if HAVE_NUMPY:
+            self._LoadTileGrid(w, h, start, end)
+            self.ProfEnd()
+            return
         tiles = [None]*(w*h)
         x, y = 0, 0
         nloaded = 0
@@ -611,9 +924,9 @@ class World(object):
                 i = self._PosToIdx(x, y)
                 tile, rle = Tile.FromStream(self._stream, important)
                 if tile.IsActive:
-                    self._tile_counts[tile.Type] += max(rle, 1)
+                    self._tile_counts[tile.Type] += max(rle, 0) + 1
                 if tile.Wall != 0:
-                    self._wall_counts[tile.Wall] += max(rle, 1)
+                    self._wall_counts[tile.Wall] += max(rle, 0) + 1
                 nloaded += 1
                 tiles[i] = tile
                 while rle > 0:
@@ -639,6 +952,39 @@ class World(object):
         self._tiles = tiles
         self.ProfEnd()
 
+    def _LoadTileGrid(self, w, h, start, end):
+        "Decodes the tiles section in bulk via TileDecoder"
+        def progress(done, total):
+            self._progress("Loading tiles... %d/%d %d%%", done, total,
+                           done*100/max(total, 1))
+        content, _ = self._stream.getContent()
+        verbose("Decoding tiles with the %s decoder",
+                "compiled" if TileDecoder.HAVE_NUMBA else "pure-Python")
+        if self._workers > 1:
+            # the column offsets let each worker start at its own range
+            index = self._GetTileIndex()
+            verbose("Decoding tiles with %d workers", self._workers)
+            grid, pos = TileDecoder.DecodeTilesParallel(content, start, end,
+                    w, h, self._header.ImportantTiles, self._workers,
+                    columns=index.Columns, progress=progress)
+        else:
+            grid, pos = TileDecoder.DecodeTiles(content, start, end, w, h,
+                                                self._header.ImportantTiles,
+                                                progress=progress)
+        self._stream.seek_set(pos)
+        if pos > end:
+            warn("Read %d bytes past the end of the section!" % (pos - end,))
+        elif pos < end:
+            warn("Tiles section has %d unread bytes" % (end - pos,))
+        self._SetTileGrid(grid)
+
+    def _SetTileGrid(self, grid):
+        "Installs @param grid as the world's tiles and updates tile counts"
+        self._tiles = grid
+        self._tile_counts = collections.defaultdict(int, grid.TileCounts())
+        self._wall_counts = collections.defaultdict(int, grid.WallCounts())
+        verbose("Tile storage uses %d bytes", grid.NumBytes())
+
     def LoadChests(self):
         self._ensure_offset(self._header.GetChestsPointer())
         chests = []
@@ -759,41 +1105,209 @@ class World(object):
     def GetHeader(self):
         return self._header
 
-    def EachTile(self, rowcol=True, unreachable=True, progress=None):
+    def _ShouldStream(self):
+        """Returns True if the tiles are to be decoded column by column
+        instead of loaded. The tiles are loaded if they are in the cache, or
+        if loading them would store them there or decode them with several
+        workers."""
+        if 'tiles' not in self._pending:
+            return False
+        self._LoadFromCache()
+        if 'tiles' in self._pending and (self._WillStoreInCache() or
+                                         self._workers > 1):
+            self._Require('tiles')
+        return 'tiles' in self._pending
+
+    def StreamColumns(self, xmin=0, xmax=None, progress=None):
+        """Returns an iterable of (x, columns) for each column x of the
+        world, in file order, where columns is a dict of TileGrid column
+        name to a 1D numpy array indexed by y (needs numpy).
+
+        If the tiles have not been loaded yet (see World(lazy=True)), they
+        are decoded one column at a time as the iteration proceeds, so only
+        a single column is ever held in memory. Worlds with a cache or with
+        several workers load the tiles instead: the cache is filled, and
+        the workers decode in parallel."""
+        if not HAVE_NUMPY:
+            raise RuntimeError("Please install numpy")
+        self._Require('flags')
+        xmax = self._width if xmax is None else xmax
+        if self._ShouldStream():
+            content, _ = self._stream.getContent()
+            columns = TileDecoder.IterColumns(content,
+                    self._header.GetTilesPointer(),
+                    self._header.GetChestsPointer(), xmax, self._height,
+                    self._header.ImportantTiles)
+        else:
+            self._Require('tiles')
+            columns = ((x, self._tiles.Column(x)) for x in xrange(xmax))
+        for x, column in columns:
+            if x < xmin:
+                continue
+            if progress is not None:
+                self._progress("%s %d/%d %d%%", progress, x-xmin, xmax-xmin,
+                               (x-xmin)*100/max(xmax-xmin, 1))
+            yield x, column
+        if progress is not None:
+            self._progress(force=True)
+
+    def StreamColumnBlocks(self, ncols, xmin=0, xmax=None, progress=None):
+        """Like StreamColumns, but returns an iterable of (x0, columns) where
+        columns is a dict of TileGrid column name to an array of shape
+        (n, height) holding the n <= @param ncols columns starting at x0.
+
+        If the tiles are loaded, the arrays are views of the TileGrid rather
+        than copies; do not modify them."""
+        if not HAVE_NUMPY:
+            raise RuntimeError("Please install numpy")
+        self._Require('flags')
+        xmax = self._width if xmax is None else xmax
+        if not self._ShouldStream():
+            self._Require('tiles')
+            for x0 in xrange(xmin, xmax, ncols):
+                if progress is not None:
+                    self._progress("%s %d/%d %d%%", progress, x0-xmin,
+                                   xmax-xmin, (x0-xmin)*100/max(xmax-xmin, 1))
+                x1 = min(x0 + ncols, xmax)
+                yield x0, dict((name, getattr(self._tiles, name)[x0:x1])
+                               for name in TileGrid.ColumnNames)
+            if progress is not None:
+                self._progress(force=True)
+            return
+        block, x0 = [], xmin
+        for x, column in self.StreamColumns(xmin, xmax, progress=progress):
+            if not block:
+                x0 = x
+            block.append(column)
+            if len(block) == ncols:
+                yield x0, self._StackColumns(block)
+                block = []
+        if block:
+            yield x0, self._StackColumns(block)
+
+    def _StackColumns(self, block):
+        return dict((name, np.stack([c[name] for c in block]))
+                    for name in TileGrid.ColumnNames)
+
+    def EachTile(self, rowcol=True, unreachable=True, progress=None,
+                 stream=False):
         """Returns an iterable of (row, col, Tile) for each tile
         @param rowcol (default: True)
             If false, result is an iterable of (col, row, Tile), aka (x, y, t)
         @param unreachable (default: True)
             If false, omit unreachable tiles (outer 40 tiles)
+        @param stream (default: False)
+            If true, visit the tiles column by column, in the order they
+            are stored in the file, decoding them as needed (see
+            StreamColumns). The Tile objects are only valid until the
+            iteration moves on to the next column.
         """
+        if stream and HAVE_NUMPY:
+            return self._EachTileStreamed(rowcol, unreachable, progress)
+        return self._EachTile(rowcol, unreachable, progress, colmajor=stream)
+
+    def _EachTileStreamed(self, rowcol, unreachable, progress):
+        self._Require('flags')
+        border = 0 if unreachable else BORDER_TILES
+        ymin, ymax = border, self._height - border
+        for x, column in self.StreamColumns(border, self._width - border,
+                                            progress=progress):
+            grid = TileGrid.TileGrid(1, self._height, dict(
+                    (name, arr.reshape((1, -1))) for name, arr in
+                    column.iteritems()))
+            for y in xrange(ymin, ymax):
+                if rowcol:
+                    yield y, x, grid.GetTile(0, y)
+                else:
+                    yield x, y, grid.GetTile(0, y)
+
+    def _EachTile(self, rowcol, unreachable, progress, colmajor=False):
+        self._Require('tiles')
         ymin = 0 if unreachable else 40
         xmin = 0 if unreachable else 40
         ymax = self._height if unreachable else self._height - 40
         xmax = self._width if unreachable else self._width - 40
         total = (xmax-xmin)*(ymax-ymin)
         curr = 0
-        for y in xrange(ymin, ymax):
-            for x in xrange(xmin, xmax):
-                if progress is not None:
-                    curr += 1
-                    self._progress("%s %d/%d %d%%", progress, curr, total,
-                                   curr*100/total)
-                if rowcol:
-                    yield y, x, self._tiles[self._PosToIdx(x, y)]
-                else:
-                    yield x, y, self._tiles[self._PosToIdx(x, y)]
+        if colmajor:
+            positions = ((x, y) for x in xrange(xmin, xmax)
+                                for y in xrange(ymin, ymax))
+        else:
+            positions = ((x, y) for y in xrange(ymin, ymax)
+                                for x in xrange(xmin, xmax))
+        for x, y in positions:
+            if progress is not None:
+                curr += 1
+                self._progress("%s %d/%d %d%%", progress, curr, total,
+                               curr*100/total)
+            if rowcol:
+                yield y, x, self._TileAt(x, y)
+            else:
+                yield x, y, self._TileAt(x, y)
         if progress is not None:
             self._progress(force=True)
 
     def Width(self):
+        self._Require('flags')
         return self._width
 
     def Height(self):
+        self._Require('flags')
         return self._height
 
     def GetTile(self, x, y):
         "Return the Tile object at x, y"
-        return self._tiles[self._PosToIdx(x, y)]
+        if self._UseTileIndex():
+            return self._IndexedTile(x, y)
+        self._Require('tiles')
+        return self._TileAt(x, y)
+
+    def _UseTileIndex(self):
+        "True if tiles should be decoded per column via a TileIndex"
+        return HAVE_NUMPY and 'tiles' in self._pending
+
+    def _GetTileIndex(self):
+        "Returns the TileIndex for this world, loading or building it"
+        if self._index is None:
+            self._Require('flags')
+            rows = self._index_rows
+            if rows is None:
+                rows = TileIndex.DEFAULT_ROW_INTERVAL
+            path = self._path if self._path and os.path.exists(self._path) \
+                              else None
+            content, _ = self._stream.getContent()
+            self._progress("Indexing tiles...")
+            self._index = TileIndex.TileIndex.ForWorld(path, content,
+                    self._header, self._flags, row_interval=rows)
+            self._progress(force=True)
+        return self._index
+
+    def _DecodeSpan(self, start, end, width, height):
+        "Decodes width by height tiles from the tiles section at start:end"
+        content, _ = self._stream.getContent()
+        grid, _ = TileDecoder.DecodeTiles(content, start, end, width, height,
+                                          self._header.ImportantTiles)
+        return grid
+
+    def _IndexedColumn(self, x):
+        "Returns a 1 by Height() TileGrid holding column x"
+        start, end = self._GetTileIndex().ColumnRange(x)
+        return self._DecodeSpan(start, end, 1, self._height)
+
+    def _IndexedTile(self, x, y):
+        "Returns the tile at x, y, decoding from the nearest row checkpoint"
+        index = self._GetTileIndex()
+        offset, ystart = index.RowCheckpoint(x, y)
+        _, end = index.ColumnRange(x)
+        grid = self._DecodeSpan(offset, end, 1, y - ystart + 1)
+        return grid.GetTile(0, y - ystart)
+
+    def GetTileGrid(self):
+        "Return the TileGrid.TileGrid holding the world's tiles (needs numpy)"
+        if not HAVE_NUMPY:
+            raise RuntimeError("Please install numpy")
+        self._Require('tiles')
+        return self._tiles
 
     def GetTiles(self, rows, cols):
         """
@@ -801,9 +1315,19 @@ class World(object):
         @param rows - an iterable of rows to get
         @param cols - an iterable of cols to get
         """
+        if self._UseTileIndex():
+            # each column is decoded once per call, and dropped after it
+            columns = {}
+            for r in rows:
+                for c in cols:
+                    if c not in columns:
+                        columns[c] = self._IndexedColumn(c)
+                    yield columns[c].GetTile(0, r)
+            return
+        self._Require('tiles')
         for r in rows:
             for c in cols:
-                yield self._tiles[self._PosToIdx(c, r)]
+                yield self._TileAt(c, r)
 
     def __getitem__(self, idx):
         """
@@ -833,29 +1357,65 @@ class World(object):
             elif arg < 0:
                 return [maxVal + arg]
             return [arg]
-        rows = parseGetItemArg(r, self._height)
-        cols = parseGetItemArg(c, self._width)
+        rows = parseGetItemArg(r, self.Height())
+        cols = parseGetItemArg(c, self.Width())
         # special case instance of asking for just one tile
         if len(rows) == 1 and len(cols) == 1:
-            return self._tiles[self._PosToIdx(cols[0], rows[0])]
+            return self.GetTile(cols[0], rows[0])
         return self.GetTiles(rows, cols)
 
     def GetFlags(self):
         "Return a tuple of (flagName, flagValue)"
+        self._Require('flags')
         return tuple((f, self._flags.get(f)) for f,_,_ in WorldFlags.Flags)
 
     def GetFlag(self, flag):
         "Return the value of @param flag"
+        self._Require('flags')
         return self._flags.get(flag)
 
+    def GetChests(self):
+        "Return the loaded chests"
+        self._Require('chests')
+        return self._chests
+
+    def GetSigns(self):
+        "Return the loaded signs as (x, y, text) triples"
+        self._Require('signs')
+        return self._signs
+
     def GetNPCs(self):
         "Return the loaded NPCs"
+        self._Require('npcs')
         return self._npcs
 
     def GetTileEntities(self):
         "Return the loaded tile entities"
+        self._Require('tents')
         return self._tents
 
+    def FindMatches(self, terms, unreachable=True, tiles=False,
+                    progress=None):
+        """Finds the tiles matched by any of the Match.Match objects in
+        @param terms, whose parts apply to (Type, U, V, Wall) in that order
+        (needs numpy).
+
+        Returns (xs, ys) numpy arrays of the matching positions, sorted by
+        row and then column like EachTile. If @param tiles is True, returns
+        (xs, ys, tiles) where tiles is a list of standalone Tile objects.
+        If @param unreachable is False, the outer 40 tiles are skipped.
+
+        The terms are evaluated over whole columns at once via
+        Match.match_arrays. The columns are streamed (see StreamColumns), so
+        this does not need the tiles to be loaded."""
+        if not HAVE_NUMPY:
+            raise RuntimeError("Please install numpy")
+        plan = ColumnPass.ColumnPass(self)
+        finder = plan.Add(ColumnPass.Finder(terms, tiles=tiles,
+                border=(0 if unreachable else BORDER_TILES)))
+        plan.Run(progress=progress)
+        return finder.Result()
+
     def GetLevels(self):
         "Returns a dictionary of strings (name) to number (depth)"
         w, h = self.Width(), self.Height()
@@ -882,6 +1442,14 @@ class World(object):
         the match function given by @param match_fn. See the module-level
         PolyMatch_Tile, PolyMatch_Wall, and PolyMatch functions.
 
+        @param match_fn may be one of:
+            a function of a Tile object returning True for matching tiles
+            an object with a Mask(columns) method, like those returned by
+                the PolyMatch functions, evaluated over whole columns
+            a boolean numpy array of shape (width, height)
+        The latter two are much faster, and do not need the tiles to be
+        loaded (see World(lazy=True)).
+
         If @param multi is True, the result is a list of polygons, rather than
         a single polygon.
 
@@ -901,76 +1469,138 @@ class World(object):
         that this algorithm does not work on "noisy" polygons with large
         vertex angle variation.
         """
-        simplify_fn = lambda p: p
-        if simplify:
-            import Region.Poly
-            simplify_fn = lambda p: Region.Poly.Simplify(p, epsilon)
         xmin = 0 if xmin is None else xmin
         xmax = self.Width() if xmax is None else xmax
         ymin = 0 if ymin is None else ymin
         ymax = self.Height() if ymax is None else ymax
-        xseq = xrange(xmin, xmax)
+        if HAVE_NUMPY and (isinstance(match_fn, np.ndarray) or
+                           hasattr(match_fn, 'Mask')):
+            extents = self._MaskExtents(match_fn, xmin, xmax, ymin, ymax,
+                                        progress)
+            return ExtentsToPolygons(extents, simplify=simplify,
+                                     epsilon=epsilon, multi=multi,
+                                     shortcircuit=shortcircuit)
+        self._Require('tiles')
         yseq = xrange(ymin, ymax)
-        polys = []
-        points = []
-        # 1) generate a sequence of (top, bottom) point pairs
-        for x in xseq:
-            if progress is not None:
-                self._progress("%s %d/%d %d%%", progress, x-xmin, xmax-xmin,
-                               (x-xmin)*100/(xmax-xmin))
-            start = None
-            end = None
-            for y in yseq:
-                if match_fn(self._tiles[self._PosToIdx(x, y)]):
-                    if start is None:
-                        start = [x, y]
-                    end = [x, y]
-            if start is not None: # implies: end is not None
-                points.append([start, end])
-            else:
-                if multi and len(points) > 0:
-                    polys.append(points)
-                    points = []
-                if shortcircuit and len(polys) > 0:
-                    break
-        if len(points) > 0:
-            verbose("Adding points: %s", points)
-            polys.append(points)
-        # 2) convert those to polygons
-        results = []
-        for poly in polys:
-            verbose("Evaluating %s", poly)
-            if len(poly) < 3:
-                warn("Discarding line segment %s" % (poly,))
-                continue
-            results.append(simplify_fn(PointsToChain(poly)))
+        def extents():
+            # 1) generate a sequence of (x, top, bottom) per column
+            for x in xrange(xmin, xmax):
+                if progress is not None:
+                    self._progress("%s %d/%d %d%%", progress, x-xmin,
+                                   xmax-xmin, (x-xmin)*100/(xmax-xmin))
+                start = None
+                end = None
+                for y in yseq:
+                    if match_fn(self._TileAt(x, y)):
+                        if start is None:
+                            start = y
+                        end = y
+                yield x, start, end
+        results = ExtentsToPolygons(extents(), simplify=simplify,
+                                    epsilon=epsilon, multi=multi,
+                                    shortcircuit=shortcircuit)
         if progress is not None:
             self._progress(force=True)
-        return results if multi else results[0]
+        return results
+
+    def _MaskExtents(self, match, xmin, xmax, ymin, ymax, progress=None):
+        """Returns the (x, top, bottom) extents of the boolean array or
+        Mask() object @param match over columns xmin..xmax-1 and rows
+        ymin..ymax-1, for ExtentsToPolygons"""
+        if isinstance(match, np.ndarray):
+            tops, bottoms = ColumnPass.MaskExtents(match[xmin:xmax,
+                                                         ymin:ymax])
+            return [(x, t + ymin, b + ymin) if t >= 0 else (x, None, None)
+                    for x, t, b in zip(xrange(xmin, xmax), tops.tolist(),
+                                       bottoms.tolist())]
+        plan = ColumnPass.ColumnPass(self)
+        extents = plan.Add(ColumnPass.ColumnExtents(
+                lambda chunk: match.Mask(chunk.Columns), ymin, ymax))
+        plan.Run(progress=progress, xmin=xmin, xmax=xmax)
+        return extents.Result()
+
+    def GetMatchMask(self, match, progress=None):
+        """Returns a boolean numpy array of shape (width, height) which is
+        True where @param match holds. @param match is a predicate as
+        accepted by GetPolygon."""
+        if not HAVE_NUMPY:
+            raise RuntimeError("Please install numpy")
+        if isinstance(match, np.ndarray):
+            return match
+        mask = np.zeros((self.Width(), self.Height()), dtype=np.bool_)
+        if hasattr(match, 'Mask'):
+            blocks = self.StreamColumnBlocks(ColumnPass.CHUNK_COLUMNS,
+                                             progress=progress)
+            for x0, columns in blocks:
+                block = match.Mask(columns)
+                mask[x0:x0+block.shape[0]] = block
+        else:
+            for x, y, t in self.EachTile(rowcol=False, progress=progress):
+                mask[x, y] = match(t)
+        return mask
 
-    def GetBiomes(self, biome_def, progress=None):
+    def GetRegions(self, match, connectivity=4, min_count=0, labels=False,
+                   progress=None):
+        """
+        Returns the connected regions of tiles satisfying @param match (any
+        predicate accepted by GetPolygon), as a list of Region.Label.Component
+        tuples (label, count, area, xmin, ymin, xmax, ymax). Needs numpy.
+
+        Unlike GetPolygon(multi=True), regions sharing columns are kept apart
+        and concave regions are represented exactly. A region's count is its
+        number of tiles; its area also includes the holes it encloses.
+
+        @param connectivity is 4 (default) to join tiles sharing an edge, or
+        8 to also join tiles touching at a corner. Regions of fewer than
+        @param min_count tiles are omitted. If @param labels is True, the
+        result is (regions, grid), where grid is an int32 array of shape
+        (width, height) holding each tile's region label (0 for none).
+        """
+        import Region.Label
+        mask = self.GetMatchMask(match, progress=progress)
+        regions, grid = Region.Label.label(mask, connectivity, grid=labels,
+                                           min_count=min_count)
+        if labels:
+            return regions, grid
+        return regions
+
+    def GetBiomeMask(self, biome_def, points=None, progress=None):
+        """Returns a boolean numpy array of shape (width, height) which is
+        True where the tiles within @param biome_def's window are worth at
+        least its threshold. @param points is the biome's result from a
+        ColumnPass.BiomePoints consumer which already scanned the world."""
         from Region.Density import DensityCalculator
+        if not HAVE_NUMPY:
+            raise RuntimeError("Please install numpy")
+        if points is None:
+            plan = ColumnPass.ColumnPass(self)
+            found = plan.Add(ColumnPass.BiomePoints((biome_def,)))
+            plan.Run(progress=progress)
+            points = found.Result()[0]
         calc = DensityCalculator(self.Width(), self.Height(),
                                  biome_def.WindowSize())
-        for x, y, t in self.EachTile(rowcol=False, progress=progress):
-            v = biome_def.TileValue(t)
-            if v != 0:
-                calc.add_point(x, y, v)
-        # a point (x,y) is part of a biome if that point's value is no less
-        # than biome_def.Threshold(), akin to: (won't work, but it's the idea)
-        #   [point for point in calc if point.value >= biome_def.Threshold()]
-        biome_matrix = calc.get_matrix() >= biome_def.Threshold()
-        # until edge->poly detection is implemented, end here
-        return biome_matrix
-
-        # clockwise tracing around points greater than the biome minimum
-        # should result in a crisp polygon edge, which can be simplified
-        # via the normal algorithm
-        # edge has matching biome on the right, non-matching on the left,
-        # so it's essentially an arrow
-        #
-        # state of scan: single point and an arrow leading towards the next
-        # single point (edge detection!!)
+        calc.add_points(*points)
+        return calc.get_matrix() >= biome_def.Threshold()
+
+    def GetBiomes(self, biome_def, connectivity=4, simplify=True,
+                  epsilon=0.5, min_count=0, points=None, progress=None):
+        """
+        Returns the outlines of the regions of @param biome_def (see
+        GetBiomeMask) as a list of polygons in the format of WorldFile.py
+        --poly, traced by Region.Contour.to_polygons: a list of [x, y]
+        points for a region without holes, otherwise [shell, [hole, ...]].
+        Points are tile corners. Needs numpy and, if @param simplify is
+        set, shapely.
+
+        @param connectivity and @param min_count are as for GetRegions;
+        @param epsilon is passed to Region.Poly.Simplify. @param points is
+        as for GetBiomeMask.
+        """
+        import Region.Contour
+        mask = self.GetBiomeMask(biome_def, points=points, progress=progress)
+        return Region.Contour.to_polygons(mask, connectivity,
+                                          simplify=simplify, epsilon=epsilon,
+                                          min_count=min_count)
 
     def Crimson(self):
         "True if world is Crimson, False otherwise"
@@ -995,17 +1625,72 @@ class World(object):
         return self.GetFlag('Title')
 
     def GetTileCounts(self):
+        self._Require('tiles')
         return self._tile_counts
 
     def GetTileCount(self, tile):
         "Number of occurrences of tile ID given"
+        self._Require('tiles')
         return self._tile_counts[tile]
 
+    def BuildCountIndex(self, types=None, block=None, progress=None):
+        """
+        Builds the CountIndex.CountIndex used by CountInRect and
+        CountByLayer, for the tile types @param types (default: every type
+        present), with blocks of @param block tiles (default:
+        CountIndex.DEFAULT_BLOCK). Returns the index. Needs numpy.
+
+        Indexing fewer types saves memory: the index keeps the position of
+        every tile of the indexed types.
+        """
+        if not HAVE_NUMPY:
+            raise RuntimeError("Please install numpy")
+        if block is None:
+            block = CountIndex.DEFAULT_BLOCK
+        self._count_index = CountIndex.CountIndex.ForWorld(
+                self, types=types, block=block, progress=progress)
+        return self._count_index
+
+    def _GetCountIndex(self, tileid):
+        index = self._count_index
+        if index is None:
+            index = self.BuildCountIndex()
+        if not index.HasType(tileid):
+            raise ValueError("Tile type %r is not in the count index; see "
+                             "World.BuildCountIndex" % (tileid,))
+        return index
+
+    def CountInRect(self, tileid, x0, y0, x1, y1):
+        """Returns the number of active @param tileid tiles with
+        x0 <= x < x1 and y0 <= y < y1. The first query builds an index of
+        every type unless BuildCountIndex was called; later queries take
+        time independent of the size of the rectangle."""
+        return self._GetCountIndex(tileid).Count(tileid, x0, y0, x1, y1)
+
+    def CountByLayer(self, tileid):
+        """Returns a dict of layer name to the number of active @param tileid
+        tiles in that layer, splitting the world at the GetLevels depths:
+        Space (above Space), Surface (Space to Surface), Underground
+        (Surface to Rock), Cavern (Rock to Hell), and Underworld (below
+        Hell). See CountInRect."""
+        index = self._GetCountIndex(tileid)
+        levels = self.GetLevels()
+        names = ('Space', 'Surface', 'Underground', 'Cavern', 'Underworld')
+        depths = [0] + [levels[n] for n in ('Space', 'Surface', 'Rock',
+                                            'Hell')] + [self.Height()]
+        # keep the layers from overlapping, even in odd (tiny) worlds
+        for i in range(1, len(depths)):
+            depths[i] = min(max(int(depths[i]), depths[i-1]), self.Height())
+        return dict((name, index.Count(tileid, 0, y0, self.Width(), y1))
+                    for name, y0, y1 in zip(names, depths, depths[1:]))
+
     def GetWallCounts(self):
+        self._Require('tiles')
         return self._wall_counts
 
     def GetWallCount(self, wall):
         "Number of occurrences of wall ID given"
+        self._Require('tiles')
         return self._wall_counts[wall]
 
 ListWorlds = World.ListWorlds
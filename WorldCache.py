@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+
+"""
+On-disk cache of decoded worlds
+
+Decoding a world's tiles is by far the most expensive part of loading it.
+A WorldCache stores the decoded tile columns of a world, together with its
+tile and wall counts, chests, signs, NPCs, and tile entities, so that
+loading the same world again only has to memory-map the arrays.
+
+Layout:
+    <directory>/<key digest>/<Column>.npy   one per TileGrid column
+    <directory>/<key digest>/sections.pickle
+
+Entries are keyed by the world's path, size, modification time,
+MetaRevision, and a SHA-1 of its contents, so any change to the world file
+misses the cache. Storing an entry removes older entries for the same
+path, and the least recently used entries are evicted once the cache grows
+beyond its size limit.
+
+Usage:
+    cache = WorldCache.WorldCache()
+    w = World.World(fname=path, cache=cache)
+"""
+
+import cPickle
+import hashlib
+import os
+import shutil
+from warnings import warn
+
+import numpy as np
+
+import TileGrid
+
+DEFAULT_CACHE_DIR = os.path.expanduser("~/.cache/pyterraria")
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+SECTIONS_FILE = "sections.pickle"
+
+# Bump when the entry layout changes
+CACHE_VERSION = 1
+
+class WorldCache(object):
+    """
+    A directory of decoded worlds
+
+    WorldCache.__init__ parameters:
+        directory   (str) where to store entries (default: DEFAULT_CACHE_DIR)
+        max_bytes   (int) evict entries once the cache exceeds this size
+    """
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self._dir = directory if directory is not None else DEFAULT_CACHE_DIR
+        self._max_bytes = max_bytes
+
+    def Directory(self):
+        return self._dir
+
+    @staticmethod
+    def Key(path, content, header):
+        """Returns the cache key for the world at @param path, whose file
+        contents are @param content and whose header is @param header"""
+        path = os.path.realpath(path)
+        stat = os.stat(path)
+        digest = hashlib.sha1(content).hexdigest()
+        return (CACHE_VERSION, path, len(content), int(stat.st_mtime),
+                header.MetaRevision, digest)
+
+    def _EntryPath(self, key):
+        name = hashlib.sha1(repr(key)).hexdigest()
+        return os.path.join(self._dir, name)
+
+    def Fetch(self, key, writable=False):
+        """Returns the entry stored for @param key, or None. The entry is a
+        dict with 'tiles' (a TileGrid of memory-mapped columns) and the
+        sections passed to Store(). If @param writable is True, the columns
+        are mapped copy-on-write so the tiles can be modified in memory."""
+        entry = self._EntryPath(key)
+        sections_path = os.path.join(entry, SECTIONS_FILE)
+        if not os.path.exists(sections_path):
+            return None
+        try:
+            with open(sections_path, 'rb') as fobj:
+                sections = cPickle.load(fobj)
+            if sections.get('key') != key:
+                return None
+            w, h = sections['size']
+            mode = 'c' if writable else 'r'
+            columns = dict((name, np.load(os.path.join(entry, name + ".npy"),
+                                          mmap_mode=mode))
+                           for name in TileGrid.ColumnNames)
+            sections['tiles'] = TileGrid.TileGrid(w, h, columns)
+        except (IOError, OSError, ValueError, EOFError,
+                cPickle.UnpicklingError) as e:
+            warn("Discarding unreadable cache entry %s: %s" % (entry, e))
+            self._Remove(entry)
+            return None
+        # record the access for LRU eviction
+        os.utime(sections_path, None)
+        return sections
+
+    def Store(self, key, grid, **sections):
+        """Stores @param grid (a TileGrid) and the picklable @param sections
+        (tile_counts, chests, etc.) under @param key. Returns True on
+        success."""
+        entry = self._EntryPath(key)
+        temp = "%s.%d.tmp" % (entry, os.getpid())
+        sections = dict(sections)
+        sections['key'] = key
+        sections['size'] = (grid.Width(), grid.Height())
+        try:
+            if not os.path.isdir(self._dir):
+                os.makedirs(self._dir)
+            self.Invalidate(key[1])
+            os.mkdir(temp)
+            for name in TileGrid.ColumnNames:
+                np.save(os.path.join(temp, name + ".npy"), getattr(grid, name))
+            with open(os.path.join(temp, SECTIONS_FILE), 'wb') as fobj:
+                cPickle.dump(sections, fobj, cPickle.HIGHEST_PROTOCOL)
+            os.rename(temp, entry)
+        except (IOError, OSError) as e:
+            warn("Unable to cache world in %s: %s" % (entry, e))
+            self._Remove(temp)
+            return False
+        self.Evict()
+        return True
+
+    def _Entries(self):
+        "Returns a list of (entry path, last access time, size in bytes)"
+        entries = []
+        if not os.path.isdir(self._dir):
+            return entries
+        for name in os.listdir(self._dir):
+            entry = os.path.join(self._dir, name)
+            sections_path = os.path.join(entry, SECTIONS_FILE)
+            if name.endswith('.tmp') or not os.path.exists(sections_path):
+                continue
+            size = sum(os.path.getsize(os.path.join(entry, f))
+                       for f in os.listdir(entry))
+            entries.append((entry, os.path.getmtime(sections_path), size))
+        return entries
+
+    def _Remove(self, entry):
+        shutil.rmtree(entry, ignore_errors=True)
+
+    def Invalidate(self, path):
+        "Removes every entry for the world file at @param path"
+        path = os.path.realpath(path)
+        for entry, _, _ in self._Entries():
+            try:
+                with open(os.path.join(entry, SECTIONS_FILE), 'rb') as fobj:
+                    key = cPickle.load(fobj).get('key')
+            except (IOError, EOFError, cPickle.UnpicklingError):
+                key = None
+            if key is None or key[1] == path:
+                self._Remove(entry)
+
+    def Evict(self, max_bytes=None):
+        """Removes the least recently used entries until the cache holds at
+        most @param max_bytes (default: the limit given to __init__)"""
+        if max_bytes is None:
+            max_bytes = self._max_bytes
+        entries = sorted(self._Entries(), key=lambda e: e[1])
+        total = sum(size for _, _, size in entries)
+        while entries and total > max_bytes:
+            entry, _, size = entries.pop(0)
+            self._Remove(entry)
+            total -= size
+
+    def Clear(self):
+        "Removes every entry"
+        for entry, _, _ in self._Entries():
+            self._Remove(entry)
@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+
+"""
+Persistent index of the worlds in a directory
+
+Listing worlds or finding one by name or ID needs the title and WorldId of
+every world, which are in the world flags near the start of each file. A
+WorldCatalog keeps those (along with the size, version, and a few flags)
+in an index file, so that only new or changed worlds have to be read, and
+only their first pages at that: the files are memory-mapped and just the
+header and flags are parsed.
+
+Layout:
+    <index directory>/catalog-<digest of the world directory>.pickle
+
+Entries are keyed by file name and reused while the file's modification
+time and size are unchanged. Lookups by file name, title, or WorldId are
+dictionary lookups, and stat() only the file found; the directory is
+listed again only when a lookup misses or finds a changed file.
+
+Usage:
+    catalog = WorldCatalog.GetCatalog()
+    entry = catalog.ByTitle("My World")
+    for entry in catalog.Entries():
+        print(entry.Title, entry.Path)
+"""
+
+import cPickle
+import hashlib
+import os
+import struct
+from warnings import warn
+
+import AtomicFile
+import World
+
+DEFAULT_INDEX_DIR = os.path.expanduser("~/.cache/pyterraria")
+
+# Bump when the entry layout changes
+CATALOG_VERSION = 1
+
+class WorldEntry(object):
+    """
+    What the catalog knows about one world file
+
+    Attributes:
+        FileName, Path, MTime, FileSize     the file, and its stat() values
+        Title, WorldId, Width, Height       from the world flags
+        Version, MetaRevision               from the world header
+        Crimson, Expert                     booleans from the world flags
+    """
+    def __init__(self, path, mtime, filesize, title, worldid, width, height,
+                 version, revision, crimson, expert):
+        self.FileName = os.path.basename(path)
+        self.Path = path
+        self.MTime = mtime
+        self.FileSize = filesize
+        self.Title = title
+        self.WorldId = worldid
+        self.Width = width
+        self.Height = height
+        self.Version = version
+        self.MetaRevision = revision
+        self.Crimson = crimson
+        self.Expert = expert
+
+    @staticmethod
+    def FromFile(path, stat=None):
+        """Reads the header and flags of the world file @param path, whose
+        os.stat() is @param stat (default: stat the file now)"""
+        if stat is None:
+            stat = os.stat(path)
+        w = World.World()
+        with open(path, 'rb') as fobj:
+            # memory-mapped: only the pages parsed are read
+            w.Open(fobj, lazy=True)
+            w.LoadHeader()
+            w.LoadFlags()
+        header = w.GetHeader()
+        return WorldEntry(path, stat.st_mtime, stat.st_size,
+                          w.GetFlag('Title'), w.GetFlag('WorldId'),
+                          w.GetFlag('TilesWide'), w.GetFlag('TilesHigh'),
+                          header.Version, header.MetaRevision,
+                          bool(w.GetFlag('IsCrimson')),
+                          bool(w.GetFlag('ExpertMode')))
+
+    def IsCurrent(self, stat):
+        "Returns True if the file still has the os.stat() @param stat"
+        return (self.MTime, self.FileSize) == (stat.st_mtime, stat.st_size)
+
+    def GetSize(self):
+        "Returns one of World.SIZE_* constants, or World.SIZE_UNKNOWN"
+        size = (self.Width, self.Height)
+        if size in (World.SIZE_SMALL, World.SIZE_MEDIUM, World.SIZE_LARGE):
+            return size
+        return World.SIZE_UNKNOWN
+
+    def __repr__(self):
+        return "<World %d %r (%d, %d) at %s>" % (self.WorldId, self.Title,
+                self.Width, self.Height, self.Path)
+
+class WorldCatalog(object):
+    """
+    The worlds of a directory, indexed by file name, title, and WorldId
+
+    WorldCatalog.__init__ parameters:
+        directory   (str) the worlds directory (default:
+                    World.WORLDPATH_LINUX)
+        index_dir   (str) where to keep the index file (default:
+                    DEFAULT_INDEX_DIR), or False to keep it in memory only
+    """
+    def __init__(self, directory=None, index_dir=None):
+        if directory is None:
+            directory = World.WORLDPATH_LINUX
+        if index_dir is None:
+            index_dir = DEFAULT_INDEX_DIR
+        self._dir = directory
+        self._index_path = None
+        if index_dir is not False:
+            digest = hashlib.sha1(os.path.realpath(directory)).hexdigest()
+            self._index_path = os.path.join(index_dir,
+                                            "catalog-%s.pickle" % (digest,))
+        self._entries = None
+        self._by_name = {}
+        self._by_title = {}
+        self._by_id = {}
+
+    def Directory(self):
+        return self._dir
+
+    def IndexPath(self):
+        "Returns the path of the index file, or None"
+        return self._index_path
+
+    def _LoadIndex(self):
+        "Returns the entries saved in the index file, by file name"
+        if self._index_path is None or not os.path.exists(self._index_path):
+            return {}
+        try:
+            with open(self._index_path, 'rb') as fobj:
+                index = cPickle.load(fobj)
+        except (IOError, OSError, ValueError, EOFError, AttributeError,
+                cPickle.UnpicklingError) as e:
+            warn("Ignoring unreadable world catalog %s: %s" %
+                 (self._index_path, e))
+            return {}
+        if index.get('version') != CATALOG_VERSION or \
+                index.get('directory') != self._dir:
+            return {}
+        return index['entries']
+
+    def _SaveIndex(self):
+        "Writes the entries to the index file"
+        index = {'version': CATALOG_VERSION, 'directory': self._dir,
+                 'entries': dict((e.FileName, e) for e in self._entries)}
+        try:
+            parent = os.path.dirname(self._index_path)
+            if not os.path.isdir(parent):
+                os.makedirs(parent)
+            with AtomicFile.AtomicWrite(self._index_path) as fobj:
+                cPickle.dump(index, fobj, cPickle.HIGHEST_PROTOCOL)
+        except (IOError, OSError) as e:
+            warn("Unable to save world catalog %s: %s" %
+                 (self._index_path, e))
+
+    def Refresh(self):
+        """Brings the catalog up to date with the directory, reading only the
+        worlds added or modified since they were indexed. Returns the number
+        of worlds read."""
+        known = self._LoadIndex() if self._entries is None else \
+                dict((e.FileName, e) for e in self._entries)
+        entries = []
+        nread = 0
+        names = os.listdir(self._dir) if os.path.isdir(self._dir) else []
+        for name in names:
+            if not name.endswith('.wld'):
+                continue
+            path = os.path.join(self._dir, name)
+            try:
+                stat = os.stat(path)
+                entry = known.get(name)
+                if entry is None or not entry.IsCurrent(stat):
+                    entry = WorldEntry.FromFile(path, stat)
+                    nread += 1
+            except (IOError, OSError, EOFError, IndexError, ValueError,
+                    RuntimeError, AssertionError, struct.error) as e:
+                warn("Skipping unreadable world %s: %s" % (path, e))
+                continue
+            entries.append(entry)
+        changed = nread > 0 or len(entries) != len(known)
+        self._entries = entries
+        # the first of several worlds with the same title or ID wins
+        self._by_name = dict((e.FileName, e) for e in entries)
+        self._by_title, self._by_id = {}, {}
+        for e in entries:
+            self._by_title.setdefault(e.Title, e)
+            self._by_id.setdefault(e.WorldId, e)
+        if changed and self._index_path is not None:
+            self._SaveIndex()
+        World.verbose("Cataloged %d worlds (%d read)", len(entries), nread)
+        return nread
+
+    def _Ensure(self):
+        if self._entries is None:
+            self.Refresh()
+
+    def Entries(self):
+        "Returns the list of WorldEntry objects, in directory order"
+        self._Ensure()
+        return list(self._entries)
+
+    def _Lookup(self, table, key):
+        """Returns the entry under @param key in the lookup dict named
+        @param table, or None. An entry already loaded is checked by
+        stat()ing just its file; the catalog is refreshed only when the entry
+        is missing or out of date."""
+        if self._entries is not None:
+            entry = getattr(self, table).get(key)
+            try:
+                if entry is not None and \
+                        entry.IsCurrent(os.stat(entry.Path)):
+                    return entry
+            except OSError:
+                pass
+        self.Refresh()
+        return getattr(self, table).get(key)
+
+    def ByFileName(self, filename):
+        "Returns the entry for the file @param filename, or None"
+        return self._Lookup('_by_name', filename)
+
+    def ByTitle(self, title):
+        "Returns the entry of the world titled @param title, or None"
+        return self._Lookup('_by_title', title)
+
+    def ById(self, worldid):
+        "Returns the entry of the world with WorldId @param worldid, or None"
+        return self._Lookup('_by_id', worldid)
+
+    def __len__(self):
+        self._Ensure()
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self.Entries())
+
+_catalogs = {}
+
+def GetCatalog(directory=None):
+    """Returns the catalog of @param directory (default:
+    World.WORLDPATH_LINUX) shared by the process. Lookups refresh it as
+    needed; call Refresh() before listing Entries() to pick up worlds
+    changed since it was first used."""
+    if directory is None:
+        directory = World.WORLDPATH_LINUX
+    catalog = _catalogs.get(directory)
+    if catalog is None:
+        catalog = _catalogs[directory] = WorldCatalog(directory)
+    return catalog
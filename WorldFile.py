@@ -10,6 +10,7 @@ import Match
 import Header
 import IDs
 import World
+import WorldCatalog
 import MapFile
 
 ARGPARSE_EPILOG = """
@@ -136,12 +137,17 @@ To format the results as "Tile Name U V":
 """
 try:
     import PIL.Image
+    import PIL.ImageDraw
     HAVE_PIL = True
     PIL_ERROR = None
 except ImportError as e:
     HAVE_PIL = False
     PIL_ERROR = e
 
+if World.HAVE_NUMPY:
+    import ColumnPass
+    import MapRender
+
 def _xxyy_to_poly(x1, x2, y1, y2):
     return [[x1, y1], [x2, y1], [x2, y2], [x1, y2]]
 
@@ -167,7 +173,64 @@ def _tile_to_string(tile):
             raise
     return fmt
 
-def _generate_polygons(world, args=None):
+# (name, color, 'tile' or 'wall', id, skip if the wall is absent,
+#  GetPolygon arguments) of the regions _generate_polygons traces
+POLY_REGIONS = (
+    ('Jungle', 'darkgreen', 'tile', IDs.Tile.JungleGrass, False,
+        dict(multi=True)),
+    ('Temple', '#8d3800', 'wall', IDs.Wall.LihzahrdBrickUnsafe, True,
+        dict(shortcircuit=True)),
+    ('Granite', '#322e68', 'wall', IDs.Wall.GraniteUnsafe, True,
+        dict(multi=True)),
+    ('Marble', '#a8b2cc', 'wall', IDs.Wall.MarbleUnsafe, True,
+        dict(multi=True)),
+    ('Hive', 'goldenrod', 'wall', IDs.Wall.HiveUnsafe, True,
+        dict(multi=True)),
+)
+
+# Outline color of each World.AllZones biome for --biomes
+BIOME_COLORS = {
+    'Corrupt': 'mediumpurple',
+    'Hallow': 'hotpink',
+    'Meteor': 'orangered',
+    'Jungle': 'limegreen',
+    'Snow': 'white',
+    'Crimson': 'crimson',
+    'Desert': 'khaki',
+    'Glowing Mushroom': 'royalblue',
+    'Water Candle': 'deepskyblue',
+    'Peace Candle': 'pink',
+}
+
+def _generate_biomes(world, args=None, points=None):
+    """Traces the World.AllZones biomes. Returns a list of (name, color,
+    polygons) per biome present; names are prefixed with "Biome_" to keep
+    them apart from the POLY_REGIONS names in --poly output.
+    If @param points is given, it is the result of a ColumnPass.BiomePoints
+    consumer for World.AllZones which already scanned the world."""
+    biomes = []
+    for i, zone in enumerate(World.AllZones):
+        progress = None
+        if args and args.progress:
+            progress = "Generating polygon for %s..." % (zone.Name(),)
+        polys = world.GetBiomes(zone, points=points[i] if points else None,
+                                progress=progress)
+        if polys:
+            biomes.append(("Biome_" + _make_token_from(zone.Name()),
+                           BIOME_COLORS.get(zone.Name(), 'white'), polys))
+    return biomes
+
+def _draw_biomes(img, biomes):
+    "Outlines the result of _generate_biomes on the PIL image @param img"
+    draw = PIL.ImageDraw.Draw(img)
+    for name, color, polys in biomes:
+        for poly in polys:
+            rings = [poly[0]] + poly[1] if isinstance(poly[0][0], list) \
+                    else [poly]
+            for ring in rings:
+                draw.polygon([tuple(p) for p in ring], outline=color)
+
+def _generate_polygons(world, args=None, extents=None, biomes=None):
     """
     Generating world polygons (accurately!) is hard.
 
@@ -194,6 +257,11 @@ def _generate_polygons(world, args=None):
 
        Therefore, the boundary is:
           Y = Surface / 5 + (Width**2) / 1764000 + 65
+
+    The regions in POLY_REGIONS are traced from the tile data. If @param
+    extents is given, it maps their names to ColumnPass.ColumnExtents
+    consumers that already scanned the world (see _plan_analyses). The
+    result of _generate_biomes, if given as @param biomes, is appended.
     """
     b = World.BORDER_TILES
     w, h = world.Width(), world.Height()
@@ -235,7 +303,6 @@ def _generate_polygons(world, args=None):
             kwargs['progress'] = progress_str % (name,)
         p.append((name, w.GetPolygon(matchfn, **kwargs)))
     def poly_extend(w, p, name, matchfn, color=None, **kwargs):
-        kwargs['multi'] = True
         if color is not None:
             p.append(('+color', '%s %s' % (name, color)))
         if args and args.progress:
@@ -257,25 +324,33 @@ def _generate_polygons(world, args=None):
     polys.append(('Caverns', _xxyy_to_poly(left, right, caves, h-204)))
     polys.append(('Hell', _xxyy_to_poly(left, right, h-204, bottom)))
     polys.append(('Space', _xxyy_to_poly(left, right, top, space)))
-    poly_extend(world, polys, 'Jungle',
-                World.PolyMatch_Tile(IDs.Tile.JungleGrass),
-                color='darkgreen', simplify=True)
-    if world.GetWallCount(IDs.Wall.LihzahrdBrickUnsafe) > 0:
-        poly_append(world, polys, 'Temple',
-                    World.PolyMatch_Wall(IDs.Wall.LihzahrdBrickUnsafe),
-                    color='#8d3800', simplify=True, shortcircuit=True)
-    if world.GetWallCount(IDs.Wall.GraniteUnsafe) > 0:
-        poly_extend(world, polys, 'Granite',
-                    World.PolyMatch_Wall(IDs.Wall.GraniteUnsafe),
-                    color='#322e68', simplify=True)
-    if world.GetWallCount(IDs.Wall.MarbleUnsafe) > 0:
-        poly_extend(world, polys, 'Marble',
-                    World.PolyMatch_Wall(IDs.Wall.MarbleUnsafe),
-                    color='#a8b2cc', simplify=True)
-    if world.GetWallCount(IDs.Wall.HiveUnsafe) > 0:
-        poly_extend(world, polys, 'Hive',
-                    World.PolyMatch_Wall(IDs.Wall.HiveUnsafe),
-                    color='goldenrod', simplify=True)
+    for name, color, kind, value, guarded, kwargs in POLY_REGIONS:
+        if extents is not None:
+            if guarded and not extents[name].Any():
+                continue
+            polys.append(('+color', '%s %s' % (name, color)))
+            result = World.ExtentsToPolygons(extents[name].Result(),
+                                             simplify=True, **kwargs)
+            if kwargs.get('multi'):
+                polys.extend((name, poly) for poly in result)
+            else:
+                polys.append((name, result))
+            continue
+        if guarded and world.GetWallCount(value) == 0:
+            continue
+        if kind == 'wall':
+            matchfn = World.PolyMatch_Wall(value)
+        else:
+            matchfn = World.PolyMatch_Tile(value)
+        if kwargs.get('multi'):
+            poly_extend(world, polys, name, matchfn, color=color,
+                        simplify=True, **kwargs)
+        else:
+            poly_append(world, polys, name, matchfn, color=color,
+                        simplify=True, **kwargs)
+    for name, color, result in biomes or ():
+        polys.append(('+color', '%s %s' % (name, color)))
+        polys.extend((name, poly) for poly in result)
     polys.append(('Water', _xxyy_to_poly(b, b, b, b)))  # FIXME
     polys.append(('Lava', _xxyy_to_poly(b, b, b, b)))   # FIXME
     polys.append(('OceanL', _xxyy_to_poly(left, 308, top, surf+10)))
@@ -292,17 +367,26 @@ def _do_find_arg(p, args, w, out, tile2str, *vargs, **kwargs):
 
     terms = list(Match.Match(m, IDs.Tiles) for m in args.find)
     matches = []
-    for r, c, t in w.EachTile(unreachable=not args.reachable,
-                              progress="Searching..."):
-        if any(term.match(t.Type, t.U, t.V, t.Wall) for term in terms):
-            matches.append((t, c, r))
+    if kwargs.get("found") is not None:
+        # already searched by _plan_analyses
+        xs, ys, tiles = kwargs["found"]
+        matches = zip(tiles, xs.tolist(), ys.tolist())
+    elif World.HAVE_NUMPY:
+        xs, ys, tiles = w.FindMatches(terms, unreachable=not args.reachable,
+                                      tiles=True, progress="Searching...")
+        matches = zip(tiles, xs.tolist(), ys.tolist())
+    else:
+        for r, c, t in w.EachTile(unreachable=not args.reachable,
+                                  progress="Searching..."):
+            if any(term.match(t.Type, t.U, t.V, t.Wall) for term in terms):
+                matches.append((t, c, r))
 
     if args.density:
         from Region.Density import DensityCalculator
         calc = DensityCalculator(w.Width(), w.Height())
         w.ProfStart()
-        for t, x, y in matches:
-            calc.add_point(x, y)
+        calc.add_points([x for t, x, y in matches],
+                        [y for t, x, y in matches])
         matrix = calc.get_matrix().astype(str).tolist()
         for row in matrix:
             out.write(' '.join(row))
@@ -347,6 +431,39 @@ def _do_find_arg(p, args, w, out, tile2str, *vargs, **kwargs):
         for t, c, r in matches:
             out.write("%s (%d, %d)\n" % (tile2str(t), c, r))
 
+def _plan_analyses(args, w, argsTileToLookup):
+    """Runs every requested analysis needing the tiles in a single pass over
+    the world (needs numpy). Returns a dict of analysis name to result."""
+    plan = ColumnPass.ColumnPass(w)
+    consumers = {}
+    if args.counts:
+        consumers['counts'] = plan.Add(ColumnPass.TileCounter())
+    if args.gem_counts:
+        consumers['gem_counts'] = plan.Add(ColumnPass.GemCounter())
+    if args.find:
+        terms = list(Match.Match(m, IDs.Tiles) for m in args.find)
+        border = World.BORDER_TILES if args.reachable else 0
+        consumers['find'] = plan.Add(ColumnPass.Finder(terms, border=border,
+                                                       tiles=True))
+    if args.poly:
+        extents = {}
+        for name, _, kind, value, _, _ in POLY_REGIONS:
+            if kind == 'wall':
+                mask_fn = lambda chunk, value=value: chunk.WallMask(value)
+            else:
+                mask_fn = lambda chunk, value=value: chunk.TypeMask(value)
+            extents[name] = plan.Add(ColumnPass.ColumnExtents(mask_fn))
+    if args.png:
+        renderer = MapRender.MapRenderer(w, **argsTileToLookup)
+        consumers['png'] = plan.Add(ColumnPass.Image(renderer))
+    if args.biomes:
+        consumers['biomes'] = plan.Add(ColumnPass.BiomePoints(World.AllZones))
+    plan.Run(progress="Analyzing tiles...")
+    results = dict((k, c.Result()) for k, c in consumers.iteritems())
+    if args.poly:
+        results['poly'] = extents
+    return results
+
 def _main():
     p = argparse.ArgumentParser(usage="%(prog)s [args] <path>",
                                 epilog = ARGPARSE_EPILOG,
@@ -371,6 +488,13 @@ def _main():
                    help="display world loading progress")
     p.add_argument("--allow-writing", action="store_true",
                    help="allow modifying the tiles (makes loading very slow)")
+    p.add_argument("--cache-dir", type=str, default=None, metavar="PATH",
+                   help="cache decoded worlds here (default: %s)" % (
+                        "~/.cache/pyterraria",))
+    p.add_argument("--no-cache", action="store_true",
+                   help="do not cache decoded worlds")
+    p.add_argument("-j", "--jobs", type=int, default=1, metavar="N",
+                   help="decode tiles using N processes (default: 1)")
     p.add_argument("-v", "--verbose", action="store_true",
                    help="be more verbose")
     p.add_argument("-d", "--debug", action="store_true",
@@ -437,7 +561,7 @@ def _main():
     i.add_argument("--png", action="store_true",
                    help="generate a minimap-style PNG (use --out)")
     i.add_argument("--biomes", action="store_true",
-                   help="draw biome regions on the image")
+                   help="outline biome regions in --poly and --png output")
     i.add_argument("--no-tiles", action="store_true",
                    help="do not output tiles; assume all tiles are inactive")
     i.add_argument("--no-walls", action="store_true",
@@ -484,6 +608,28 @@ def _main():
         for m in args.find:
             Match.Match(m, names=IDs.Tiles)
 
+    if args.ignore_tiles:
+        for arg, name in ((args.counts, "--counts"),
+                          (args.gem_counts, "--gem-counts"),
+                          (args.find, "--find"),
+                          (args.tile_table, "tile table arguments"),
+                          (args.png, "--png argument"),
+                          (args.biomes, "--biomes")):
+            if arg:
+                p.error("--ignore-tiles blocks %s" % (name,))
+
+    if args.biomes:
+        if not args.poly and not args.png:
+            p.error("--biomes requires --poly or --png")
+        if not World.HAVE_NUMPY:
+            p.error("Please install numpy before using --biomes")
+
+    if args.png:
+        if not args.out:
+            p.error("--png requires --out to be specified")
+        if not HAVE_PIL:
+            p.error("Please install PIL before using --png: %s" % (PIL_ERROR,))
+
     tile2str = lambda t: _tile_to_string(t)
     if args.format:
         tile2str = lambda t: t.Format(args.format)
@@ -498,6 +644,10 @@ def _main():
                       load_signs=(not args.ignore_signs),
                       load_npcs=True,
                       load_tents=True,
+                      lazy=True,
+                      workers=args.jobs,
+                      cache=(World.HAVE_NUMPY and not args.no_cache and
+                             (args.cache_dir or True)),
                       progress=args.progress,
                       verbose=args.verbose,
                       debug=args.debug,
@@ -512,16 +662,15 @@ def _main():
             print(stat)
 
     if args.list:
-        worlds = World.World.ListWorlds()
-        for fname, world, fpath in World.World.ListWorlds():
-            attribs = World.SizeToStr(world.GetSize())
-            attribs += ", Crimson" if world.Crimson() else ", Corruption"
-            if world.Expert():
+        catalog = WorldCatalog.GetCatalog()
+        catalog.Refresh()
+        for entry in catalog.Entries():
+            attribs = World.SizeToStr(entry.GetSize())
+            attribs += ", Crimson" if entry.Crimson else ", Corruption"
+            if entry.Expert:
                 attribs += ", Expert"
-            wname = world.Title()
-            wid = world.GetFlag('WorldId')
-            out.write('World %d "%s" (%s) at %s\n' % (wid, wname, attribs,
-                                                      fpath))
+            out.write('World %d "%s" (%s) at %s\n' % (entry.WorldId,
+                      entry.Title, attribs, entry.Path))
 
     if args.path is None:
         World.verbose("Nothing to do; exiting")
@@ -536,6 +685,17 @@ def _main():
 
     w.Load(open(path, 'r'))
 
+    # the counts, gems, find, poly, and png analyses share one pass
+    analyses = {}
+    if World.HAVE_NUMPY and not args.ignore_tiles and \
+            any((args.counts, args.gem_counts, args.find, args.poly,
+                 args.png)):
+        analyses = _plan_analyses(args, w, argsTileToLookup)
+
+    biomes = None
+    if args.biomes:
+        biomes = _generate_biomes(w, args, analyses.get('biomes'))
+
     if args.pointers:
         h = w.GetHeader()
         flags = h.GetFlagsPointer()
@@ -622,9 +782,10 @@ def _main():
                 out.write(fmt % result)
 
     if args.counts:
-        if args.ignore_tiles:
-            p.error("--ignore-tiles blocks --counts")
-        counts = w.GetTileCounts()
+        if 'counts' in analyses:
+            counts = analyses['counts']
+        else:
+            counts = w.GetTileCounts()
         types = sorted(counts.keys())
         if args.csv:
             rows = [["Tile", "Tile Name", "Count"]]
@@ -635,21 +796,21 @@ def _main():
                 out.write("%-6d %d %s\n" % (counts[t], t, IDs.TileID[t]))
 
     if args.gem_counts:
-        if args.ignore_tiles:
-            p.error("--ignore-tiles blocks --gem-counts")
-        results = []
-        for row, col, tile in w.EachTile(progress="Finding gems..."):
-            if IDs.Tile.Sapphire <= tile.Type <= IDs.Tile.Diamond:
-                results.append((tile.Type, None))
-            elif tile.Type == IDs.Tile.SmallPiles:
-                item = IDs.tile_to_item(tile.Type, tile.U, tile.V)
-                if item != IDs.INVALID:
-                    results.append((tile.Type, item))
-        counts = {}
-        for t, i in results:
-            if (t, i) not in counts:
-                counts[(t, i)] = 0
-            counts[(t, i)] += 1
+        if 'gem_counts' in analyses:
+            counts = analyses['gem_counts']
+        else:
+            counts = {}
+            for row, col, tile in w.EachTile(progress="Finding gems..."):
+                if IDs.Tile.Sapphire <= tile.Type <= IDs.Tile.Diamond:
+                    key = (tile.Type, None)
+                elif tile.Type == IDs.Tile.SmallPiles:
+                    item = IDs.tile_to_item(tile.Type, tile.U, tile.V)
+                    if item == IDs.INVALID:
+                        continue
+                    key = (tile.Type, item)
+                else:
+                    continue
+                counts[key] = counts.get(key, 0) + 1
         for ti in sorted(counts):
             t, i = ti
             c = counts[ti]
@@ -662,11 +823,10 @@ def _main():
 
     if args.find:
         _do_find_arg(p, args, w, out, tile2str,
-                     argsTileToLookup=argsTileToLookup)
+                     argsTileToLookup=argsTileToLookup,
+                     found=analyses.get('find'))
 
     if args.tile_table:
-        if args.ignore_tiles:
-            p.error("--ignore-tiles blocks tile table arguments")
         var = "TILES_%s = [" % (_make_token_from(w.Title()),)
         if args.tile_table_expr:
             var = "["
@@ -693,7 +853,8 @@ def _main():
     if args.poly:
         if args.profile:
             w.ProfStart()
-        for k,v in _generate_polygons(w, args):
+        for k,v in _generate_polygons(w, args, analyses.get('poly'),
+                                      biomes):
             out.write("%-10s %s\n" % (k, v))
         if args.profile:
             w.ProfEnd()
@@ -707,25 +868,22 @@ def _main():
             out.write("%s\n" % (tent,))
 
     if args.png:
-        if not args.out:
-            p.error("--png requires --out to be specified")
-        if args.ignore_tiles:
-            p.error("--ignore-tiles blocks --png argument")
-        if not HAVE_PIL:
-            p.error("Please install PIL before using --png: %s" % (PIL_ERROR,))
-        m = MapFile.Map()
-        m.FromWorld(w)
-        img = PIL.Image.new('RGBA', (w.Width(), w.Height()))
-        argsEachTile = {}
-        argsTileToLookup = {}
-        if args.progress:
-            argsEachTile['progress'] = "Generating image..."
-        for x, y, t in w.EachTile(rowcol=False, **argsEachTile):
-            table, lookup, option = m.TileToLookup(t, x, y, **argsTileToLookup)
-            color = m.DoColorLookup(table, lookup, option)
-            if color is None:
-                continue
-            img.putpixel((x, y), color)
+        if 'png' in analyses:
+            img = MapRender.MapRenderer.ToImage(analyses['png'])
+        else:
+            m = MapFile.Map()
+            m.FromWorld(w)
+            img = PIL.Image.new('RGBA', (w.Width(), w.Height()))
+            progress = "Generating image..." if args.progress else None
+            for x, y, t in w.EachTile(rowcol=False, progress=progress):
+                table, lookup, option = m.TileToLookup(t, x, y,
+                                                       **argsTileToLookup)
+                color = m.DoColorLookup(table, lookup, option)
+                if color is None:
+                    continue
+                img.putpixel((x, y), color)
+        if biomes:
+            _draw_biomes(img, biomes)
         img.save(args.out)
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+# AtomicFile replaces the target only once it is written, and cleans up
+import os
+import shutil
+import tempfile
+import tests
+import AtomicFile
+
+tempdir = tempfile.mkdtemp()
+try:
+    path = os.path.join(tempdir, "data")
+    with AtomicFile.AtomicWrite(path) as fobj:
+        fobj.write("first")
+        assert not os.path.exists(path)
+    assert open(path, 'rb').read() == "first"
+    assert os.listdir(tempdir) == ["data"]
+
+    # a failed write leaves the old contents and no temporary file behind
+    try:
+        with AtomicFile.AtomicWrite(path) as fobj:
+            fobj.write("second")
+            raise ValueError("interrupted")
+    except ValueError:
+        pass
+    else:
+        assert False, "the exception was swallowed"
+    assert open(path, 'rb').read() == "first"
+    assert os.listdir(tempdir) == ["data"]
+
+    # so does one that cannot be renamed into place
+    os.mkdir(os.path.join(tempdir, "dir"))
+    os.mkdir(os.path.join(tempdir, "dir", "full"))
+    try:
+        with AtomicFile.AtomicWrite(os.path.join(tempdir, "dir")) as fobj:
+            fobj.write("third")
+    except OSError:
+        pass
+    else:
+        assert False, "renamed over a directory"
+    assert sorted(os.listdir(tempdir)) == ["data", "dir"]
+finally:
+    shutil.rmtree(tempdir)
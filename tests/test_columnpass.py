@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+# Consumers sharing a ColumnPass agree with the per-analysis World methods
+import os
+import tests
+import ColumnPass
+import IDs
+import Match
+import World
+
+path = os.environ.get('TERRARIA_WORLD')
+if not path:
+    raise SystemExit(0)
+
+w = World.World(fname=path)
+lazy = World.World(fname=path, lazy=True)
+plan = ColumnPass.ColumnPass(lazy, chunk_columns=7)
+tiles = plan.Add(ColumnPass.TileCounter())
+walls = plan.Add(ColumnPass.WallCounter())
+gems = plan.Add(ColumnPass.GemCounter())
+terms = [Match.Match("Dirt", IDs.Tiles), Match.Match(";;;1-3", IDs.Tiles)]
+finder = plan.Add(ColumnPass.Finder(terms, border=World.BORDER_TILES))
+extents = plan.Add(ColumnPass.ColumnExtents(lambda chunk: chunk.WallMask(1)))
+plan.Run()
+
+assert tiles.Result() == w.GetTileCounts()
+assert walls.Result() == w.GetWallCounts()
+
+expect = {}
+for row, col, t in w.EachTile():
+    if IDs.Tile.Sapphire <= t.Type <= IDs.Tile.Diamond:
+        key = (t.Type, None)
+    elif t.Type == IDs.Tile.SmallPiles:
+        key = (t.Type, IDs.tile_to_item(t.Type, t.U, t.V))
+        if key[1] == IDs.INVALID:
+            continue
+    else:
+        continue
+    expect[key] = expect.get(key, 0) + 1
+assert gems.Result() == expect
+
+xs, ys = finder.Result()
+exs, eys = w.FindMatches(terms, unreachable=False)
+assert xs.tolist() == exs.tolist() and ys.tolist() == eys.tolist()
+
+polys = World.ExtentsToPolygons(extents.Result(), multi=True)
+expect = w.GetPolygon(World.PolyMatch_Wall(1), multi=True)
+assert map(list, polys) == map(list, expect)
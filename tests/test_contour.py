@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+# Region.Contour outlines every component of a mask exactly, and
+# World.GetBiomes traces the biome mask
+import os
+import tests
+import numpy as np
+from shapely.geometry import Polygon
+import World
+from Region import Contour, Label
+from Region.PolySet import WorldPolySet
+
+def rasterize(rings, shape):
+    "Fills the tiles inside @param rings by the even-odd rule"
+    width, height = shape
+    crossings = np.zeros((width + 1, height), dtype=np.int32)
+    for ring in rings:
+        for (x0, y0), (x1, y1) in zip(ring, ring[1:] + ring[:1]):
+            if x0 == x1:
+                crossings[x0, min(y0, y1):max(y0, y1)] += 1
+    return np.cumsum(crossings, axis=0)[:-1] % 2 == 1
+
+rs = np.random.RandomState(0)
+for trial in range(100):
+    mask = rs.rand(rs.randint(1, 25), rs.randint(1, 25)) < rs.rand()
+    for connectivity in (4, 8):
+        components, grid = Label.label(mask, connectivity)
+        traced = Contour.trace(mask, connectivity)
+        assert len(traced) == len(components)
+        for c, (shell, holes) in zip(components, traced):
+            assert (rasterize([shell] + holes, mask.shape) ==
+                    (grid == c.label)).all()
+        polys = Contour.to_polygons(mask, connectivity, min_count=3)
+        assert len(polys) == sum(c.count >= 3 for c in components)
+
+# a ring enclosing a hole with an island in it
+mask = np.zeros((9, 9), dtype=np.bool_)
+mask[1:8, 1:8] = True
+mask[2:7, 2:7] = False
+mask[4, 4] = True
+ring, island = Contour.to_polygons(mask)
+shell, holes = ring
+assert Polygon(shell, holes).area == 24
+assert Polygon(island).area == 1
+polyset = WorldPolySet()
+assert polyset.parse_lines(["Ring %s" % (ring,), "Island %s" % (island,)])
+assert [p.area for p in polyset.polys()] == [24, 1]
+
+path = os.environ.get('TERRARIA_WORLD')
+if not path:
+    raise SystemExit(0)
+
+w = World.World(fname=path)
+for zone in (World.Zone_Jungle, World.Zone_Snow):
+    mask = w.GetBiomeMask(zone)
+    expect = np.zeros(mask.shape, dtype=np.int64)
+    for x, y, t in w.EachTile(rowcol=False):
+        if t.IsActive and zone.TileValue(t):
+            window = zone.WindowSize()
+            expect[max(0, x-window):x+window, max(0, y-window):y+window] += \
+                    zone.TileValue(t)
+    assert (mask == (expect >= zone.Threshold())).all()
+    polys = w.GetBiomes(zone, simplify=False)
+    area = 0
+    for poly in polys:
+        if isinstance(poly[0][0], list):
+            area += Polygon(poly[0], poly[1]).area
+        else:
+            area += Polygon(poly).area
+    assert area == mask.sum()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+# World.CountInRect and CountByLayer agree with counting the tile grid
+import os
+import tests
+import numpy as np
+import IDs
+import World
+
+path = os.environ.get('TERRARIA_WORLD')
+if not path:
+    raise SystemExit(0)
+
+w = World.World(fname=path)
+grid = w.GetTileGrid()
+types = np.where(grid.Flags & 1, grid.Type, -1)
+width, height = w.Width(), w.Height()
+
+rs = np.random.RandomState(0)
+for block in (1, 7, 64):
+    w.BuildCountIndex(block=block)
+    for trial in range(300):
+        tileid = (IDs.Tile.Dirt, IDs.Tile.Stone, IDs.Tile.Grass,
+                  9999)[trial % 4]
+        x0, x1 = sorted(rs.randint(-5, width + 5, 2))
+        y0, y1 = sorted(rs.randint(-5, height + 5, 2))
+        expect = (types[max(x0, 0):max(x1, 0),
+                        max(y0, 0):max(y1, 0)] == tileid).sum()
+        assert w.CountInRect(tileid, x0, y0, x1, y1) == expect
+    assert w.CountInRect(IDs.Tile.Stone, 0, 0, width, height) == \
+            w.GetTileCount(IDs.Tile.Stone)
+    # rectangles entirely above or left of the world hold nothing
+    assert w.CountInRect(IDs.Tile.Stone, 8, -4, 118, -3) == 0
+    assert w.CountInRect(IDs.Tile.Stone, -9, 0, -2, height) == 0
+
+layers = w.CountByLayer(IDs.Tile.Stone)
+assert sum(layers.values()) == w.GetTileCount(IDs.Tile.Stone)
+assert sorted(layers) == ['Cavern', 'Space', 'Surface', 'Underground',
+                          'Underworld']
+levels = w.GetLevels()
+if levels['Space'] <= levels['Surface'] <= levels['Rock']:
+    rock = types[:, int(levels['Surface']):int(levels['Rock'])]
+    assert layers['Underground'] == (rock == IDs.Tile.Stone).sum()
+
+lazy = World.World(fname=path, lazy=True)
+lazy.BuildCountIndex(types=[IDs.Tile.Stone], block=16)
+assert lazy.CountByLayer(IDs.Tile.Stone) == layers
+try:
+    lazy.CountInRect(IDs.Tile.Dirt, 0, 0, 10, 10)
+    assert False, "Dirt is not indexed"
+except ValueError:
+    pass
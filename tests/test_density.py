@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+# DensityCalculator.add_points agrees with adding each point's window, and
+# World.BiomeIdentifier with each zone's tile values
+import os
+import tests
+import numpy as np
+import World
+from Region.Density import DensityCalculator
+
+rs = np.random.RandomState(0)
+for trial in range(30):
+    width, height, window = rs.randint(1, 40), rs.randint(1, 40), \
+                            rs.randint(1, 12)
+    n = rs.randint(0, 50)
+    xs, ys = rs.randint(0, width, n), rs.randint(0, height, n)
+    weights = rs.randint(-5, 6, n)
+    box = np.zeros((width, height), dtype=np.int64)
+    gauss = np.zeros((width, height))
+    gx, gy = np.mgrid[0:width, 0:height]
+    for x, y, v in zip(xs, ys, weights):
+        box[max(0, x-window):x+window, max(0, y-window):y+window] += v
+        near = (abs(gx - x) <= window) & (abs(gy - y) <= window)
+        gauss += near * v * np.exp(-((gx - x)**2 + (gy - y)**2) / 18.0)
+
+    calc = DensityCalculator(width, height, window)
+    calc.add_points(xs, ys, weights)
+    assert calc.get_matrix().dtype == np.int32
+    assert (calc.get_matrix() == box).all()
+    if n > 0:
+        calc.add_point(xs[0], ys[0], -weights[0])
+        box[max(0, xs[0]-window):xs[0]+window,
+            max(0, ys[0]-window):ys[0]+window] -= weights[0]
+        assert (calc.get_matrix() == box).all()
+
+    calc = DensityCalculator(width, height, window, sigma=3.0)
+    calc.add_points(xs, ys, weights)
+    assert np.allclose(calc.get_matrix(), gauss)
+
+# sums beyond int32 are kept in int64
+calc = DensityCalculator(10, 10, 5)
+calc.add_points([2, 3, 4, 5], [5, 5, 5, 5], 2**30)
+assert calc.get_matrix().dtype == np.int64
+assert calc.get_density(4, 5) == 2**32
+
+path = os.environ.get('TERRARIA_WORLD')
+if not path:
+    raise SystemExit(0)
+
+w = World.World(fname=path)
+zones = (World.Zone_Jungle, World.Zone_Snow, World.Zone_Corrupt)
+planes = World.BiomeIdentifier(w, zones)
+lazy = World.BiomeIdentifier(w, zones, lazy=True)
+expect = np.zeros((len(zones), w.Width(), w.Height()), dtype=np.int64)
+for x, y, t in w.EachTile(rowcol=False):
+    for i, zone in enumerate(zones):
+        v = zone.TileValue(t) if t.IsActive else 0
+        if v != 0:
+            window = zone.WindowSize()
+            expect[i, max(0, x-window):x+window,
+                   max(0, y-window):y+window] += v
+for x, y in zip(rs.randint(0, w.Width(), 200), rs.randint(0, w.Height(), 200)):
+    values = tuple(expect[:, x, y].tolist())
+    assert planes.GetBiomesAt(x, y) == values
+    assert lazy.GetBiomesAt(x, y) == values
+    assert lazy.GetBiomesAt(x, y, asdict=True) == \
+            dict((z.Name(), v) for z, v in zip(zones, values))
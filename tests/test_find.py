@@ -0,0 +1,22 @@
+#!/usr/bin/env python
+
+# World.FindMatches agrees with matching tile by tile
+import os
+import tests
+import IDs
+import Match
+import World
+
+path = os.environ.get('TERRARIA_WORLD')
+if not path:
+    raise SystemExit(0)
+
+w = World.World(fname=path)
+for exprs in (["Dirt"], ["Containers;18-36", "Timers"], [";;;1-10"],
+              ["Stone;;;1,2"], ["0x0-0xffff;0-100"]):
+    terms = [Match.Match(m, IDs.Tiles) for m in exprs]
+    expect = [(x, y) for y, x, t in w.EachTile(unreachable=False)
+              if any(term.match(t.Type, t.U, t.V, t.Wall) for term in terms)]
+    xs, ys = w.FindMatches(terms, unreachable=False)
+    assert zip(xs.tolist(), ys.tolist()) == expect, "mismatch for %s" % (
+            exprs,)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+# IDs loads each table from a marshal cache of IDTables.py on first access,
+# compiling the cache again when it is missing or stale
+import os
+import shutil
+import sys
+import tempfile
+import tests
+import IDs
+import IDTables
+
+tmp = tempfile.mkdtemp()
+try:
+    path = os.path.join(tmp, "tables.marshal")
+    cache = IDs._TableCache(path)
+    assert cache.TileID == IDTables.TileID and os.path.exists(path)
+    # a current cache is read one table at a time
+    cache = IDs._TableCache(path)
+    assert cache.Items == IDTables.Items
+    assert cache._tables is None
+    assert 'Items' in vars(cache) and 'ItemID' not in vars(cache)
+    for name in IDs.TABLES:
+        assert cache.Load(name) == getattr(IDTables, name), name
+    try:
+        cache.Frames
+        assert False, "expected an AttributeError"
+    except AttributeError:
+        pass
+    # unreadable and stale caches are compiled again
+    open(path, 'wb').write("garbage")
+    assert IDs._TableCache(path).Walls == IDTables.Walls
+    assert IDs._TableCache(path)._tables is None
+    IDs.CACHE_VERSION += 1
+    try:
+        cache = IDs._TableCache(path)
+        assert cache.BannerToNPC == IDTables.BannerToNPC
+        assert cache._tables is not None
+    finally:
+        IDs.CACHE_VERSION -= 1
+finally:
+    shutil.rmtree(tmp)
+
+# the module and the name classes load their tables when first used
+for name in IDs.TABLES:
+    assert getattr(IDs, name) == getattr(IDTables, name), name
+assert set(IDs.TABLES) <= set(dir(IDs)) and set(IDs.__all__) <= set(dir(IDs))
+for names, table in ((IDs.Item, IDTables.Items), (IDs.Tile, IDTables.Tiles),
+                     (IDs.Wall, IDTables.Walls)):
+    for name, value in table.iteritems():
+        assert getattr(names, name) == value
+try:
+    IDs.NoSuchTable
+    assert False, "expected an AttributeError"
+except AttributeError:
+    pass
+assert sys.modules['IDs'] is IDs
+assert IDs.valid_tile(IDs.Tile.Stone) and not IDs.valid_item(-5)
+assert IDs.tile_to_item(IDs.Tile.Diamond) == IDs.Item.Diamond
+assert not IDs.IsWallSafe(IDs.Wall.BlueDungeonUnsafe)
+
+# tile_to_item looks tiles up in dense tables, by frame where it matters
+Tile, Item = IDs.Tile, IDs.Item
+assert IDs.tile_to_item(Tile.Mud, 36, 18) == Item.MudBlock
+assert IDs.tile_to_item(Tile.Torches, 0, 22) == 427
+assert IDs.tile_to_item(Tile.Torches, 0, 22 * 100) == IDs.INVALID
+assert IDs.tile_to_item(Tile.Books, 90) == Item.WaterBolt
+assert IDs.tile_to_item(Tile.Books, 36) == Item.Book
+assert IDs.tile_to_item(Tile.DyePlants, 34 * 9) == Item.StrangePlant1 + 1
+assert IDs.tile_to_item(Tile.Bottles, 0, 0) == IDs.INVALID
+assert IDs.tile_to_item(Tile.Trees, 0, 0) == IDs.INVALID
+for tile in (-1, Tile.Count + 1000):
+    assert IDs.tile_to_item(tile) == IDs.INVALID
+for lookup in (IDs._identify_SmallPiles, IDs._identify_DyePlants,
+               IDs._identify_Banners, IDs._identify_Books):
+    tile = getattr(Tile, lookup.__name__[len('_identify_'):])
+    for u in range(0, 2000, 2):
+        expect = lookup(tile, u, 0)
+        assert IDs.tile_to_item(tile, u, 0) == expect, (tile, u)
+
+# tile_to_item_array agrees with tile_to_item
+import numpy as np
+rs = np.random.RandomState(0)
+types = rs.randint(0, Tile.Count + 10, 20000).astype(np.uint16)
+frames = [Tile.Torches, Tile.Books, Tile.Candles,
+          Tile.SmallPiles, Tile.Banners, Tile.Platforms]
+types[::2] = rs.choice(frames, 10000)
+us = (rs.randint(-2, 100, 20000) * 18).astype(np.int16)
+vs = (rs.randint(-2, 40, 20000) * 22).astype(np.int16)
+items = IDs.tile_to_item_array(types.reshape(100, 200), us.reshape(100, 200),
+                               vs.reshape(100, 200))
+assert items.shape == (100, 200) and items.dtype == np.int32
+expect = [IDs.tile_to_item(t, u, v) for t, u, v in
+          zip(types.tolist(), us.tolist(), vs.tolist())]
+assert items.ravel().tolist() == expect
+assert IDs.tile_to_item_array([], [], []).tolist() == []
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+# Region.Label agrees with a flood fill, and World.GetRegions uses it
+import os
+import tests
+import numpy as np
+import IDs
+import World
+from Region import Label
+
+def enclosed_area(grid, label, connectivity):
+    # tiles the outside cannot reach without crossing the component
+    padded = np.ones((grid.shape[0] + 2, grid.shape[1] + 2), dtype=np.bool_)
+    padded[1:-1, 1:-1] = grid != label
+    outside = flood_fill(padded, 12 - connectivity)[0] == 1
+    return padded.size - outside.sum()
+
+def flood_fill(mask, connectivity):
+    w, h = mask.shape
+    steps = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+    if connectivity == 8:
+        steps += [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+    grid = np.zeros(mask.shape, dtype=np.int32)
+    counts = [0]
+    for x, y in zip(*np.nonzero(mask)):
+        if grid[x, y]:
+            continue
+        counts.append(0)
+        grid[x, y] = len(counts) - 1
+        todo = [(x, y)]
+        while todo:
+            cx, cy = todo.pop()
+            counts[-1] += 1
+            for dx, dy in steps:
+                nx, ny = cx + dx, cy + dy
+                if 0 <= nx < w and 0 <= ny < h and mask[nx, ny] and \
+                        not grid[nx, ny]:
+                    grid[nx, ny] = grid[x, y]
+                    todo.append((nx, ny))
+    return grid, counts[1:]
+
+rs = np.random.RandomState(0)
+for trial in range(100):
+    mask = rs.rand(rs.randint(1, 25), rs.randint(1, 25)) < rs.rand()
+    for connectivity in (4, 8):
+        components, grid = Label.label(mask, connectivity)
+        expect, counts = flood_fill(mask, connectivity)
+        assert (grid == expect).all()
+        assert [c.count for c in components] == counts
+        for c in components:
+            xs, ys = np.nonzero(grid == c.label)
+            assert (c.xmin, c.ymin, c.xmax, c.ymax) == (xs.min(), ys.min(),
+                                                        xs.max(), ys.max())
+            assert c.area == enclosed_area(grid, c.label, connectivity)
+
+# a ring enclosing a hole with an island in it
+mask = np.zeros((9, 9), dtype=np.bool_)
+mask[1:8, 1:8] = True
+mask[2:7, 2:7] = False
+mask[4, 4] = True
+ring, island = Label.label(mask)[0]
+assert (ring.count, ring.area) == (24, 49)
+assert (island.count, island.area) == (1, 1)
+# and the ring inside another one
+mask = np.pad(mask, 2, 'constant')
+mask[1:12, 1] = mask[1:12, 11] = mask[1, 1:12] = mask[11, 1:12] = True
+outer, ring, island = Label.label(mask)[0]
+assert (outer.count, outer.area) == (40, 121)
+assert (ring.count, ring.area) == (24, 49)
+
+path = os.environ.get('TERRARIA_WORLD')
+if not path:
+    raise SystemExit(0)
+
+w = World.World(fname=path)
+match = World.PolyMatch_Tile(IDs.Tile.Dirt)
+regions, grid = w.GetRegions(match, labels=True)
+mask = w.GetTileGrid().Type == IDs.Tile.Dirt
+assert sum(r.count for r in regions) == mask.sum()
+assert ((grid > 0) == mask).all()
+lazy = World.World(fname=path, lazy=True)
+assert lazy.GetRegions(match, connectivity=8, min_count=5) == \
+        w.GetRegions(mask, connectivity=8, min_count=5)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+# MapFile.Map.LoadMapTiles decodes every kind of map tile record
+import struct
+import zlib
+import tests
+import numpy as np
+import MapFile
+from BinaryString import BinaryString
+
+rs = np.random.RandomState(0)
+width, height = 300, 40
+m = MapFile.Map()
+m._groundLevel, m._rockLevel = 10, 25
+m._tileOpts = [1] * 300 + [3] * 100
+m._wallOpts = [1] * 200 + [2] * 50
+m._totalTileOpts, m._totalWallOpts = sum(m._tileOpts), sum(m._wallOpts)
+m._numLiquidOpts, m._numSkyOpts = 3, 256
+m._numDirtOpts, m._numRockOpts = 256, 256
+m.GenerateTileTypes()
+
+# encode random runs, filling in the expected arrays tile by tile
+data = []
+tiles = np.zeros((width, height), dtype=np.uint16)
+light = np.zeros((width, height), dtype=np.uint8)
+colors = np.zeros((width, height), dtype=np.uint8)
+for y in range(height):
+    x = 0
+    while x < width:
+        section = rs.randint(0, 8)
+        rle = min(rs.choice([0, 0, 3, 200, 400]), width - x - 1)
+        header1 = section << 1
+        record = ""
+        paint = rs.randint(0, 32) if rs.rand() < 0.3 else 0
+        if paint:
+            header1 |= 1
+            record += chr(paint << 1)
+        index = 0
+        if section in (1, 2, 7):
+            index = rs.randint(0, 256 if section == 7 else 300)
+            if index > 255:
+                header1 |= 16
+                record += struct.pack("<H", index)
+            else:
+                record += chr(index)
+        lit = rs.choice([255, 0, 17])
+        if lit != 255:
+            header1 |= 32
+            record += chr(lit)
+        if rle > 255:
+            header1 |= 128
+            record += struct.pack("<h", rle)
+        elif rle > 0:
+            header1 |= 64
+            record += chr(rle)
+        lights = [lit] * (rle + 1)
+        if lit != 255 and section != 0:
+            lights[1:] = rs.randint(0, 256, rle)
+            record += "".join(chr(v) for v in lights[1:])
+        data.append(chr(header1) + record)
+        if section != 0:
+            if section == 1:
+                index += m._posTileOpts
+            elif section == 2:
+                index += m._posWallOpts
+            elif section in (3, 4, 5):
+                index = m._posLiquidOpts + section - 3
+            elif section == 6:
+                index = m._posSkyOpts + 256 * y // 10 if y < 10 else m._posHell
+            else:
+                index += m._posDirtOpts if y < 25 else m._posRockOpts
+            for i in range(rle + 1):
+                tiles[x+i, y] = index
+                light[x+i, y] = lights[i]
+                colors[x+i, y] = paint
+        x += rle + 1
+
+compress = zlib.compressobj(9, zlib.DEFLATED, -15)
+payload = compress.compress("".join(data)) + compress.flush()
+m._stream = BinaryString("header" + payload)
+# small chunks make records straddle the decompressed pieces
+for chunk in (MapFile.INFLATE_CHUNK, 5, 64):
+    MapFile.INFLATE_CHUNK = chunk
+    m._stream._pos = len("header")
+    m.LoadMapTiles(width, height)
+    assert m.GetTileIndexes().shape == (width, height)
+    assert (m.GetTileIndexes() == tiles).all()
+    assert (m.GetLight() == light).all()
+    assert (m.GetColors() == colors).all()
+
+# truncated data is an error
+m._stream = BinaryString(payload[:len(payload) // 2])
+try:
+    m.LoadMapTiles(width, height)
+    assert False, "expected an error"
+except (IndexError, zlib.error):
+    pass
+
+# the tile type table, one type and option at a time
+expect = [(MapFile.Map.LOOKUP_NONE, 0, 0)]
+for kind, opts in ((MapFile.Map.LOOKUP_TILE, m._tileOpts),
+                   (MapFile.Map.LOOKUP_WALL, m._wallOpts)):
+    for t, n in enumerate(opts):
+        expect.extend((kind, t, o) for o in range(n))
+expect.extend((MapFile.Map.LOOKUP_LIQUID, t + 1, 0) for t in range(3))
+for kind in (MapFile.Map.LOOKUP_SKY, MapFile.Map.LOOKUP_DIRT,
+             MapFile.Map.LOOKUP_ROCK):
+    expect.extend((kind, k, 0) for k in range(256))
+expect.append((MapFile.Map.LOOKUP_HELL, 0, 0))
+assert zip(*[a.tolist() for a in m.GetTileTypes()]) == expect
+colors = m.GetTileColors()
+gradients = {MapFile.Map.LOOKUP_SKY: m.skyGradient,
+             MapFile.Map.LOOKUP_DIRT: m.dirtGradient,
+             MapFile.Map.LOOKUP_ROCK: m.rockGradient}
+for i, (kind, lookup, option) in enumerate(expect):
+    if kind in gradients:
+        c1, c2 = gradients[kind]
+        color = tuple((a * (255 - lookup) + b * lookup) // 255
+                      for a, b in zip(c1, c2))
+    elif kind == MapFile.Map.LOOKUP_NONE:
+        color = None
+    else:
+        try:
+            color = m.DoColorLookup(kind, lookup, option)
+        except IndexError:
+            color = None
+    if color is None:
+        assert colors[i, 3] == 0, (kind, lookup, option)
+    else:
+        assert tuple(colors[i]) == color + (255,), (kind, lookup, option)
+
+# rendering dims every tile by its light
+m._stream = BinaryString(payload)
+m.LoadMapTiles(width, height)
+image = m.Render(band=7)
+assert image.shape == (height, width, 4)
+for x, y in zip(rs.randint(0, width, 500), rs.randint(0, height, 500)):
+    color = colors[tiles[x, y]].astype(np.int64)
+    color[:3] = color[:3] * light[x, y] // 255
+    assert (image[y, x] == color).all()
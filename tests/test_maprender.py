@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+# MapRender agrees with MapFile.Map.TileToLookup and DoColorLookup
+import os
+import tests
+import numpy as np
+import MapFile
+import MapRender
+import Tile
+import World
+
+m = MapFile.Map()
+m._groundLevel, m._rockLevel, m._height = 10, 20, 300
+palette = MapRender.Palette()
+rs = np.random.RandomState(0)
+types = np.array([t for ts, _ in MapRender.OptionRules for t in ts] + [0, 1],
+                 dtype=np.uint16)
+types = types[rs.randint(0, len(types), 5000)]
+us = rs.randint(0, 2400, len(types)).astype(np.int16)
+vs = rs.randint(0, 1400, len(types)).astype(np.int16)
+ys = rs.randint(0, 300, len(types))
+options = MapRender.TileOptions(types, us, vs, ys)
+for i in range(len(types)):
+    t = Tile.Tile(Type=int(types[i]), U=int(us[i]), V=int(vs[i]),
+                  IsActive=True)
+    try:
+        key, lookup, option = m.TileToLookup(t, 0, int(ys[i]))
+    except AssertionError:
+        # option out of range; MapRender draws nothing
+        key, option = MapFile.Map.LOOKUP_TILE, None
+    assert palette.TileMissing[types[i]] == (key != MapFile.Map.LOOKUP_TILE)
+    if key != MapFile.Map.LOOKUP_TILE:
+        continue
+    color = m.DoColorLookup(key, lookup, option) if option is not None else None
+    mine = palette.Tiles[types[i], options[i]]
+    if color is None:
+        assert mine[3] == 0, (types[i], us[i], vs[i])
+    else:
+        assert tuple(mine) == color + (255,), (types[i], us[i], vs[i])
+
+path = os.environ.get('TERRARIA_WORLD')
+if not path:
+    raise SystemExit(0)
+
+w = World.World(fname=path)
+m.FromWorld(w)
+for flags in ({}, {'transparentBg': True, 'transparentWalls': True},
+              {'transparentTiles': True, 'transparentLiquid': True}):
+    expect = np.zeros((w.Height(), w.Width(), 4), dtype=np.uint8)
+    for x, y, t in w.EachTile(rowcol=False):
+        color = m.DoColorLookup(*m.TileToLookup(t, x, y, **flags))
+        if color is not None:
+            expect[y, x] = color + (255,)
+    renderer = MapRender.MapRenderer(w, **flags)
+    image = renderer.Render()
+    assert (image == expect).all(), "mismatch for %s" % (flags,)
+    assert (np.asarray(renderer.ToImage(image)) == image).all()
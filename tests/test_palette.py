@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+# Palette compiles the MapTile_*.csv files, caches them on disk, and is
+# shared by MapFile.Map and RegionArea.FindFile
+import csv
+import os
+import shutil
+import tempfile
+import tests
+import numpy as np
+import IDs
+import MapFile
+import Palette
+import RegionArea
+
+palette = Palette.Palette()
+rows = list(csv.reader(open(os.path.join(Palette.CSV_DIR,
+                                         "MapTile_Colors.csv"))))[1:]
+# later rows override earlier ones, as the options were read by Map
+colors, last = {}, {}
+for t, o, r, g, b in rows:
+    colors[int(t), int(o)] = last[int(t)] = (int(r), int(g), int(b))
+for (t, o), color in colors.items():
+    assert palette.TileColor(t, o) == color
+assert palette.TileColor(int(rows[0][0]), Palette.MAX_TILE_OPTIONS) is None
+for t in range(palette.NumTiles()):
+    assert palette.TileColor(t) == last.get(t)
+    assert palette.TileMissing[t] == (0 < t < IDs.Tile.Count and
+                                      t not in last)
+
+# saved palettes are reused only while the CSV files are unchanged
+tmp = tempfile.mkdtemp()
+try:
+    path = os.path.join(tmp, "palette.npz")
+    assert Palette.Palette.Load(path) is None
+    palette.Save(path)
+    loaded = Palette.Palette.Load(path)
+    for name in Palette.ARRAYS:
+        assert np.array_equal(getattr(loaded, name), getattr(palette, name))
+    stale = Palette.SourceKey()
+    stale[0] += 1
+    assert Palette.Palette.Load(path, stale) is None
+    assert Palette.Palette.ForPackage(path).Tiles.shape == palette.Tiles.shape
+    open(path, 'w').write("garbage")
+    assert Palette.Palette.Load(path) is None
+    assert Palette.Palette.ForPackage(path) is not None
+    assert Palette.Palette.Load(path) is not None
+finally:
+    shutil.rmtree(tmp)
+
+# one palette for the whole process, whatever the working directory
+os.chdir(tempfile.gettempdir())
+m = MapFile.Map()
+assert Palette.GetPalette() is Palette.GetPalette()
+assert m.GetLookup(MapFile.Map.LOOKUP_TILE) is Palette.GetPalette().Tiles
+stone = int(rows[1][0])
+assert m.DoColorLookup(MapFile.Map.LOOKUP_TILE, stone, 0) == last[stone]
+assert m.DoColorLookup(MapFile.Map.LOOKUP_LIQUID, 1, 0) == (9, 61, 191)
+findfile = RegionArea.FindFile()
+findfile._format = RegionArea.FindFile.FMT_CSV
+assert findfile.Color(stone) == last[stone]
+assert findfile.Color(100000) == (0, 0, 0)
+
+# without numpy, Map looks colors up in the CSV files as lists instead
+lists = MapFile._ListPalette()
+for t in range(palette.NumTiles()):
+    for o in range(Palette.MAX_TILE_OPTIONS):
+        assert lists.TileColor(t, o) == palette.TileColor(t, o)
+    assert lists.TileMissing[t] == palette.TileMissing[t]
+for wall in range(256):
+    for o in range(Palette.MAX_WALL_OPTIONS):
+        assert lists.WallColor(wall, o) == palette.WallColor(wall, o)
+    assert lists.WallMissing[wall] == palette.WallMissing[wall]
+for liquid in range(4):
+    assert lists.LiquidColor(liquid) == palette.LiquidColor(liquid)
+MapFile.HAVE_NUMPY = False
+try:
+    m = MapFile.Map()
+    assert m.GetLookup(MapFile.Map.LOOKUP_TILE) == lists.Tiles
+    assert m.DoColorLookup(MapFile.Map.LOOKUP_TILE, stone, 0) == last[stone]
+    assert m.DoColorLookup(MapFile.Map.LOOKUP_LIQUID, 1, 0) == (9, 61, 191)
+finally:
+    MapFile.HAVE_NUMPY = True
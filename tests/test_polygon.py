@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+
+# World.GetPolygon gives the same polygons for per-tile functions, PolyMatch
+# objects, and boolean masks
+import os
+import tests
+import IDs
+import World
+
+path = os.environ.get('TERRARIA_WORLD')
+if not path:
+    raise SystemExit(0)
+
+w = World.World(fname=path)
+lazy = World.World(fname=path, lazy=True)
+grid = w.GetTileGrid()
+
+def polys(world, match, kwargs):
+    try:
+        result = world.GetPolygon(match, **kwargs)
+    except IndexError:
+        # no matches with multi=False
+        return None
+    return map(list, result) if kwargs.get('multi') else list(result)
+
+cases = (
+    (World.PolyMatch_Tile(IDs.Tile.Dirt), grid.Type == IDs.Tile.Dirt),
+    (World.PolyMatch_Wall(1), grid.Wall == 1),
+    (World.PolyMatch(IDs.Tile.Stone, 1),
+     (grid.Type == IDs.Tile.Stone) & (grid.Wall == 1)),
+)
+for match, mask in cases:
+    fn = lambda t: match(t)
+    for kwargs in (dict(multi=True), dict(multi=True, shortcircuit=True),
+                   dict(multi=True, xmin=10, xmax=90, ymin=5, ymax=60),
+                   dict(simplify=True, xmin=20, xmax=40)):
+        expect = polys(w, fn, kwargs)
+        assert polys(w, match, kwargs) == expect
+        assert polys(w, mask, kwargs) == expect
+        assert polys(lazy, match, kwargs) == expect
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+# Region.Raster agrees with shapely's contains(), and RegionArea.do_search
+# with testing every point against every polygon
+from StringIO import StringIO
+import tests
+import numpy as np
+from shapely.geometry import Point, Polygon, box
+from shapely.ops import unary_union
+import RegionArea
+from Region.PolySet import WorldPolySet
+from Region.Raster import contains_points
+
+rs = np.random.RandomState(0)
+
+def star():
+    "A random polygon with integer vertices, possibly self-intersecting"
+    n = rs.randint(3, 12)
+    angles = np.sort(rs.rand(n) * 2 * np.pi)
+    radii = rs.randint(1, 15, n)
+    cx, cy = rs.randint(0, 30, 2)
+    return Polygon([(int(cx + round(r * np.cos(a))),
+                     int(cy + round(r * np.sin(a))))
+                    for r, a in zip(radii, angles)])
+
+def boxes():
+    "A union of random boxes, minus another one"
+    parts = [box(x, y, x + rs.randint(1, 9), y + rs.randint(1, 9))
+             for x, y in rs.randint(0, 30, (5, 2))]
+    x0, y0 = rs.randint(0, 20, 2)
+    x1, y1 = rs.randint(20, 40, 2)
+    return unary_union(parts).difference(box(x0, y0, x1, y1))
+
+def holes():
+    "A box with a hole (keeping to integer vertices)"
+    hole = star()
+    while not hole.is_valid:
+        hole = star()
+    return box(-20, -20, 60, 60).difference(hole)
+
+xs, ys = np.mgrid[-2:42, -2:42]
+xs, ys = xs.ravel(), ys.ravel()
+shapes = []
+for trial in range(90):
+    geom = (star, boxes, holes)[trial % 3]()
+    shapes.append(geom)
+    expect = [geom.contains(Point(x, y)) for x, y in zip(xs, ys)]
+    assert contains_points(geom, xs, ys).tolist() == expect
+# points off the lattice
+fx, fy = rs.rand(300) * 40, rs.rand(300) * 40
+assert contains_points(shapes[0], fx, fy).tolist() == \
+        [shapes[0].contains(Point(x, y)) for x, y in zip(fx, fy)]
+
+polyset = WorldPolySet()
+lines = ["A %s" % ([list(c) for c in shapes[i].exterior.coords],)
+         for i in range(0, 30, 3)]
+lines += ["B %s" % ([list(c) for c in shapes[i].exterior.coords],)
+          for i in range(0, 30, 6)]
+assert polyset.parse_lines(lines)
+points = [(Point(x, y), rs.randint(0, 4))
+          for x, y in zip(rs.randint(-2, 42, 500), rs.randint(-2, 42, 500))]
+expect = {'+counts': {}}
+for point, ptname in points:
+    for poly in polyset.polys():
+        name = poly.name()
+        expect.setdefault(name, [])
+        counts = expect['+counts'].setdefault(name, {})
+        if poly.contains(point):
+            counts[ptname] = counts.get(ptname, 0) + 1
+            expect[name].append((ptname, point))
+results = RegionArea.do_search(polyset, points)
+assert results['+counts'] == expect['+counts']
+assert sorted(results) == sorted(expect)
+for name in polyset.names():
+    assert [(n, p.coords[0]) for n, p in results[name]] == \
+           [(n, p.coords[0]) for n, p in expect[name]]
+assert RegionArea.do_search(polyset, []) == {'+counts': {}}
+
+# a FindFile is searched from its arrays, with the same results
+rows = ["x,y,Tile,U,V"] + ["%d,%d,%d,0,0" % (p.x, p.y, n)
+                          for p, n in points]
+findfile = RegionArea.FindFile()
+findfile.Load(file=StringIO("\n".join(rows[:1] + ["1,1,-1,0,0"] + rows[1:])))
+assert len(findfile) == len(points)
+assert sorted((n, p.coords[0]) for p, n in findfile) == \
+       sorted((n, p.coords[0]) for p, n in points)
+# grouped by tile in order of first appearance, each group in file order
+firsts = []
+for _, n in points:
+    if n not in firsts:
+        firsts.append(n)
+assert [(n, p.coords[0]) for p, n in findfile] == \
+       [(n, p.coords[0]) for tile in firsts for p, n in points if n == tile]
+results = RegionArea.do_search(polyset, findfile)
+pairs = RegionArea.do_search(polyset, list(findfile))
+assert results['+counts'] == expect['+counts']
+for name in polyset.names():
+    assert sorted((n, p.coords[0]) for n, p in results[name]) == \
+           sorted((n, p.coords[0]) for n, p in expect[name])
+    assert [(n, p.coords[0]) for n, p in results[name]] == \
+           [(n, p.coords[0]) for n, p in pairs[name]]
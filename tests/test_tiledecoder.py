@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+# TileDecoder: bulk decoding agrees with Tile.FromStream
+import os
+import struct
+import tests
+import BinaryString
+import IDs
+import Importance
+import Tile
+import TileDecoder
+
+important = list(Importance.ImportantTiles)
+
+# (header bytes, body) for a 2x4 world; column-major with vertical RLE
+encoded = [
+    # active dirt with a wall and a run of 2 more cells
+    chr(0b01000110) + chr(IDs.Tile.Dirt) + chr(2) + chr(2),
+    # painted, red-wired half brick chest (important, 16-bit type field)
+    chr(0b00100011) + chr(0b00010011) + chr(0b00001010) +
+        struct.pack('<Hhh', IDs.Tile.Containers, 18, 36) + chr(7),
+    # lava, no tile
+    chr(0b00010000) + chr(200),
+    # timer with a non-zero V and a 16-bit run of 1
+    chr(0b10000010) + chr(IDs.Tile.Timers) + struct.pack('<hhh', 0, 18, 1),
+    # empty
+    chr(0),
+]
+content = 'HEADER' + ''.join(encoded)
+start, end = 6, len(content)
+
+expected = []
+stream = BinaryString.BinaryString(content)
+stream.seek_set(start)
+while stream.tell() < end:
+    tile, rle = Tile.FromStream(stream, important)
+    expected.extend([tile] * (max(rle, 0) + 1))
+
+grid, pos = TileDecoder.DecodeTiles(content, start, end, 2, 4, important,
+                                    compiled=False)
+assert pos == end, "decoder stopped at %d, not %d" % (pos, end)
+for i, tile in enumerate(expected):
+    x, y = divmod(i, 4)
+    got = grid.GetTile(x, y)
+    assert got == tile, "tile (%d, %d) is %r, not %r" % (x, y, got, tile)
+assert grid.GetTile(1, 1).V == 0, "timers always have V=0"
+assert grid.TileCounts() == {IDs.Tile.Dirt: 3, IDs.Tile.Containers: 1,
+                             IDs.Tile.Timers: 2}
+
+if TileDecoder.HAVE_NUMBA:
+    grid2, pos2 = TileDecoder.DecodeTiles(content, start, end, 2, 4,
+                                          important, compiled=True)
+    assert pos2 == pos
+    for name, arr in grid.Columns().items():
+        assert (getattr(grid2, name) == arr).all(), "column %s differs" % name
+
+columns, rowpos, rowy = TileDecoder.ScanColumns(content, start, end, 2, 4,
+                                                important, every=2,
+                                                compiled=False)
+assert list(columns) == [start, start + len(encoded[0]) + len(encoded[1]),
+                         end]
+assert rowy.tolist() == [[0, 0], [0, 1]], "rows 0 and 2 start at rows %s" % (
+        rowy.tolist(),)
+
+grid3, pos3 = TileDecoder.DecodeTilesParallel(content, start, end, 2, 4,
+                                              important, 2, columns=columns)
+assert pos3 == pos
+for name, arr in grid.Columns().items():
+    assert (getattr(grid3, name) == arr).all(), "column %s differs" % name
+
+if TileDecoder.HAVE_NUMBA:
+    scanned = TileDecoder.ScanColumns(content, start, end, 2, 4, important,
+                                      every=2, compiled=True)
+    assert [a.tolist() for a in scanned] == \
+           [list(columns), rowpos.tolist(), rowy.tolist()]
+
+# the plain Python kernels copy the section a window of columns at a time
+TileDecoder.BATCH_COLUMNS = 1
+scanned = TileDecoder.ScanColumns(content, start, end, 2, 4, important,
+                                  every=2, compiled=False)
+assert [a.tolist() for a in scanned] == \
+       [list(columns), rowpos.tolist(), rowy.tolist()]
+grid4, pos4 = TileDecoder.DecodeTiles(content, start, end, 2, 4, important,
+                                      compiled=False)
+assert pos4 == pos
+for name, arr in grid.Columns().items():
+    assert (getattr(grid4, name) == arr).all(), "column %s differs" % name
+for x, column in TileDecoder.IterColumns(buffer(content), start, end, 2, 4,
+                                         important, compiled=False):
+    for name, arr in column.items():
+        assert (getattr(grid, name)[x] == arr).all()
+TileDecoder.BATCH_COLUMNS = 64
+
+# the compiled kernels decode a real world as the plain Python ones do
+path = os.environ.get('TERRARIA_WORLD')
+if not path or not TileDecoder.HAVE_NUMBA:
+    raise SystemExit(0)
+
+import World
+w = World.World(fname=path, load_tiles=False)
+header = w.GetHeader()
+args = (open(path, 'rb').read(), header.GetTilesPointer(),
+        header.GetChestsPointer(), w.Width(), w.Height(),
+        header.ImportantTiles)
+plain, pos = TileDecoder.DecodeTiles(*args, compiled=False)
+compiled, pos2 = TileDecoder.DecodeTiles(*args, compiled=True)
+assert pos2 == pos
+for name, arr in plain.Columns().items():
+    assert (getattr(compiled, name) == arr).all(), "column %s differs" % name
+plain = TileDecoder.ScanColumns(*args, every=64, compiled=False)
+compiled = TileDecoder.ScanColumns(*args, every=64, compiled=True)
+for a, b in zip(plain, compiled):
+    assert (a == b).all()
@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+
+# TileGrid: views read and write through to the columns
+import tests
+import Tile
+import TileGrid
+
+tiles = [Tile.Tile(IsActive=True, Type=1, Wall=2),
+         Tile.Tile(IsActive=True, Type=5, U=18, V=36, WireRed=True,
+                   BrickStyle=Tile.BrickStyle.HalfBrick),
+         Tile.Tile(Wall=4, LiquidType=Tile.LiquidType.Water, LiquidAmount=255)]
+grid = TileGrid.TileGrid.FromTiles(2, 3, tiles, [2, 3, 1])
+
+assert grid.GetTile(0, 0) == tiles[0], "tile (0, 0) is %r" % (grid.GetTile(0, 0),)
+assert grid.GetTile(0, 1) == tiles[0]
+assert grid.GetTile(0, 2) == tiles[1]
+assert grid.GetTile(1, 1) == tiles[1]
+assert grid.GetTile(1, 2) == tiles[2]
+assert grid.GetTile(1, 0).WireRed is True
+assert grid.GetTile(1, 2).U == -1
+assert grid.TileCounts() == {1: 2, 5: 3}
+assert grid.WallCounts() == {2: 2, 4: 1}
+
+view = grid.GetTile(0, 1)
+view.Type = 7
+view.IsActive = False
+assert grid.Type[0, 1] == 7 and not grid.Active()[0, 1]
+assert grid.GetTile(0, 0).Type == 1, "modifying a view changes one cell"
+assert view.Detach() == Tile.Tile(Type=7, Wall=2)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+# TileIndex: per-column decoding agrees with decoding the whole section
+import os
+import random
+import shutil
+import StringIO
+import tempfile
+import tests
+import TileIndex
+import World
+
+path = os.environ.get('TERRARIA_WORLD')
+if not path:
+    raise SystemExit(0)
+
+content = open(path, 'rb').read()
+full = World.World(fobj=StringIO.StringIO(content))
+
+for rows in (0, 5):
+    # an in-memory world has no path, so no sidecar file is written
+    w = World.World(fobj=StringIO.StringIO(content), lazy=True,
+                    index_rows=rows)
+    rng = random.Random(rows)
+    for i in range(200):
+        x, y = rng.randrange(w.Width()), rng.randrange(w.Height())
+        assert w.GetTile(x, y) == full.GetTile(x, y), "tile %d, %d" % (x, y)
+    cols = range(w.Width() - 3, w.Width())
+    assert list(w.GetTiles(range(w.Height()), cols)) == \
+           list(full.GetTiles(range(full.Height()), cols))
+    assert 'tiles' in w._pending, "tiles section was not decoded in full"
+
+# GetTiles decodes each column once per call and keeps none of them
+decoded = []
+decode_span = w._DecodeSpan
+def counting_decode_span(start, end, width, height):
+    decoded.append((start, end))
+    return decode_span(start, end, width, height)
+w._DecodeSpan = counting_decode_span
+for i in range(2):
+    list(w.GetTiles(range(w.Height()), cols))
+    assert len(decoded) == len(cols) * (i + 1)
+del w._DecodeSpan
+
+index = w._GetTileIndex()
+assert index.Columns[0] == w.GetHeader().GetTilesPointer()
+assert index.Columns[-1] == w.GetHeader().GetChestsPointer()
+
+tempdir = tempfile.mkdtemp()
+try:
+    sidecar = os.path.join(tempdir, "index.npz")
+    index.Save(sidecar)
+    loaded = TileIndex.TileIndex.Load(sidecar, w.GetHeader(), w._flags)
+    assert (loaded.Columns == index.Columns).all()
+    assert (loaded.RowPos == index.RowPos).all()
+    assert loaded.RowCheckpoint(7, 12) == index.RowCheckpoint(7, 12)
+    w.GetHeader().MetaRevision += 1
+    assert TileIndex.TileIndex.Load(sidecar, w.GetHeader(), w._flags) is None
+finally:
+    shutil.rmtree(tempdir)
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+
+# Lazy loading decodes sections on demand and agrees with eager loading
+import os
+import tests
+import World
+
+path = os.environ.get('TERRARIA_WORLD')
+if not path:
+    raise SystemExit(0)
+
+eager = World.World(fname=path)
+lazy = World.World(fname=path, lazy=True)
+assert lazy.GetHeader().SectionPointers == eager.GetHeader().SectionPointers
+assert 'tiles' in lazy._pending, "tiles are not decoded by Load()"
+assert lazy.GetFlags() == eager.GetFlags()
+assert 'tiles' in lazy._pending, "flags do not require tiles"
+lazy.GetTile(0, 0)
+assert 'chests' in lazy._pending, "without a cache, tiles load on their own"
+assert repr(lazy.GetNPCs()) == repr(eager.GetNPCs())
+assert repr(lazy.GetChests()) == repr(eager._chests)
+assert lazy.GetSigns() == eager._signs
+assert lazy.GetTile(lazy.Width() / 2, lazy.Height() / 2) == \
+       eager.GetTile(eager.Width() / 2, eager.Height() / 2)
+assert lazy.GetTileCounts() == eager.GetTileCounts()
+assert repr(lazy.GetTileEntities()) == repr(eager.GetTileEntities())
+assert not lazy._pending, "all sections loaded: %s" % (lazy._pending,)
+
+# streaming decodes column by column without loading the tiles section
+lazy = World.World(fname=path, lazy=True)
+grid = eager.GetTileGrid()
+for x, column in lazy.StreamColumns():
+    for name, arr in column.items():
+        assert (arr == getattr(grid, name)[x]).all(), "column %d" % (x,)
+assert 'tiles' in lazy._pending, "StreamColumns does not load all tiles"
+streamed = list((y, x, repr(t)) for y, x, t in lazy.EachTile(stream=True))
+assert streamed[1][:2] == (1, 0), "streaming is column-major"
+assert sorted(streamed) == sorted((y, x, repr(t)) for y, x, t in
+                                  eager.EachTile())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+# WorldCache: cached worlds match decoded ones; eviction bounds the size
+import os
+import shutil
+import tempfile
+import tests
+import World
+import WorldCache
+
+path = os.environ.get('TERRARIA_WORLD')
+if not path:
+    raise SystemExit(0)
+
+tempdir = tempfile.mkdtemp()
+try:
+    cache = WorldCache.WorldCache(tempdir)
+    full = World.World(fname=path)
+    first = World.World(fname=path, cache=cache)
+    assert len(cache._Entries()) == 1, "world was stored in the cache"
+    for lazy in (False, True):
+        w = World.World(fname=path, cache=cache, lazy=lazy)
+        assert w.GetTileCounts() == full.GetTileCounts()
+        assert w.GetWallCounts() == full.GetWallCounts()
+        grid, fgrid = w.GetTileGrid(), full.GetTileGrid()
+        for name, arr in fgrid.Columns().items():
+            assert (getattr(grid, name) == arr).all(), "column %s" % (name,)
+        assert repr(w.GetChests()) == repr(full.GetChests())
+        assert w.GetSigns() == full.GetSigns()
+        assert len(w.GetNPCs()) == len(full.GetNPCs())
+    assert len(cache._Entries()) == 1, "cache hits add no entries"
+
+    # a different key for the same path replaces the old entry
+    key = list(cache._Entries()[0])
+    w = World.World(fname=path, lazy=True)
+    newkey = WorldCache.WorldCache.Key(path, "other contents", w.GetHeader())
+    cache.Store(newkey, full.GetTileGrid(), tile_counts={})
+    assert [e[0] for e in cache._Entries()] != [key[0]]
+    assert cache.Fetch(newkey)['tile_counts'] == {}
+
+    cache.Evict(max_bytes=0)
+    assert cache._Entries() == [], "eviction removes everything"
+
+    # streaming a lazy world fills the cache, hashing the file only once
+    keys = []
+    key = WorldCache.WorldCache.Key
+    def counted_key(*args):
+        keys.append(args)
+        return key(*args)
+    WorldCache.WorldCache.Key = staticmethod(counted_key)
+    try:
+        w = World.World(fname=path, cache=cache, lazy=True)
+        blocks = list(w.StreamColumnBlocks(7))
+        assert w.GetTileCounts() == full.GetTileCounts()
+    finally:
+        WorldCache.WorldCache.Key = staticmethod(key)
+    assert len(keys) == 1 and len(cache._Entries()) == 1
+    assert sum(len(b['Type']) for _, b in blocks) == full.Width()
+    w = World.World(fname=path, cache=cache, lazy=True)
+    assert w._LoadFromCache() and 'tiles' not in w._pending
+
+    # several workers decode the whole section instead of streaming it
+    w = World.World(fname=path, lazy=True, workers=2)
+    assert not w._ShouldStream() and 'tiles' not in w._pending
+finally:
+    shutil.rmtree(tempdir)
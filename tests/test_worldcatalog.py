@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+# WorldCatalog indexes a directory of worlds, reading only new or changed
+# files, and backs World.ListWorlds and World.FindWorld
+import os
+import shutil
+import tempfile
+import warnings
+import tests
+import World
+import WorldCatalog
+
+tmp = tempfile.mkdtemp()
+try:
+    worlds = os.path.join(tmp, "Worlds")
+    os.mkdir(worlds)
+    index_dir = os.path.join(tmp, "index")
+    catalog = WorldCatalog.WorldCatalog(worlds, index_dir)
+    assert len(catalog) == 0 and catalog.ByTitle("nothing") is None
+    # unreadable worlds are skipped with a warning
+    open(os.path.join(worlds, "broken.wld"), 'w').write("not a world")
+    open(os.path.join(worlds, "notes.txt"), 'w').write("not a world either")
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert catalog.Refresh() == 0
+    assert len(caught) == 1 and len(catalog) == 0
+
+    path = os.environ.get('TERRARIA_WORLD')
+    if not path:
+        raise SystemExit(0)
+
+    w = World.World(fname=path, load_tiles=False)
+    for name in ("one.wld", "two.wld"):
+        shutil.copy(path, os.path.join(worlds, name))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        assert catalog.Refresh() == 2
+        assert catalog.Refresh() == 0
+        entries = catalog.Entries()
+        assert sorted(e.FileName for e in entries) == ["one.wld", "two.wld"]
+        entry = catalog.ByFileName("two.wld")
+        assert entry.Path == os.path.join(worlds, "two.wld")
+        assert (entry.Title, entry.WorldId) == (w.Title(),
+                                                w.GetFlag('WorldId'))
+        assert (entry.Width, entry.Height) == (w.Width(), w.Height())
+        assert entry.GetSize() == w.GetSize()
+        assert (entry.Crimson, entry.Expert) == (w.Crimson(), w.Expert())
+        assert entry.Version == w.GetHeader().Version
+        # the first file listed wins lookups by title and ID
+        assert catalog.ByTitle(w.Title()) is entries[0]
+        assert catalog.ById(w.GetFlag('WorldId')) is entries[0]
+
+        # a new catalog reads the index and only the files changed since
+        os.utime(os.path.join(worlds, "one.wld"), (1, 1))
+        again = WorldCatalog.WorldCatalog(worlds, index_dir)
+        assert again.Refresh() == 1
+        assert again.ByFileName("one.wld").MTime == 1
+        os.remove(os.path.join(worlds, "two.wld"))
+        assert again.Refresh() == 0
+        assert [e.FileName for e in again.Entries()] == ["one.wld"]
+        assert WorldCatalog.WorldCatalog(worlds, index_dir).Refresh() == 0
+        assert WorldCatalog.WorldCatalog(worlds, False).Refresh() == 1
+
+        # World.ListWorlds and World.FindWorld use the catalog
+        World.WORLDPATH_LINUX = worlds
+        WorldCatalog.DEFAULT_INDEX_DIR = index_dir
+        listed = World.ListWorlds()
+        assert [(f, p) for f, _, p in listed] == \
+               [("one.wld", os.path.join(worlds, "one.wld"))]
+        assert listed[0][1].Title() == w.Title()
+        one = os.path.join(worlds, "one.wld")
+        assert World.FindWorld(worldname="one") == one
+        assert World.FindWorld(worldname=w.Title()) == one
+        assert World.FindWorld(worldid=w.GetFlag('WorldId')) == one
+        assert World.FindWorld(worldid=-5, failquiet=True) is None
+
+        # the shared catalog refreshes only on a miss or a changed file
+        shared = WorldCatalog.GetCatalog()
+        assert WorldCatalog.GetCatalog() is shared
+        refreshes = []
+        refresh = WorldCatalog.WorldCatalog.Refresh
+        def counting_refresh(self):
+            refreshes.append(self)
+            return refresh(self)
+        WorldCatalog.WorldCatalog.Refresh = counting_refresh
+        try:
+            assert shared.ByTitle(w.Title()).Path == one
+            assert shared.ById(w.GetFlag('WorldId')).Path == one
+            assert World.FindWorld(worldid=w.GetFlag('WorldId')) == one
+            assert refreshes == []
+            assert shared.ByTitle("nothing") is None
+            assert refreshes == [shared]
+            os.utime(one, (2, 2))
+            assert shared.ByFileName("one.wld").MTime == 2
+            assert refreshes == [shared, shared]
+        finally:
+            WorldCatalog.WorldCatalog.Refresh = refresh
+finally:
+    shutil.rmtree(tmp)